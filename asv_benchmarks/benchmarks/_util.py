@@ -0,0 +1,36 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Shared benchmark parameters."""
+
+from __future__ import annotations
+
+import ffsim
+
+NORBS = [4, 8, 12, 16, 24, 30]
+FILLINGS = [0.1, 0.25, 0.5]
+
+# Largest state vector dimension to benchmark. Larger parameter combinations are
+# skipped.
+MAX_DIM = 1 << 25
+
+
+def nelec_from_filling(norb: int, filling: float) -> tuple[int, int]:
+    """Return the numbers of alpha and beta electrons for a filling fraction.
+
+    Raises NotImplementedError, which asv treats as a skipped benchmark, if the
+    state vector dimension exceeds ``MAX_DIM``.
+    """
+    n_electrons = max(1, round(filling * norb))
+    nelec = (n_electrons, n_electrons)
+    if ffsim.dim(norb, nelec) > MAX_DIM:
+        raise NotImplementedError
+    ffsim.init_cache(norb, nelec)
+    return nelec
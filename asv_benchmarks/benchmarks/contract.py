@@ -0,0 +1,55 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+from __future__ import annotations
+
+import numpy as np
+
+import ffsim
+
+from ._util import FILLINGS, NORBS, nelec_from_filling
+
+
+class ContractBenchmark:
+    """Benchmark tensor contractions."""
+
+    params = (NORBS, FILLINGS)
+    param_names = ["norb", "filling"]
+
+    def setup(self, norb: int, filling: float):
+        self.norb = norb
+        self.nelec = nelec_from_filling(norb, filling)
+        rng = np.random.default_rng(2024)
+        self.vec = ffsim.random.random_state_vector(
+            ffsim.dim(self.norb, self.nelec), seed=rng
+        )
+        self.diag_coulomb_mat = ffsim.random.random_real_symmetric_matrix(
+            norb, seed=rng
+        )
+        self.one_body_tensor = ffsim.random.random_hermitian(norb, seed=rng)
+
+    def time_contract_diag_coulomb(self, *_):
+        ffsim.contract.contract_diag_coulomb(
+            self.vec, self.diag_coulomb_mat, norb=self.norb, nelec=self.nelec
+        )
+
+    def time_contract_diag_coulomb_z_rep(self, *_):
+        ffsim.contract.contract_diag_coulomb(
+            self.vec,
+            self.diag_coulomb_mat,
+            norb=self.norb,
+            nelec=self.nelec,
+            z_representation=True,
+        )
+
+    def time_contract_one_body(self, *_):
+        ffsim.contract.contract_one_body(
+            self.vec, self.one_body_tensor, norb=self.norb, nelec=self.nelec
+        )
@@ -0,0 +1,81 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+from __future__ import annotations
+
+import numpy as np
+
+import ffsim
+
+from ._util import FILLINGS, NORBS, nelec_from_filling
+
+
+class FermionOperatorBenchmark:
+    """Benchmark FermionOperator."""
+
+    params = (NORBS,)
+    param_names = ["norb"]
+
+    def setup(self, norb: int):
+        rng = np.random.default_rng(2024)
+        self.op1 = ffsim.random.random_fermion_operator(
+            norb, n_terms=100, max_term_length=4, seed=rng
+        )
+        self.op2 = ffsim.random.random_fermion_operator(
+            norb, n_terms=100, max_term_length=4, seed=rng
+        )
+
+    def time_add(self, *_):
+        self.op1 + self.op2
+
+    def time_mul(self, *_):
+        self.op1 * self.op2
+
+    def time_normal_ordered(self, *_):
+        (self.op1 * self.op2).normal_ordered()
+
+
+class FermionOperatorHamiltonianBenchmark:
+    """Benchmark normal ordering a molecular Hamiltonian FermionOperator."""
+
+    # The operator has O(norb**4) terms, so larger norb makes setup dominate
+    params = ([4, 8, 12],)
+    param_names = ["norb"]
+
+    def setup(self, norb: int):
+        rng = np.random.default_rng(2024)
+        self.hamiltonian = ffsim.fermion_operator(
+            ffsim.random.random_molecular_hamiltonian(norb, seed=rng)
+        )
+
+    def time_normal_ordered(self, *_):
+        self.hamiltonian.normal_ordered()
+
+
+class FermionOperatorLinearOperatorBenchmark:
+    """Benchmark FermionOperator linear operator."""
+
+    params = ([4, 8, 12], FILLINGS)
+    param_names = ["norb", "filling"]
+
+    def setup(self, norb: int, filling: float):
+        self.norb = norb
+        self.nelec = nelec_from_filling(norb, filling)
+        rng = np.random.default_rng(2024)
+        self.vec = ffsim.random.random_state_vector(
+            ffsim.dim(self.norb, self.nelec), seed=rng
+        )
+        op = ffsim.fermion_operator(
+            ffsim.random.random_molecular_hamiltonian(norb, seed=rng)
+        )
+        self.linop = ffsim.linear_operator(op, norb=norb, nelec=self.nelec)
+
+    def time_matvec(self, *_):
+        self.linop @ self.vec
@@ -0,0 +1,77 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+from __future__ import annotations
+
+import numpy as np
+
+import ffsim
+
+from ._util import FILLINGS, NORBS, nelec_from_filling
+
+
+class GatesBenchmark:
+    """Benchmark gates."""
+
+    params = (NORBS, FILLINGS)
+    param_names = ["norb", "filling"]
+
+    def setup(self, norb: int, filling: float):
+        self.norb = norb
+        self.nelec = nelec_from_filling(norb, filling)
+        rng = np.random.default_rng(2024)
+        self.vec = ffsim.random.random_state_vector(
+            ffsim.dim(self.norb, self.nelec), seed=rng
+        )
+        self.orbital_rotation = ffsim.random.random_unitary(norb, seed=rng)
+        self.diag_coulomb_mat = ffsim.random.random_real_symmetric_matrix(
+            norb, seed=rng
+        )
+        self.coeffs = rng.standard_normal(norb)
+
+    def time_apply_orbital_rotation(self, *_):
+        ffsim.apply_orbital_rotation(
+            self.vec,
+            self.orbital_rotation,
+            norb=self.norb,
+            nelec=self.nelec,
+            copy=False,
+        )
+
+    def time_apply_num_op_sum_evolution(self, *_):
+        ffsim.apply_num_op_sum_evolution(
+            self.vec,
+            self.coeffs,
+            time=1.0,
+            norb=self.norb,
+            nelec=self.nelec,
+            copy=False,
+        )
+
+    def time_apply_diag_coulomb_evolution(self, *_):
+        ffsim.apply_diag_coulomb_evolution(
+            self.vec,
+            self.diag_coulomb_mat,
+            time=1.0,
+            norb=self.norb,
+            nelec=self.nelec,
+            copy=False,
+        )
+
+    def time_apply_diag_coulomb_evolution_z_rep(self, *_):
+        ffsim.apply_diag_coulomb_evolution(
+            self.vec,
+            self.diag_coulomb_mat,
+            time=1.0,
+            norb=self.norb,
+            nelec=self.nelec,
+            z_representation=True,
+            copy=False,
+        )
@@ -0,0 +1,59 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+from __future__ import annotations
+
+import numpy as np
+
+import ffsim
+
+from ._util import FILLINGS, nelec_from_filling
+
+
+class MolecularHamiltonianBenchmark:
+    """Benchmark molecular Hamiltonian."""
+
+    params = ([4, 8, 12, 16], FILLINGS)
+    param_names = ["norb", "filling"]
+
+    def setup(self, norb: int, filling: float):
+        self.norb = norb
+        self.nelec = nelec_from_filling(norb, filling)
+        rng = np.random.default_rng(2024)
+        self.vec = ffsim.random.random_state_vector(
+            ffsim.dim(self.norb, self.nelec), seed=rng
+        )
+        hamiltonian = ffsim.random.random_molecular_hamiltonian(norb, seed=rng)
+        self.linop = ffsim.linear_operator(hamiltonian, norb=norb, nelec=self.nelec)
+
+    def time_matvec(self, *_):
+        self.linop @ self.vec
+
+
+class DoubleFactorizedHamiltonianBenchmark:
+    """Benchmark double-factorized Hamiltonian."""
+
+    params = ([4, 8, 12, 16], FILLINGS, [False, True])
+    param_names = ["norb", "filling", "z_representation"]
+
+    def setup(self, norb: int, filling: float, z_representation: bool):
+        self.norb = norb
+        self.nelec = nelec_from_filling(norb, filling)
+        rng = np.random.default_rng(2024)
+        self.vec = ffsim.random.random_state_vector(
+            ffsim.dim(self.norb, self.nelec), seed=rng
+        )
+        hamiltonian = ffsim.random.random_double_factorized_hamiltonian(
+            norb, rank=norb, z_representation=z_representation, seed=rng
+        )
+        self.linop = ffsim.linear_operator(hamiltonian, norb=norb, nelec=self.nelec)
+
+    def time_matvec(self, *_):
+        self.linop @ self.vec
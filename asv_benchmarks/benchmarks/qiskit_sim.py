@@ -0,0 +1,39 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+from __future__ import annotations
+
+import numpy as np
+from qiskit.circuit import QuantumCircuit, QuantumRegister
+
+import ffsim
+
+from ._util import FILLINGS, NORBS, nelec_from_filling
+
+
+class FinalStateVectorBenchmark:
+    """Benchmark simulating a Qiskit circuit."""
+
+    params = (NORBS, FILLINGS)
+    param_names = ["norb", "filling"]
+
+    def setup(self, norb: int, filling: float):
+        nelec = nelec_from_filling(norb, filling)
+        rng = np.random.default_rng(2024)
+        ucj_op = ffsim.random.random_ucj_op_spin_balanced(
+            norb, n_reps=2, with_final_orbital_rotation=True, seed=rng
+        )
+        qubits = QuantumRegister(2 * norb)
+        self.circuit = QuantumCircuit(qubits)
+        self.circuit.append(ffsim.qiskit.PrepareHartreeFockJW(norb, nelec), qubits)
+        self.circuit.append(ffsim.qiskit.UCJOpSpinBalancedJW(ucj_op), qubits)
+
+    def time_final_state_vector(self, *_):
+        ffsim.qiskit.final_state_vector(self.circuit)
@@ -0,0 +1,70 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+from __future__ import annotations
+
+import numpy as np
+
+import ffsim
+
+from ._util import FILLINGS, NORBS, nelec_from_filling
+
+
+class RDMBenchmark:
+    """Benchmark reduced density matrices."""
+
+    params = (NORBS, FILLINGS, [1, 2])
+    param_names = ["norb", "filling", "rank"]
+
+    def setup(self, norb: int, filling: float, rank: int):
+        self.norb = norb
+        self.nelec = nelec_from_filling(norb, filling)
+        rng = np.random.default_rng(2024)
+        self.vec = ffsim.random.random_state_vector(
+            ffsim.dim(self.norb, self.nelec), seed=rng
+        )
+
+    def time_rdms(self, norb: int, filling: float, rank: int):
+        ffsim.rdms(self.vec, norb=self.norb, nelec=self.nelec, rank=rank)
+
+    def time_rdms_spin_summed(self, norb: int, filling: float, rank: int):
+        ffsim.rdms(
+            self.vec, norb=self.norb, nelec=self.nelec, rank=rank, spin_summed=True
+        )
+
+
+class SampleStateVectorBenchmark:
+    """Benchmark sampling from a state vector."""
+
+    params = (NORBS, FILLINGS, [1_000, 100_000])
+    param_names = ["norb", "filling", "shots"]
+
+    def setup(self, norb: int, filling: float, shots: int):
+        self.norb = norb
+        self.nelec = nelec_from_filling(norb, filling)
+        rng = np.random.default_rng(2024)
+        self.vec = ffsim.random.random_state_vector(
+            ffsim.dim(self.norb, self.nelec), seed=rng
+        )
+
+    def time_sample_state_vector(self, norb: int, filling: float, shots: int):
+        ffsim.sample_state_vector(
+            self.vec, norb=self.norb, nelec=self.nelec, shots=shots, seed=1234
+        )
+
+    def time_sample_state_vector_int(self, norb: int, filling: float, shots: int):
+        ffsim.sample_state_vector(
+            self.vec,
+            norb=self.norb,
+            nelec=self.nelec,
+            shots=shots,
+            bitstring_type=ffsim.BitstringType.INT,
+            seed=1234,
+        )
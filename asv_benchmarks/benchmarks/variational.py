@@ -0,0 +1,38 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+from __future__ import annotations
+
+import numpy as np
+
+import ffsim
+
+from ._util import FILLINGS, NORBS, nelec_from_filling
+
+
+class UCJOpSpinBalancedBenchmark:
+    """Benchmark spin-balanced UCJ operator."""
+
+    params = (NORBS, FILLINGS, [1, 3])
+    param_names = ["norb", "filling", "n_reps"]
+
+    def setup(self, norb: int, filling: float, n_reps: int):
+        self.norb = norb
+        self.nelec = nelec_from_filling(norb, filling)
+        rng = np.random.default_rng(2024)
+        self.vec = ffsim.random.random_state_vector(
+            ffsim.dim(self.norb, self.nelec), seed=rng
+        )
+        self.ucj_op = ffsim.random.random_ucj_op_spin_balanced(
+            norb, n_reps=n_reps, with_final_orbital_rotation=True, seed=rng
+        )
+
+    def time_apply_unitary(self, *_):
+        ffsim.apply_unitary(self.vec, self.ucj_op, norb=self.norb, nelec=self.nelec)
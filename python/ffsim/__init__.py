@@ -12,10 +12,15 @@
 
 from ffsim import contract, linalg, optimize, qiskit, random, testing
 from ffsim.cistring import init_cache
+from ffsim.davidson import lowest_eigenstates
 from ffsim.gates import (
+    DiagCoulombEvolutionGate,
+    NumOpSumEvolutionGate,
+    OrbitalRotationGate,
     apply_diag_coulomb_evolution,
     apply_fsim_gate,
     apply_fswap_gate,
+    apply_gates,
     apply_givens_rotation,
     apply_hop_gate,
     apply_num_interaction,
@@ -25,6 +30,7 @@ from ffsim.gates import (
     apply_on_site_interaction,
     apply_orbital_rotation,
     apply_tunneling_interaction,
+    merge_orbital_rotations,
 )
 from ffsim.hamiltonians import (
     DiagonalCoulombHamiltonian,
@@ -32,6 +38,7 @@ from ffsim.hamiltonians import (
     MolecularHamiltonian,
     SingleFactorizedHamiltonian,
 )
+from ffsim.krylov import simulate_krylov
 from ffsim.molecular_data import MolecularData
 from ffsim.operators import (
     FermionAction,
@@ -65,12 +72,14 @@ from ffsim.states import (
     BitstringType,
     ProductStateSum,
     StateVector,
+    StateVectorSampler,
     addresses_to_strings,
     dim,
     dims,
     expectation_one_body_power,
     expectation_one_body_product,
     hartree_fock_state,
+    memmap_state_vector,
     rdms,
     sample_slater_determinant,
     sample_state_vector,
@@ -82,8 +91,11 @@ from ffsim.states import (
 )
 from ffsim.trotter import (
     simulate_qdrift_double_factorized,
+    simulate_qdrift_double_factorized_average,
     simulate_trotter_diag_coulomb_split_op,
+    simulate_trotter_diag_coulomb_split_op_iter,
     simulate_trotter_double_factorized,
+    simulate_trotter_double_factorized_iter,
 )
 from ffsim.variational import (
     GivensAnsatzOp,
@@ -94,12 +106,14 @@ from ffsim.variational import (
     UCJOpSpinBalanced,
     UCJOpSpinless,
     UCJOpSpinUnbalanced,
+    UCJPlan,
     multireference_state,
     multireference_state_prod,
 )
 
 __all__ = [
     "BitstringType",
+    "DiagCoulombEvolutionGate",
     "DiagonalCoulombHamiltonian",
     "DoubleFactorizedHamiltonian",
     "FermionAction",
@@ -109,10 +123,13 @@ __all__ = [
     "MolecularData",
     "MolecularHamiltonian",
     "NumNumAnsatzOpSpinBalanced",
+    "NumOpSumEvolutionGate",
+    "OrbitalRotationGate",
     "ProductStateSum",
     "SingleFactorizedHamiltonian",
     "Spin",
     "StateVector",
+    "StateVectorSampler",
     "SupportsApplyUnitary",
     "SupportsApproximateEquality",
     "SupportsDiagonal",
@@ -124,10 +141,12 @@ __all__ = [
     "UCJOpSpinBalanced",
     "UCJOpSpinUnbalanced",
     "UCJOpSpinless",
+    "UCJPlan",
     "addresses_to_strings",
     "apply_diag_coulomb_evolution",
     "apply_fsim_gate",
     "apply_fswap_gate",
+    "apply_gates",
     "apply_givens_rotation",
     "apply_hop_gate",
     "apply_num_interaction",
@@ -158,6 +177,9 @@ __all__ = [
     "init_cache",
     "linalg",
     "linear_operator",
+    "lowest_eigenstates",
+    "memmap_state_vector",
+    "merge_orbital_rotations",
     "multireference_state",
     "multireference_state_prod",
     "number_operator",
@@ -167,9 +189,13 @@ __all__ = [
     "rdms",
     "sample_slater_determinant",
     "sample_state_vector",
+    "simulate_krylov",
     "simulate_qdrift_double_factorized",
+    "simulate_qdrift_double_factorized_average",
     "simulate_trotter_diag_coulomb_split_op",
+    "simulate_trotter_diag_coulomb_split_op_iter",
     "simulate_trotter_double_factorized",
+    "simulate_trotter_double_factorized_iter",
     "slater_determinant",
     "slater_determinant_amplitudes",
     "slater_determinant_rdms",
@@ -32,12 +32,26 @@ class FermionOperator(MutableMapping[tuple[tuple[bool, bool, int], ...], complex
     def __mul__(self, other: FermionOperator) -> FermionOperator: ...
     def __pow__(self, other: int) -> FermionOperator: ...
 
+class FermionOperatorTables:
+    def __init__(
+        self, operator: FermionOperator, norb: int, nelec: tuple[int, int]
+    ) -> None: ...
+
 def apply_phase_shift_in_place(
     vec: np.ndarray, phase: complex, indices: np.ndarray
 ) -> None: ...
 def apply_givens_rotation_in_place(
     vec: np.ndarray, c: float, s: complex, slice1: np.ndarray, slice2: np.ndarray
 ) -> None: ...
+def apply_givens_rotations_in_place(
+    vec: np.ndarray,
+    cs: np.ndarray,
+    ss: np.ndarray,
+    target_orbs: np.ndarray,
+    indices: np.ndarray,
+    phases: np.ndarray,
+    occupations: np.ndarray,
+) -> None: ...
 def apply_num_op_sum_evolution_in_place(
     vec: np.ndarray,
     phases: np.ndarray,
@@ -90,3 +104,38 @@ def contract_num_op_sum_spin_into_buffer(
     occupations: np.ndarray,
     out: np.ndarray,
 ) -> None: ...
+def contract_one_body_into_buffer(
+    vec: np.ndarray,
+    mat: np.ndarray,
+    linkstr_index_a: np.ndarray,
+    linkstr_index_b: np.ndarray,
+    out: np.ndarray,
+) -> None: ...
+def contract_two_body_into_buffer(
+    vec: np.ndarray,
+    two_body: np.ndarray,
+    norb: int,
+    linkstr_index_a: np.ndarray,
+    linkstr_index_b: np.ndarray,
+    out: np.ndarray,
+    block_size: int,
+) -> None: ...
+def contract_fermion_operator_into_buffer(
+    vec: np.ndarray,
+    tables: FermionOperatorTables,
+    out: np.ndarray,
+) -> None: ...
+def build_alias_table_into_buffers(
+    weights: np.ndarray,
+    thresholds: np.ndarray,
+    aliases: np.ndarray,
+) -> None: ...
+def sample_alias_table_into_buffer(
+    thresholds: np.ndarray,
+    aliases: np.ndarray,
+    uniforms: np.ndarray,
+    out: np.ndarray,
+) -> None: ...
+def jordan_wigner_symplectic(
+    op: FermionOperator, norb: int, tol: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]: ...
@@ -0,0 +1,45 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+from __future__ import annotations
+
+import numpy as np
+import pyscf.fci
+
+from ffsim.operators import FermionOperator
+
+
+def contract_fermion_operator_into_buffer_slow(
+    vec: np.ndarray,
+    operator: FermionOperator,
+    norb: int,
+    nelec: tuple[int, int],
+    out: np.ndarray,
+) -> None:
+    action_funcs = {
+        # key: (action, spin)
+        (False, False): pyscf.fci.addons.des_a,
+        (False, True): pyscf.fci.addons.des_b,
+        (True, False): pyscf.fci.addons.cre_a,
+        (True, True): pyscf.fci.addons.cre_b,
+    }
+    for term, coeff in operator.items():
+        for part, phase in [(vec.real, 1), (vec.imag, 1j)]:
+            transformed = part
+            this_nelec = list(nelec)
+            for action, spin, orb in reversed(term):
+                action_func = action_funcs[(action, spin)]
+                transformed = action_func(transformed, norb, this_nelec, orb)
+                this_nelec[spin] += 1 if action else -1
+                if this_nelec[spin] < 0 or this_nelec[spin] > norb:
+                    break
+            else:
+                out += coeff * phase * transformed
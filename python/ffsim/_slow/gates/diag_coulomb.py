@@ -27,7 +27,7 @@ def apply_diag_coulomb_evolution_in_place_num_rep_slow(
     occupations_b: np.ndarray,
 ) -> None:
     """Apply time evolution by a diagonal Coulomb operator in-place."""
-    dim_a, dim_b = vec.shape
+    dim_a, dim_b = vec.shape[-2:]
     alpha_phases = np.ones((dim_a,), dtype=complex)
     beta_phases = np.ones((dim_b,), dtype=complex)
     phase_map = np.ones((dim_a, norb), dtype=complex)
@@ -46,12 +46,12 @@ def apply_diag_coulomb_evolution_in_place_num_rep_slow(
                 phase *= mat_exp_aa[orbs[j], orbs[k]]
         alpha_phases[i] = phase
 
-    for row, alpha_phase, phase_map in zip(vec, alpha_phases, phase_map):
+    for i, (alpha_phase, phase_map) in enumerate(zip(alpha_phases, phase_map)):
         for j, occ_b in enumerate(occupations_b):
             phase = alpha_phase * beta_phases[j]
             for orb_b in occ_b:
                 phase *= phase_map[orb_b]
-            row[j] *= phase
+            vec[..., i, j] *= phase
 
 
 def apply_diag_coulomb_evolution_in_place_z_rep_slow(
@@ -67,7 +67,7 @@ def apply_diag_coulomb_evolution_in_place_z_rep_slow(
     strings_b: np.ndarray,
 ) -> None:
     """Apply time evolution by a diagonal Coulomb operator in-place."""
-    dim_a, dim_b = vec.shape
+    dim_a, dim_b = vec.shape[-2:]
     alpha_phases = np.ones((dim_a,), dtype=complex)
     beta_phases = np.ones((dim_b,), dtype=complex)
     phase_map = np.ones((dim_a, norb), dtype=complex)
@@ -94,15 +94,15 @@ def apply_diag_coulomb_evolution_in_place_z_rep_slow(
                 phase *= mat[j, k]
         alpha_phases[i] = phase
 
-    for row, alpha_phase, phase_map in zip(vec, alpha_phases, phase_map):
-        for i, str0 in enumerate(strings_b):
-            phase = alpha_phase * beta_phases[i]
+    for i, (alpha_phase, phase_map) in enumerate(zip(alpha_phases, phase_map)):
+        for k, str0 in enumerate(strings_b):
+            phase = alpha_phase * beta_phases[k]
             for j in range(norb):
                 phase_shift = phase_map[j]
                 if str0 >> j & 1:
                     phase_shift = phase_shift.conjugate()
                 phase *= phase_shift
-            row[i] *= phase
+            vec[..., i, k] *= phase
 
 
 def apply_diag_coulomb_evolution_in_place_num_rep_numpy(
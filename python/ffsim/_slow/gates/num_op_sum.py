@@ -17,8 +17,8 @@ def apply_num_op_sum_evolution_in_place_slow(
     vec: np.ndarray, phases: np.ndarray, occupations: np.ndarray
 ) -> None:
     """Apply time evolution by a sum of number operators in-place."""
-    for row, orbs in zip(vec, occupations):
+    for i, orbs in enumerate(occupations):
         phase = 1
         for orb in orbs:
             phase *= phases[orb]
-        row *= phase
+        vec[..., i, :] *= phase
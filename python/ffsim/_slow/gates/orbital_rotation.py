@@ -24,3 +24,25 @@ def apply_givens_rotation_in_place_slow(
     """Apply a Givens rotation to slices of a state vector."""
     for i, j in zip(slice1, slice2):
         vec[i], vec[j] = zrot(vec[i], vec[j], c, s)
+
+
+def apply_givens_rotations_in_place_slow(
+    vec: np.ndarray,
+    cs: np.ndarray,
+    ss: np.ndarray,
+    target_orbs: np.ndarray,
+    indices: np.ndarray,
+    phases: np.ndarray,
+    occupations: np.ndarray,
+) -> None:
+    """Apply a sequence of Givens rotations followed by phase shifts in-place."""
+    n_pairs = indices.shape[1] // 2
+    for c, s, (i, j) in zip(cs, ss, target_orbs):
+        row = indices[min(i, j)]
+        slice1, slice2 = row[:n_pairs], row[n_pairs:]
+        if i > j:
+            slice1, slice2 = slice2, slice1
+        for mat in vec:
+            apply_givens_rotation_in_place_slow(mat, c, s, slice1, slice2)
+    for i, orbs in enumerate(occupations):
+        vec[:, i] *= np.prod(phases[orbs])
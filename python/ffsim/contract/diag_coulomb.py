@@ -24,6 +24,7 @@ from ffsim._lib import (
 from ffsim.cistring import gen_occslst, make_strings
 from ffsim.gates.orbital_rotation import apply_orbital_rotation
 from ffsim.states import dim
+from ffsim.states.states import _complex_dtype
 
 
 def _conjugate_orbital_rotation(
@@ -77,7 +78,7 @@ def contract_diag_coulomb(
     mat_aa, mat_ab, mat_bb = _get_mats(
         mat, norb=norb, z_representation=z_representation
     )
-    vec = vec.astype(complex, copy=False)
+    vec = vec.astype(_complex_dtype(vec), copy=False)
 
     if z_representation:
         return _contract_diag_coulomb_z_rep(
@@ -23,6 +23,7 @@ from ffsim._lib import (
 from ffsim.cistring import gen_occslst
 from ffsim.gates.orbital_rotation import apply_orbital_rotation
 from ffsim.states import dim
+from ffsim.states.states import _complex_dtype
 
 
 def contract_num_op_sum(
@@ -49,7 +50,7 @@ def contract_num_op_sum(
         The result of applying the linear combination of number operators on the input
         state vector.
     """
-    vec = vec.astype(complex, copy=False)
+    vec = vec.astype(_complex_dtype(vec), copy=False)
     n_alpha, n_beta = nelec
 
     occupations_a = gen_occslst(range(norb), n_alpha)
@@ -14,10 +14,11 @@ from __future__ import annotations
 
 import numpy as np
 import scipy.sparse.linalg
-from pyscf.fci.direct_nosym import contract_1e
 
+from ffsim._lib import contract_one_body_into_buffer
 from ffsim.cistring import gen_linkstr_index
-from ffsim.states import dim
+from ffsim.states import dim, dims
+from ffsim.states.states import _complex_dtype
 
 
 def contract_one_body(
@@ -44,14 +45,11 @@ def contract_one_body(
     n_alpha, n_beta = nelec
     link_index_a = gen_linkstr_index(range(norb), n_alpha)
     link_index_b = gen_linkstr_index(range(norb), n_beta)
-    link_index = (link_index_a, link_index_b)
-    result = contract_1e(mat.real, vec.real, norb, nelec, link_index=link_index).astype(
-        complex
-    )
-    result += 1j * contract_1e(mat.imag, vec.real, norb, nelec, link_index=link_index)
-    result += 1j * contract_1e(mat.real, vec.imag, norb, nelec, link_index=link_index)
-    result -= contract_1e(mat.imag, vec.imag, norb, nelec, link_index=link_index)
-    return result
+    vec = vec.reshape(dims(norb, nelec)).astype(_complex_dtype(vec), copy=False)
+    mat = mat.astype(complex, copy=False)
+    out = np.zeros_like(vec)
+    contract_one_body_into_buffer(vec, mat, link_index_a, link_index_b, out=out)
+    return out.reshape(-1)
 
 
 def one_body_linop(
@@ -0,0 +1,147 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Lowest eigenstates of Hamiltonians via the Davidson method."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+from pyscf.fci.spin_op import contract_ss
+from scipy.sparse.linalg import LinearOperator
+
+from ffsim import linalg, protocols
+from ffsim.cistring import make_strings
+from ffsim.states import dim, dims
+
+
+def lowest_eigenstates(
+    hamiltonian: Any,
+    *,
+    norb: int,
+    nelec: tuple[int, int],
+    k: int = 1,
+    v0: np.ndarray | None = None,
+    tol: float = 1e-8,
+    max_iter: int = 100,
+    max_subspace_dim: int | None = None,
+    spin_penalty: float = 0.0,
+    target_spin_square: float | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    r"""Compute the lowest eigenstates of a Hamiltonian with the Davidson method.
+
+    The Hamiltonian is applied to blocks of state vectors through its linear operator,
+    and its diagonal, given by :func:`ffsim.diag`, is used as the preconditioner.
+    For molecular Hamiltonians this usually converges in far fewer applications of the
+    Hamiltonian than a Lanczos solver such as ``scipy.sparse.linalg.eigsh``. See
+    :func:`ffsim.linalg.davidson` for details of the algorithm.
+
+    The Hamiltonian preserves the total spin, so its eigenstates can be selected by
+    spin with a penalty. If ``spin_penalty`` is positive, the eigenstates of
+    :math:`H + \mu (S^2 - s)` are computed instead, where :math:`\mu` is the spin
+    penalty and :math:`s` is the target value of :math:`S^2`. This raises the
+    energies of states with larger total spin than the target. The returned
+    eigenvalues are the energies of the eigenstates with respect to the original
+    Hamiltonian.
+
+    Args:
+        hamiltonian: The Hamiltonian. It must support both :func:`ffsim.linear_operator`
+            and :func:`ffsim.diag`.
+        norb: The number of spatial orbitals.
+        nelec: The number of alpha and beta electrons.
+        k: The number of eigenstates to compute.
+        v0: Initial guesses for the eigenstates, as the columns of a matrix. A single
+            state vector can also be passed.
+        tol: The convergence tolerance for the norms of the residuals.
+        max_iter: The maximum number of iterations.
+        max_subspace_dim: The maximum dimension of the subspace, which bounds the
+            number of state vectors stored.
+        spin_penalty: The coefficient of the spin penalty.
+        target_spin_square: The target value of :math:`S^2`. The default is the
+            smallest value compatible with ``nelec``, that is, :math:`S_z(S_z + 1)`,
+            where :math:`S_z` is half the difference of the numbers of alpha and beta
+            electrons.
+
+    Returns:
+        The energies, in ascending order, and the corresponding eigenstates, as the
+        columns of a matrix.
+    """
+    linop = protocols.linear_operator(hamiltonian, norb=norb, nelec=nelec)
+    diag = np.asarray(protocols.diag(hamiltonian, norb=norb, nelec=nelec)).real
+    if not spin_penalty:
+        return linalg.davidson(
+            linop,
+            diag,
+            k=k,
+            v0=v0,
+            tol=tol,
+            max_iter=max_iter,
+            max_subspace_dim=max_subspace_dim,
+        )
+
+    if target_spin_square is None:
+        n_alpha, n_beta = nelec
+        spin_z = 0.5 * abs(n_alpha - n_beta)
+        target_spin_square = spin_z * (spin_z + 1)
+    shift = spin_penalty * target_spin_square
+    spin_square_linop = _spin_square_linear_operator(norb, nelec)
+
+    def matmat(vecs: np.ndarray) -> np.ndarray:
+        return linop @ vecs + spin_penalty * (spin_square_linop @ vecs) - shift * vecs
+
+    penalized = LinearOperator(
+        linop.shape, matvec=matmat, matmat=matmat, dtype=linop.dtype
+    )
+    penalized_diag = (
+        diag + spin_penalty * _spin_square_diag(norb, nelec).reshape(-1) - shift
+    )
+    _, vecs = linalg.davidson(
+        penalized,
+        penalized_diag,
+        k=k,
+        v0=v0,
+        tol=tol,
+        max_iter=max_iter,
+        max_subspace_dim=max_subspace_dim,
+    )
+    energies = np.einsum("ij,ij->j", vecs.conj(), linop @ vecs).real
+    order = np.argsort(energies, kind="stable")
+    return energies[order], vecs[:, order]
+
+
+def _spin_square_linear_operator(norb: int, nelec: tuple[int, int]) -> LinearOperator:
+    shape = dims(norb, nelec)
+
+    def matvec(vec: np.ndarray) -> np.ndarray:
+        vec = vec.reshape(shape)
+        if np.iscomplexobj(vec):
+            result = contract_ss(vec.real, norb, nelec).astype(complex)
+            result += 1j * contract_ss(vec.imag, norb, nelec)
+        else:
+            result = contract_ss(vec, norb, nelec)
+        return result.reshape(-1)
+
+    size = dim(norb, nelec)
+    return LinearOperator((size, size), matvec=matvec, rmatvec=matvec, dtype=complex)
+
+
+def _spin_square_diag(norb: int, nelec: tuple[int, int]) -> np.ndarray:
+    r"""Return the diagonal entries of :math:`S^2`.
+
+    The diagonal entry of a determinant is :math:`S_z(S_z + 1) + n_\beta - n_d`, where
+    :math:`n_d` is the number of doubly occupied orbitals.
+    """
+    n_alpha, n_beta = nelec
+    spin_z = 0.5 * (n_alpha - n_beta)
+    occ_a = (make_strings(range(norb), n_alpha)[:, None] >> np.arange(norb)) & 1
+    occ_b = (make_strings(range(norb), n_beta)[:, None] >> np.arange(norb)) & 1
+    n_double = occ_a @ occ_b.T
+    return spin_z * (spin_z + 1) + n_beta - n_double
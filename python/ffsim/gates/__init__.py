@@ -22,13 +22,24 @@ from ffsim.gates.basic_gates import (
     apply_tunneling_interaction,
 )
 from ffsim.gates.diag_coulomb import apply_diag_coulomb_evolution
+from ffsim.gates.gate_sequence import (
+    DiagCoulombEvolutionGate,
+    NumOpSumEvolutionGate,
+    OrbitalRotationGate,
+    apply_gates,
+    merge_orbital_rotations,
+)
 from ffsim.gates.num_op_sum import apply_num_op_sum_evolution
 from ffsim.gates.orbital_rotation import apply_orbital_rotation
 
 __all__ = [
+    "DiagCoulombEvolutionGate",
+    "NumOpSumEvolutionGate",
+    "OrbitalRotationGate",
     "apply_diag_coulomb_evolution",
     "apply_fsim_gate",
     "apply_fswap_gate",
+    "apply_gates",
     "apply_givens_rotation",
     "apply_hop_gate",
     "apply_num_interaction",
@@ -38,4 +49,5 @@ __all__ = [
     "apply_on_site_interaction",
     "apply_orbital_rotation",
     "apply_tunneling_interaction",
+    "merge_orbital_rotations",
 ]
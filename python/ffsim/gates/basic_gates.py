@@ -43,12 +43,13 @@ def _apply_phase_shift(
     n_alpha, n_beta = nelec
     dim_a = math.comb(norb, n_alpha)
     dim_b = math.comb(norb, n_beta)
-    vec = vec.reshape((dim_a, dim_b))
+    shape = vec.shape
+    vec = vec.reshape((-1, dim_a, dim_b))
     target_orbs_a, target_orbs_b = target_orbs
     indices_a = _one_subspace_indices(norb, n_alpha, target_orbs_a)
     indices_b = _one_subspace_indices(norb, n_beta, target_orbs_b)
-    vec[np.ix_(indices_a, indices_b)] *= phase
-    return vec.reshape(-1)
+    vec[:, indices_a[:, None], indices_b] *= phase
+    return vec.reshape(shape)
 
 
 def apply_givens_rotation(
@@ -87,7 +88,9 @@ def apply_givens_rotation(
         \end{pmatrix}
 
     Args:
-        vec: The state vector to be transformed.
+        vec: The state vector to be transformed. To transform a batch of state
+            vectors at once, pass a two-dimensional array of shape
+            ``(batch, dim)`` whose rows are the state vectors.
         theta: The rotation angle.
         target_orbs: The orbitals (p, q) to rotate.
         norb: The number of spatial orbitals.
@@ -156,7 +159,9 @@ def apply_tunneling_interaction(
         \end{pmatrix}
 
     Args:
-        vec: The state vector to be transformed.
+        vec: The state vector to be transformed. To transform a batch of state
+            vectors at once, pass a two-dimensional array of shape
+            ``(batch, dim)`` whose rows are the state vectors.
         theta: The rotation angle.
         target_orbs: The orbitals (p, q) on which to apply the interaction.
         norb: The number of spatial orbitals.
@@ -212,7 +217,9 @@ def apply_num_interaction(
         \exp\left(i \theta a^\dagger_{\sigma, p} a_{\sigma, p}\right)
 
     Args:
-        vec: The state vector to be transformed.
+        vec: The state vector to be transformed. To transform a batch of state
+            vectors at once, pass a two-dimensional array of shape
+            ``(batch, dim)`` whose rows are the state vectors.
         theta: The rotation angle.
         target_orb: The orbital on which to apply the interaction.
         norb: The number of spatial orbitals.
@@ -267,7 +274,9 @@ def apply_num_num_interaction(
         a^\dagger_{\sigma, q} a_{\sigma, q}\right)
 
     Args:
-        vec: The state vector to be transformed.
+        vec: The state vector to be transformed. To transform a batch of state
+            vectors at once, pass a two-dimensional array of shape
+            ``(batch, dim)`` whose rows are the state vectors.
         theta: The rotation angle.
         target_orbs: The orbitals (p, q) to interact.
         norb: The number of spatial orbitals.
@@ -345,7 +354,9 @@ def apply_on_site_interaction(
         a^\dagger_{\beta, p} a_{\beta, p}\right)
 
     Args:
-        vec: The state vector to be transformed.
+        vec: The state vector to be transformed. To transform a batch of state
+            vectors at once, pass a two-dimensional array of shape
+            ``(batch, dim)`` whose rows are the state vectors.
         theta: The rotation angle.
         target_orb: The orbital on which to apply the interaction.
         norb: The number of spatial orbitals.
@@ -394,7 +405,9 @@ def apply_num_op_prod_interaction(
         \right)
 
     Args:
-        vec: The state vector to be transformed.
+        vec: The state vector to be transformed. To transform a batch of state
+            vectors at once, pass a two-dimensional array of shape
+            ``(batch, dim)`` whose rows are the state vectors.
         theta: The rotation angle.
         target_orbs: A pair of lists of integers giving the orbitals on which to apply
             the interaction. The first list specifies the alpha orbitals and the second
@@ -464,7 +477,9 @@ def apply_hop_gate(
         \end{pmatrix}
 
     Args:
-        vec: The state vector to be transformed.
+        vec: The state vector to be transformed. To transform a batch of state
+            vectors at once, pass a two-dimensional array of shape
+            ``(batch, dim)`` whose rows are the state vectors.
         theta: The rotation angle.
         target_orbs: The orbitals (p, q) to interact.
         norb: The number of spatial orbitals.
@@ -538,7 +553,9 @@ def apply_fsim_gate(
         \end{pmatrix}
 
     Args:
-        vec: The state vector to be transformed.
+        vec: The state vector to be transformed. To transform a batch of state
+            vectors at once, pass a two-dimensional array of shape
+            ``(batch, dim)`` whose rows are the state vectors.
         theta: The rotation angle for the tunneling interaction.
         phi: The phase angle for the number-number interaction.
         target_orbs: The orbitals (p, q) to interact.
@@ -602,7 +619,9 @@ def apply_fswap_gate(
         \end{pmatrix}
 
     Args:
-        vec: The state vector to be transformed. 
+        vec: The state vector to be transformed. To transform a batch of state
+            vectors at once, pass a two-dimensional array of shape
+            ``(batch, dim)`` whose rows are the state vectors.
         target_orbs: The orbitals (p, q) to swap.
         norb: The number of spatial orbitals.
         nelec: Either a single integer representing the number of fermions for a
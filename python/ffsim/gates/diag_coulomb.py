@@ -94,7 +94,9 @@ def apply_diag_coulomb_evolution(
     and :math:`\mathcal{U}` is an optional orbital rotation.
 
     Args:
-        vec: The state vector to be transformed.
+        vec: The state vector to be transformed. To transform a batch of state
+            vectors at once, pass a two-dimensional array of shape
+            ``(batch, dim)`` whose rows are the state vectors.
         mat: The diagonal Coulomb matrix :math:`Z`.
             You can pass either a single Numpy array specifying the coefficients
             to use for all spin interactions, or you can pass a tuple of three Numpy
@@ -126,7 +128,7 @@ def apply_diag_coulomb_evolution(
               modified in-place.
 
     Returns:
-        The evolved state vector.
+        The evolved state vector, with the same shape as the input vector.
     """
     if copy:
         vec = vec.copy()
@@ -162,12 +164,7 @@ def _apply_diag_coulomb_evolution_spinful(
     orbital_rotation: np.ndarray | tuple[np.ndarray | None, np.ndarray | None] | None,
     z_representation: bool,
 ) -> np.ndarray:
-    mat_exp_aa, mat_exp_ab, mat_exp_bb = _get_mat_exp(
-        mat, time, norb=norb, z_representation=z_representation
-    )
-    n_alpha, n_beta = nelec
-    dim_a = math.comb(norb, n_alpha)
-    dim_b = math.comb(norb, n_beta)
+    mat_exp = _get_mat_exp(mat, time, norb=norb, z_representation=z_representation)
 
     if orbital_rotation is not None:
         vec = apply_orbital_rotation(
@@ -178,7 +175,53 @@ def _apply_diag_coulomb_evolution_spinful(
             copy=False,
         )
 
-    vec = vec.reshape((dim_a, dim_b))
+    vec = _apply_diag_coulomb_mat_exp(
+        vec,
+        mat_exp,
+        norb=norb,
+        nelec=nelec,
+        z_representation=z_representation,
+    )
+
+    if orbital_rotation is not None:
+        vec = apply_orbital_rotation(
+            vec,
+            orbital_rotation,
+            norb,
+            nelec,
+            copy=False,
+        )
+
+    return vec
+
+
+def _apply_diag_coulomb_mat_exp(
+    vec: np.ndarray,
+    mat_exp: tuple[np.ndarray, np.ndarray, np.ndarray],
+    norb: int,
+    nelec: tuple[int, int],
+    z_representation: bool,
+) -> np.ndarray:
+    """Apply a diagonal Coulomb evolution given its exponentiated matrices.
+
+    Args:
+        vec: The state vector or batch of state vectors to be transformed.
+        mat_exp: The alpha-alpha, alpha-beta, and beta-beta matrices, as returned by
+            :func:`_get_mat_exp`.
+        norb: The number of spatial orbitals.
+        nelec: The numbers of spin alpha and spin beta fermions.
+        z_representation: Whether the matrices are in the "Z" representation.
+
+    Returns:
+        The evolved state vector, with the same shape as the input vector.
+        The input vector is modified in-place.
+    """
+    mat_exp_aa, mat_exp_ab, mat_exp_bb = mat_exp
+    n_alpha, n_beta = nelec
+    dim_a = math.comb(norb, n_alpha)
+    dim_b = math.comb(norb, n_beta)
+    shape = vec.shape
+    vec = vec.reshape((-1, dim_a, dim_b))
     if z_representation:
         strings_a = make_strings(range(norb), n_alpha)
         strings_b = make_strings(range(norb), n_beta)
@@ -206,18 +249,7 @@ def _apply_diag_coulomb_evolution_spinful(
             occupations_a=occupations_a,
             occupations_b=occupations_b,
         )
-    vec = vec.reshape(-1)
-
-    if orbital_rotation is not None:
-        vec = apply_orbital_rotation(
-            vec,
-            orbital_rotation,
-            norb,
-            nelec,
-            copy=False,
-        )
-
-    return vec
+    return vec.reshape(shape)
 
 
 def _get_mat_exp(
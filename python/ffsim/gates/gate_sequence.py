@@ -0,0 +1,249 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Sequences of gates with merged orbital rotations."""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Optional, Union, cast
+
+import numpy as np
+
+from ffsim.gates.diag_coulomb import apply_diag_coulomb_evolution
+from ffsim.gates.num_op_sum import apply_num_op_sum_evolution
+from ffsim.gates.orbital_rotation import apply_orbital_rotation
+
+_OrbitalRotation = Union[np.ndarray, tuple[Optional[np.ndarray], Optional[np.ndarray]]]
+
+
+@dataclass(frozen=True)
+class OrbitalRotationGate:
+    """An orbital rotation.
+
+    Attributes:
+        mat (np.ndarray | tuple[np.ndarray | None, np.ndarray | None]): The orbital
+            rotation, in any of the forms accepted by
+            :func:`ffsim.apply_orbital_rotation`.
+    """
+
+    mat: _OrbitalRotation
+
+    def _apply_unitary_(
+        self, vec: np.ndarray, norb: int, nelec: int | tuple[int, int], copy: bool
+    ) -> np.ndarray:
+        if isinstance(nelec, int):
+            return apply_orbital_rotation(
+                vec, cast(np.ndarray, self.mat), norb, nelec, copy=copy
+            )
+        return apply_orbital_rotation(vec, self.mat, norb, nelec, copy=copy)
+
+
+@dataclass(frozen=True)
+class NumOpSumEvolutionGate:
+    """Time evolution by a (rotated) linear combination of number operators.
+
+    Attributes:
+        coeffs (np.ndarray | tuple[np.ndarray | None, np.ndarray | None]): The
+            coefficients of the linear combination.
+        time (float): The evolution time.
+        orbital_rotation (np.ndarray | tuple | None): The optional orbital rotation.
+
+    See :func:`ffsim.apply_num_op_sum_evolution` for details.
+    """
+
+    coeffs: np.ndarray | tuple[np.ndarray | None, np.ndarray | None]
+    time: float
+    orbital_rotation: _OrbitalRotation | None = None
+
+    def _apply_unitary_(
+        self, vec: np.ndarray, norb: int, nelec: int | tuple[int, int], copy: bool
+    ) -> np.ndarray:
+        if isinstance(nelec, int):
+            return apply_num_op_sum_evolution(
+                vec,
+                cast(np.ndarray, self.coeffs),
+                self.time,
+                norb,
+                nelec,
+                orbital_rotation=cast(Optional[np.ndarray], self.orbital_rotation),
+                copy=copy,
+            )
+        return apply_num_op_sum_evolution(
+            vec,
+            self.coeffs,
+            self.time,
+            norb,
+            nelec,
+            orbital_rotation=self.orbital_rotation,
+            copy=copy,
+        )
+
+
+@dataclass(frozen=True)
+class DiagCoulombEvolutionGate:
+    """Time evolution by a (rotated) diagonal Coulomb operator.
+
+    Attributes:
+        mat (np.ndarray | tuple): The diagonal Coulomb matrix.
+        time (float): The evolution time.
+        orbital_rotation (np.ndarray | tuple | None): The optional orbital rotation.
+        z_representation (bool): Whether the matrix is in the "Z" representation.
+
+    See :func:`ffsim.apply_diag_coulomb_evolution` for details.
+    """
+
+    mat: np.ndarray | tuple[np.ndarray | None, np.ndarray | None, np.ndarray | None]
+    time: float
+    orbital_rotation: _OrbitalRotation | None = None
+    z_representation: bool = False
+
+    def _apply_unitary_(
+        self, vec: np.ndarray, norb: int, nelec: int | tuple[int, int], copy: bool
+    ) -> np.ndarray:
+        if isinstance(nelec, int):
+            return apply_diag_coulomb_evolution(
+                vec,
+                cast(np.ndarray, self.mat),
+                self.time,
+                norb,
+                nelec,
+                orbital_rotation=cast(Optional[np.ndarray], self.orbital_rotation),
+                z_representation=self.z_representation,
+                copy=copy,
+            )
+        return apply_diag_coulomb_evolution(
+            vec,
+            self.mat,
+            self.time,
+            norb,
+            nelec,
+            orbital_rotation=self.orbital_rotation,
+            z_representation=self.z_representation,
+            copy=copy,
+        )
+
+
+Gate = Union[OrbitalRotationGate, NumOpSumEvolutionGate, DiagCoulombEvolutionGate]
+
+
+def merge_orbital_rotations(gates: Iterable[Gate]) -> list[Gate]:
+    r"""Merge the orbital rotations in a sequence of gates.
+
+    A rotated evolution :math:`\mathcal{U} e^{-itH} \mathcal{U}^\dagger` applies the
+    orbital rotation :math:`\mathcal{U}^\dagger`, then the unrotated evolution,
+    and then :math:`\mathcal{U}`. This function splits each rotated evolution in this
+    way and multiplies each run of consecutive orbital rotations into a single
+    orbital rotation. In the returned sequence, the evolutions have no orbital
+    rotation, and they are separated by at most one orbital rotation gate. For
+    example, in a Trotter step of a double-factorized Hamiltonian, this halves the
+    number of orbital rotations.
+
+    Args:
+        gates: The gates, in the order in which they are applied.
+
+    Returns:
+        The merged sequence of gates, which applies the same transformation.
+    """
+    merged: list[Gate] = []
+    current_basis: _OrbitalRotation | None = None
+    for gate in gates:
+        if isinstance(gate, OrbitalRotationGate):
+            current_basis = _compose(gate.mat, current_basis)
+            continue
+        if gate.orbital_rotation is not None:
+            current_basis = _compose(_adjoint(gate.orbital_rotation), current_basis)
+        if current_basis is not None:
+            merged.append(OrbitalRotationGate(current_basis))
+        merged.append(dataclasses.replace(gate, orbital_rotation=None))
+        current_basis = gate.orbital_rotation
+    if current_basis is not None:
+        merged.append(OrbitalRotationGate(current_basis))
+    return merged
+
+
+def apply_gates(
+    vec: np.ndarray,
+    gates: Iterable[Gate],
+    norb: int,
+    nelec: int | tuple[int, int],
+    *,
+    copy: bool = True,
+) -> np.ndarray:
+    """Apply a sequence of gates to a vector.
+
+    The orbital rotations of the gates are first merged with
+    :func:`merge_orbital_rotations`.
+
+    Args:
+        vec: The state vector to be transformed. To transform a batch of state
+            vectors at once, pass a two-dimensional array of shape
+            ``(batch, dim)`` whose rows are the state vectors.
+        gates: The gates, in the order in which they are applied.
+        norb: The number of spatial orbitals.
+        nelec: Either a single integer representing the number of fermions for a
+            spinless system, or a pair of integers storing the numbers of spin alpha
+            and spin beta fermions.
+        copy: Whether to copy the vector before operating on it.
+
+            - If `copy=True` then this function always returns a newly allocated
+              vector and the original vector is left untouched.
+            - If `copy=False` then this function may still return a newly allocated
+              vector, but the original vector may have its data overwritten.
+              It is also possible that the original vector is returned,
+              modified in-place.
+
+    Returns:
+        The transformed vector, with the same shape as the input vector.
+    """
+    if copy:
+        vec = vec.copy()
+    for gate in merge_orbital_rotations(gates):
+        vec = gate._apply_unitary_(vec, norb=norb, nelec=nelec, copy=False)
+    return vec
+
+
+def _adjoint(mat: _OrbitalRotation) -> _OrbitalRotation:
+    if isinstance(mat, np.ndarray) and mat.ndim == 2:
+        return mat.T.conj()
+    mat_a, mat_b = mat
+    return (
+        None if mat_a is None else mat_a.T.conj(),
+        None if mat_b is None else mat_b.T.conj(),
+    )
+
+
+def _compose(
+    second: _OrbitalRotation, first: _OrbitalRotation | None
+) -> _OrbitalRotation:
+    """Return the orbital rotation that applies first, then second."""
+    if first is None:
+        return second
+    if isinstance(second, np.ndarray) and second.ndim == 2:
+        if isinstance(first, np.ndarray) and first.ndim == 2:
+            return second @ first
+        second = (second, second)
+    elif isinstance(first, np.ndarray) and first.ndim == 2:
+        first = (first, first)
+    second_a, second_b = second
+    first_a, first_b = first
+    return (_compose_mats(second_a, first_a), _compose_mats(second_b, first_b))
+
+
+def _compose_mats(
+    second: np.ndarray | None, first: np.ndarray | None
+) -> np.ndarray | None:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return second @ first
@@ -86,7 +86,9 @@ def apply_num_op_sum_evolution(
     :math:`\mathcal{U}` is an optional orbital rotation.
 
     Args:
-        vec: The state vector to be transformed.
+        vec: The state vector to be transformed. To transform a batch of state
+            vectors at once, pass a two-dimensional array of shape
+            ``(batch, dim)`` whose rows are the state vectors.
         coeffs: The coefficients of the linear combination.
             You can pass either a single Numpy array specifying the coefficients
             to apply to both spin sectors, or you can pass a pair of Numpy arrays
@@ -116,7 +118,7 @@ def apply_num_op_sum_evolution(
               modified in-place.
 
     Returns:
-        The evolved state vector.
+        The evolved state vector, with the same shape as the input vector.
     """
     if copy:
         vec = vec.copy()
@@ -157,9 +159,10 @@ def _apply_num_op_sum_evolution_spinless(
             nelec,
             copy=False,
         )
-    vec = vec.reshape((-1, 1))
+    shape = vec.shape
+    vec = vec.reshape((-1, math.comb(norb, nelec), 1))
     apply_num_op_sum_evolution_in_place(vec, phases, occupations=occupations)
-    vec = vec.reshape(-1)
+    vec = vec.reshape(shape)
     if orbital_rotation is not None:
         vec = apply_orbital_rotation(
             vec,
@@ -179,12 +182,7 @@ def _apply_num_op_sum_evolution_spinful(
     nelec: tuple[int, int],
     orbital_rotation: np.ndarray | tuple[np.ndarray | None, np.ndarray | None] | None,
 ) -> np.ndarray:
-    phases_a, phases_b = _get_phases(coeffs, time=time)
-    n_alpha, n_beta = nelec
-    dim_a = math.comb(norb, n_alpha)
-    dim_b = math.comb(norb, n_beta)
-    occupations_a = gen_occslst(range(norb), n_alpha)
-    occupations_b = gen_occslst(range(norb), n_beta)
+    phases = _get_phases(coeffs, time=time)
 
     if orbital_rotation is not None:
         vec = apply_orbital_rotation(
@@ -195,16 +193,7 @@ def _apply_num_op_sum_evolution_spinful(
             copy=False,
         )
 
-    vec = vec.reshape((dim_a, dim_b))
-    if phases_a is not None:
-        # apply alpha
-        apply_num_op_sum_evolution_in_place(vec, phases_a, occupations=occupations_a)
-    if phases_b is not None:
-        # apply beta
-        vec = vec.T
-        apply_num_op_sum_evolution_in_place(vec, phases_b, occupations=occupations_b)
-        vec = vec.T
-    vec = vec.reshape(-1)
+    vec = _apply_num_op_sum_phases(vec, phases, norb=norb, nelec=nelec)
 
     if orbital_rotation is not None:
         vec = apply_orbital_rotation(
@@ -218,6 +207,43 @@ def _apply_num_op_sum_evolution_spinful(
     return vec
 
 
+def _apply_num_op_sum_phases(
+    vec: np.ndarray,
+    phases: tuple[np.ndarray | None, np.ndarray | None],
+    norb: int,
+    nelec: tuple[int, int],
+) -> np.ndarray:
+    """Apply a number operator sum evolution given its phases.
+
+    Args:
+        vec: The state vector or batch of state vectors to be transformed.
+        phases: The alpha and beta phases, as returned by :func:`_get_phases`.
+        norb: The number of spatial orbitals.
+        nelec: The numbers of spin alpha and spin beta fermions.
+
+    Returns:
+        The evolved state vector, with the same shape as the input vector.
+        The input vector is modified in-place.
+    """
+    phases_a, phases_b = phases
+    n_alpha, n_beta = nelec
+    dim_a = math.comb(norb, n_alpha)
+    dim_b = math.comb(norb, n_beta)
+    shape = vec.shape
+    vec = vec.reshape((-1, dim_a, dim_b))
+    if phases_a is not None:
+        # apply alpha
+        occupations_a = gen_occslst(range(norb), n_alpha)
+        apply_num_op_sum_evolution_in_place(vec, phases_a, occupations=occupations_a)
+    if phases_b is not None:
+        # apply beta
+        occupations_b = gen_occslst(range(norb), n_beta)
+        vec = vec.transpose(0, 2, 1)
+        apply_num_op_sum_evolution_in_place(vec, phases_b, occupations=occupations_b)
+        vec = vec.transpose(0, 2, 1)
+    return vec.reshape(shape)
+
+
 def _get_phases(
     coeffs: np.ndarray | tuple[np.ndarray | None, np.ndarray | None], time: float
 ) -> tuple[np.ndarray | None, np.ndarray | None]:
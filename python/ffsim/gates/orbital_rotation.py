@@ -13,15 +13,21 @@
 from __future__ import annotations
 
 import math
+import mmap
 from functools import cache
-from typing import cast, overload
+from typing import NamedTuple, cast, overload
 
 import numpy as np
 from pyscf.fci import cistring
 
-from ffsim._lib import apply_givens_rotation_in_place, apply_phase_shift_in_place
+from ffsim._lib import apply_givens_rotations_in_place
+from ffsim.cistring import gen_occslst
 from ffsim.linalg import GivensRotation, givens_decomposition
 
+# Number of vector entries processed at a time when transforming a memory-mapped
+# vector. At 16 bytes per entry this corresponds to 64 MiB.
+_MEMMAP_BLOCK_SIZE = 1 << 22
+
 
 @overload
 def apply_orbital_rotation(
@@ -68,7 +74,9 @@ def apply_orbital_rotation(
         \log(U^{(\sigma)})_{ij} a^\dagger_{\sigma, i} a_{\sigma, j}\right)
 
     Args:
-        vec: The state vector to be transformed.
+        vec: The state vector to be transformed. To transform a batch of state
+            vectors at once, pass a two-dimensional array of shape
+            ``(batch, dim)`` whose rows are the state vectors.
         mat: The unitary matrix :math:`U` describing the orbital rotation.
             You can pass either a single Numpy array specifying the orbital rotation
             to apply to both spin sectors, or you can pass a pair of Numpy arrays
@@ -89,8 +97,15 @@ def apply_orbital_rotation(
               It is also possible that the original vector is returned,
               modified in-place.
 
+            If the vector is backed by a memory-mapped file, such as one created by
+            :func:`ffsim.memmap_state_vector`, pass `copy=False` to transform it
+            in-place on disk. A spinful vector is then processed in blocks, so only
+            a bounded amount of it is held in memory at a time. A spinless vector
+            is transformed directly in the mapped memory without blocking, because
+            each Givens rotation mixes entries across the whole vector.
+
     Returns:
-        The rotated vector.
+        The rotated vector, with the same shape as the input vector.
     """
     if copy:
         vec = vec.copy()
@@ -99,19 +114,20 @@ def apply_orbital_rotation(
     return _apply_orbital_rotation_spinful(vec, mat, norb, nelec)
 
 
+class _GivensArrays(NamedTuple):
+    """A Givens decomposition unpacked into the arrays used by the Rust kernel."""
+
+    cs: np.ndarray
+    ss: np.ndarray
+    target_orbs: np.ndarray
+    phase_shifts: np.ndarray
+
+
 def _apply_orbital_rotation_spinless(
     vec: np.ndarray, mat: np.ndarray, norb: int, nelec: int
 ):
-    givens_rotations, phase_shifts = givens_decomposition(mat)
-    vec = np.ascontiguousarray(vec.reshape((-1, 1)))
-    for c, s, i, j in givens_rotations:
-        _apply_orbital_rotation_adjacent_spin_in_place(
-            vec, c, s.conjugate(), (i, j), norb, nelec
-        )
-    for i, phase_shift in enumerate(phase_shifts):
-        indices = _one_subspace_indices(norb, nelec, (i,))
-        apply_phase_shift_in_place(vec, phase_shift, indices)
-    return vec.reshape(-1)
+    givens_arrays = _givens_arrays(givens_decomposition(mat))
+    return _apply_givens_arrays_spinless(vec, givens_arrays, norb, nelec)
 
 
 def _apply_orbital_rotation_spinful(
@@ -120,83 +136,187 @@ def _apply_orbital_rotation_spinful(
     norb: int,
     nelec: tuple[int, int],
 ):
-    givens_decomp_a, givens_decomp_b = _get_givens_decomposition(mat)
+    givens_arrays_a, givens_arrays_b = _get_givens_arrays(mat)
+    return _apply_givens_arrays_spinful(
+        vec, givens_arrays_a, givens_arrays_b, norb, nelec
+    )
+
+
+def _apply_givens_arrays_spinless(
+    vec: np.ndarray, givens_arrays: _GivensArrays, norb: int, nelec: int
+) -> np.ndarray:
+    shape = vec.shape
+    vec = np.ascontiguousarray(vec.reshape((-1, math.comb(norb, nelec), 1)))
+    _apply_givens_arrays_in_place(vec, givens_arrays, norb, nelec)
+    return vec.reshape(shape)
+
+
+def _apply_givens_arrays_spinful(
+    vec: np.ndarray,
+    givens_arrays_a: _GivensArrays | None,
+    givens_arrays_b: _GivensArrays | None,
+    norb: int,
+    nelec: tuple[int, int],
+) -> np.ndarray:
     n_alpha, n_beta = nelec
     dim_a = math.comb(norb, n_alpha)
     dim_b = math.comb(norb, n_beta)
-    vec = np.ascontiguousarray(vec.reshape((dim_a, dim_b)))
+    shape = vec.shape
+    if _is_memory_mapped(vec):
+        _apply_givens_arrays_spinful_blocked(
+            vec.reshape((-1, dim_a, dim_b)),
+            givens_arrays_a,
+            givens_arrays_b,
+            norb,
+            nelec,
+        )
+        return vec
+    vec = np.ascontiguousarray(vec.reshape((-1, dim_a, dim_b)))
 
-    if givens_decomp_a is not None:
+    if givens_arrays_a is not None:
         # transform alpha
-        givens_rotations, phase_shifts = givens_decomp_a
-        for c, s, i, j in givens_rotations:
-            _apply_orbital_rotation_adjacent_spin_in_place(
-                vec, c, s.conjugate(), (i, j), norb, n_alpha
-            )
-        for i, phase_shift in enumerate(phase_shifts):
-            indices = _one_subspace_indices(norb, n_alpha, (i,))
-            apply_phase_shift_in_place(vec, phase_shift, indices)
-
-    if givens_decomp_b is not None:
+        _apply_givens_arrays_in_place(vec, givens_arrays_a, norb, n_alpha)
+
+    if givens_arrays_b is not None:
         # transform beta
         # copy transposed vector to align memory layout
-        vec = np.ascontiguousarray(vec.T)
-        givens_rotations, phase_shifts = givens_decomp_b
-        for c, s, i, j in givens_rotations:
-            _apply_orbital_rotation_adjacent_spin_in_place(
-                vec, c, s.conjugate(), (i, j), norb, n_beta
-            )
-        for i, phase_shift in enumerate(phase_shifts):
-            indices = _one_subspace_indices(norb, n_beta, (i,))
-            apply_phase_shift_in_place(vec, phase_shift, indices)
-        vec = vec.T
+        vec = np.ascontiguousarray(vec.transpose(0, 2, 1))
+        _apply_givens_arrays_in_place(vec, givens_arrays_b, norb, n_beta)
+        vec = vec.transpose(0, 2, 1)
 
-    return vec.reshape(-1)
+    return vec.reshape(shape)
 
 
-def _get_givens_decomposition(
-    mat: np.ndarray | tuple[np.ndarray | None, np.ndarray | None],
-) -> tuple[
-    tuple[list[GivensRotation], np.ndarray] | None,
-    tuple[list[GivensRotation], np.ndarray] | None,
-]:
-    if isinstance(mat, np.ndarray) and mat.ndim == 2:
-        decomp = givens_decomposition(mat)
-        return decomp, decomp
-    else:
-        mat_a, mat_b = mat
-        decomp_a = None
-        decomp_b = None
-        if mat_a is not None:
-            decomp_a = givens_decomposition(mat_a)
-        if mat_b is not None:
-            decomp_b = givens_decomposition(mat_b)
-        return decomp_a, decomp_b
+def _is_memory_mapped(vec: np.ndarray) -> bool:
+    """Return whether an array is a view of a memory-mapped file.
+
+    Copies of a :class:`numpy.memmap` are still instances of it but live in memory.
+    They have no ``filename``, and their ``base`` does not lead to a memory map.
+    """
+    base: object = vec
+    while base is not None:
+        if getattr(base, "filename", None) is not None or isinstance(base, mmap.mmap):
+            return True
+        base = getattr(base, "base", None)
+    return False
 
 
-def _apply_orbital_rotation_adjacent_spin_in_place(
+def _apply_givens_arrays_spinful_blocked(
     vec: np.ndarray,
-    c: float,
-    s: complex,
-    target_orbs: tuple[int, int],
+    givens_arrays_a: _GivensArrays | None,
+    givens_arrays_b: _GivensArrays | None,
+    norb: int,
+    nelec: tuple[int, int],
+) -> None:
+    """Transform a memory-mapped batch of vectors in-place, one block at a time.
+
+    Each pass reads every entry of the vector once. The alpha pass copies blocks of
+    columns into a contiguous buffer, and the beta pass copies blocks of rows into a
+    transposed buffer, so that the Givens rotations are applied to rows of the buffer
+    as usual. Each block is written back before the next one is read.
+
+    Args:
+        vec: Memory-mapped batch of vectors with shape ``(batch, dim_a, dim_b)``.
+        givens_arrays_a: The Givens arrays for spin alpha, or None.
+        givens_arrays_b: The Givens arrays for spin beta, or None.
+        norb: Number of spatial orbitals.
+        nelec: Number of alpha and beta fermions.
+    """
+    n_alpha, n_beta = nelec
+    _, dim_a, dim_b = vec.shape
+    for this_vec in vec:
+        if givens_arrays_a is not None:
+            block_size = max(1, _MEMMAP_BLOCK_SIZE // dim_a)
+            for start in range(0, dim_b, block_size):
+                block = slice(start, start + block_size)
+                buf = np.ascontiguousarray(this_vec[None, :, block])
+                _apply_givens_arrays_in_place(buf, givens_arrays_a, norb, n_alpha)
+                this_vec[:, block] = buf[0]
+        if givens_arrays_b is not None:
+            block_size = max(1, _MEMMAP_BLOCK_SIZE // dim_b)
+            for start in range(0, dim_a, block_size):
+                block = slice(start, start + block_size)
+                buf = np.ascontiguousarray(this_vec[None, block].transpose(0, 2, 1))
+                _apply_givens_arrays_in_place(buf, givens_arrays_b, norb, n_beta)
+                this_vec[block] = buf[0].T
+
+
+def _apply_givens_arrays_in_place(
+    vec: np.ndarray,
+    givens_arrays: _GivensArrays,
     norb: int,
     nocc: int,
 ) -> None:
-    """Apply an orbital rotation to adjacent orbitals.
+    """Apply a Givens decomposition to a batch of vectors in a single kernel call.
 
     Args:
-        vec: Vector to be transformed.
-        mat: A 2x2 unitary matrix describing the orbital rotation.
-        target_orbs: The orbitals to transform.
+        vec: Batch of vectors to be transformed, with shape ``(batch, rows, columns)``
+            and rows indexed by the strings of the spin sector being transformed.
+        givens_arrays: The Givens rotations and phase shifts, as returned by
+            :func:`_givens_arrays`.
         norb: Number of spatial orbitals.
-        nelec: Number of alpha and beta electrons.
+        nocc: Number of fermions in the spin sector being transformed.
     """
-    i, j = target_orbs
-    assert i == j + 1 or i == j - 1, "Target orbitals must be adjacent."
-    indices = _zero_one_subspace_indices(norb, nocc, target_orbs)
-    slice1 = indices[: len(indices) // 2]
-    slice2 = indices[len(indices) // 2 :]
-    apply_givens_rotation_in_place(vec, c, s, slice1, slice2)
+    cs, ss, target_orbs, phase_shifts = givens_arrays
+    apply_givens_rotations_in_place(
+        vec,
+        cs,
+        ss,
+        target_orbs,
+        _adjacent_zero_one_subspace_indices(norb, nocc),
+        phase_shifts,
+        gen_occslst(range(norb), nocc),
+    )
+
+
+def _givens_arrays(
+    givens_decomp: tuple[list[GivensRotation], np.ndarray],
+) -> _GivensArrays:
+    """Unpack a Givens decomposition into arrays.
+
+    Args:
+        givens_decomp: The Givens rotations and phase shifts, as returned by
+            :func:`ffsim.linalg.givens_decomposition`.
+
+    Returns:
+        The rotation cosines, the conjugated rotation sines, the target orbitals
+        of the rotations, and the phase shifts.
+    """
+    givens_rotations, phase_shifts = givens_decomp
+    n_rotations = len(givens_rotations)
+    cs = np.fromiter(
+        (c for c, _, _, _ in givens_rotations), dtype=float, count=n_rotations
+    )
+    ss = np.fromiter(
+        (s.conjugate() for _, s, _, _ in givens_rotations),
+        dtype=complex,
+        count=n_rotations,
+    )
+    target_orbs = np.fromiter(
+        (orb for _, _, i, j in givens_rotations for orb in (i, j)),
+        dtype=np.uint,
+        count=2 * n_rotations,
+    ).reshape((n_rotations, 2))
+    return _GivensArrays(
+        cs, ss, target_orbs, np.ascontiguousarray(phase_shifts, dtype=complex)
+    )
+
+
+def _get_givens_arrays(
+    mat: np.ndarray | tuple[np.ndarray | None, np.ndarray | None],
+) -> tuple[_GivensArrays | None, _GivensArrays | None]:
+    if isinstance(mat, np.ndarray) and mat.ndim == 2:
+        givens_arrays = _givens_arrays(givens_decomposition(mat))
+        return givens_arrays, givens_arrays
+    else:
+        mat_a, mat_b = mat
+        givens_arrays_a = None
+        givens_arrays_b = None
+        if mat_a is not None:
+            givens_arrays_a = _givens_arrays(givens_decomposition(mat_a))
+        if mat_b is not None:
+            givens_arrays_b = _givens_arrays(givens_decomposition(mat_b))
+        return givens_arrays_a, givens_arrays_b
 
 
 @cache
@@ -212,6 +332,20 @@ def _zero_one_subspace_indices(
     return indices[n00 : len(indices) - n11].astype(np.uint, copy=False)
 
 
+@cache
+def _adjacent_zero_one_subspace_indices(norb: int, nocc: int) -> np.ndarray:
+    """Return the 01 and 10 subspace indices for each pair of adjacent orbitals.
+
+    Row :math:`k` of the returned array holds the indices where orbitals
+    :math:`(k, k + 1)` are 10 followed by the indices where they are 01.
+    """
+    if norb < 2:
+        return np.zeros((0, 0), dtype=np.uint)
+    return np.stack(
+        [_zero_one_subspace_indices(norb, nocc, (k, k + 1)) for k in range(norb - 1)]
+    )
+
+
 @cache
 def _one_subspace_indices(
     norb: int, nocc: int, target_orbs: tuple[int, ...]
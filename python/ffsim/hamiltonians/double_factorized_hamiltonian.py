@@ -20,6 +20,7 @@ from ffsim.contract.diag_coulomb import diag_coulomb_linop
 from ffsim.contract.num_op_sum import num_op_sum_linop
 from ffsim.hamiltonians.molecular_hamiltonian import MolecularHamiltonian
 from ffsim.linalg import double_factorized
+from ffsim.linalg.packed import exchange_trace
 from ffsim.operators import FermionOperator
 from ffsim.protocols import fermion_operator
 from ffsim.states import dim
@@ -146,6 +147,7 @@ class DoubleFactorizedHamiltonian:
         options: dict | None = None,
         diag_coulomb_indices: list[tuple[int, int]] | None = None,
         cholesky: bool = True,
+        initial_decomposition: tuple[np.ndarray, np.ndarray] | None = None,
     ) -> DoubleFactorizedHamiltonian:
         r"""Initialize a DoubleFactorizedHamiltonian from a MolecularHamiltonian.
 
@@ -153,7 +155,8 @@ class DoubleFactorizedHamiltonian:
         one-body tensor, two-body tensor, and constant. It performs a double-factorized
         decomposition of the two-body tensor and computes a new one-body tensor
         and constant, and returns a :class:`DoubleFactorizedHamiltonian` storing the
-        results.
+        results. If the two-body tensor is stored in compressed format, the
+        decomposition is computed without expanding it, unless `optimize` is True.
 
         See :class:`DoubleFactorizedHamiltonian` for a description of the
         `z_representation` argument. See :func:`ffsim.linalg.double_factorized` for a
@@ -187,12 +190,17 @@ class DoubleFactorizedHamiltonian:
                 decomposition. If False, a full eigenvalue decomposition is used
                 instead, which can be much more expensive. This argument is ignored if
                 `optimize` is set to True.
+            initial_decomposition: The diagonal Coulomb matrices and orbital rotations
+                from which to start the optimization, in the number representation.
+                This is useful for warm-starting the decomposition from that of a
+                nearby geometry. This argument is only used if `optimize` is set to
+                True.
 
         Returns:
             The double-factorized Hamiltonian.
         """
-        one_body_tensor = hamiltonian.one_body_tensor - 0.5 * np.einsum(
-            "prqr", hamiltonian.two_body_tensor
+        one_body_tensor = hamiltonian.one_body_tensor - 0.5 * exchange_trace(
+            hamiltonian.two_body_tensor, hamiltonian.norb
         )
 
         diag_coulomb_mats, orbital_rotations = double_factorized(
@@ -205,6 +213,7 @@ class DoubleFactorizedHamiltonian:
             options=options,
             diag_coulomb_indices=diag_coulomb_indices,
             cholesky=cholesky,
+            initial_decomposition=initial_decomposition,
         )
         df_hamiltonian = DoubleFactorizedHamiltonian(
             one_body_tensor=one_body_tensor,
@@ -15,12 +15,28 @@ import itertools
 
 import numpy as np
 from opt_einsum import contract
-from pyscf.fci.direct_nosym import absorb_h1e, contract_2e, make_hdiag
+from pyscf import ao2mo
+from pyscf.fci import cistring, direct_spin1
+from pyscf.fci.direct_nosym import absorb_h1e, make_hdiag
 from scipy.sparse.linalg import LinearOperator
 
-from ffsim.cistring import gen_linkstr_index
+from ffsim._lib import contract_two_body_into_buffer
+from ffsim.cistring import gen_linkstr_index, gen_occslst
+from ffsim.linalg.packed import (
+    coulomb_exchange_diagonals,
+    exchange_trace,
+    pack_two_body_tensor,
+    pair_indices,
+    two_body_symmetry,
+    unpack_two_body_tensor,
+)
 from ffsim.operators import FermionOperator, cre_a, cre_b, des_a, des_b
-from ffsim.states import dim
+from ffsim.states import dim, dims
+from ffsim.states.states import _complex_dtype
+
+# Maximum number of entries in each of the intermediate buffers of the two-body
+# contraction, which are of size (block_size, dim_b, norb**2)
+_TWO_BODY_BLOCK_ENTRIES = 1 << 22
 
 
 @dataclasses.dataclass(frozen=True)
@@ -39,9 +55,18 @@ class MolecularHamiltonian:
     Here :math:`h_{pq}` is called the one-body tensor and :math:`h_{pqrs}` is called
     the two-body tensor.
 
+    A real two-body tensor with the 8-fold permutational symmetry of the electron
+    repulsion integrals can be stored in a compressed format, as in PySCF: a
+    2-dimensional array with 4-fold symmetry, or a 1-dimensional array with 8-fold
+    symmetry. This reduces the memory needed to store the tensor by a factor of about
+    4 or 8. Rotating the Hamiltonian by a real orbital rotation, constructing its
+    linear operator, and computing its diagonal all work directly with the compressed
+    tensor. See :meth:`packed`.
+
     Attributes:
         one_body_tensor (np.ndarray): The one-body tensor.
-        two_body_tensor (np.ndarray): The two-body tensor.
+        two_body_tensor (np.ndarray): The two-body tensor, either as a 4-dimensional
+            array or in a compressed format.
         constant (float): The constant.
     """
 
@@ -54,6 +79,49 @@ class MolecularHamiltonian:
         """The number of spatial orbitals."""
         return self.one_body_tensor.shape[0]
 
+    @property
+    def two_body_symmetry(self) -> int:
+        """The permutational symmetry used to store the two-body tensor.
+
+        This is 1 if the two-body tensor is stored in full as a 4-dimensional array,
+        4 if it is stored with 4-fold symmetry as a 2-dimensional array, and 8 if it is
+        stored with 8-fold symmetry as a 1-dimensional array.
+        """
+        return two_body_symmetry(self.two_body_tensor)
+
+    def packed(self, symmetry: int = 8) -> MolecularHamiltonian:
+        """Return the Hamiltonian with the two-body tensor stored in compressed format.
+
+        The two-body tensor must be real and have the 8-fold permutational symmetry of
+        the electron repulsion integrals.
+
+        Args:
+            symmetry: The permutational symmetry to use to store the two-body tensor.
+                Can be 4 or 8.
+
+        Returns:
+            The Hamiltonian with the two-body tensor stored in compressed format.
+        """
+        if symmetry not in (4, 8):
+            raise ValueError(f"symmetry must be 4 or 8. Got {symmetry}.")
+        if np.iscomplexobj(self.two_body_tensor):
+            raise ValueError("Complex two-body tensors cannot be stored compressed.")
+        return MolecularHamiltonian(
+            one_body_tensor=self.one_body_tensor,
+            two_body_tensor=pack_two_body_tensor(
+                self.two_body_tensor, self.norb, symmetry
+            ),
+            constant=self.constant,
+        )
+
+    def unpacked(self) -> MolecularHamiltonian:
+        """Return the Hamiltonian with the two-body tensor stored in full."""
+        return MolecularHamiltonian(
+            one_body_tensor=self.one_body_tensor,
+            two_body_tensor=unpack_two_body_tensor(self.two_body_tensor, self.norb),
+            constant=self.constant,
+        )
+
     def rotated(self, orbital_rotation: np.ndarray) -> MolecularHamiltonian:
         r"""Return the Hamiltonian in a rotated orbital basis.
 
@@ -65,6 +133,11 @@ class MolecularHamiltonian:
 
         where :math:`H` is the original Hamiltonian.
 
+        If the two-body tensor is stored in compressed format and the orbital rotation
+        is real, then the rotated two-body tensor is computed and returned in the same
+        format. If the orbital rotation is complex, the rotated two-body tensor does
+        not have 8-fold symmetry, so it is returned in full.
+
         Args:
             orbital_rotation: The orbital rotation.
 
@@ -78,9 +151,23 @@ class MolecularHamiltonian:
             orbital_rotation.conj(),
             optimize="greedy",
         )
+        symmetry = self.two_body_symmetry
+        if symmetry != 1 and not np.any(np.imag(orbital_rotation)):
+            two_body_tensor_rotated = pack_two_body_tensor(
+                ao2mo.incore.full(
+                    self.two_body_tensor, np.real(orbital_rotation).T, compact=True
+                ),
+                self.norb,
+                symmetry,
+            )
+            return MolecularHamiltonian(
+                one_body_tensor=one_body_tensor_rotated,
+                two_body_tensor=two_body_tensor_rotated,
+                constant=self.constant,
+            )
         two_body_tensor_rotated = contract(
             "abcd,Aa,Bb,Cc,Dd->ABCD",
-            self.two_body_tensor,
+            unpack_two_body_tensor(self.two_body_tensor, self.norb),
             orbital_rotation,
             orbital_rotation.conj(),
             orbital_rotation,
@@ -95,25 +182,78 @@ class MolecularHamiltonian:
 
     def _linear_operator_(self, norb: int, nelec: tuple[int, int]) -> LinearOperator:
         """Return a SciPy LinearOperator representing the object."""
+        if self.two_body_symmetry != 1 and np.isrealobj(self.one_body_tensor):
+            return self._packed_linear_operator(norb, nelec)
         n_alpha, n_beta = nelec
         linkstr_index_a = gen_linkstr_index(range(norb), n_alpha)
         linkstr_index_b = gen_linkstr_index(range(norb), n_beta)
-        link_index = (linkstr_index_a, linkstr_index_b)
         two_body = absorb_h1e(
+            self.one_body_tensor,
+            unpack_two_body_tensor(self.two_body_tensor, norb),
+            norb,
+            nelec,
+            0.5,
+        )
+        two_body = np.ascontiguousarray(
+            two_body.reshape((norb**2, norb**2)), dtype=complex
+        )
+        shape = dims(norb, nelec)
+        _, dim_b = shape
+        block_size = max(1, _TWO_BODY_BLOCK_ENTRIES // (dim_b * norb**2 or 1))
+
+        def matvec(vec: np.ndarray):
+            vec = vec.reshape(shape).astype(_complex_dtype(vec), copy=False)
+            result = np.zeros_like(vec)
+            contract_two_body_into_buffer(
+                vec,
+                two_body,
+                norb,
+                linkstr_index_a,
+                linkstr_index_b,
+                out=result,
+                block_size=block_size,
+            )
+            if self.constant:
+                result += self.constant * vec
+            return result.reshape(-1)
+
+        dim_ = dim(norb, nelec)
+        return LinearOperator(
+            shape=(dim_, dim_), matvec=matvec, rmatvec=matvec, dtype=complex
+        )
+
+    def _packed_linear_operator(
+        self, norb: int, nelec: tuple[int, int]
+    ) -> LinearOperator:
+        n_alpha, n_beta = nelec
+        link_index = (
+            cistring.gen_linkstr_index_trilidx(range(norb), n_alpha),
+            cistring.gen_linkstr_index_trilidx(range(norb), n_beta),
+        )
+        two_body = _absorb_h1e_packed(
             self.one_body_tensor, self.two_body_tensor, norb, nelec, 0.5
         )
+        shape = dims(norb, nelec)
 
         def matvec(vec: np.ndarray):
-            result = contract_2e(
+            dtype = _complex_dtype(vec)
+            vec = vec.reshape(shape)
+            result = direct_spin1.contract_2e(
+                two_body,
+                np.ascontiguousarray(vec.real, dtype=float),
+                norb,
+                nelec,
+                link_index,
+            ) + 1j * direct_spin1.contract_2e(
                 two_body,
-                vec.astype(complex, copy=False),
+                np.ascontiguousarray(vec.imag, dtype=float),
                 norb,
                 nelec,
-                link_index=link_index,
+                link_index,
             )
             if self.constant:
                 result += self.constant * vec
-            return result
+            return result.reshape(-1).astype(dtype, copy=False)
 
         dim_ = dim(norb, nelec)
         return LinearOperator(
@@ -129,6 +269,11 @@ class MolecularHamiltonian:
                 "Computing diagonal of complex molecular Hamiltonian is not yet "
                 "supported."
             )
+        if self.two_body_symmetry != 1:
+            return (
+                _diag_packed(self.one_body_tensor, self.two_body_tensor, norb, nelec)
+                + self.constant
+            )
         return (
             make_hdiag(self.one_body_tensor, self.two_body_tensor, norb, nelec)
             + self.constant
@@ -145,8 +290,9 @@ class MolecularHamiltonian:
                     (cre_b(p), des_b(q)): coeff,
                 }
             )
+        two_body_tensor = unpack_two_body_tensor(self.two_body_tensor, self.norb)
         for p, q, r, s in itertools.product(range(self.norb), repeat=4):
-            coeff = 0.5 * self.two_body_tensor[p, q, r, s]
+            coeff = 0.5 * two_body_tensor[p, q, r, s]
             op += FermionOperator(
                 {
                     (cre_a(p), cre_a(r), des_a(s), des_a(q)): coeff,
@@ -165,9 +311,68 @@ class MolecularHamiltonian:
                 self.one_body_tensor, other.one_body_tensor, rtol=rtol, atol=atol
             ):
                 return False
+            two_body_tensor = self.two_body_tensor
+            other_two_body_tensor = other.two_body_tensor
+            if self.two_body_symmetry != other.two_body_symmetry:
+                two_body_tensor = unpack_two_body_tensor(two_body_tensor, self.norb)
+                other_two_body_tensor = unpack_two_body_tensor(
+                    other_two_body_tensor, other.norb
+                )
             if not np.allclose(
-                self.two_body_tensor, other.two_body_tensor, rtol=rtol, atol=atol
+                two_body_tensor, other_two_body_tensor, rtol=rtol, atol=atol
             ):
                 return False
             return True
         return NotImplemented
+
+
+def _absorb_h1e_packed(
+    one_body_tensor: np.ndarray,
+    two_body_tensor: np.ndarray,
+    norb: int,
+    nelec: tuple[int, int],
+    factor: float,
+) -> np.ndarray:
+    """Absorb the one-body tensor into a compressed two-body tensor.
+
+    This is the same as pyscf.fci.direct_spin1.absorb_h1e, but it never expands the
+    two-body tensor. The result has 4-fold symmetry.
+    """
+    one_body = one_body_tensor - 0.5 * exchange_trace(two_body_tensor, norb)
+    one_body *= 1 / (sum(nelec) + 1e-100)
+    packed_one_body = one_body[np.tril_indices(norb)]
+    diag_pairs = np.diagonal(pair_indices(norb))
+    result = pack_two_body_tensor(two_body_tensor, norb, 4).copy()
+    result[diag_pairs] += packed_one_body
+    result[:, diag_pairs] += packed_one_body[:, None]
+    return result * factor
+
+
+def _diag_packed(
+    one_body_tensor: np.ndarray,
+    two_body_tensor: np.ndarray,
+    norb: int,
+    nelec: tuple[int, int],
+) -> np.ndarray:
+    """Return the diagonal of a Hamiltonian with a compressed two-body tensor."""
+    n_alpha, n_beta = nelec
+    coulomb, exchange = coulomb_exchange_diagonals(two_body_tensor, norb)
+    one_body_diag = np.diagonal(one_body_tensor).real
+    occupations_a = _occupations(norb, n_alpha)
+    occupations_b = _occupations(norb, n_beta)
+    # Energies of each spin sector, and interaction energies between the sectors
+    energies_a = occupations_a @ one_body_diag + 0.5 * np.einsum(
+        "ap,pq,aq->a", occupations_a, coulomb - exchange, occupations_a
+    )
+    energies_b = occupations_b @ one_body_diag + 0.5 * np.einsum(
+        "bp,pq,bq->b", occupations_b, coulomb - exchange, occupations_b
+    )
+    interactions = occupations_a @ coulomb @ occupations_b.T
+    return (energies_a[:, None] + energies_b[None, :] + interactions).reshape(-1)
+
+
+def _occupations(norb: int, nocc: int) -> np.ndarray:
+    occslst = gen_occslst(range(norb), nocc)
+    occupations = np.zeros((len(occslst), norb))
+    occupations[np.arange(len(occslst))[:, None], occslst] = 1
+    return occupations
@@ -22,6 +22,7 @@ from ffsim.linalg.double_factorized_decomposition import (
     _truncated_eigh,
     modified_cholesky,
 )
+from ffsim.linalg.packed import unpack_two_body_tensor
 from ffsim.states import dim
 
 
@@ -104,11 +105,12 @@ class SingleFactorizedHamiltonian:
                 constant=hamiltonian.constant,
             )
 
+        two_body_tensor = unpack_two_body_tensor(hamiltonian.two_body_tensor, norb)
         one_body_tensor = hamiltonian.one_body_tensor - 0.5 * np.einsum(
-            "prqr", hamiltonian.two_body_tensor
+            "prqr", two_body_tensor
         )
 
-        reshaped_tensor = np.reshape(hamiltonian.two_body_tensor, (norb**2, norb**2))
+        reshaped_tensor = np.reshape(two_body_tensor, (norb**2, norb**2))
 
         if cholesky:
             cholesky_vecs = modified_cholesky(
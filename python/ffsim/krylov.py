@@ -0,0 +1,70 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Hamiltonian simulation via Krylov subspace projection."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+import numpy as np
+from scipy.sparse.linalg import LinearOperator
+
+from ffsim import linalg, protocols
+
+
+def simulate_krylov(
+    vec: np.ndarray,
+    hamiltonian: Any,
+    times: Sequence[float],
+    *,
+    norb: int,
+    nelec: tuple[int, int],
+    hermitian: bool = True,
+    krylov_dim: int = 30,
+    tol: float = 1e-12,
+) -> Iterator[np.ndarray]:
+    r"""Hamiltonian simulation using Krylov subspace projection.
+
+    Computes :math:`e^{-i t H} v` for each requested time :math:`t`, where :math:`H` is
+    the Hamiltonian and :math:`v` is the initial state vector. The states are computed
+    lazily as the returned iterator is advanced, and the work done to reach one time
+    is reused for the next. See :func:`ffsim.linalg.krylov_evolution` for details of
+    the algorithm.
+
+    Args:
+        vec: The state vector to evolve.
+        hamiltonian: The Hamiltonian. It can be any object that supports
+            :func:`ffsim.linear_operator`, or a SciPy LinearOperator.
+        times: The times at which to return the evolved state. They must be
+            nonnegative and sorted in nondecreasing order.
+        norb: The number of spatial orbitals.
+        nelec: The number of alpha and beta electrons.
+        hermitian: Whether the Hamiltonian is Hermitian. If True, the Lanczos
+            algorithm is used. Otherwise, the Arnoldi algorithm is used.
+        krylov_dim: The maximum dimension of the Krylov subspace. The memory used is
+            bounded by this many state vectors.
+        tol: The error tolerance. The error in each returned state, relative to the
+            norm of the initial state, is approximately bounded by this value.
+
+    Returns:
+        An iterator over the evolved states at the requested times, in order.
+    """
+    if not isinstance(hamiltonian, LinearOperator):
+        hamiltonian = protocols.linear_operator(hamiltonian, norb=norb, nelec=nelec)
+    return linalg.krylov_evolution(
+        hamiltonian,
+        vec,
+        times,
+        hermitian=hermitian,
+        krylov_dim=krylov_dim,
+        tol=tol,
+    )
@@ -10,6 +10,7 @@
 
 """Linear algebra utilities."""
 
+from ffsim.linalg.davidson import davidson
 from ffsim.linalg.double_factorized_decomposition import (
     double_factorized,
     double_factorized_t2,
@@ -21,6 +22,7 @@ from ffsim.linalg.givens import (
     apply_matrix_to_slices,
     givens_decomposition,
 )
+from ffsim.linalg.krylov import expm_multiply_krylov, krylov_evolution
 from ffsim.linalg.linalg import (
     expm_multiply_taylor,
     lup,
@@ -40,9 +42,11 @@ from ffsim.linalg.predicates import (
 __all__ = [
     "GivensRotation",
     "apply_matrix_to_slices",
+    "davidson",
     "double_factorized",
     "double_factorized_t2",
     "double_factorized_t2_alpha_beta",
+    "expm_multiply_krylov",
     "expm_multiply_taylor",
     "givens_decomposition",
     "is_antihermitian",
@@ -51,6 +55,7 @@ __all__ = [
     "is_real_symmetric",
     "is_special_orthogonal",
     "is_unitary",
+    "krylov_evolution",
     "lup",
     "match_global_phase",
     "modified_cholesky",
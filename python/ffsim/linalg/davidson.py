@@ -0,0 +1,176 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Davidson eigensolver."""
+
+from __future__ import annotations
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse.linalg
+
+# Smallest magnitude of the denominator of the diagonal preconditioner
+_PRECONDITIONER_TOL = 1e-8
+# Norm below which a new direction is considered linearly dependent on the basis
+_LINEAR_DEPENDENCE_TOL = 1e-10
+
+
+def davidson(
+    mat: scipy.sparse.linalg.LinearOperator | np.ndarray,
+    diag: np.ndarray,
+    *,
+    k: int = 1,
+    v0: np.ndarray | None = None,
+    tol: float = 1e-8,
+    max_iter: int = 100,
+    max_subspace_dim: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    r"""Compute the lowest eigenpairs of a Hermitian matrix with Davidson's method.
+
+    The matrix is only accessed through products with blocks of vectors, and its
+    diagonal is used to precondition the correction vectors: the correction for the
+    residual :math:`r` of a Ritz pair :math:`(\theta, x)` is
+    :math:`(\theta - D)^{-1} r`, where :math:`D` is the diagonal of the matrix. In
+    each iteration, the corrections of all unconverged Ritz pairs are added to the
+    subspace and multiplied by the matrix as one block. When the dimension of the
+    subspace would exceed ``max_subspace_dim``, the subspace is restarted from the
+    current Ritz vectors, which bounds the memory used. If ``max_subspace_dim`` is at
+    least ``3 * k``, the Ritz vectors of the previous iteration are kept as well, so
+    that the direction of the last step survives the restart.
+
+    Args:
+        mat: The Hermitian matrix, as a Numpy array or SciPy LinearOperator.
+        diag: The diagonal entries of the matrix.
+        k: The number of eigenpairs to compute.
+        v0: Initial guesses for the eigenvectors, as the columns of a matrix. A single
+            vector can also be passed. If not specified, the unit vectors
+            corresponding to the smallest diagonal entries are used.
+        tol: The convergence tolerance. An eigenpair is converged when the norm of its
+            residual is at most this value.
+        max_iter: The maximum number of iterations.
+        max_subspace_dim: The maximum dimension of the subspace. The default is
+            ``max(8 * k, 32)``.
+
+    Returns:
+        The eigenvalues, in ascending order, and the corresponding eigenvectors, as
+        the columns of a matrix.
+
+    Raises:
+        ValueError: k must be at least 1 and at most the dimension of the matrix.
+        ValueError: max_subspace_dim must be at least 2 * k.
+        RuntimeError: The Davidson iteration did not converge.
+    """
+    dim = len(diag)
+    if not 1 <= k <= dim:
+        raise ValueError(
+            f"k must be at least 1 and at most the dimension of the matrix. Got {k}."
+        )
+    if max_subspace_dim is None:
+        max_subspace_dim = max(8 * k, 32)
+    max_subspace_dim = min(max_subspace_dim, dim)
+    if max_subspace_dim < min(2 * k, dim):
+        raise ValueError(
+            f"max_subspace_dim must be at least 2 * k. Got {max_subspace_dim}."
+        )
+    diag = np.asarray(diag).real
+
+    if v0 is None:
+        guess = np.zeros((dim, k))
+        guess[np.argsort(diag, kind="stable")[:k], range(k)] = 1
+    else:
+        guess = np.asarray(v0).reshape((dim, -1))
+    dtype = np.result_type(guess, getattr(mat, "dtype", float), float)
+    basis = np.zeros((dim, 0), dtype=dtype)
+    basis, _ = _extend_basis(basis, guess.astype(dtype))
+    mat_basis = _matmat(mat, basis, dtype)
+    # Coefficients of the Ritz vectors of the previous iteration in the basis
+    prev_coeffs = np.zeros((basis.shape[1], 0), dtype=dtype)
+
+    for _ in range(max_iter):
+        projected = basis.T.conj() @ mat_basis
+        eigs, coeffs = scipy.linalg.eigh(0.5 * (projected + projected.T.conj()))
+        n_ritz = min(k, len(eigs))
+        ritz_vecs = basis @ coeffs[:, :n_ritz]
+        residuals = mat_basis @ coeffs[:, :n_ritz] - ritz_vecs * eigs[:n_ritz]
+        norms = np.linalg.norm(residuals, axis=0)
+        if n_ritz == k and np.all(norms <= tol):
+            return eigs[:k], ritz_vecs
+
+        unconverged = norms > tol
+        denominators = eigs[:n_ritz][unconverged] - diag[:, None]
+        small = np.abs(denominators) < _PRECONDITIONER_TOL
+        denominators[small] = np.copysign(_PRECONDITIONER_TOL, denominators[small])
+        corrections = residuals[:, unconverged] / denominators
+
+        if basis.shape[1] + corrections.shape[1] > max_subspace_dim:
+            # Restart from the lowest Ritz vectors and the Ritz vectors of the
+            # previous iteration, which keeps the direction of the last step
+            n_prev = min(
+                prev_coeffs.shape[1],
+                max(0, max_subspace_dim - corrections.shape[1] - k),
+            )
+            n_keep = max(k, max_subspace_dim // 2 - n_prev)
+            prev_coeffs = np.concatenate(
+                [
+                    prev_coeffs,
+                    np.zeros(
+                        (basis.shape[1] - prev_coeffs.shape[0], prev_coeffs.shape[1]),
+                        dtype=dtype,
+                    ),
+                ]
+            )
+            restart, _ = _extend_basis(coeffs[:, :n_keep], prev_coeffs[:, :n_prev])
+            mat_basis = mat_basis @ restart
+            basis = basis @ restart
+            coeffs = restart.T.conj() @ coeffs[:, :n_ritz]
+        prev_coeffs = coeffs[:, :n_ritz]
+        basis, new_vecs = _extend_basis(basis, corrections)
+        if not new_vecs.shape[1]:
+            # The corrections lie in the subspace, so fall back to the residuals
+            basis, new_vecs = _extend_basis(basis, residuals[:, unconverged])
+        if not new_vecs.shape[1]:
+            break
+        mat_basis = np.concatenate([mat_basis, _matmat(mat, new_vecs, dtype)], axis=1)
+
+    raise RuntimeError(
+        f"The Davidson iteration did not converge in {max_iter} iterations."
+    )
+
+
+def _matmat(
+    mat: scipy.sparse.linalg.LinearOperator | np.ndarray,
+    vecs: np.ndarray,
+    dtype: np.dtype,
+) -> np.ndarray:
+    return np.asarray(mat @ vecs, dtype=dtype).reshape(vecs.shape)
+
+
+def _extend_basis(basis: np.ndarray, vecs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Orthonormalize vectors against a basis and append them to it.
+
+    Returns:
+        The extended basis and the new orthonormal vectors appended to it.
+    """
+    new_vecs: list[np.ndarray] = []
+    for vec in vecs.T:
+        norm = np.linalg.norm(vec)
+        if not norm:
+            continue
+        vec = vec / norm
+        # Orthogonalize twice for numerical stability
+        for _ in range(2):
+            vec = vec - basis @ (basis.T.conj() @ vec)
+            for new_vec in new_vecs:
+                vec = vec - new_vec * np.vdot(new_vec, vec)
+        norm = np.linalg.norm(vec)
+        if norm > _LINEAR_DEPENDENCE_TOL:
+            new_vecs.append(vec / norm)
+    new_block = np.stack(new_vecs, axis=1) if new_vecs else basis[:, :0]
+    return np.concatenate([basis, new_block], axis=1), new_block
@@ -21,6 +21,15 @@ import scipy.linalg
 import scipy.optimize
 from opt_einsum import contract
 
+from ffsim.linalg.packed import (
+    pack_two_body_tensor,
+    pair_indices,
+    two_body_norb,
+    two_body_symmetry,
+    unpack_symmetric_matrices,
+    unpack_two_body_tensor,
+)
+
 
 def _truncated_eigh(
     mat: np.ndarray,
@@ -128,6 +137,22 @@ def _validate_diag_coulomb_indices(indices: list[tuple[int, int]] | None):
                 )
 
 
+def _validate_initial_decomposition(
+    initial_decomposition: tuple[np.ndarray, np.ndarray], norb: int
+):
+    diag_coulomb_mats, orbital_rotations = initial_decomposition
+    n_tensors = len(orbital_rotations)
+    for name, tensor in [
+        ("diagonal Coulomb matrices", diag_coulomb_mats),
+        ("orbital rotations", orbital_rotations),
+    ]:
+        if tensor.shape != (n_tensors, norb, norb):
+            raise ValueError(
+                f"The {name} of the initial decomposition must have shape "
+                f"{(n_tensors, norb, norb)}. Got {tensor.shape}."
+            )
+
+
 def double_factorized(
     two_body_tensor: np.ndarray,
     *,
@@ -139,6 +164,7 @@ def double_factorized(
     options: dict | None = None,
     diag_coulomb_indices: list[tuple[int, int]] | None = None,
     cholesky: bool = True,
+    initial_decomposition: tuple[np.ndarray, np.ndarray] | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     r"""Double-factorized decomposition of a two-body tensor.
 
@@ -177,14 +203,27 @@ def double_factorized(
     symmetric, only upper triangular indices should be given, i.e.,
     pairs :math:`(i, j)` where :math:`i \leq j`.
 
+    The optimization evaluates the objective function and its gradient together,
+    sharing the residual tensor between them. By default, it starts from the exact
+    factorization. When decomposing a sequence of similar tensors, such as along a
+    potential energy curve, the result for one tensor can be passed as the
+    `initial_decomposition` for the next, which usually reduces the number of
+    iterations needed.
+
     References:
         - `arXiv:1808.02625`_
         - `arXiv:2104.08957`_
 
     Note: Currently, only real-valued two-body tensors are supported.
 
+    The two-body tensor can also be passed in the compressed format with 4-fold or
+    8-fold symmetry used by PySCF. In that case, the exact factorization is computed
+    from the compressed tensor without expanding it, which uses a fraction of the
+    memory. The optimization does expand the tensor.
+
     Args:
-        two_body_tensor: The two-body tensor to decompose.
+        two_body_tensor: The two-body tensor to decompose. It can be a 4-dimensional
+            array, or a compressed tensor with 4-fold or 8-fold symmetry.
         tol: Tolerance for error in the decomposition.
             The error is defined as the maximum absolute difference between
             an element of the original tensor and the corresponding element of
@@ -208,6 +247,11 @@ def double_factorized(
             decomposition. If False, a full eigenvalue decomposition is used instead,
             which can be much more expensive. This argument is ignored if ``optimize``
             is set to True.
+        initial_decomposition: The diagonal Coulomb matrices and orbital rotations
+            from which to start the optimization, for example the result of a
+            previous decomposition of a similar tensor. Their number determines the
+            number of terms in the result, overriding ``tol`` and ``max_vecs``. This
+            argument is only used if ``optimize`` is set to True.
 
     Returns:
         The diagonal Coulomb matrices and the orbital rotations. Each list of matrices
@@ -218,6 +262,7 @@ def double_factorized(
 
     Raises:
         ValueError: diag_coulomb_indices contains lower triangular indices.
+        ValueError: The initial decomposition has the wrong number of orbitals.
 
     .. _arXiv:1808.02625: https://arxiv.org/abs/1808.02625
     .. _arXiv:2104.08957: https://arxiv.org/abs/2104.08957
@@ -230,13 +275,26 @@ def double_factorized(
 
     _validate_diag_coulomb_indices(diag_coulomb_indices)
 
-    norb, _, _, _ = two_body_tensor.shape
+    norb = two_body_norb(two_body_tensor)
 
     if not norb:
         return np.empty((0, 0, 0)), np.empty((0, 0, 0))
 
     if max_vecs is None:
         max_vecs = norb * (norb + 1) // 2
+    if optimize and initial_decomposition is not None:
+        _validate_initial_decomposition(initial_decomposition, norb)
+    if two_body_symmetry(two_body_tensor) != 1:
+        if optimize:
+            two_body_tensor = unpack_two_body_tensor(two_body_tensor, norb)
+        else:
+            return _double_factorized_packed(
+                pack_two_body_tensor(two_body_tensor, norb, 4),
+                norb=norb,
+                tol=tol,
+                max_vecs=max_vecs,
+                cholesky=cholesky,
+            )
     if optimize:
         if diag_coulomb_indices is None:
             diag_coulomb_mask = None
@@ -253,6 +311,7 @@ def double_factorized(
             callback=callback,
             options=options,
             diag_coulomb_mask=diag_coulomb_mask,
+            initial_decomposition=initial_decomposition,
         )
     if cholesky:
         return _double_factorized_explicit_cholesky(
@@ -276,6 +335,41 @@ def _double_factorized_explicit_cholesky(
     return diag_coulomb_mats, orbital_rotations
 
 
+def _double_factorized_packed(
+    two_body_tensor: np.ndarray,
+    *,
+    norb: int,
+    tol: float,
+    max_vecs: int,
+    cholesky: bool,
+) -> tuple[np.ndarray, np.ndarray]:
+    # The reshaped two-body tensor is E M E^T, where M is the tensor with 4-fold
+    # symmetry and E maps each pair of orbitals to both of its orderings.
+    if cholesky:
+        # Columns of E M E^T for two orderings of a pair are identical, so the
+        # modified Cholesky decomposition of M yields that of E M E^T.
+        vecs = modified_cholesky(two_body_tensor, tol=tol, max_vecs=max_vecs)
+        mats = unpack_symmetric_matrices(vecs, norb)
+        eigs, orbital_rotations = np.linalg.eigh(mats)
+        diag_coulomb_mats = eigs[:, :, None] * eigs[:, None, :]
+        return diag_coulomb_mats, orbital_rotations
+    # E^T E = D is diagonal, with entries 1 for diagonal pairs and 2 otherwise, so the
+    # eigenvectors of E M E^T with nonzero eigenvalues are E D^(-1/2) v, where v are
+    # the eigenvectors of D^(1/2) M D^(1/2).
+    weights = np.full(len(two_body_tensor), 2.0)
+    weights[np.diagonal(pair_indices(norb))] = 1.0
+    sqrt_weights = np.sqrt(weights)
+    outer_eigs, outer_vecs = _truncated_eigh(
+        sqrt_weights[:, None] * two_body_tensor * sqrt_weights,
+        tol=tol,
+        max_vecs=max_vecs,
+    )
+    mats = unpack_symmetric_matrices(outer_vecs / sqrt_weights[:, None], norb)
+    eigs, orbital_rotations = np.linalg.eigh(mats)
+    diag_coulomb_mats = outer_eigs[:, None, None] * eigs[:, :, None] * eigs[:, None, :]
+    return diag_coulomb_mats, orbital_rotations
+
+
 def _double_factorized_explicit_eigh(
     two_body_tensor: np.ndarray,
     *,
@@ -338,73 +432,60 @@ def _double_factorized_compressed(
     callback,
     options: dict | None,
     diag_coulomb_mask: np.ndarray | None,
+    initial_decomposition: tuple[np.ndarray, np.ndarray] | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
-    diag_coulomb_mats, orbital_rotations = _double_factorized_explicit_cholesky(
-        two_body_tensor, tol=tol, max_vecs=max_vecs
-    )
+    if initial_decomposition is None:
+        diag_coulomb_mats, orbital_rotations = _double_factorized_explicit_cholesky(
+            two_body_tensor, tol=tol, max_vecs=max_vecs
+        )
+    else:
+        diag_coulomb_mats, orbital_rotations = initial_decomposition
     n_tensors, norb, _ = orbital_rotations.shape
     if diag_coulomb_mask is None:
         diag_coulomb_mask = np.ones((norb, norb), dtype=bool)
     diag_coulomb_mask = np.triu(diag_coulomb_mask)
+    core_param_indices = np.nonzero(diag_coulomb_mask)
+    n_leaf_params = n_tensors * norb * (norb - 1) // 2
+    target = np.reshape(two_body_tensor, (norb**2, norb**2))
 
-    def fun(x):
-        diag_coulomb_mats, orbital_rotations = _params_to_df_tensors(
-            x, n_tensors, norb, diag_coulomb_mask
+    def fun_and_jac(x: np.ndarray) -> tuple[float, np.ndarray]:
+        leaf_logs = _params_to_leaf_logs(x, n_tensors, norb)
+        eigs, vecs = np.linalg.eigh(-1j * leaf_logs)
+        orbital_rotations = _expm_antisymmetric_from_eigh(eigs, vecs)
+        diag_coulomb_mats = _params_to_diag_coulomb_mats(
+            x[n_leaf_params:], n_tensors, norb, diag_coulomb_mask
         )
-        diff = two_body_tensor - contract(
-            "kpi,kqi,kij,krj,ksj->pqrs",
-            orbital_rotations,
-            orbital_rotations,
-            diag_coulomb_mats,
-            orbital_rotations,
-            orbital_rotations,
-            optimize="greedy",
+        # pairs[t, k, pq] = U^t_pk U^t_qk, so that the reconstructed tensor is
+        # sum_t pairs[t]^T Z^t pairs[t]
+        pairs = np.einsum("tpk,tqk->tkpq", orbital_rotations, orbital_rotations)
+        pairs = np.reshape(pairs, (n_tensors, norb, norb**2))
+        weighted_pairs = diag_coulomb_mats @ pairs
+        diff = target - np.reshape(pairs, (-1, norb**2)).T @ np.reshape(
+            weighted_pairs, (-1, norb**2)
         )
-        return 0.5 * np.sum(diff**2)
-
-    def jac(x):
-        diag_coulomb_mats, orbital_rotations = _params_to_df_tensors(
-            x, n_tensors, norb, diag_coulomb_mask
-        )
-        diff = two_body_tensor - contract(
-            "kpi,kqi,kij,krj,ksj->pqrs",
-            orbital_rotations,
-            orbital_rotations,
-            diag_coulomb_mats,
-            orbital_rotations,
-            orbital_rotations,
-            optimize="greedy",
+        value = 0.5 * np.sum(diff**2)
+        # Contract the residual with one pair of leaves once, and reuse it for the
+        # gradients with respect to both the leaves and the cores
+        half = np.reshape(
+            diff @ np.reshape(pairs, (-1, norb**2)).T, (norb**2, -1, norb)
         )
+        half = np.transpose(half, (1, 0, 2))
+        grad_core = -2 * pairs @ half
+        grad_core[:, range(norb), range(norb)] /= 2
         grad_leaf = -4 * contract(
-            "pqrs,tqk,tkl,trl,tsl->tpk",
-            diff,
+            "tpql,tqk,tkl->tpk",
+            np.reshape(half, (n_tensors, norb, norb, norb)),
             orbital_rotations,
             diag_coulomb_mats,
-            orbital_rotations,
-            orbital_rotations,
-            optimize="greedy",
-        )
-        leaf_logs = _params_to_leaf_logs(x, n_tensors, norb)
-        grad_leaf_log = np.ravel(
-            [_grad_leaf_log(log, grad) for log, grad in zip(leaf_logs, grad_leaf)]
-        )
-        grad_core = -2 * contract(
-            "pqrs,tpk,tqk,trl,tsl->tkl",
-            diff,
-            orbital_rotations,
-            orbital_rotations,
-            orbital_rotations,
-            orbital_rotations,
             optimize="greedy",
         )
-        grad_core[:, range(norb), range(norb)] /= 2
-        param_indices = np.nonzero(diag_coulomb_mask)
-        grad_core = np.ravel([mat[param_indices] for mat in grad_core])
-        return np.concatenate([grad_leaf_log, grad_core])
+        grad_leaf_log = _grad_leaf_logs(eigs, vecs, grad_leaf)
+        grad_core_params = np.ravel(grad_core[(slice(None), *core_param_indices)])
+        return value, np.concatenate([grad_leaf_log, grad_core_params])
 
     x0 = _df_tensors_to_params(diag_coulomb_mats, orbital_rotations, diag_coulomb_mask)
     result = scipy.optimize.minimize(
-        fun, x0, method=method, jac=jac, callback=callback, options=options
+        fun_and_jac, x0, method=method, jac=True, callback=callback, options=options
     )
     diag_coulomb_mats, orbital_rotations = _params_to_df_tensors(
         result.x, n_tensors, norb, diag_coulomb_mask
@@ -419,27 +500,38 @@ def _df_tensors_to_params(
     diag_coulomb_mat_mask: np.ndarray,
 ):
     _, norb, _ = orbital_rotations.shape
-    leaf_logs = [scipy.linalg.logm(mat) for mat in orbital_rotations]
-    leaf_param_indices = np.triu_indices(norb, k=1)
+    leaf_logs = np.stack([scipy.linalg.logm(mat) for mat in orbital_rotations])
+    rows, cols = np.triu_indices(norb, k=1)
     # TODO this discards the imaginary part of the logarithm, see if we can do better
-    leaf_params = np.real(
-        np.ravel([leaf_log[leaf_param_indices] for leaf_log in leaf_logs])
-    )
-    core_param_indices = np.nonzero(diag_coulomb_mat_mask)
-    core_params = np.ravel(
-        [diag_coulomb_mat[core_param_indices] for diag_coulomb_mat in diag_coulomb_mats]
-    )
+    leaf_params = np.real(np.ravel(leaf_logs[:, rows, cols]))
+    rows, cols = np.nonzero(diag_coulomb_mat_mask)
+    core_params = np.ravel(diag_coulomb_mats[:, rows, cols])
     return np.concatenate([leaf_params, core_params])
 
 
 def _params_to_leaf_logs(params: np.ndarray, n_tensors: int, norb: int):
+    rows, cols = np.triu_indices(norb, k=1)
     leaf_logs = np.zeros((n_tensors, norb, norb))
-    triu_indices = np.triu_indices(norb, k=1)
-    param_length = len(triu_indices[0])
-    for i in range(n_tensors):
-        leaf_logs[i][triu_indices] = params[i * param_length : (i + 1) * param_length]
-        leaf_logs[i] -= leaf_logs[i].T
-    return leaf_logs
+    leaf_logs[:, rows, cols] = np.reshape(
+        params[: n_tensors * len(rows)], (n_tensors, len(rows))
+    )
+    return leaf_logs - leaf_logs.transpose(0, 2, 1)
+
+
+def _params_to_diag_coulomb_mats(
+    core_params: np.ndarray,
+    n_tensors: int,
+    norb: int,
+    diag_coulomb_mat_mask: np.ndarray,
+):
+    rows, cols = np.nonzero(diag_coulomb_mat_mask)
+    diag_coulomb_mats = np.zeros((n_tensors, norb, norb))
+    diag_coulomb_mats[:, rows, cols] = np.reshape(
+        np.real(core_params), (n_tensors, len(rows))
+    )
+    diag_coulomb_mats += diag_coulomb_mats.transpose(0, 2, 1)
+    diag_coulomb_mats[:, range(norb), range(norb)] /= 2
+    return diag_coulomb_mats
 
 
 def _params_to_df_tensors(
@@ -447,37 +539,46 @@ def _params_to_df_tensors(
 ):
     leaf_logs = _params_to_leaf_logs(params, n_tensors, norb)
     orbital_rotations = _expm_antisymmetric(leaf_logs)
-
     n_leaf_params = n_tensors * norb * (norb - 1) // 2
-    core_params = np.real(params[n_leaf_params:])
-    param_indices = np.nonzero(diag_coulomb_mat_mask)
-    param_length = len(param_indices[0])
-    diag_coulomb_mats = np.zeros((n_tensors, norb, norb))
-    for i in range(n_tensors):
-        diag_coulomb_mats[i][param_indices] = core_params[
-            i * param_length : (i + 1) * param_length
-        ]
-        diag_coulomb_mats[i] += diag_coulomb_mats[i].T
-        diag_coulomb_mats[i][range(norb), range(norb)] /= 2
+    diag_coulomb_mats = _params_to_diag_coulomb_mats(
+        params[n_leaf_params:], n_tensors, norb, diag_coulomb_mat_mask
+    )
     return diag_coulomb_mats, orbital_rotations
 
 
 def _expm_antisymmetric(mats: np.ndarray) -> np.ndarray:
     eigs, vecs = np.linalg.eigh(-1j * mats)
-    return np.einsum("tij,tj,tkj->tik", vecs, np.exp(1j * eigs), vecs.conj()).real
+    return _expm_antisymmetric_from_eigh(eigs, vecs)
+
 
+def _expm_antisymmetric_from_eigh(eigs: np.ndarray, vecs: np.ndarray) -> np.ndarray:
+    return (
+        (vecs * np.exp(1j * eigs)[:, None, :]) @ vecs.conj().transpose(0, 2, 1)
+    ).real
 
-def _grad_leaf_log(mat: np.ndarray, grad_leaf: np.ndarray) -> np.ndarray:
-    eigs, vecs = scipy.linalg.eigh(-1j * mat)
-    eig_i, eig_j = np.meshgrid(eigs, eigs, indexing="ij")
+
+def _grad_leaf_logs(
+    eigs: np.ndarray, vecs: np.ndarray, grad_leaf: np.ndarray
+) -> np.ndarray:
+    """Pull back gradients with respect to orbital rotations to their logarithms.
+
+    The eigendecompositions are those of -i times the logarithms, and all tensors are
+    handled at once.
+    """
+    _, norb = eigs.shape
+    eig_i = eigs[:, :, None]
+    eig_j = eigs[:, None, :]
+    exp_i = np.broadcast_to(np.exp(1j * eig_i), (len(eigs), norb, norb))
+    exp_j = np.exp(1j * eig_j)
     with np.errstate(divide="ignore", invalid="ignore"):
-        coeffs = -1j * (np.exp(1j * eig_i) - np.exp(1j * eig_j)) / (eig_i - eig_j)
-    coeffs[eig_i == eig_j] = np.exp(1j * eig_i[eig_i == eig_j])
-    grad = vecs.conj() @ (vecs.T @ grad_leaf @ vecs.conj() * coeffs) @ vecs.T
-    grad -= grad.T
-    norb, _ = mat.shape
-    triu_indices = np.triu_indices(norb, k=1)
-    return np.real(grad[triu_indices])
+        coeffs = -1j * (exp_i - exp_j) / (eig_i - eig_j)
+    degenerate = np.broadcast_to(eig_i == eig_j, coeffs.shape)
+    coeffs[degenerate] = exp_i[degenerate]
+    vecs_t = vecs.transpose(0, 2, 1)
+    grad = vecs.conj() @ (vecs_t @ grad_leaf @ vecs.conj() * coeffs) @ vecs_t
+    grad -= grad.transpose(0, 2, 1)
+    rows, cols = np.triu_indices(norb, k=1)
+    return np.ravel(np.real(grad[:, rows, cols]))
 
 
 def double_factorized_t2(
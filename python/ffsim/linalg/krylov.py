@@ -0,0 +1,242 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Krylov subspace time evolution."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse.linalg
+
+# Tolerance below which a subdiagonal element signals an invariant subspace
+_BREAKDOWN_TOL = 1e-14
+# Safety factor applied to the round-off floor of the error estimate
+_ROUNDOFF_FACTOR = 10
+# Maximum number of times a step is shrunk before giving up
+_MAX_STEP_REDUCTIONS = 100
+
+
+def krylov_evolution(
+    mat: scipy.sparse.linalg.LinearOperator | np.ndarray,
+    vec: np.ndarray,
+    times: Sequence[float],
+    *,
+    hermitian: bool = True,
+    krylov_dim: int = 30,
+    tol: float = 1e-12,
+) -> Iterator[np.ndarray]:
+    r"""Evolve a vector in time using Krylov subspace projection.
+
+    Computes :math:`e^{-i t A} v` for each requested time :math:`t`, where :math:`A`
+    is the given matrix and :math:`v` is the given vector. The evolution proceeds in
+    steps. In each step, an orthonormal basis of the Krylov subspace generated by the
+    current vector is built with the Lanczos algorithm if the matrix is Hermitian,
+    and with the Arnoldi algorithm otherwise. The exponential of the projected
+    matrix is then used to advance the vector by the largest step whose estimated
+    error is within the tolerance. All requested times that fall within a step are
+    evaluated from the same basis.
+
+    At most ``krylov_dim`` basis vectors are stored at a time, which bounds the memory
+    used in addition to the input and output vectors.
+
+    Args:
+        mat: The matrix :math:`A`, as a Numpy array or SciPy LinearOperator.
+        vec: The initial vector :math:`v`.
+        times: The times at which to return the evolved vector. They must be
+            nonnegative and sorted in nondecreasing order.
+        hermitian: Whether the matrix is Hermitian. If True, the Lanczos algorithm is
+            used. Otherwise, the Arnoldi algorithm is used.
+        krylov_dim: The maximum dimension of the Krylov subspace.
+        tol: The error tolerance. The error in each returned vector, relative to the
+            norm of the initial vector, is approximately bounded by this value.
+            Tolerances below the round-off error of a step are raised to it.
+
+    Returns:
+        An iterator over the evolved vectors at the requested times, in order. The
+        vectors are computed as the iterator is advanced.
+    """
+    if krylov_dim < 1:
+        raise ValueError(f"krylov_dim must be at least 1. Got {krylov_dim}.")
+    if any(t < 0 for t in times) or any(a > b for a, b in zip(times, times[1:])):
+        raise ValueError("times must be nonnegative and sorted in nondecreasing order.")
+    return _krylov_evolution(
+        mat,
+        vec.astype(complex, copy=True),
+        times,
+        hermitian=hermitian,
+        krylov_dim=krylov_dim,
+        tol=tol,
+    )
+
+
+def _krylov_evolution(
+    mat: scipy.sparse.linalg.LinearOperator | np.ndarray,
+    vec: np.ndarray,
+    times: Sequence[float],
+    hermitian: bool,
+    krylov_dim: int,
+    tol: float,
+) -> Iterator[np.ndarray]:
+    if not len(times):
+        return
+    total_time = times[-1]
+    current_time = 0.0
+    step = total_time
+    index = 0
+    while index < len(times):
+        # Requested times that coincide with the current time
+        while index < len(times) and times[index] <= current_time:
+            yield vec.copy()
+            index += 1
+        if index == len(times):
+            return
+
+        norm = np.linalg.norm(vec)
+        if norm == 0:
+            for _ in range(index, len(times)):
+                yield vec.copy()
+            return
+        basis, projected, residual = _krylov_basis(
+            mat, vec / norm, krylov_dim=krylov_dim, hermitian=hermitian
+        )
+        exp_func = _projected_exp_func(projected, hermitian=hermitian)
+
+        # Find the largest step whose estimated error is within the tolerance,
+        # allotting the tolerance in proportion to the step size. The last entry of
+        # the projected exponential is computed with an absolute round-off error of
+        # about m times machine precision, so the error target is never set below
+        # the resulting floor of the error estimate.
+        remaining = total_time - current_time
+        step = min(max(step, 1e-3 * total_time), remaining)
+        if residual > _BREAKDOWN_TOL:
+            m = len(projected)
+            min_error = (
+                _ROUNDOFF_FACTOR * m * np.finfo(float).eps * norm * max(residual, 1.0)
+            )
+            for _ in range(_MAX_STEP_REDUCTIONS):
+                error = norm * residual * abs(exp_func(step)[-1])
+                allowed = max(tol * step / total_time, min_error)
+                if error <= allowed:
+                    break
+                step *= max(0.1, min(0.5, 0.9 * (allowed / error) ** (1 / m)))
+            else:
+                raise RuntimeError(
+                    "Krylov evolution failed to find a time step within the error "
+                    f"tolerance at time {current_time}. Try increasing krylov_dim or "
+                    "tol."
+                )
+        else:
+            # The Krylov subspace is invariant, so the evolution is exact
+            step = remaining
+
+        # Evaluate requested times within this step from the same basis
+        end_time = total_time if step >= remaining else current_time + step
+        while index < len(times) and times[index] < end_time:
+            yield norm * (exp_func(times[index] - current_time) @ basis)
+            index += 1
+        vec = norm * (exp_func(step) @ basis)
+        current_time = end_time
+        # Let the next step grow if this one was accepted easily
+        step *= 2
+
+
+def _krylov_basis(
+    mat: scipy.sparse.linalg.LinearOperator | np.ndarray,
+    vec: np.ndarray,
+    krylov_dim: int,
+    hermitian: bool,
+) -> tuple[np.ndarray, np.ndarray, float]:
+    """Build an orthonormal basis of the Krylov subspace generated by a unit vector.
+
+    Returns:
+        The basis vectors as the rows of a matrix, the projection of the matrix onto
+        the subspace, and the norm of the component of the next Krylov vector
+        orthogonal to the subspace.
+    """
+    dim = len(vec)
+    krylov_dim = min(krylov_dim, dim)
+    basis = np.zeros((krylov_dim, dim), dtype=complex)
+    projected = np.zeros((krylov_dim, krylov_dim), dtype=complex)
+    basis[0] = vec
+    residual = 0.0
+    for j in range(krylov_dim):
+        w = np.asarray(mat @ basis[j], dtype=complex)
+        if hermitian:
+            # Lanczos three-term recurrence
+            projected[j, j] = np.vdot(basis[j], w).real
+            w -= projected[j, j] * basis[j]
+            if j > 0:
+                w -= projected[j - 1, j] * basis[j - 1]
+        else:
+            # Arnoldi with modified Gram-Schmidt
+            for i in range(j + 1):
+                projected[i, j] = np.vdot(basis[i], w)
+                w -= projected[i, j] * basis[i]
+        # Reorthogonalize against the whole basis to keep it numerically orthonormal
+        w -= basis[: j + 1].T @ (basis[: j + 1].conj() @ w)
+        residual = float(np.linalg.norm(w))
+        if residual <= _BREAKDOWN_TOL or j == krylov_dim - 1:
+            return basis[: j + 1], projected[: j + 1, : j + 1], residual
+        basis[j + 1] = w / residual
+        projected[j + 1, j] = residual
+        if hermitian:
+            projected[j, j + 1] = residual
+    raise AssertionError("unreachable")
+
+
+def _projected_exp_func(projected: np.ndarray, hermitian: bool):
+    """Return a function mapping t to the first column of exp(-i t projected)."""
+    if hermitian:
+        eigs, vecs = scipy.linalg.eigh(projected.real)
+        first_row = vecs[0]
+
+        def exp_func(t: float) -> np.ndarray:
+            return vecs @ (np.exp(-1j * t * eigs) * first_row)
+
+    else:
+
+        def exp_func(t: float) -> np.ndarray:
+            return scipy.linalg.expm(-1j * t * projected)[:, 0]
+
+    return exp_func
+
+
+def expm_multiply_krylov(
+    mat: scipy.sparse.linalg.LinearOperator | np.ndarray,
+    vec: np.ndarray,
+    time: float = 1.0,
+    *,
+    hermitian: bool = True,
+    krylov_dim: int = 30,
+    tol: float = 1e-12,
+) -> np.ndarray:
+    r"""Compute :math:`e^{-i t A} v` using Krylov subspace projection.
+
+    This is a convenience wrapper around :func:`krylov_evolution` for a single time.
+
+    Args:
+        mat: The matrix :math:`A`, as a Numpy array or SciPy LinearOperator.
+        vec: The vector :math:`v`.
+        time: The time :math:`t`. It must be nonnegative.
+        hermitian: Whether the matrix is Hermitian. If True, the Lanczos algorithm is
+            used. Otherwise, the Arnoldi algorithm is used.
+        krylov_dim: The maximum dimension of the Krylov subspace.
+        tol: The error tolerance, relative to the norm of the vector.
+
+    Returns:
+        The evolved vector.
+    """
+    (result,) = krylov_evolution(
+        mat, vec, [time], hermitian=hermitian, krylov_dim=krylov_dim, tol=tol
+    )
+    return result
@@ -0,0 +1,140 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+r"""Utilities for two-body tensors stored in compressed format.
+
+A real two-body tensor :math:`h_{pqrs}` with the permutational symmetries of the
+electron repulsion integrals,
+
+.. math::
+
+    h_{pqrs} = h_{qprs} = h_{pqsr} = h_{rspq},
+
+can be stored in the compressed formats used by PySCF. With 4-fold symmetry, it is
+stored as a 2-dimensional array indexed by pairs :math:`p \geq q` and
+:math:`r \geq s`. With 8-fold symmetry, it is stored as a 1-dimensional array
+holding the lower triangle of that matrix. The pairs are ordered as in
+``np.tril_indices``.
+"""
+
+from __future__ import annotations
+
+import math
+from functools import cache
+
+import numpy as np
+from pyscf import ao2mo
+
+
+def two_body_symmetry(two_body_tensor: np.ndarray) -> int:
+    """Return the permutational symmetry used to store a two-body tensor.
+
+    Args:
+        two_body_tensor: The two-body tensor.
+
+    Returns:
+        1 if the tensor is stored in full as a 4-dimensional array, 4 if it is stored
+        with 4-fold symmetry as a 2-dimensional array, and 8 if it is stored with
+        8-fold symmetry as a 1-dimensional array.
+
+    Raises:
+        ValueError: The two-body tensor must have 1, 2, or 4 dimensions.
+    """
+    symmetry = {4: 1, 2: 4, 1: 8}.get(two_body_tensor.ndim)
+    if symmetry is None:
+        raise ValueError(
+            "The two-body tensor must have 1, 2, or 4 dimensions. "
+            f"Got {two_body_tensor.ndim}."
+        )
+    return symmetry
+
+
+def two_body_norb(two_body_tensor: np.ndarray) -> int:
+    """Return the number of orbitals of a two-body tensor in any format."""
+    symmetry = two_body_symmetry(two_body_tensor)
+    if symmetry == 1:
+        return two_body_tensor.shape[0]
+    npair = two_body_tensor.shape[0]
+    if symmetry == 8:
+        npair = _triangular_root(npair)
+    return _triangular_root(npair)
+
+
+def pack_two_body_tensor(
+    two_body_tensor: np.ndarray, norb: int, symmetry: int
+) -> np.ndarray:
+    """Convert a real two-body tensor to the format with the given symmetry."""
+    if two_body_symmetry(two_body_tensor) == symmetry:
+        return two_body_tensor
+    return ao2mo.restore(symmetry, two_body_tensor, norb)
+
+
+def unpack_two_body_tensor(two_body_tensor: np.ndarray, norb: int) -> np.ndarray:
+    """Return a two-body tensor in full as a 4-dimensional array."""
+    return pack_two_body_tensor(two_body_tensor, norb, 1)
+
+
+@cache
+def pair_indices(norb: int) -> np.ndarray:
+    """Return the matrix whose entry (p, q) is the index of the pair of p and q.
+
+    The result is cached, so it is returned as a read-only array.
+    """
+    indices = np.zeros((norb, norb), dtype=int)
+    rows, cols = np.tril_indices(norb)
+    indices[rows, cols] = np.arange(len(rows))
+    indices[cols, rows] = indices[rows, cols]
+    indices.flags.writeable = False
+    return indices
+
+
+def unpack_symmetric_matrices(vecs: np.ndarray, norb: int) -> np.ndarray:
+    """Unpack the columns of an array of pair vectors into symmetric matrices."""
+    return vecs.T[:, pair_indices(norb)]
+
+
+def exchange_trace(two_body_tensor: np.ndarray, norb: int) -> np.ndarray:
+    r"""Return the matrix :math:`\sum_r h_{prqr}` of a two-body tensor in any format."""
+    if two_body_symmetry(two_body_tensor) == 1:
+        return np.einsum("prqr", two_body_tensor)
+    mat = pack_two_body_tensor(two_body_tensor, norb, 4)
+    pairs = pair_indices(norb)
+    result = np.zeros((norb, norb), dtype=mat.dtype)
+    for r in range(norb):
+        result += mat[np.ix_(pairs[:, r], pairs[:, r])]
+    return result
+
+
+def coulomb_exchange_diagonals(
+    two_body_tensor: np.ndarray, norb: int
+) -> tuple[np.ndarray, np.ndarray]:
+    r"""Return the matrices :math:`h_{ppqq}` and :math:`h_{pqqp}` of a two-body tensor.
+
+    The two-body tensor can be in any format.
+    """
+    if two_body_symmetry(two_body_tensor) == 1:
+        return (
+            np.einsum("ppqq->pq", two_body_tensor),
+            np.einsum("pqqp->pq", two_body_tensor),
+        )
+    mat = pack_two_body_tensor(two_body_tensor, norb, 4)
+    pairs = pair_indices(norb)
+    diag_pairs = np.diagonal(pairs)
+    return mat[np.ix_(diag_pairs, diag_pairs)], np.diagonal(mat)[pairs]
+
+
+def _triangular_root(n: int) -> int:
+    root = (math.isqrt(8 * n + 1) - 1) // 2
+    if root * (root + 1) // 2 != n:
+        raise ValueError(
+            "The size of a compressed two-body tensor must be a triangular number. "
+            f"Got {n}."
+        )
+    return root
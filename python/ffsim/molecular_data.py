@@ -119,10 +119,18 @@ class MolecularData:
 
     @property
     def hamiltonian(self) -> MolecularHamiltonian:
-        """The Hamiltonian defined by the molecular data."""
+        """The Hamiltonian defined by the molecular data.
+
+        Real two-body integrals are passed through in the compressed format they are
+        stored in. Use :meth:`MolecularHamiltonian.unpacked` to get the two-body
+        tensor as a 4-dimensional array.
+        """
+        two_body_tensor = self.two_body_integrals
+        if np.iscomplexobj(two_body_tensor):
+            two_body_tensor = pyscf.ao2mo.restore(1, two_body_tensor, self.norb)
         return MolecularHamiltonian(
             one_body_tensor=self.one_body_integrals,
-            two_body_tensor=pyscf.ao2mo.restore(1, self.two_body_integrals, self.norb),
+            two_body_tensor=two_body_tensor,
             constant=self.core_energy,
         )
 
@@ -33,6 +33,7 @@ def minimize_linear_method(
     hamiltonian: LinearOperator,
     x0: np.ndarray,
     *,
+    jac: Callable[[np.ndarray], np.ndarray] | None = None,
     maxiter: int = 1000,
     lindep: float = 1e-8,
     epsilon: float = 1e-8,
@@ -57,11 +58,17 @@ def minimize_linear_method(
             by those parameters.
         hamiltonian: The Hamiltonian representing the energy to be minimized.
         x0: Initial guess for the parameters.
+        jac: Optional function that returns the Jacobian of ``params_to_vec``,
+            as a matrix whose columns are the derivatives of the state vector with
+            respect to the parameters. For example, pass
+            :meth:`ffsim.variational.AdjointAnsatz.jacobian` to use analytic
+            derivatives. If not specified, the Jacobian is approximated using
+            finite differences.
         maxiter: Maximum number of optimization iterations to perform.
         lindep: Linear dependency threshold to use when solving the generalized
             eigenvalue problem.
         epsilon: Increment to use for approximating the gradient using
-            finite difference.
+            finite difference. Ignored if `jac` is specified.
         ftol: Convergence threshold for the objective function value. The optimization
             stops when `(f^k - f^{k+1})/max{|f^k|,|f^{k+1}|,1} <= ftol`.
         gtol: Convergence threshold for the gradient. The optimization stops when
@@ -143,10 +150,15 @@ def minimize_linear_method(
 
     for i in range(maxiter):
         vec = params_to_vec(params)
-        jac = jacobian_finite_diff(params_to_vec, params, len(vec), epsilon=epsilon)
-        jac = orthogonalize_columns(jac, vec)
+        if jac is None:
+            jac_mat = jacobian_finite_diff(
+                params_to_vec, params, len(vec), epsilon=epsilon
+            )
+        else:
+            jac_mat = jac(params)
+        jac_mat = orthogonalize_columns(jac_mat, vec)
 
-        energy_mat, overlap_mat = _linear_method_matrices(vec, jac, hamiltonian)
+        energy_mat, overlap_mat = _linear_method_matrices(vec, jac_mat, hamiltonian)
         energy = energy_mat[0, 0]
         grad = 2 * energy_mat[0, 1:]
 
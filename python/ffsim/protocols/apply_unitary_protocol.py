@@ -55,7 +55,9 @@ def apply_unitary(
     """Apply a unitary transformation to a vector.
 
     Args:
-        vec: The vector to apply the unitary transformation to.
+        vec: The vector to apply the unitary transformation to. To transform a batch
+            of vectors at once, pass a two-dimensional array of shape
+            ``(batch, dim)`` whose rows are the vectors.
         obj: The object with a unitary effect.
         norb: The number of spatial orbitals.
         nelec: Either a single integer representing the number of fermions for a
@@ -12,6 +12,7 @@
 
 from qiskit.transpiler import PassManager
 
+from ffsim.qiskit.estimator import FfsimEstimator
 from ffsim.qiskit.gates import (
     DiagCoulombEvolutionJW,
     DiagCoulombEvolutionSpinlessJW,
@@ -34,8 +35,12 @@ from ffsim.qiskit.gates import (
 )
 from ffsim.qiskit.jordan_wigner import jordan_wigner
 from ffsim.qiskit.sampler import FfsimSampler
-from ffsim.qiskit.sim import final_state_vector
-from ffsim.qiskit.transpiler_passes import DropNegligible, MergeOrbitalRotations
+from ffsim.qiskit.sim import CompiledCircuit, final_state_vector
+from ffsim.qiskit.transpiler_passes import (
+    DropNegligible,
+    FuseQiskitGates,
+    MergeOrbitalRotations,
+)
 from ffsim.qiskit.transpiler_stages import pre_init_passes
 from ffsim.qiskit.util import ffsim_vec_to_qiskit_vec, qiskit_vec_to_ffsim_vec
 
@@ -48,10 +53,13 @@ pass manager.
 
 
 __all__ = [
+    "CompiledCircuit",
     "DiagCoulombEvolutionJW",
     "DiagCoulombEvolutionSpinlessJW",
     "DropNegligible",
+    "FfsimEstimator",
     "FfsimSampler",
+    "FuseQiskitGates",
     "GivensAnsatzOpJW",
     "GivensAnsatzOpSpinlessJW",
     "MergeOrbitalRotations",
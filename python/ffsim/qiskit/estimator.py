@@ -0,0 +1,294 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""ffsim's implementation of the Qiskit Estimator primitive."""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from qiskit.circuit import QuantumCircuit
+from qiskit.primitives import (
+    BaseEstimatorV2,
+    DataBin,
+    PrimitiveJob,
+    PrimitiveResult,
+    PubResult,
+)
+from qiskit.primitives.containers.bindings_array import BindingsArray
+from qiskit.primitives.containers.estimator_pub import EstimatorPub
+from qiskit.quantum_info import SparsePauliOp, Statevector
+from scipy.sparse.linalg import LinearOperator
+
+from ffsim import protocols, states
+from ffsim.operators import FermionOperator
+from ffsim.qiskit.sim import CompiledCircuit
+from ffsim.qiskit.util import ffsim_vec_to_qiskit_vec
+
+
+class FfsimEstimator(BaseEstimatorV2):
+    """Implementation of the Qiskit Estimator primitive backed by ffsim."""
+
+    def __init__(
+        self,
+        *,
+        default_precision: float = 0.0,
+        norb: int | None = None,
+        nelec: int | tuple[int, int] | None = None,
+        seed: np.random.Generator | int | None = None,
+    ):
+        r"""Initialize the ffsim Estimator.
+
+        FfsimEstimator is an implementation of the Qiskit Estimator Primitive
+        specialized for fermionic quantum circuits. It computes expectation values
+        exactly from the final state vectors of the circuits. It supports the same
+        circuits as :class:`FfsimSampler`, except that the circuits must not contain
+        measurements.
+
+        In addition to the observables accepted by the Qiskit Estimator, such as
+        :class:`~qiskit.quantum_info.SparsePauliOp`, the observables of a pub can be
+        objects that can be converted to a linear operator with
+        :func:`ffsim.linear_operator`, such as a :class:`ffsim.FermionOperator` or a
+        :class:`ffsim.MolecularHamiltonian`, or arrays of them. Such observables are
+        only supported for spinful circuits. Pauli observables act on the qubits of
+        the circuit under the Jordan-Wigner transformation used by
+        :func:`ffsim.qiskit.jordan_wigner`.
+
+        The final state vector of a circuit is computed only once for each set of
+        parameter values, and it is used for all of the observables that are
+        broadcast against those parameter values.
+
+        Args:
+            default_precision: The default precision to use if not specified during
+                run. If it is nonzero, Gaussian noise with this standard deviation
+                is added to the exact expectation values, and it is reported as
+                their standard error.
+            norb: The number of spatial orbitals.
+            nelec: Either a single integer representing the number of fermions for a
+                spinless system, or a pair of integers storing the numbers of spin alpha
+                and spin beta fermions.
+            seed: A seed to initialize the pseudorandom number generator used to add
+                noise. Should be a valid input to ``np.random.default_rng``.
+        """
+        self._default_precision = default_precision
+        self._norb = norb
+        self._nelec = nelec
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def default_precision(self) -> float:
+        """The default precision."""
+        return self._default_precision
+
+    def run(
+        self, pubs: Iterable[Any], *, precision: float | None = None
+    ) -> PrimitiveJob[PrimitiveResult[PubResult]]:
+        if precision is None:
+            precision = self._default_precision
+        coerced_pubs = [_coerce_pub(pub, precision) for pub in pubs]
+        job = PrimitiveJob(self._run, coerced_pubs)
+        job._submit()
+        return job
+
+    def _run(
+        self, pubs: list[EstimatorPub | _FermionicEstimatorPub]
+    ) -> PrimitiveResult[PubResult]:
+        return PrimitiveResult(
+            [self._run_pub(pub) for pub in pubs], metadata={"version": 2}
+        )
+
+    def _run_pub(self, pub: EstimatorPub | _FermionicEstimatorPub) -> PubResult:
+        if isinstance(pub, EstimatorPub):
+            observables = np.empty(pub.observables.shape, dtype=object)
+            for index in np.ndindex(pub.observables.shape):
+                terms = pub.observables[index]
+                if terms:
+                    paulis, coeffs = zip(*terms.items())
+                    observables[index] = SparsePauliOp(paulis, coeffs)
+                else:
+                    # An observable with no terms is zero
+                    observables[index] = SparsePauliOp.from_sparse_list(
+                        [], num_qubits=pub.circuit.num_qubits
+                    )
+        else:
+            observables = pub.observables
+        compiled_circuit = CompiledCircuit(
+            pub.circuit, norb=self._norb, nelec=self._nelec
+        )
+        param_shape = pub.parameter_values.shape
+        parameter_values = pub.parameter_values.as_array(compiled_circuit.parameters)
+        shape = np.broadcast_shapes(param_shape, observables.shape)
+        param_indices = np.broadcast_to(
+            np.arange(math.prod(param_shape)).reshape(param_shape), shape
+        )
+        obs_indices = np.broadcast_to(
+            np.arange(observables.size).reshape(observables.shape), shape
+        )
+        flat_observables = observables.reshape(-1)
+
+        # Group the entries of the result by their parameter values so that each
+        # final state vector is computed only once
+        groups: defaultdict[int, list[tuple[tuple[int, ...], int]]] = defaultdict(list)
+        for index in np.ndindex(shape):
+            groups[int(param_indices[index])].append((index, int(obs_indices[index])))
+
+        evs = np.zeros(shape)
+        linear_operators: dict[int, LinearOperator] = {}
+        for param_index, entries in groups.items():
+            final_state = compiled_circuit.final_state_vector(
+                parameter_values[np.unravel_index(param_index, param_shape)]
+            )
+            qiskit_state = None
+            for index, obs_index in entries:
+                observable = flat_observables[obs_index]
+                if isinstance(observable, SparsePauliOp):
+                    if qiskit_state is None:
+                        qiskit_state = Statevector(
+                            ffsim_vec_to_qiskit_vec(
+                                final_state.vec, final_state.norb, final_state.nelec
+                            )
+                        )
+                    evs[index] = qiskit_state.expectation_value(observable).real
+                else:
+                    if obs_index not in linear_operators:
+                        linear_operators[obs_index] = _linear_operator(
+                            observable, final_state
+                        )
+                    vec = final_state.vec
+                    evs[index] = np.vdot(vec, linear_operators[obs_index] @ vec).real
+        if pub.precision:
+            evs = self._rng.normal(evs, pub.precision)
+            stds = np.full_like(evs, pub.precision)
+        else:
+            stds = np.zeros_like(evs)
+        data = DataBin(evs=evs, stds=stds, shape=evs.shape)
+        return PubResult(
+            data,
+            metadata={
+                "target_precision": pub.precision,
+                "circuit_metadata": pub.circuit.metadata,
+            },
+        )
+
+
+@dataclass(frozen=True)
+class _FermionicEstimatorPub:
+    """An estimator pub whose observables are converted with linear_operator."""
+
+    circuit: QuantumCircuit
+    observables: np.ndarray
+    parameter_values: BindingsArray
+    precision: float
+
+
+def _coerce_pub(pub: Any, precision: float) -> EstimatorPub | _FermionicEstimatorPub:
+    if isinstance(pub, (EstimatorPub, QuantumCircuit)):
+        return EstimatorPub.coerce(pub, precision)
+    if len(pub) < 2 or not _contains_fermionic_observables(pub[1]):
+        return EstimatorPub.coerce(pub, precision)
+    if len(pub) > 4:
+        raise ValueError(
+            f"The length of pub must be 2, 3 or 4, but length {len(pub)} is given."
+        )
+    circuit = pub[0]
+    observables = _fermionic_observables_array(pub[1])
+    values = pub[2] if len(pub) > 2 else None
+    if values is None:
+        parameter_values = BindingsArray()
+    else:
+        if not isinstance(values, (BindingsArray, Mapping)):
+            values = {tuple(circuit.parameters): values}
+        parameter_values = BindingsArray.coerce(values)
+    if parameter_values.num_parameters != circuit.num_parameters:
+        raise ValueError(
+            f"The number of values ({parameter_values.num_parameters}) does not "
+            f"match the number of parameters ({circuit.num_parameters}) for the "
+            "circuit."
+        )
+    try:
+        np.broadcast_shapes(parameter_values.shape, observables.shape)
+    except ValueError as error:
+        raise ValueError(
+            f"The shape of the observables {observables.shape} is not broadcastable "
+            f"with the shape of the parameter values {parameter_values.shape}."
+        ) from error
+    if len(pub) > 3 and pub[3] is not None:
+        precision = pub[3]
+    if precision < 0:
+        raise ValueError("precision must be non-negative.")
+    return _FermionicEstimatorPub(
+        circuit=circuit,
+        observables=observables,
+        parameter_values=parameter_values,
+        precision=precision,
+    )
+
+
+def _is_fermionic_observable(obj: Any) -> bool:
+    return isinstance(obj, FermionOperator) or hasattr(obj, "_linear_operator_")
+
+
+def _contains_fermionic_observables(observables: Any) -> bool:
+    """Return whether the first leaf of an array of observables is fermionic."""
+    while isinstance(observables, (list, tuple, np.ndarray)):
+        if isinstance(observables, np.ndarray) and not observables.ndim:
+            observables = observables[()]
+        elif len(observables):
+            observables = observables[0]
+        else:
+            return False
+    return _is_fermionic_observable(observables)
+
+
+def _fermionic_observables_array(observables: Any) -> np.ndarray:
+    """Convert a nested sequence of fermionic observables to an object array.
+
+    The observables can't be passed to ``np.array`` directly because some of them,
+    such as FermionOperator, are themselves iterable.
+    """
+    if isinstance(observables, np.ndarray) and not observables.ndim:
+        observables = observables[()]
+    if _is_fermionic_observable(observables):
+        result = np.empty((), dtype=object)
+        result[()] = observables
+        return result
+    if not isinstance(observables, (list, tuple, np.ndarray)):
+        raise TypeError(
+            "Observables must all be fermionic observables or all be Pauli "
+            f"observables. Got an observable of type {type(observables)}."
+        )
+    arrays = [_fermionic_observables_array(obs) for obs in observables]
+    shapes = {array.shape for array in arrays}
+    if len(shapes) != 1:
+        raise ValueError("The array of observables must have a rectangular shape.")
+    (shape,) = shapes
+    result = np.empty((len(arrays), *shape), dtype=object)
+    for i, array in enumerate(arrays):
+        result[i, ...] = array
+    return result
+
+
+def _linear_operator(
+    observable: Any, final_state: states.StateVector
+) -> LinearOperator:
+    if isinstance(final_state.nelec, int):
+        raise ValueError(
+            "Fermionic observables are only supported for spinful circuits. "
+            "Pass norb and nelec to FfsimEstimator to simulate circuits composed of "
+            "Qiskit gates as spinful circuits."
+        )
+    return protocols.linear_operator(
+        observable, norb=final_state.norb, nelec=final_state.nelec
+    )
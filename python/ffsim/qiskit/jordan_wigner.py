@@ -12,10 +12,9 @@
 
 from __future__ import annotations
 
-import functools
-
-from qiskit.quantum_info import SparsePauliOp
+from qiskit.quantum_info import PauliList, SparsePauliOp
 
+from ffsim._lib import jordan_wigner_symplectic
 from ffsim.operators import FermionOperator
 
 
@@ -69,25 +68,10 @@ def jordan_wigner(op: FermionOperator, norb: int | None = None) -> SparsePauliOp
             f"only {norb} were specified."
         )
 
-    qubit_terms = [SparsePauliOp.from_sparse_list([("", [], 0.0)], num_qubits=2 * norb)]
-    for term, coeff in op.items():
-        qubit_op = SparsePauliOp.from_sparse_list(
-            [("", [], coeff)], num_qubits=2 * norb
-        )
-        for action, spin, orb in term:
-            qubit_op @= _qubit_action(action, orb + spin * norb, norb)
-        qubit_terms.append(qubit_op)
-
-    return SparsePauliOp.sum(qubit_terms).simplify()
-
-
-@functools.cache
-def _qubit_action(action: bool, qubit: int, norb: int):
-    qubits = list(range(qubit + 1))
-    return SparsePauliOp.from_sparse_list(
-        [
-            ("Z" * qubit + "X", qubits, 0.5),
-            ("Z" * qubit + "Y", qubits, -0.5j if action else 0.5j),
-        ],
-        num_qubits=2 * norb,
-    )
+    # The Pauli strings are computed and summed in Rust, which returns them as
+    # symplectic arrays. Strings with coefficients that cancel to within the default
+    # tolerance of SparsePauliOp.simplify are discarded.
+    z, x, coeffs = jordan_wigner_symplectic(op, norb, 1e-8)
+    if not len(coeffs):
+        return SparsePauliOp.from_sparse_list([("", [], 0.0)], num_qubits=2 * norb)
+    return SparsePauliOp(PauliList.from_symplectic(z, x), coeffs, copy=False)
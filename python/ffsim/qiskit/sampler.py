@@ -12,7 +12,12 @@
 
 from __future__ import annotations
 
+import itertools
+import math
+import os
+import weakref
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
 import numpy as np
@@ -30,7 +35,7 @@ from qiskit.primitives import (
 from qiskit.primitives.containers.sampler_pub import SamplerPub
 
 from ffsim import states
-from ffsim.qiskit.sim import final_state_vector
+from ffsim.qiskit.sim import CompiledCircuit
 
 
 class FfsimSampler(BaseSamplerV2):
@@ -44,6 +49,7 @@ class FfsimSampler(BaseSamplerV2):
         nelec: int | tuple[int, int] | None = None,
         global_depolarizing: float = 0.0,
         seed: np.random.Generator | int | None = None,
+        max_workers: int | None = 1,
     ):
         r"""Initialize the ffsim Sampler.
 
@@ -72,6 +78,15 @@ class FfsimSampler(BaseSamplerV2):
         Currently, spinless circuits are limited to 64 qubits, and spinful circuits are
         limited to 128 qubits.
 
+        Pubs and parameter values can be simulated in parallel worker processes by
+        setting ``max_workers``. The parameter values of each pub are split into at
+        most one block per worker, so each compiled circuit is sent to a worker at most
+        once per block rather than once per parameter value. The worker processes are
+        started by the first job that uses them and are reused by later jobs. Each
+        parameter value is sampled with its own pseudorandom number generator, seeded
+        from ``seed`` when the pub is submitted, so results are reproducible regardless
+        of the number of workers and the order in which the pubs are executed.
+
         Args:
             default_shots: The default shots to use if not specified during run.
             norb: The number of spatial orbitals.
@@ -83,12 +98,23 @@ class FfsimSampler(BaseSamplerV2):
                 instead of the state vector.
             seed: A seed to initialize the pseudorandom number generator.
                 Should be a valid input to ``np.random.default_rng``.
+            max_workers: The number of worker processes used to simulate pubs and
+                parameter values in parallel. If None, the number of CPUs is used.
+                With the default value of 1, they are simulated one at a time in the
+                calling process.
+
+        Raises:
+            ValueError: max_workers must be at least 1.
         """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1. Got {max_workers}.")
         self._default_shots = default_shots
         self._norb = norb
         self._nelec = nelec
         self._global_depolarizing = global_depolarizing
         self._rng = np.random.default_rng(seed)
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._executor: ProcessPoolExecutor | None = None
 
     def run(
         self, pubs: Iterable[SamplerPubLike], *, shots: int | None = None
@@ -96,68 +122,131 @@ class FfsimSampler(BaseSamplerV2):
         if shots is None:
             shots = self._default_shots
         coerced_pubs = [SamplerPub.coerce(pub, shots) for pub in pubs]
-        job = PrimitiveJob(self._run, coerced_pubs)
+        # Draw the seeds of the pubs now so that they don't depend on when the job
+        # runs or on the order in which the pubs are executed
+        seeds = np.random.SeedSequence(self._rng.integers(1 << 63)).spawn(
+            len(coerced_pubs)
+        )
+        job = PrimitiveJob(self._run, coerced_pubs, seeds)
         job._submit()
         return job
 
-    def _run(self, pubs: Iterable[SamplerPub]) -> PrimitiveResult[SamplerPubResult]:
-        results = [self._run_pub(pub) for pub in pubs]
-        return PrimitiveResult(results)
-
-    def _run_pub(self, pub: SamplerPub) -> SamplerPubResult:
-        circuit, qargs, meas_info = _preprocess_circuit(pub.circuit)
-        bound_circuits = pub.parameter_values.bind_all(circuit)
-        arrays = {
-            item.creg_name: np.zeros(
-                bound_circuits.shape + (pub.shots, item.num_bytes), dtype=np.uint8
-            )
-            for item in meas_info
-        }
-        for index, bound_circuit in np.ndenumerate(bound_circuits):
+    def _run(
+        self, pubs: list[SamplerPub], seeds: list[np.random.SeedSequence]
+    ) -> PrimitiveResult[SamplerPubResult]:
+        preprocessed = [_preprocess_circuit(pub.circuit) for pub in pubs]
+        # Split the parameter points of each pub into blocks that share the
+        # compiled circuit, at most one block per worker
+        tasks: list[_SamplingTask] = []
+        for pub, seed, (circuit, qargs, _) in zip(pubs, seeds, preprocessed):
+            shape = pub.parameter_values.shape
+            point_seeds = seed.spawn(math.prod(shape))
             if qargs:
-                final_state = final_state_vector(
-                    bound_circuit, norb=self._norb, nelec=self._nelec
-                )
-                norb, nelec = final_state.norb, final_state.nelec
-                if isinstance(nelec, int):
-                    orbs = qargs
-                    n_qubits = len(orbs)
-                else:
-                    orbs_a = [q for q in qargs if q < norb]
-                    orbs_b = [q % norb for q in qargs if q >= norb]
-                    orbs = (orbs_a, orbs_b)
-                    n_qubits = len(orbs_a) + len(orbs_b)
-                uniform_shots = self._rng.binomial(pub.shots, self._global_depolarizing)
-                exact_shots = pub.shots - uniform_shots
-                uniform_samples_array = self._rng.integers(
-                    2, size=(uniform_shots, n_qubits), dtype=bool
-                )
-                exact_samples_array = states.sample_state_vector(
-                    final_state,
-                    orbs=orbs,
-                    shots=exact_shots,
-                    bitstring_type=states.BitstringType.BIT_ARRAY,
-                    seed=self._rng,
+                compiled_circuit = CompiledCircuit(
+                    circuit, norb=self._norb, nelec=self._nelec
                 )
-                samples_array = np.concatenate(
-                    [uniform_samples_array, exact_samples_array]
+                parameter_values = pub.parameter_values.as_array(
+                    compiled_circuit.parameters
+                ).reshape((len(point_seeds), len(compiled_circuit.parameters)))
+                n_blocks = max(1, min(self._max_workers, len(point_seeds)))
+                for indices in np.array_split(np.arange(len(point_seeds)), n_blocks):
+                    tasks.append(
+                        _SamplingTask(
+                            circuit=compiled_circuit,
+                            parameter_values=parameter_values[indices],
+                            qargs=qargs,
+                            shots=pub.shots,
+                            global_depolarizing=self._global_depolarizing,
+                            seeds=[point_seeds[i] for i in indices],
+                        )
+                    )
+        if self._max_workers == 1 or len(tasks) <= 1:
+            blocks = [_sample(task) for task in tasks]
+        else:
+            blocks = list(self._get_executor().map(_sample, tasks))
+        samples = itertools.chain.from_iterable(blocks)
+
+        results = []
+        for pub, (_, qargs, meas_info) in zip(pubs, preprocessed):
+            shape = pub.parameter_values.shape
+            arrays = {
+                item.creg_name: np.zeros(
+                    shape + (pub.shots, item.num_bytes), dtype=np.uint8
                 )
-                self._rng.shuffle(samples_array)
-            else:
-                samples_array = np.empty((pub.shots, 0), dtype=bool)
-            for item in meas_info:
-                ary = _samples_to_packed_array(
-                    samples_array, item.num_bits, item.qreg_indices
+                for item in meas_info
+            }
+            for index in np.ndindex(shape):
+                if qargs:
+                    samples_array = next(samples)
+                else:
+                    samples_array = np.empty((pub.shots, 0), dtype=bool)
+                for item in meas_info:
+                    ary = _samples_to_packed_array(
+                        samples_array, item.num_bits, item.qreg_indices
+                    )
+                    arrays[item.creg_name][index] = ary
+            meas = {
+                item.creg_name: BitArray(arrays[item.creg_name], item.num_bits)
+                for item in meas_info
+            }
+            results.append(
+                SamplerPubResult(
+                    DataBin(**meas, shape=pub.shape), metadata={"shots": pub.shots}
                 )
-                arrays[item.creg_name][index] = ary
-
-        meas = {
-            item.creg_name: BitArray(arrays[item.creg_name], item.num_bits)
-            for item in meas_info
-        }
-        return SamplerPubResult(
-            DataBin(**meas, shape=pub.shape), metadata={"shots": pub.shots}
+            )
+        return PrimitiveResult(results)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the pool of worker processes, starting it on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            # Stop the workers when the sampler is garbage collected
+            weakref.finalize(self, self._executor.shutdown, wait=False)
+        return self._executor
+
+
+@dataclass(frozen=True)
+class _SamplingTask:
+    circuit: CompiledCircuit
+    parameter_values: np.ndarray
+    qargs: list[int]
+    shots: int
+    global_depolarizing: float
+    seeds: list[np.random.SeedSequence]
+
+
+def _sample(task: _SamplingTask) -> list[np.ndarray]:
+    """Sample the measured qubits of a circuit at each parameter point of a block."""
+    samples = []
+    for parameter_values, seed in zip(task.parameter_values, task.seeds):
+        rng = np.random.default_rng(seed)
+        final_state = task.circuit.final_state_vector(parameter_values)
+        norb, nelec = final_state.norb, final_state.nelec
+        orbs: list[int] | tuple[list[int], list[int]]
+        if isinstance(nelec, int):
+            orbs = task.qargs
+            n_qubits = len(orbs)
+        else:
+            orbs_a = [q for q in task.qargs if q < norb]
+            orbs_b = [q % norb for q in task.qargs if q >= norb]
+            orbs = (orbs_a, orbs_b)
+            n_qubits = len(orbs_a) + len(orbs_b)
+        uniform_shots = rng.binomial(task.shots, task.global_depolarizing)
+        exact_shots = task.shots - uniform_shots
+        uniform_samples_array = rng.integers(
+            2, size=(uniform_shots, n_qubits), dtype=bool
+        )
+        exact_samples_array = states.sample_state_vector(
+            final_state,
+            orbs=orbs,
+            shots=exact_shots,
+            bitstring_type=states.BitstringType.BIT_ARRAY,
+            seed=rng,
         )
+        samples_array = np.concatenate([uniform_samples_array, exact_samples_array])
+        rng.shuffle(samples_array)
+        samples.append(samples_array)
+    return samples
 
 
 @dataclass
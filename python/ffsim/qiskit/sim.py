@@ -14,10 +14,12 @@ from __future__ import annotations
 
 import cmath
 import math
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Union, cast
 
 import numpy as np
-from qiskit.circuit import CircuitInstruction, QuantumCircuit
+from qiskit.circuit import Operation, Parameter, ParameterExpression, QuantumCircuit
 from qiskit.circuit.library import (
     Barrier,
     CPhaseGate,
@@ -56,6 +58,7 @@ from ffsim.qiskit.gates import (
     UCJOpSpinlessJW,
     UCJOpSpinUnbalancedJW,
 )
+from ffsim.qiskit.transpiler_passes.fuse_qiskit_gates import FuseQiskitGates
 from ffsim.spin import Spin
 
 
@@ -66,6 +69,9 @@ def final_state_vector(
 ) -> states.StateVector:
     """Return the final state vector of a fermionic quantum circuit.
 
+    To simulate a parameterized circuit for many values of its parameters, use
+    :class:`CompiledCircuit` instead, which processes the circuit only once.
+
     Args:
         norb: The number of spatial orbitals.
         nelec: Either a single integer representing the number of fermions for a
@@ -77,29 +83,177 @@ def final_state_vector(
         The final state vector that results from applying the circuit to the vacuum
         state.
     """
-    if not circuit.data:
-        raise ValueError("Circuit must contain at least one instruction.")
-    state_vector, remaining_circuit = _prepare_state_vector(circuit, norb, nelec)
-    if norb is not None and norb != state_vector.norb:
-        raise ValueError(
-            "norb did not match the circuit's state preparation. "
-            f"Got {norb}, but the circuit's state preparation gave "
-            f"{state_vector.norb}."
+    return CompiledCircuit(circuit, norb=norb, nelec=nelec).final_state_vector()
+
+
+@dataclass(frozen=True)
+class _ParameterSlot:
+    """A gate parameter whose value is computed from the circuit parameter values."""
+
+    expression: ParameterExpression
+    parameters: tuple[Parameter, ...]
+    indices: tuple[int, ...]
+
+    def evaluate(self, values: np.ndarray) -> float:
+        if isinstance(self.expression, Parameter):
+            (index,) = self.indices
+            return values[index]
+        return float(
+            self.expression.bind(
+                {param: values[i] for param, i in zip(self.parameters, self.indices)}
+            )
         )
-    if nelec is not None and nelec != state_vector.nelec:
-        raise ValueError(
-            "nelec did not match the circuit's state preparation. "
-            f"Got {nelec}, but the circuit's state preparation gave "
-            f"{state_vector.nelec}."
-        )
-    evolve_func = (
-        _evolve_state_vector_spinless
-        if isinstance(state_vector.nelec, int)
-        else _evolve_state_vector_spinful
+
+
+@dataclass(frozen=True)
+class _CompiledInstruction:
+    op: Operation
+    params: list
+    qubit_indices: list[int]
+
+
+class CompiledCircuit:
+    """A fermionic quantum circuit compiled for repeated simulation.
+
+    Compiling a circuit prepares its initial state and resolves the qubits of its
+    gates once. The final state vector can then be computed for any values of the
+    circuit's parameters without processing the circuit again, which makes parameter
+    sweeps much faster than binding and simulating each circuit separately.
+    Blocks of Qiskit gates with bound parameters are also fused into fermionic gates
+    using :class:`FuseQiskitGates`. Gates with unbound parameters are not fused, not
+    even after their parameters are given values, so they are applied one at a time
+    by :meth:`final_state_vector` and break up the blocks of gates around them. To
+    fuse every gate, bind the parameters with ``circuit.assign_parameters`` before
+    compiling the circuit.
+
+    The supported circuits are the same as those supported by :class:`FfsimSampler`.
+    """
+
+    def __init__(
+        self,
+        circuit: QuantumCircuit,
+        norb: int | None = None,
+        nelec: int | tuple[int, int] | None = None,
+    ):
+        """Compile a circuit.
+
+        Args:
+            circuit: The circuit composed of fermionic gates.
+            norb: The number of spatial orbitals.
+            nelec: Either a single integer representing the number of fermions for a
+                spinless system, or a pair of integers storing the numbers of spin
+                alpha and spin beta fermions.
+        """
+        if not circuit.data:
+            raise ValueError("Circuit must contain at least one instruction.")
+        state_vector, remaining_circuit = _prepare_state_vector(circuit, norb, nelec)
+        if norb is not None and norb != state_vector.norb:
+            raise ValueError(
+                "norb did not match the circuit's state preparation. "
+                f"Got {norb}, but the circuit's state preparation gave "
+                f"{state_vector.norb}."
+            )
+        if nelec is not None and nelec != state_vector.nelec:
+            raise ValueError(
+                "nelec did not match the circuit's state preparation. "
+                f"Got {nelec}, but the circuit's state preparation gave "
+                f"{state_vector.nelec}."
+            )
+        if remaining_circuit.data:
+            fuse_pass = FuseQiskitGates(
+                None if isinstance(state_vector.nelec, int) else state_vector.norb
+            )
+            remaining_circuit = dag_to_circuit(
+                fuse_pass.run(circuit_to_dag(remaining_circuit))
+            )
+        self._initial_state = state_vector
+        self._parameters = tuple(circuit.parameters)
+        parameter_indices = {param: i for i, param in enumerate(self._parameters)}
+        self._instructions = [
+            _CompiledInstruction(
+                op=instruction.operation,
+                params=[
+                    _compile_param(param, parameter_indices)
+                    for param in instruction.operation.params
+                ],
+                qubit_indices=[
+                    circuit.find_bit(qubit).index for qubit in instruction.qubits
+                ],
+            )
+            for instruction in remaining_circuit
+        ]
+
+    @property
+    def norb(self) -> int:
+        """The number of spatial orbitals."""
+        return self._initial_state.norb
+
+    @property
+    def nelec(self) -> int | tuple[int, int]:
+        """The number of fermions."""
+        return self._initial_state.nelec
+
+    @property
+    def parameters(self) -> tuple[Parameter, ...]:
+        """The parameters of the circuit, in the order of ``circuit.parameters``."""
+        return self._parameters
+
+    def final_state_vector(
+        self, parameter_values: Sequence[float] | np.ndarray | None = None
+    ) -> states.StateVector:
+        """Return the final state vector for the given values of the parameters.
+
+        Args:
+            parameter_values: The values of the parameters, in the order of
+                :attr:`parameters`. Can be omitted if the circuit has no parameters.
+
+        Returns:
+            The final state vector that results from applying the circuit to the
+            vacuum state.
+        """
+        values = np.asarray(
+            [] if parameter_values is None else parameter_values, dtype=float
+        )
+        if values.shape != (len(self._parameters),):
+            raise ValueError(
+                f"Expected {len(self._parameters)} parameter values. "
+                f"Got an array of shape {values.shape}."
+            )
+        norb = self.norb
+        nelec = self.nelec
+        evolve_func = (
+            _evolve_state_vector_spinless
+            if isinstance(nelec, int)
+            else _evolve_state_vector_spinful
+        )
+        vec = self._initial_state.vec.copy()
+        for instruction in self._instructions:
+            params = [
+                param.evaluate(values) if isinstance(param, _ParameterSlot) else param
+                for param in instruction.params
+            ]
+            vec = evolve_func(
+                vec,
+                instruction.op,
+                params,
+                instruction.qubit_indices,
+                norb,
+                nelec,  # type: ignore[arg-type]
+            )
+        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+
+
+def _compile_param(param, parameter_indices: dict[Parameter, int]):
+    if not isinstance(param, ParameterExpression):
+        return param
+    if not param.parameters:
+        return float(param)
+    parameters = tuple(param.parameters)
+    return _ParameterSlot(
+        expression=param,
+        parameters=parameters,
+        indices=tuple(parameter_indices[p] for p in parameters),
     )
-    for instruction in remaining_circuit:
-        state_vector = evolve_func(state_vector, instruction, circuit)
-    return state_vector
 
 
 def _prepare_state_vector(
@@ -146,7 +300,11 @@ def _prepare_state_vector(
                 op.norb, op.occupied_orbitals, orbital_rotation=op.orbital_rotation
             )
 
-        remaining_circuit = QuantumCircuit.from_instructions(circuit.data[1:])
+        # Keep all of the qubits of the circuit, in their original order, so that
+        # qubit positions in the remaining circuit are still orbital indices
+        remaining_circuit = circuit.copy_empty_like()
+        for instruction in circuit.data[1:]:
+            remaining_circuit.append(instruction)
         return states.StateVector(
             vec=vec,
             norb=cast(int, norb),
@@ -178,24 +336,21 @@ def _prepare_state_vector(
 
 
 def _evolve_state_vector_spinless(
-    state_vector: states.StateVector,
-    instruction: CircuitInstruction,
-    circuit: QuantumCircuit,
-) -> states.StateVector:
-    op = instruction.operation
-    qubit_indices = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
+    vec: np.ndarray,
+    op: Operation,
+    params: list[float],
+    qubit_indices: list[int],
+    norb: int,
+    nelec: int,
+) -> np.ndarray:
     consecutive_sorted = not qubit_indices or qubit_indices == list(
         range(min(qubit_indices), max(qubit_indices) + 1)
     )
-    vec = state_vector.vec
-    norb = state_vector.norb
-    nelec = state_vector.nelec
-
     if isinstance(op, DiagCoulombEvolutionSpinlessJW):
         vec = gates.apply_diag_coulomb_evolution(
             vec, op.mat, op.time, norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, GivensAnsatzOpSpinlessJW):
         if not consecutive_sorted:
@@ -206,7 +361,7 @@ def _evolve_state_vector_spinless(
         vec = protocols.apply_unitary(
             vec, op.givens_ansatz_op, norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, OrbitalRotationSpinlessJW):
         if not consecutive_sorted:
@@ -217,7 +372,7 @@ def _evolve_state_vector_spinless(
         vec = gates.apply_orbital_rotation(
             vec, op.orbital_rotation, norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, UCJOpSpinlessJW):
         if not consecutive_sorted:
@@ -228,10 +383,10 @@ def _evolve_state_vector_spinless(
         vec = protocols.apply_unitary(
             vec, op.ucj_op, norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, Barrier):
-        return state_vector
+        return vec
 
     if isinstance(op, Measure):
         raise ValueError(
@@ -240,39 +395,39 @@ def _evolve_state_vector_spinless(
 
     if isinstance(op, CPhaseGate):
         i, j = qubit_indices
-        (theta,) = op.params
+        (theta,) = params
         vec = gates.apply_num_num_interaction(
             vec, theta, target_orbs=(i, j), norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, CZGate):
         i, j = qubit_indices
         vec = gates.apply_num_num_interaction(
             vec, math.pi, target_orbs=(i, j), norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, PhaseGate):
         (orb,) = qubit_indices
-        (theta,) = op.params
+        (theta,) = params
         vec = gates.apply_num_interaction(
             vec, theta, orb, norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, RZGate):
         (orb,) = qubit_indices
-        (theta,) = op.params
+        (theta,) = params
         vec = gates.apply_num_interaction(
             vec, theta, orb, norb=norb, nelec=nelec, copy=False
         )
         vec *= cmath.rect(1, -0.5 * theta)
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, RZZGate):
         i, j = qubit_indices
-        (theta,) = op.params
+        (theta,) = params
         vec = gates.apply_num_num_interaction(
             vec, -2 * theta, target_orbs=(i, j), norb=norb, nelec=nelec, copy=False
         )
@@ -283,83 +438,80 @@ def _evolve_state_vector_spinless(
             vec, theta, j, norb=norb, nelec=nelec, copy=False
         )
         vec *= cmath.rect(1, -0.5 * theta)
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, ZGate):
         (orb,) = qubit_indices
         vec = gates.apply_num_interaction(
             vec, math.pi, orb, norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, SGate):
         (orb,) = qubit_indices
         vec = gates.apply_num_interaction(
             vec, 0.5 * math.pi, orb, norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, SdgGate):
         (orb,) = qubit_indices
         vec = gates.apply_num_interaction(
             vec, -0.5 * math.pi, orb, norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, TGate):
         (orb,) = qubit_indices
         vec = gates.apply_num_interaction(
             vec, 0.25 * math.pi, orb, norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, TdgGate):
         (orb,) = qubit_indices
         vec = gates.apply_num_interaction(
             vec, -0.25 * math.pi, orb, norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, SwapGate):
         i, j = qubit_indices
         vec = _apply_swap(vec, (i, j), norb=norb, nelec=nelec, copy=False)
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, iSwapGate):
         i, j = qubit_indices
         vec = _apply_iswap(vec, (i, j), norb=norb, nelec=nelec, copy=False)
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, XXPlusYYGate):
         i, j = qubit_indices
-        theta, beta = op.params
+        theta, beta = params
         vec = _apply_xx_plus_yy(
             vec, theta, beta, (i, j), norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, GlobalPhaseGate):
-        (phase,) = op.params
+        (phase,) = params
         vec *= cmath.rect(1, phase)
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     raise ValueError(f"Unsupported gate for spinless circuit: {op}.")
 
 
 def _evolve_state_vector_spinful(
-    state_vector: states.StateVector,
-    instruction: CircuitInstruction,
-    circuit: QuantumCircuit,
-) -> states.StateVector:
-    op = instruction.operation
-    qubit_indices = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
+    vec: np.ndarray,
+    op: Operation,
+    params: list[float],
+    qubit_indices: list[int],
+    norb: int,
+    nelec: tuple[int, int],
+) -> np.ndarray:
     consecutive_sorted = not qubit_indices or qubit_indices == list(
         range(min(qubit_indices), max(qubit_indices) + 1)
     )
-    vec = state_vector.vec
-    norb = state_vector.norb
-    nelec = cast(tuple[int, int], state_vector.nelec)
-
     if isinstance(op, DiagCoulombEvolutionJW):
         vec = gates.apply_diag_coulomb_evolution(
             vec,
@@ -370,7 +522,7 @@ def _evolve_state_vector_spinful(
             z_representation=op.z_representation,
             copy=False,
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, GivensAnsatzOpJW):
         if not consecutive_sorted:
@@ -381,7 +533,7 @@ def _evolve_state_vector_spinful(
         vec = protocols.apply_unitary(
             vec, op.givens_ansatz_op, norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, OrbitalRotationJW):
         if not consecutive_sorted:
@@ -395,7 +547,7 @@ def _evolve_state_vector_spinful(
         vec = gates.apply_orbital_rotation(
             vec, (None, op.orbital_rotation_b), norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, SimulateTrotterDoubleFactorizedJW):
         vec = trotter.simulate_trotter_double_factorized(
@@ -408,7 +560,7 @@ def _evolve_state_vector_spinful(
             order=op.order,
             copy=False,
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, (UCJOpSpinBalancedJW, UCJOpSpinUnbalancedJW)):
         if not consecutive_sorted:
@@ -419,10 +571,10 @@ def _evolve_state_vector_spinful(
         vec = protocols.apply_unitary(
             vec, op.ucj_op, norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, Barrier):
-        return state_vector
+        return vec
 
     if isinstance(op, Measure):
         raise ValueError(
@@ -434,11 +586,11 @@ def _evolve_state_vector_spinful(
         target_orbs: tuple[list[int], list[int]] = ([], [])
         target_orbs[i >= norb].append(i % norb)
         target_orbs[j >= norb].append(j % norb)
-        (theta,) = op.params
+        (theta,) = params
         vec = gates.apply_num_op_prod_interaction(
             vec, theta, target_orbs=target_orbs, norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, CZGate):
         i, j = qubit_indices
@@ -448,33 +600,33 @@ def _evolve_state_vector_spinful(
         vec = gates.apply_num_op_prod_interaction(
             vec, math.pi, target_orbs=target_orbs, norb=norb, nelec=nelec, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, PhaseGate):
         (orb,) = qubit_indices
         spin = Spin.ALPHA if orb < norb else Spin.BETA
-        (theta,) = op.params
+        (theta,) = params
         vec = gates.apply_num_interaction(
             vec, theta, orb % norb, norb=norb, nelec=nelec, spin=spin, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, RZGate):
         (orb,) = qubit_indices
         spin = Spin.ALPHA if orb < norb else Spin.BETA
-        (theta,) = op.params
+        (theta,) = params
         vec = gates.apply_num_interaction(
             vec, theta, orb % norb, norb=norb, nelec=nelec, spin=spin, copy=False
         )
         vec *= cmath.rect(1, -0.5 * theta)
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, RZZGate):
         i, j = qubit_indices
         target_orbs = ([], [])
         target_orbs[i >= norb].append(i % norb)
         target_orbs[j >= norb].append(j % norb)
-        (theta,) = op.params
+        (theta,) = params
         vec = gates.apply_num_op_prod_interaction(
             vec, -2 * theta, target_orbs=target_orbs, norb=norb, nelec=nelec, copy=False
         )
@@ -497,7 +649,7 @@ def _evolve_state_vector_spinful(
             copy=False,
         )
         vec *= cmath.rect(1, -0.5 * theta)
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, ZGate):
         (orb,) = qubit_indices
@@ -505,7 +657,7 @@ def _evolve_state_vector_spinful(
         vec = gates.apply_num_interaction(
             vec, math.pi, orb % norb, norb=norb, nelec=nelec, spin=spin, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, SGate):
         (orb,) = qubit_indices
@@ -519,7 +671,7 @@ def _evolve_state_vector_spinful(
             spin=spin,
             copy=False,
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, SdgGate):
         (orb,) = qubit_indices
@@ -533,7 +685,7 @@ def _evolve_state_vector_spinful(
             spin=spin,
             copy=False,
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, TGate):
         (orb,) = qubit_indices
@@ -547,7 +699,7 @@ def _evolve_state_vector_spinful(
             spin=spin,
             copy=False,
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, TdgGate):
         (orb,) = qubit_indices
@@ -561,7 +713,7 @@ def _evolve_state_vector_spinful(
             spin=spin,
             copy=False,
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, SwapGate):
         i, j = qubit_indices
@@ -574,7 +726,7 @@ def _evolve_state_vector_spinful(
         vec = _apply_swap(
             vec, (i % norb, j % norb), norb=norb, nelec=nelec, spin=spin, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, iSwapGate):
         i, j = qubit_indices
@@ -587,7 +739,7 @@ def _evolve_state_vector_spinful(
         vec = _apply_iswap(
             vec, (i % norb, j % norb), norb=norb, nelec=nelec, spin=spin, copy=False
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, XXPlusYYGate):
         i, j = qubit_indices
@@ -597,7 +749,7 @@ def _evolve_state_vector_spinful(
                 "of the same spin."
             )
         spin = Spin.ALPHA if i < norb else Spin.BETA
-        theta, beta = op.params
+        theta, beta = params
         vec = _apply_xx_plus_yy(
             vec,
             theta,
@@ -608,12 +760,12 @@ def _evolve_state_vector_spinful(
             spin=spin,
             copy=False,
         )
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     if isinstance(op, GlobalPhaseGate):
-        (phase,) = op.params
+        (phase,) = params
         vec *= cmath.rect(1, phase)
-        return states.StateVector(vec=vec, norb=norb, nelec=nelec)
+        return vec
 
     raise ValueError(f"Unsupported gate for spinful circuit: {op}.")
 
@@ -11,9 +11,11 @@
 """Qiskit transpiler passes for fermionic quantum circuits."""
 
 from ffsim.qiskit.transpiler_passes.drop_negligible import DropNegligible
+from ffsim.qiskit.transpiler_passes.fuse_qiskit_gates import FuseQiskitGates
 from ffsim.qiskit.transpiler_passes.merge_orbital_rotations import MergeOrbitalRotations
 
 __all__ = [
     "DropNegligible",
+    "FuseQiskitGates",
     "MergeOrbitalRotations",
 ]
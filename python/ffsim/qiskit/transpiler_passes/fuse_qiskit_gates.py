@@ -0,0 +1,251 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Transpiler pass to fuse Qiskit gates into fermionic gates."""
+
+from __future__ import annotations
+
+import cmath
+import math
+
+import numpy as np
+from qiskit.circuit import Gate, ParameterExpression, Qubit
+from qiskit.circuit.library import (
+    CPhaseGate,
+    CZGate,
+    GlobalPhaseGate,
+    PhaseGate,
+    RZGate,
+    RZZGate,
+    SdgGate,
+    SGate,
+    TdgGate,
+    TGate,
+    XXPlusYYGate,
+    ZGate,
+    iSwapGate,
+)
+from qiskit.dagcircuit import DAGCircuit, DAGOpNode
+from qiskit.dagcircuit.collect_blocks import BlockCollector
+from qiskit.transpiler.basepasses import TransformationPass
+
+from ffsim.qiskit.gates import (
+    DiagCoulombEvolutionJW,
+    DiagCoulombEvolutionSpinlessJW,
+    OrbitalRotationJW,
+    OrbitalRotationSpinlessJW,
+)
+
+# Phases of single-qubit diagonal gates with fixed angles
+_FIXED_PHASES = {
+    ZGate: math.pi,
+    SGate: 0.5 * math.pi,
+    SdgGate: -0.5 * math.pi,
+    TGate: 0.25 * math.pi,
+    TdgGate: -0.25 * math.pi,
+}
+_DIAGONAL_GATES = (CPhaseGate, CZGate, PhaseGate, RZGate, RZZGate, *_FIXED_PHASES)
+_ROTATION_GATES = (XXPlusYYGate, iSwapGate)
+
+
+class FuseQiskitGates(TransformationPass):
+    """Fuse runs of Qiskit gates into fermionic gates.
+
+    Circuits built from Qiskit gates are simulated one gate at a time, and each gate
+    requires a pass over the whole state vector. This pass collects maximal blocks
+    of gates that can be combined and replaces each of them by a single fermionic
+    gate acting on all of the qubits:
+
+    - ``XXPlusYYGate`` and ``iSwapGate`` gates acting on neighboring qubits of the
+      same spin species are Givens rotations under the Jordan-Wigner
+      transformation. Blocks of them are fused into an :class:`OrbitalRotationJW`
+      gate, or an :class:`OrbitalRotationSpinlessJW` gate for spinless circuits.
+    - The diagonal gates ``CPhaseGate``, ``CZGate``, ``PhaseGate``, ``RZGate``,
+      ``RZZGate``, ``ZGate``, ``SGate``, ``SdgGate``, ``TGate`` and ``TdgGate``
+      are evolutions by polynomials of degree at most two in the number operators.
+      Blocks of them are fused into a :class:`DiagCoulombEvolutionJW` gate, or a
+      :class:`DiagCoulombEvolutionSpinlessJW` gate for spinless circuits, followed
+      by a ``GlobalPhaseGate`` if needed.
+
+    Gates whose parameters are unbound are not fused. The qubits are assumed to be
+    ordered as in the circuits accepted by :class:`FfsimSampler`: for spinful
+    circuits, the first ``norb`` qubits represent the spin alpha orbitals and the
+    last ``norb`` qubits represent the spin beta orbitals.
+    """
+
+    def __init__(self, norb: int | None = None):
+        """Initialize the pass.
+
+        Args:
+            norb: The number of spatial orbitals of a spinful circuit, which must act
+                on ``2 * norb`` qubits. If not specified, the circuit is treated as
+                a spinless circuit with one orbital per qubit.
+        """
+        super().__init__()
+        self.norb = norb
+
+    def run(self, dag: DAGCircuit) -> DAGCircuit:
+        n_qubits = dag.num_qubits()
+        if self.norb is not None and n_qubits != 2 * self.norb:
+            raise ValueError(
+                "The circuit must act on 2 * norb qubits. "
+                f"Got norb={self.norb} and a circuit with {n_qubits} qubits."
+            )
+        qubit_indices = {qubit: i for i, qubit in enumerate(dag.qubits)}
+
+        # The fused gates act on all of the qubits. To avoid serializing unrelated
+        # operations while the blocks are being collected, each block is first
+        # replaced by a placeholder acting only on the qubits of the block.
+        blocks = BlockCollector(dag).collect_all_matching_blocks(
+            lambda node: _is_fusable(node, _DIAGONAL_GATES), split_blocks=False
+        )
+        for block in blocks:
+            self._replace_block(dag, block, self._fuse_diagonal(block, qubit_indices))
+        blocks = BlockCollector(dag).collect_all_matching_blocks(
+            lambda node: _is_fusable(node, _ROTATION_GATES)
+            and self._is_givens_rotation([qubit_indices[q] for q in node.qargs]),
+            split_blocks=False,
+        )
+        for block in blocks:
+            self._replace_block(dag, block, self._fuse_rotation(block, qubit_indices))
+
+        # Expand the placeholders into the fused gates
+        new_dag = dag.copy_empty_like()
+        for node in dag.topological_op_nodes():
+            if isinstance(node.op, _FusedBlock):
+                for gate in node.op.gates:
+                    new_dag.apply_operation_back(
+                        gate, tuple(dag.qubits[: gate.num_qubits]), (), check=False
+                    )
+            else:
+                new_dag.apply_operation_back(node.op, node.qargs, node.cargs)
+        return new_dag
+
+    def _replace_block(
+        self, dag: DAGCircuit, block: list[DAGOpNode], gates: list[Gate]
+    ) -> None:
+        qubits = {qubit for node in block for qubit in node.qargs}
+        wire_pos_map = {
+            qubit: i for i, qubit in enumerate(q for q in dag.qubits if q in qubits)
+        }
+        dag.replace_block_with_op(
+            block, _FusedBlock(len(qubits), gates), wire_pos_map, cycle_check=False
+        )
+
+    def _is_givens_rotation(self, qubits: list[int]) -> bool:
+        i, j = qubits
+        if abs(i - j) != 1:
+            return False
+        return self.norb is None or (i < self.norb) == (j < self.norb)
+
+    def _fuse_diagonal(
+        self, block: list[DAGOpNode], qubit_indices: dict[Qubit, int]
+    ) -> list[Gate]:
+        """Return the gates that implement a block of diagonal gates."""
+        n_qubits = len(qubit_indices)
+        # The block applies exp(i phase) exp(i sum_{p <= q} coeffs[p, q] n_p n_q)
+        coeffs = np.zeros((n_qubits, n_qubits))
+        phase = 0.0
+        for node in block:
+            op = node.op
+            qubits = sorted(qubit_indices[qubit] for qubit in node.qargs)
+            if isinstance(op, (PhaseGate, RZGate)):
+                (p,) = qubits
+                theta = float(op.params[0])
+                coeffs[p, p] += theta
+                if isinstance(op, RZGate):
+                    phase -= 0.5 * theta
+            elif isinstance(op, CPhaseGate):
+                p, q = qubits
+                coeffs[p, q] += float(op.params[0])
+            elif isinstance(op, CZGate):
+                p, q = qubits
+                coeffs[p, q] += math.pi
+            elif isinstance(op, RZZGate):
+                p, q = qubits
+                theta = float(op.params[0])
+                coeffs[p, q] -= 2 * theta
+                coeffs[p, p] += theta
+                coeffs[q, q] += theta
+                phase -= 0.5 * theta
+            else:
+                (p,) = qubits
+                coeffs[p, p] += next(
+                    theta
+                    for gate_type, theta in _FIXED_PHASES.items()
+                    if isinstance(op, gate_type)
+                )
+        # With a time of 1, the diagonal Coulomb evolution applies exp(-i Z_pp n_p / 2)
+        # and exp(-i Z_pq n_p n_q) for p < q
+        mat = -(coeffs + np.triu(coeffs, 1).T)
+        mat[np.diag_indices(n_qubits)] *= 2
+        gates: list[Gate]
+        if self.norb is None:
+            gates = [DiagCoulombEvolutionSpinlessJW(n_qubits, mat, 1.0)]
+        else:
+            norb = self.norb
+            gates = [
+                DiagCoulombEvolutionJW(
+                    norb,
+                    (mat[:norb, :norb], mat[:norb, norb:], mat[norb:, norb:]),
+                    1.0,
+                )
+            ]
+        if phase:
+            gates.append(GlobalPhaseGate(phase))
+        return gates
+
+    def _fuse_rotation(
+        self, block: list[DAGOpNode], qubit_indices: dict[Qubit, int]
+    ) -> list[Gate]:
+        """Return the gate that implements a block of Givens rotations."""
+        mat = np.eye(len(qubit_indices), dtype=complex)
+        for node in block:
+            op = node.op
+            p, q = [qubit_indices[qubit] for qubit in node.qargs]
+            if isinstance(op, XXPlusYYGate):
+                theta, beta = (float(param) for param in op.params)
+                givens = _givens_matrix(0.5 * theta, -beta - 0.5 * math.pi)
+            else:
+                givens = _givens_matrix(0.5 * math.pi, 0.5 * math.pi)
+            mat[[p, q]] = givens @ mat[[p, q]]
+        if self.norb is None:
+            return [OrbitalRotationSpinlessJW(len(mat), mat, validate=False)]
+        norb = self.norb
+        return [
+            OrbitalRotationJW(
+                norb, (mat[:norb, :norb], mat[norb:, norb:]), validate=False
+            )
+        ]
+
+
+class _FusedBlock(Gate):
+    """Placeholder for a block of gates that has been fused."""
+
+    def __init__(self, num_qubits: int, gates: list[Gate]):
+        self.gates = gates
+        super().__init__("fused_block", num_qubits, [])
+
+
+def _is_fusable(node: DAGOpNode, gate_types: tuple[type[Gate], ...]) -> bool:
+    return isinstance(node.op, gate_types) and not any(
+        isinstance(param, ParameterExpression) and param.parameters
+        for param in node.op.params
+    )
+
+
+def _givens_matrix(theta: float, phi: float) -> np.ndarray:
+    """Return the matrix of a Givens rotation on its two orbitals.
+
+    See :func:`ffsim.apply_givens_rotation`.
+    """
+    c = math.cos(theta)
+    s = cmath.exp(1j * phi) * math.sin(theta)
+    return np.array([[c, s], [-s.conjugate(), c]])
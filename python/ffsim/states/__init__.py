@@ -26,8 +26,10 @@ from ffsim.states.slater import (
 )
 from ffsim.states.states import (
     StateVector,
+    StateVectorSampler,
     dim,
     dims,
+    memmap_state_vector,
     sample_state_vector,
     spin_square,
 )
@@ -37,12 +39,14 @@ __all__ = [
     "BitstringType",
     "ProductStateSum",
     "StateVector",
+    "StateVectorSampler",
     "addresses_to_strings",
     "dim",
     "dims",
     "expectation_one_body_power",
     "expectation_one_body_product",
     "hartree_fock_state",
+    "memmap_state_vector",
     "rdms",
     "sample_slater_determinant",
     "sample_state_vector",
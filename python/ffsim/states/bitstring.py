@@ -78,40 +78,33 @@ def convert_bitstring_type(
 
     if input_type is BitstringType.STRING:
         strings = cast(list[str], strings)
-
         if output_type is BitstringType.INT:
-            return [int(s, base=2) for s in strings]
-
+            if not len(strings):
+                return []
+            return _bit_array_to_int_list(_str_list_to_bit_array(strings))
         if output_type is BitstringType.BIT_ARRAY:
-            if not strings:
+            if not len(strings):
                 return np.empty((0, length), dtype=bool)
-            return np.array([[b == "1" for b in s] for s in strings])
+            return _str_list_to_bit_array(strings)
 
     if input_type is BitstringType.INT:
         strings = cast(Sequence[int], strings)
-
+        if not len(strings):
+            if output_type is BitstringType.STRING:
+                return []
+            return np.empty((0, length), dtype=bool)
+        bits = _int_strings_to_bit_array(strings, length)
         if output_type is BitstringType.STRING:
-            return [f"{string:0{length}b}" for string in strings]
-
+            return _bit_array_to_str_list(bits)
         if output_type is BitstringType.BIT_ARRAY:
-            if not strings:
-                return np.empty((0, length), dtype=bool)
-            return np.array(
-                [[s >> i & 1 for i in range(length - 1, -1, -1)] for s in strings],
-                dtype=bool,
-            )
+            return bits
 
     if input_type is BitstringType.BIT_ARRAY:
         strings = cast(np.ndarray, strings)
-
         if output_type is BitstringType.STRING:
-            return ["".join("1" if bit else "0" for bit in bits) for bits in strings]
-
+            return _bit_array_to_str_list(strings)
         if output_type is BitstringType.INT:
-            return [
-                sum(bit * (1 << i) for i, bit in enumerate(bits[::-1]))
-                for bits in strings
-            ]
+            return _bit_array_to_int_list(strings)
 
 
 def restrict_bitstrings(
@@ -129,17 +122,22 @@ def restrict_bitstrings(
     Returns:
         The restricted bitstrings.
     """
+    columns = [-1 - i for i in indices[::-1]]
     if bitstring_type is BitstringType.STRING:
-        return [
-            "".join(s[-1 - i] for i in indices[::-1]) for s in cast(list[str], strings)
-        ]
+        if not len(strings):
+            return []
+        bits = _str_list_to_bit_array(cast(list[str], strings))
+        return _bit_array_to_str_list(bits[:, columns])
     if bitstring_type is BitstringType.INT:
-        return [
-            sum((s >> index & 1) * (1 << i) for i, index in enumerate(indices))
-            for s in cast(list[int], strings)
-        ]
+        int_strings = _as_uint64_strings(cast(list[int], strings))
+        if int_strings is None:
+            return [
+                sum((s >> index & 1) * (1 << i) for i, index in enumerate(indices))
+                for s in cast(list[int], strings)
+            ]
+        return _restrict_uint64_strings(int_strings, indices).tolist()
     if bitstring_type is BitstringType.BIT_ARRAY:
-        return cast(np.ndarray, strings)[:, [-1 - i for i in indices[::-1]]]
+        return cast(np.ndarray, strings)[:, columns]
 
 
 def concatenate_bitstrings(
@@ -163,9 +161,24 @@ def concatenate_bitstrings(
         The concatenated bitstrings.
     """
     if bitstring_type is BitstringType.STRING:
-        return ["".join((s_b, s_a)) for s_a, s_b in zip(strings_a, strings_b)]
+        if not len(strings_a):
+            return []
+        return np.char.add(
+            np.asarray(strings_b, dtype=str), np.asarray(strings_a, dtype=str)
+        ).tolist()
     if bitstring_type is BitstringType.INT:
-        return [(s_b << length) + s_a for s_a, s_b in zip(strings_a, strings_b)]
+        int_strings_a = _as_uint64_strings(cast(list[int], strings_a))
+        int_strings_b = _as_uint64_strings(cast(list[int], strings_b))
+        if int_strings_a is None or int_strings_b is None:
+            return [(s_b << length) + s_a for s_a, s_b in zip(strings_a, strings_b)]
+        length_b = int(np.bitwise_or.reduce(int_strings_b)).bit_length()
+        return _concatenate_uint64_strings(
+            int_strings_a,
+            int_strings_b,
+            length,
+            length_b,
+            BitstringType.INT,
+        )
     if bitstring_type is BitstringType.BIT_ARRAY:
         return np.concatenate([strings_b, strings_a], axis=1)
 
@@ -227,39 +240,26 @@ def addresses_to_strings(
         The bitstrings. The type of the output depends on `bitstring_type` and
         `concatenate`.
     """
+    addresses = np.asarray(addresses, dtype=np.int64)
     if isinstance(nelec, int):
         # Spinless case
-        return convert_bitstring_type(
-            [
-                int(s)
-                for s in cistring.addrs2str(norb=norb, nelec=nelec, addrs=addresses)
-            ],
-            input_type=BitstringType.INT,
-            output_type=bitstring_type,
-            length=norb,
-        )
+        strings = _addresses_to_uint64_strings(addresses, norb, nelec)
+        return _convert_uint64_strings(strings, bitstring_type, norb)
 
     # Spinful case
     n_alpha, n_beta = nelec
     dim_b = math.comb(norb, n_beta)
     indices_a, indices_b = np.divmod(addresses, dim_b)
-    strings_a = convert_bitstring_type(
-        [int(s) for s in cistring.addrs2str(norb=norb, nelec=n_alpha, addrs=indices_a)],
-        input_type=BitstringType.INT,
-        output_type=bitstring_type,
-        length=norb,
-    )
-    strings_b = convert_bitstring_type(
-        [int(s) for s in cistring.addrs2str(norb=norb, nelec=n_beta, addrs=indices_b)],
-        input_type=BitstringType.INT,
-        output_type=bitstring_type,
-        length=norb,
-    )
+    strings_a = _addresses_to_uint64_strings(indices_a, norb, n_alpha)
+    strings_b = _addresses_to_uint64_strings(indices_b, norb, n_beta)
     if concatenate:
-        return concatenate_bitstrings(
-            strings_a, strings_b, bitstring_type=bitstring_type, length=norb
+        return _concatenate_uint64_strings(
+            strings_a, strings_b, norb, norb, bitstring_type
         )
-    return strings_a, strings_b
+    return (
+        _convert_uint64_strings(strings_a, bitstring_type, norb),
+        _convert_uint64_strings(strings_b, bitstring_type, norb),
+    )
 
 
 def strings_to_addresses(
@@ -336,20 +336,31 @@ def strings_to_addresses(
     if not len(strings):
         return np.array([])
     if isinstance(strings, np.ndarray) and strings.ndim == 2:
-        bitstring_type = BitstringType.BIT_ARRAY
+        bits = strings
     elif isinstance(strings[0], str):
-        bitstring_type = BitstringType.STRING
+        bits = _str_list_to_bit_array(cast(list[str], strings))
     else:
-        bitstring_type = BitstringType.INT
-    strings = convert_bitstring_type(
-        strings, input_type=bitstring_type, output_type=BitstringType.INT, length=norb
-    )
-    if isinstance(nelec, int):
-        return cistring.strs2addr(norb=norb, nelec=nelec, strings=strings)
+        bits = None
+
+    if bits is None:
+        int_strings = np.asarray(strings)
+        if isinstance(nelec, int):
+            return cistring.strs2addr(norb=norb, nelec=nelec, strings=int_strings)
+        strings_a = (int_strings & ((1 << norb) - 1)).astype(np.int64)
+        strings_b = (int_strings >> norb).astype(np.int64)
+    else:
+        # Split the bits so that each spin sector fits in a 64-bit integer
+        n_bits = bits.shape[1]
+        strings_a = _bit_array_to_uint64_strings(bits[:, max(n_bits - norb, 0) :])
+        if isinstance(nelec, int):
+            return cistring.strs2addr(
+                norb=norb, nelec=nelec, strings=strings_a.astype(np.int64)
+            )
+        strings_b = _bit_array_to_uint64_strings(bits[:, : max(n_bits - norb, 0)])
+        strings_a = strings_a.astype(np.int64)
+        strings_b = strings_b.astype(np.int64)
+
     n_alpha, n_beta = nelec
-    strings = np.asarray(strings)
-    strings_a = strings & ((1 << norb) - 1)
-    strings_b = strings >> norb
     addrs_a = cistring.strs2addr(norb=norb, nelec=n_alpha, strings=strings_a)
     addrs_b = cistring.strs2addr(norb=norb, nelec=n_beta, strings=strings_b)
     dim_b = math.comb(norb, n_beta)
@@ -359,3 +370,146 @@ def strings_to_addresses(
 def bitstring_to_occupied_orbitals(bitstring: int) -> list[int]:
     """Return a list of bit indices where a bitstring is equal to one."""
     return [i for i in range(bitstring.bit_length()) if bitstring >> i & 1]
+
+
+def _addresses_to_uint64_strings(
+    addresses: np.ndarray, norb: int, nocc: int
+) -> np.ndarray:
+    """Convert addresses of a single spin sector to bitstrings in a uint64 array."""
+    if not len(addresses):
+        return np.zeros(0, dtype=np.uint64)
+    return cistring.addrs2str(norb=norb, nelec=nocc, addrs=addresses).astype(np.uint64)
+
+
+def _as_uint64_strings(strings: Sequence[int] | np.ndarray) -> np.ndarray | None:
+    """Return integer bitstrings as a uint64 array, or None if they don't fit."""
+    arr = np.asarray(strings)
+    if not arr.size:
+        return np.zeros(0, dtype=np.uint64)
+    if arr.dtype.kind not in "iu" or (arr.dtype.kind == "i" and arr.min() < 0):
+        return None
+    return arr.astype(np.uint64, copy=False)
+
+
+def _restrict_uint64_strings(strings: np.ndarray, indices: Sequence[int]) -> np.ndarray:
+    """Restrict bitstrings stored in a uint64 array to a subset of bit indices."""
+    if list(indices) == list(range(len(indices))):
+        return strings & np.uint64((1 << len(indices)) - 1)
+    result = np.zeros_like(strings)
+    for i, index in enumerate(indices):
+        result |= ((strings >> np.uint64(index)) & np.uint64(1)) << np.uint64(i)
+    return result
+
+
+def _convert_uint64_strings(
+    strings: np.ndarray,
+    bitstring_type: BitstringType,
+    length: int,
+):
+    """Convert bitstrings stored in a uint64 array to the given bitstring type."""
+    if bitstring_type is BitstringType.INT:
+        return strings.tolist()
+    bits = _uint64_strings_to_bit_array(strings, length)
+    if bitstring_type is BitstringType.BIT_ARRAY:
+        return bits
+    return _bit_array_to_str_list(bits)
+
+
+def _concatenate_uint64_strings(
+    strings_a: np.ndarray,
+    strings_b: np.ndarray,
+    length_a: int,
+    length_b: int,
+    bitstring_type: BitstringType,
+):
+    """Concatenate bitstrings stored in uint64 arrays and convert them."""
+    if bitstring_type is BitstringType.INT:
+        length = length_a + length_b
+        if length <= 64:
+            strings = strings_a.copy()
+            if length_b:
+                strings |= strings_b << np.uint64(length_a)
+            return strings.tolist()
+        strings = strings_b.astype(object) << length_a | strings_a.astype(object)
+        return strings.tolist()
+    bits = np.concatenate(
+        [
+            _uint64_strings_to_bit_array(strings_b, length_b),
+            _uint64_strings_to_bit_array(strings_a, length_a),
+        ],
+        axis=1,
+    )
+    if bitstring_type is BitstringType.BIT_ARRAY:
+        return bits
+    return _bit_array_to_str_list(bits)
+
+
+def _uint64_strings_to_bit_array(strings: np.ndarray, length: int) -> np.ndarray:
+    """Convert bitstrings stored in a uint64 array to a bit array."""
+    shifts = np.arange(length - 1, -1, -1, dtype=np.uint64)
+    return ((strings[:, None] >> shifts) & np.uint64(1)).astype(bool)
+
+
+def _bit_array_to_uint64_strings(bits: np.ndarray) -> np.ndarray:
+    """Convert a bit array with at most 64 columns to bitstrings in a uint64 array."""
+    _, length = bits.shape
+    shifts = np.arange(length - 1, -1, -1, dtype=np.uint64)
+    return np.bitwise_or.reduce(bits.astype(np.uint64) << shifts, axis=1)
+
+
+def _int_strings_to_bit_array(
+    strings: Sequence[int] | np.ndarray, length: int
+) -> np.ndarray:
+    """Convert integer bitstrings to a bit array."""
+    int_strings = _as_uint64_strings(strings)
+    if int_strings is not None and length <= 64:
+        return _uint64_strings_to_bit_array(int_strings, length)
+    # Split Python integers into 64-bit words, least significant word first
+    n_words = -(-length // 64)
+    mask = (1 << 64) - 1
+    words = np.array(
+        [[s >> (64 * i) & mask for i in range(n_words)] for s in strings],
+        dtype=np.uint64,
+    )
+    bits = np.concatenate(
+        [_uint64_strings_to_bit_array(word, 64) for word in words.T[::-1]], axis=1
+    )
+    return bits[:, bits.shape[1] - length :]
+
+
+def _bit_array_to_int_list(bits: np.ndarray) -> list[int]:
+    """Convert a bit array to a list of Python integers."""
+    _, length = bits.shape
+    if length <= 64:
+        return cast(list[int], _bit_array_to_uint64_strings(bits).tolist())
+    # Combine 64-bit words, most significant word first
+    n_words = -(-length // 64)
+    padded = np.zeros((len(bits), 64 * n_words), dtype=bool)
+    padded[:, padded.shape[1] - length :] = bits
+    strings = np.zeros(len(bits), dtype=object)
+    for i in range(n_words):
+        word = _bit_array_to_uint64_strings(padded[:, 64 * i : 64 * (i + 1)])
+        strings = strings << 64 | word.astype(object)
+    return cast(list[int], strings.tolist())
+
+
+def _str_list_to_bit_array(strings: Sequence[str]) -> np.ndarray:
+    """Convert a list of strings to a bit array without looping over the bits.
+
+    Strings shorter than the longest one are padded with zeros on the left.
+    """
+    arr = np.asarray(strings, dtype=np.bytes_)
+    length = int(np.char.str_len(arr).max())
+    if not length:
+        return np.zeros((len(arr), 0), dtype=bool)
+    arr = np.char.zfill(arr, length).astype(f"S{length}")
+    return arr.view(np.uint8).reshape(len(arr), length) == ord("1")
+
+
+def _bit_array_to_str_list(bits: np.ndarray) -> list[str]:
+    """Convert a bit array to a list of strings without looping over the bits."""
+    n_strings, length = bits.shape
+    if not length:
+        return [""] * n_strings
+    chars = np.ascontiguousarray(bits, dtype=np.uint8) + np.uint8(ord("0"))
+    return cast(list[str], chars.view(f"S{length}")[:, 0].astype(str).tolist())
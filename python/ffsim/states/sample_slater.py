@@ -12,7 +12,6 @@
 
 from __future__ import annotations
 
-import itertools
 from collections.abc import Sequence
 from typing import cast
 
@@ -25,6 +24,9 @@ from ffsim.states.bitstring import (
     restrict_bitstrings,
 )
 
+# Maximum number of entries of the array of factors stored at once
+_BATCH_SIZE = 1 << 23
+
 
 def sample_slater_determinant(
     rdm: np.ndarray | tuple[np.ndarray, np.ndarray],
@@ -80,11 +82,11 @@ def sample_slater_determinant(
         if orbs is None:
             orbs = range(norb)
         orbs = cast(Sequence[int], orbs)
-        strings = _sample_slater_spinless(rdm, nelec, shots, rng)
-        strings = restrict_bitstrings(strings, orbs, bitstring_type=BitstringType.INT)
+        bits = _sample_slater_spinless(rdm, nelec, shots, rng)
+        bits = restrict_bitstrings(bits, orbs, bitstring_type=BitstringType.BIT_ARRAY)
         return convert_bitstring_type(
-            strings,
-            BitstringType.INT,
+            bits,
+            BitstringType.BIT_ARRAY,
             bitstring_type,
             length=len(orbs),
         )
@@ -98,33 +100,33 @@ def sample_slater_determinant(
     orbs_a, orbs_b = orbs
     orbs_a = cast(Sequence[int], orbs_a)
     orbs_b = cast(Sequence[int], orbs_b)
-    strings_a = _sample_slater_spinless(rdm_a, n_a, shots, rng)
-    strings_b = _sample_slater_spinless(rdm_b, n_b, shots, rng)
-    strings_a = restrict_bitstrings(strings_a, orbs_a, bitstring_type=BitstringType.INT)
-    strings_b = restrict_bitstrings(strings_b, orbs_b, bitstring_type=BitstringType.INT)
+    bits_a = _sample_slater_spinless(rdm_a, n_a, shots, rng)
+    bits_b = _sample_slater_spinless(rdm_b, n_b, shots, rng)
+    bits_a = restrict_bitstrings(bits_a, orbs_a, bitstring_type=BitstringType.BIT_ARRAY)
+    bits_b = restrict_bitstrings(bits_b, orbs_b, bitstring_type=BitstringType.BIT_ARRAY)
 
     if concatenate:
-        strings = concatenate_bitstrings(
-            strings_a,
-            strings_b,
-            BitstringType.INT,
+        bits = concatenate_bitstrings(
+            bits_a,
+            bits_b,
+            BitstringType.BIT_ARRAY,
             length=len(orbs_a),
         )
         return convert_bitstring_type(
-            strings,
-            BitstringType.INT,
+            bits,
+            BitstringType.BIT_ARRAY,
             bitstring_type,
             length=len(orbs_a) + len(orbs_b),
         )
 
     return convert_bitstring_type(
-        strings_a,
-        BitstringType.INT,
+        bits_a,
+        BitstringType.BIT_ARRAY,
         bitstring_type,
         length=len(orbs_a),
     ), convert_bitstring_type(
-        strings_b,
-        BitstringType.INT,
+        bits_b,
+        BitstringType.BIT_ARRAY,
         bitstring_type,
         length=len(orbs_b),
     )
@@ -135,12 +137,12 @@ def _sample_slater_spinless(
     nelec: int,
     shots: int,
     seed: np.random.Generator | int | None = None,
-) -> list[int]:
+) -> np.ndarray:
     """Collect samples of electronic configurations from a Slater determinant.
 
     The Slater determinant is defined by its one-body reduced density matrix (RDM).
     The sampler uses a determinantal point process to auto-regressively produce
-    uncorrelated samples.
+    uncorrelated samples. The shots are sampled in batches.
 
     Args:
         rdm: The one-body reduced density matrix that defines the Slater determinant.
@@ -149,65 +151,74 @@ def _sample_slater_spinless(
             Should be a valid input to ``np.random.default_rng``.
 
     Returns:
-        The sampled bitstrings in integer format.
+        The sampled bitstrings as a bit array.
     """
     norb, _ = rdm.shape
+    bits = np.zeros((shots, norb), dtype=bool)
 
     if nelec == 0:
-        return [0] * shots
+        return bits
 
     if nelec == norb:
-        return [(1 << norb) - 1] * shots
+        bits[:] = True
+        return bits
 
     rng = np.random.default_rng(seed)
-    samples = [_autoregressive_slater(rdm, norb, nelec, rng) for _ in range(shots)]
-    return [sum(1 << orb for orb in sample) for sample in samples]
+    batch_size = max(1, _BATCH_SIZE // (norb * nelec))
+    for start in range(0, shots, batch_size):
+        occupied = _autoregressive_slater(
+            rdm, norb, nelec, min(batch_size, shots - start), rng
+        )
+        rows = np.arange(start, start + len(occupied))[:, None]
+        bits[rows, norb - 1 - occupied] = True
+    return bits
 
 
 def _autoregressive_slater(
     rdm: np.ndarray,
     norb: int,
     nelec: int,
+    shots: int,
     seed: np.random.Generator | int | None = None,
-) -> set[int]:
+) -> np.ndarray:
     """Autoregressively sample occupied orbitals for a Slater determinant.
 
+    All shots are sampled at once. At each step, the probability of occupying an
+    orbital is given by the diagonal of the RDM conditioned on the orbitals occupied
+    so far. The conditioned RDM is the Schur complement of the RDM restricted to the
+    occupied orbitals, which is tracked by a low-rank update with one new factor
+    per step, as in an incremental Cholesky decomposition.
+
     Args:
         rdm: The one-body reduced density matrix.
         norb: The number of orbitals.
         nelec: The number of electrons.
+        shots: The number of samples.
         seed: A seed to initialize the pseudorandom number generator.
             Should be a valid input to ``np.random.default_rng``.
 
     Returns:
-        A set containing the occupied orbitals.
+        An integer array of shape (shots, nelec) whose rows contain the occupied
+        orbitals.
     """
     rng = np.random.default_rng(seed)
-    orb = rng.choice(norb, p=np.diag(rdm).real / nelec)
-    sample = {orb}
-    for i in range(nelec - 1):
-        index = rng.choice(norb - 1 - i, p=_generate_probs(rdm, sample, norb))
-        empty_orbitals = (orb for orb in range(norb) if orb not in sample)
-        sample.add(next(itertools.islice(empty_orbitals, index, None)))
-    return sample
-
-
-def _generate_probs(rdm: np.ndarray, sample: set[int], norb: int) -> np.ndarray:
-    """Computes the probabilities for the next occupied orbital.
-
-    This is a step of the autoregressive sampling, and uses Bayes's rule.
-
-    Args:
-        rdm: A Numpy array with the one-body reduced density matrix.
-        sample: The list of already occupied orbitals.
-        norb: The number of orbitals.
-
-    Returns:
-        The probabilities for the next empty orbital to occupy.
-    """
-    probs = np.zeros(norb - len(sample))
-    empty_orbitals = (orb for orb in range(norb) if orb not in sample)
-    for i, orb in enumerate(empty_orbitals):
-        indices = list(sample | {orb})
-        probs[i] = np.linalg.det(rdm[indices][:, indices]).real
-    return probs / np.sum(probs)
+    rows = np.arange(shots)
+    probs = np.tile(np.diag(rdm).real, (shots, 1))
+    factors = np.zeros((shots, nelec, norb), dtype=rdm.dtype)
+    occupied = np.zeros((shots, nelec), dtype=int)
+    for i in range(nelec):
+        # Sample the next orbital from the conditional probabilities
+        cumulative = np.cumsum(probs, axis=1)
+        thresholds = (1 - rng.random(shots)) * cumulative[:, -1]
+        orbs = np.minimum(np.sum(cumulative < thresholds[:, None], axis=1), norb - 1)
+        occupied[:, i] = orbs
+        # Compute the new factor of the conditioned RDM
+        col = rdm[:, orbs].T - np.einsum(
+            "bkn,bk->bn", factors[:, :i], factors[rows, :i, orbs].conj()
+        )
+        col /= np.sqrt(probs[rows, orbs])[:, None]
+        factors[:, i] = col
+        probs -= np.abs(col) ** 2
+        probs[rows, orbs] = 0
+        np.maximum(probs, 0, out=probs)
+    return occupied
@@ -108,7 +108,9 @@ def slater_determinant(
     return vec
 
 
-def hartree_fock_state(norb: int, nelec: int | tuple[int, int]) -> np.ndarray:
+def hartree_fock_state(
+    norb: int, nelec: int | tuple[int, int], *, dtype=complex
+) -> np.ndarray:
     """Return the Hartree-Fock state.
 
     Args:
@@ -116,15 +118,20 @@ def hartree_fock_state(norb: int, nelec: int | tuple[int, int]) -> np.ndarray:
         nelec: Either a single integer representing the number of fermions for a
             spinless system, or a pair of integers storing the numbers of spin alpha
             and spin beta fermions.
+        dtype: The data type to use for the result. Pass ``np.complex64`` to
+            simulate in single precision.
 
     Returns:
         The Hartree-Fock state as a state vector.
     """
     if isinstance(nelec, int):
-        return slater_determinant(norb, occupied_orbitals=range(nelec))
-
-    n_alpha, n_beta = nelec
-    return slater_determinant(norb, occupied_orbitals=(range(n_alpha), range(n_beta)))
+        vec = slater_determinant(norb, occupied_orbitals=range(nelec))
+    else:
+        n_alpha, n_beta = nelec
+        vec = slater_determinant(
+            norb, occupied_orbitals=(range(n_alpha), range(n_beta))
+        )
+    return vec.astype(dtype, copy=False)
 
 
 @overload
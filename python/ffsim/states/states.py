@@ -13,6 +13,7 @@
 from __future__ import annotations
 
 import math
+import os
 from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Optional, cast
@@ -20,11 +21,16 @@ from typing import Optional, cast
 import numpy as np
 from pyscf.fci.spin_op import contract_ss
 
+from ffsim._lib import (
+    build_alias_table_into_buffers,
+    sample_alias_table_into_buffer,
+)
+from ffsim.cistring import make_strings
 from ffsim.states.bitstring import (
     BitstringType,
-    addresses_to_strings,
-    concatenate_bitstrings,
-    restrict_bitstrings,
+    _concatenate_uint64_strings,
+    _convert_uint64_strings,
+    _restrict_uint64_strings,
 )
 
 
@@ -32,6 +38,10 @@ from ffsim.states.bitstring import (
 class StateVector:
     """A state vector in the FCI representation.
 
+    The coefficients are normally stored in double precision (complex128). They can
+    also be stored in single precision (complex64), which halves the memory used.
+    Gates and contractions preserve the precision of the vector they act on.
+
     Attributes:
         vec: Array of state vector coefficients.
         norb: The number of spatial orbitals.
@@ -57,6 +67,68 @@ class StateVector:
         return self.vec.astype(dtype, copy=False)
 
 
+def memmap_state_vector(
+    filename: str | os.PathLike,
+    norb: int,
+    nelec: int | tuple[int, int],
+    *,
+    mode: str = "w+",
+    dtype: type[np.complexfloating] = np.complex128,
+) -> StateVector:
+    """Create or open a state vector stored in a memory-mapped file.
+
+    The vector is stored in a ``.npy`` file, so it can also be loaded with
+    :func:`numpy.load`. Its coefficients are only read into memory as they are
+    accessed, which makes it possible to work with state vectors that do not fit in
+    memory. Gates that are applied to a memory-mapped vector with ``copy=False``
+    transform it in-place. Orbital rotations of a spinful vector process it in blocks
+    of rows or columns of its ``(dim_a, dim_b)`` matrix representation.
+
+    Args:
+        filename: The path of the file.
+        norb: The number of spatial orbitals.
+        nelec: Either a single integer representing the number of fermions for a
+            spinless system, or a pair of integers storing the numbers of spin alpha
+            and spin beta fermions.
+        mode: The mode in which to open the file. Use ``"w+"`` to create a new file
+            whose coefficients are initialized to zero, overwriting any existing
+            file. Use ``"r+"`` to open an existing file for reading and writing, and
+            ``"r"`` to open it read-only.
+        dtype: The data type of the coefficients, either ``np.complex128`` or
+            ``np.complex64``.
+
+    Returns:
+        The state vector, whose ``vec`` attribute is a one-dimensional
+        :class:`numpy.memmap` of complex numbers.
+
+    Raises:
+        ValueError: The existing file does not hold a vector of the given dtype and the
+            dimension of the FCI space.
+    """
+    shape = (dim(norb, nelec),)
+    if mode == "w+":
+        vec = np.lib.format.open_memmap(filename, mode=mode, dtype=dtype, shape=shape)
+    else:
+        vec = np.lib.format.open_memmap(filename, mode=mode)
+        if vec.shape != shape or vec.dtype != dtype:
+            raise ValueError(
+                f"Expected the file to hold a vector of shape {shape} and dtype "
+                f"{np.dtype(dtype)}. Got shape {vec.shape} and dtype {vec.dtype}."
+            )
+    return StateVector(vec=vec, norb=norb, nelec=nelec)
+
+
+def _complex_dtype(vec: np.ndarray) -> type[np.complexfloating]:
+    """Return the complex dtype with the same precision as a vector.
+
+    Single-precision vectors are contracted in complex64, and all others in
+    complex128.
+    """
+    if vec.dtype in (np.complex64, np.float32):
+        return np.complex64
+    return np.complex128
+
+
 def dims(norb: int, nelec: tuple[int, int]) -> tuple[int, int]:
     """Get the dimensions of the FCI space.
 
@@ -117,6 +189,9 @@ def sample_state_vector(
 ):
     """Sample bitstrings from a state vector.
 
+    This function processes the whole state vector on every call. To draw samples
+    from the same state vector repeatedly, use :class:`StateVectorSampler` instead.
+
     Args:
         vec: The state vector to sample from.
         norb: The number of spatial orbitals.
@@ -182,15 +257,17 @@ def _sample_state_vector_spinless(
     bitstring_type: BitstringType,
     seed: np.random.Generator | int | None,
 ):
-    if orbs is None:
-        orbs = range(norb)
     rng = np.random.default_rng(seed)
     probabilities = np.abs(vec) ** 2
     samples = rng.choice(len(vec), size=shots, p=probabilities)
-    strings = addresses_to_strings(samples, norb, nelec, bitstring_type=bitstring_type)
-    if list(orbs) == list(range(norb)):
-        return strings
-    return restrict_bitstrings(strings, orbs, bitstring_type=bitstring_type)
+    return _addresses_to_samples(
+        samples,
+        norb=norb,
+        nelec=nelec,
+        orbs=orbs,
+        concatenate=True,
+        bitstring_type=bitstring_type,
+    )
 
 
 def _sample_state_vector_spinful(
@@ -204,29 +281,186 @@ def _sample_state_vector_spinful(
     bitstring_type: BitstringType,
     seed: np.random.Generator | int | None,
 ):
-    if orbs is None:
-        orbs = range(norb), range(norb)
     rng = np.random.default_rng(seed)
     probabilities = np.abs(vec) ** 2
     samples = rng.choice(len(vec), size=shots, p=probabilities)
-    orbs_a, orbs_b = orbs
+    return _addresses_to_samples(
+        samples,
+        norb=norb,
+        nelec=nelec,
+        orbs=orbs,
+        concatenate=concatenate,
+        bitstring_type=bitstring_type,
+    )
 
-    if list(orbs_a) == list(orbs_b) == list(range(norb)):
-        # All orbitals are sampled, so we can simply call addresses_to_strings
-        return addresses_to_strings(
-            samples, norb, nelec, concatenate=concatenate, bitstring_type=bitstring_type
-        )
 
-    strings_a, strings_b = addresses_to_strings(
-        samples, norb, nelec, concatenate=False, bitstring_type=bitstring_type
-    )
-    strings_a = restrict_bitstrings(strings_a, orbs_a, bitstring_type=bitstring_type)
-    strings_b = restrict_bitstrings(strings_b, orbs_b, bitstring_type=bitstring_type)
+def _addresses_to_samples(
+    addresses: np.ndarray,
+    *,
+    norb: int,
+    nelec: int | tuple[int, int],
+    orbs: Sequence[int] | tuple[Sequence[int], Sequence[int]] | None,
+    concatenate: bool,
+    bitstring_type: BitstringType,
+):
+    """Convert sampled addresses to bitstrings restricted to the sampled orbitals."""
+    if isinstance(nelec, int):
+        # Spinless case
+        if orbs is None:
+            orbs = range(norb)
+        orbs = cast(Sequence[int], orbs)
+        strings = make_strings(range(norb), nelec)[addresses].astype(np.uint64)
+        strings = _restrict_uint64_strings(strings, orbs)
+        return _convert_uint64_strings(strings, bitstring_type, len(orbs))
+
+    # Spinful case
+    if orbs is None:
+        orbs = range(norb), range(norb)
+    orbs_a, orbs_b = cast(tuple[Sequence[int], Sequence[int]], orbs)
+    n_alpha, n_beta = nelec
+    indices_a, indices_b = np.divmod(addresses, math.comb(norb, n_beta))
+    strings_a = make_strings(range(norb), n_alpha)[indices_a].astype(np.uint64)
+    strings_b = make_strings(range(norb), n_beta)[indices_b].astype(np.uint64)
+    strings_a = _restrict_uint64_strings(strings_a, orbs_a)
+    strings_b = _restrict_uint64_strings(strings_b, orbs_b)
     if concatenate:
-        return concatenate_bitstrings(
-            strings_a, strings_b, bitstring_type=bitstring_type, length=len(orbs_a)
+        return _concatenate_uint64_strings(
+            strings_a,
+            strings_b,
+            len(orbs_a),
+            len(orbs_b),
+            bitstring_type,
+        )
+    return (
+        _convert_uint64_strings(strings_a, bitstring_type, len(orbs_a)),
+        _convert_uint64_strings(strings_b, bitstring_type, len(orbs_b)),
+    )
+
+
+class StateVectorSampler:
+    """Sampler of bitstrings from a fixed state vector.
+
+    The measurement probabilities are preprocessed once, when the sampler is
+    constructed, into an alias table. After that, each shot takes constant time,
+    independent of the dimension of the state vector, and the shots are drawn in
+    parallel. The sampled addresses are converted to bitstrings with array operations
+    on precomputed tables of occupation strings.
+
+    Example:
+
+    .. code::
+
+        import ffsim
+
+        norb = 4
+        nelec = (2, 2)
+        state = ffsim.StateVector(
+            ffsim.random.random_state_vector(ffsim.dim(norb, nelec)), norb, nelec
+        )
+        sampler = ffsim.StateVectorSampler(state)
+        samples = sampler.sample(
+            10_000, bitstring_type=ffsim.BitstringType.BIT_ARRAY, seed=1234
+        )
+        print(samples.shape)  # prints (10000, 8)
+
+    Args:
+        vec: The state vector to sample from.
+        norb: The number of spatial orbitals.
+        nelec: Either a single integer representing the number of fermions for a
+            spinless system, or a pair of integers storing the numbers of spin alpha
+            and spin beta fermions.
+
+    Raises:
+        TypeError: When passing vec as a Numpy array, norb and nelec must be specified.
+        TypeError: When passing vec as a StateVector, norb and nelec must both be None.
+        ValueError: The number of spatial orbitals must be less than 64.
+        ValueError: The state vector must be nonzero.
+    """
+
+    def __init__(
+        self,
+        vec: np.ndarray | StateVector,
+        *,
+        norb: int | None = None,
+        nelec: int | tuple[int, int] | None = None,
+    ):
+        vec, norb, nelec = canonicalize_vec_norb_nelec(vec, norb, nelec)
+        if norb >= 64:
+            raise ValueError(
+                f"The number of spatial orbitals must be less than 64. Got {norb}."
+            )
+        weights = np.ascontiguousarray(np.abs(vec) ** 2, dtype=float)
+        if not np.sum(weights) > 0:
+            raise ValueError("The state vector must be nonzero.")
+        self.norb = norb
+        self.nelec = nelec
+        self._thresholds = np.empty(len(weights))
+        self._aliases = np.empty(len(weights), dtype=np.uint)
+        build_alias_table_into_buffers(weights, self._thresholds, self._aliases)
+
+    def sample_addresses(
+        self, shots: int = 1, *, seed: np.random.Generator | int | None = None
+    ) -> np.ndarray:
+        """Sample state vector addresses.
+
+        Args:
+            shots: The number of addresses to sample.
+            seed: A seed to initialize the pseudorandom number generator.
+                Should be a valid input to ``np.random.default_rng``.
+
+        Returns:
+            The sampled addresses, as a Numpy array of unsigned integers.
+        """
+        rng = np.random.default_rng(seed)
+        uniforms = rng.random(shots)
+        addresses = np.empty(shots, dtype=np.uint)
+        sample_alias_table_into_buffer(
+            self._thresholds, self._aliases, uniforms, addresses
+        )
+        return addresses
+
+    def sample(
+        self,
+        shots: int = 1,
+        *,
+        orbs: Sequence[int] | tuple[Sequence[int], Sequence[int]] | None = None,
+        concatenate: bool = True,
+        bitstring_type: BitstringType = BitstringType.STRING,
+        seed: np.random.Generator | int | None = None,
+    ):
+        """Sample bitstrings.
+
+        The arguments have the same meaning as in :func:`sample_state_vector`, and
+        the bitstrings are returned in the same format.
+
+        Args:
+            shots: The number of bitstrings to sample.
+            orbs: The spin-orbitals to sample.
+                In the spinless case, this is a list of integers ranging from ``0``
+                to ``norb``. In the spinful case, this is a pair of lists of such
+                integers, with the first list storing the spin-alpha orbitals and the
+                second list storing the spin-beta orbitals.
+                If not specified, then all spin-orbitals are sampled.
+            concatenate: Whether to concatenate the spin-alpha and spin-beta parts of
+                the bitstrings, with the alpha string appearing on the right.
+                If False, then a pair ``(strings_a, strings_b)`` is returned.
+                In the spinless case, this argument is ignored.
+            bitstring_type: The desired type of bitstring output.
+            seed: A seed to initialize the pseudorandom number generator.
+                Should be a valid input to ``np.random.default_rng``.
+
+        Returns:
+            The sampled bitstrings.
+        """
+        addresses = self.sample_addresses(shots, seed=seed)
+        return _addresses_to_samples(
+            addresses,
+            norb=self.norb,
+            nelec=self.nelec,
+            orbs=orbs,
+            concatenate=concatenate,
+            bitstring_type=bitstring_type,
         )
-    return strings_a, strings_b
 
 
 def canonicalize_vec_norb_nelec(
@@ -10,12 +10,24 @@
 
 """Hamiltonian simulation via Trotter-Suzuki formulas."""
 
-from ffsim.trotter.diagonal_coulomb import simulate_trotter_diag_coulomb_split_op
-from ffsim.trotter.double_factorized import simulate_trotter_double_factorized
-from ffsim.trotter.qdrift import simulate_qdrift_double_factorized
+from ffsim.trotter.diagonal_coulomb import (
+    simulate_trotter_diag_coulomb_split_op,
+    simulate_trotter_diag_coulomb_split_op_iter,
+)
+from ffsim.trotter.double_factorized import (
+    simulate_trotter_double_factorized,
+    simulate_trotter_double_factorized_iter,
+)
+from ffsim.trotter.qdrift import (
+    simulate_qdrift_double_factorized,
+    simulate_qdrift_double_factorized_average,
+)
 
 __all__ = [
     "simulate_qdrift_double_factorized",
+    "simulate_qdrift_double_factorized_average",
     "simulate_trotter_diag_coulomb_split_op",
+    "simulate_trotter_diag_coulomb_split_op_iter",
     "simulate_trotter_double_factorized",
+    "simulate_trotter_double_factorized_iter",
 ]
@@ -13,6 +13,7 @@
 from __future__ import annotations
 
 import cmath
+from collections.abc import Iterator
 
 import numpy as np
 import scipy.linalg
@@ -67,14 +68,101 @@ def simulate_trotter_diag_coulomb_split_op(
         vec = vec.copy()
     if n_steps == 0:
         return vec
+    for _, vec in simulate_trotter_diag_coulomb_split_op_iter(
+        vec,
+        hamiltonian,
+        time,
+        norb=norb,
+        nelec=nelec,
+        n_steps=n_steps,
+        order=order,
+        stride=n_steps,
+        copy=False,
+    ):
+        pass
+    return vec
+
+
+def simulate_trotter_diag_coulomb_split_op_iter(
+    vec: np.ndarray,
+    hamiltonian: DiagonalCoulombHamiltonian,
+    time: float,
+    *,
+    norb: int,
+    nelec: tuple[int, int],
+    n_steps: int = 1,
+    order: int = 0,
+    stride: int = 1,
+    copy: bool = True,
+) -> Iterator[tuple[float, np.ndarray]]:
+    """Split-operator simulation yielding intermediate states.
+
+    This function runs the same simulation as
+    :func:`simulate_trotter_diag_coulomb_split_op`, but yields the state after every
+    ``stride`` Trotter steps and after the final step. The simulation is run only
+    once, so a time series of observables can be recorded without rerunning it for
+    each time point. At each yield, the orbital rotation that restores the original
+    basis is applied to a copy of the working state, so the simulation itself is
+    unaffected.
+
+    Args:
+        vec: The state vector to evolve.
+        hamiltonian: The Hamiltonian.
+        time: The total evolution time.
+        norb: The number of spatial orbitals.
+        nelec: The number of alpha and beta electrons.
+        n_steps: The number of Trotter steps.
+        order: The order of the Trotter decomposition.
+        stride: The number of Trotter steps between yielded states.
+        copy: Whether to copy the vector before operating on it.
 
+            - If `copy=True` then the original vector is left untouched.
+            - If `copy=False` then the original vector may have its data
+              overwritten.
+
+    Returns:
+        An iterator over pairs of the evolution time and the state at that time.
+        Each yielded state is a newly allocated vector, except that the final state
+        may share memory with the working vector. Nothing is yielded if ``n_steps``
+        is zero.
+    """
+    if order < 0:
+        raise ValueError(f"order must be non-negative, got {order}.")
+    if n_steps < 0:
+        raise ValueError(f"n_steps must be non-negative, got {n_steps}.")
+    if stride < 1:
+        raise ValueError(f"stride must be positive, got {stride}.")
+    if copy:
+        vec = vec.copy()
+    return _simulate_trotter_diag_coulomb_split_op_iter(
+        vec,
+        hamiltonian,
+        time,
+        norb=norb,
+        nelec=nelec,
+        n_steps=n_steps,
+        order=order,
+        stride=stride,
+    )
+
+
+def _simulate_trotter_diag_coulomb_split_op_iter(
+    vec: np.ndarray,
+    hamiltonian: DiagonalCoulombHamiltonian,
+    time: float,
+    norb: int,
+    nelec: tuple[int, int],
+    n_steps: int,
+    order: int,
+    stride: int,
+) -> Iterator[tuple[float, np.ndarray]]:
     one_body_energies, one_body_basis_change = scipy.linalg.eigh(
         hamiltonian.one_body_tensor
     )
     step_time = time / n_steps
 
     current_basis = np.eye(norb, dtype=complex)
-    for _ in range(n_steps):
+    for step in range(1, n_steps + 1):
         vec, current_basis = _simulate_trotter_step_diag_coulomb_split_op(
             vec,
             current_basis,
@@ -86,10 +174,14 @@ def simulate_trotter_diag_coulomb_split_op(
             nelec=nelec,
             order=order,
         )
-    vec = apply_orbital_rotation(vec, current_basis, norb=norb, nelec=nelec, copy=False)
-    vec *= cmath.exp(-1j * time * hamiltonian.constant)
-
-    return vec
+        if step % stride == 0 or step == n_steps:
+            final = step == n_steps
+            current_time = time if final else step * step_time
+            state = apply_orbital_rotation(
+                vec, current_basis, norb=norb, nelec=nelec, copy=not final
+            )
+            state *= cmath.exp(-1j * current_time * hamiltonian.constant)
+            yield current_time, state
 
 
 def _simulate_trotter_step_diag_coulomb_split_op(
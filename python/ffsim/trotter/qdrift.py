@@ -11,11 +11,20 @@
 from __future__ import annotations
 
 import itertools
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
 
 import numpy as np
 import scipy.linalg
 
-from ffsim.gates import apply_diag_coulomb_evolution, apply_num_op_sum_evolution
+from ffsim.gates.diag_coulomb import _apply_diag_coulomb_mat_exp, _get_mat_exp
+from ffsim.gates.num_op_sum import _apply_num_op_sum_phases, _get_phases
+from ffsim.gates.orbital_rotation import (
+    _apply_givens_arrays_spinful,
+    _get_givens_arrays,
+    _GivensArrays,
+)
 from ffsim.hamiltonians import DoubleFactorizedHamiltonian
 from ffsim.states.wick import expectation_one_body_power, expectation_one_body_product
 
@@ -76,169 +85,328 @@ def simulate_qdrift_double_factorized(
             return initial_state
         return np.tile(initial_state, (n_samples, 1))
 
-    if isinstance(probabilities, str):
-        probabilities = qdrift_probabilities(
-            hamiltonian, sampling_method=probabilities, nelec=nelec, one_rdm=one_rdm
-        )
-    if symmetric:
-        # in symmetric qDRIFT the one-body term is treated as a constant
-        probabilities[0] = 0
-        probabilities /= sum(probabilities)
-
-    rng = np.random.default_rng(seed)
-    one_body_energies, one_body_basis_change = scipy.linalg.eigh(
-        hamiltonian.one_body_tensor
+    engine = _QDriftEngine(
+        hamiltonian,
+        time,
+        norb=norb,
+        nelec=nelec,
+        n_steps=n_steps,
+        symmetric=symmetric,
+        probabilities=probabilities,
+        one_rdm=one_rdm,
     )
-    step_time = time / n_steps
-
-    results = np.empty((n_samples, initial_state.shape[0]), dtype=complex)
-    for i in range(n_samples):
-        # TODO cache trajectories
-        vec = initial_state.copy()
-        term_indices = rng.choice(
-            len(probabilities), size=n_steps, replace=True, p=probabilities
-        )
-        if symmetric:
-            vec = _simulate_qdrift_step_double_factorized_symmetric(
-                vec,
-                one_body_energies,
-                one_body_basis_change,
-                hamiltonian.diag_coulomb_mats,
-                hamiltonian.orbital_rotations,
-                step_time,
-                z_representation=hamiltonian.z_representation,
-                norb=norb,
-                nelec=nelec,
-                probabilities=probabilities,
-                term_indices=term_indices,
-            )
-        else:
-            vec = _simulate_qdrift_step_double_factorized(
-                vec,
-                one_body_energies,
-                one_body_basis_change,
-                hamiltonian.diag_coulomb_mats,
-                hamiltonian.orbital_rotations,
-                step_time,
-                z_representation=hamiltonian.z_representation,
-                norb=norb,
-                nelec=nelec,
-                probabilities=probabilities,
-                term_indices=term_indices,
-            )
-        results[i] = vec
+    rng = np.random.default_rng(seed)
+    results = np.tile(initial_state.astype(complex, copy=False), (n_samples, 1))
+    batch_size = _qdrift_batch_size(len(initial_state))
+    for start in range(0, n_samples, batch_size):
+        batch = slice(start, start + batch_size)
+        results[batch] = engine.run(results[batch], rng)
 
     if n_samples == 1:
         return results[0]
     return results
 
 
-def _simulate_qdrift_step_double_factorized(
+def simulate_qdrift_double_factorized_average(
     vec: np.ndarray,
-    one_body_energies: np.ndarray,
-    one_body_basis_change: np.ndarray,
-    diag_coulomb_mats: np.ndarray,
-    orbital_rotations: np.ndarray,
+    hamiltonian: DoubleFactorizedHamiltonian,
     time: float,
-    z_representation: bool,
+    observable: Callable[[np.ndarray], Any],
+    *,
     norb: int,
     nelec: tuple[int, int],
-    probabilities: np.ndarray,
-    term_indices: np.ndarray,
-) -> np.ndarray:
-    for term_index in term_indices:
-        if term_index == 0:
-            vec = apply_num_op_sum_evolution(
-                vec,
-                one_body_energies,
-                time / probabilities[term_index],
-                norb=norb,
-                nelec=nelec,
-                orbital_rotation=one_body_basis_change,
-                copy=False,
-            )
-        else:
-            vec = apply_diag_coulomb_evolution(
-                vec,
-                diag_coulomb_mats[term_index - 1],
-                time / probabilities[term_index],
-                norb=norb,
-                nelec=nelec,
-                orbital_rotation=orbital_rotations[term_index - 1],
-                z_representation=z_representation,
-                copy=False,
-            )
-    return vec
+    n_steps: int = 1,
+    symmetric: bool = False,
+    probabilities: str | np.ndarray = "norm",
+    one_rdm: np.ndarray | None = None,
+    n_samples: int = 1,
+    batch_size: int | None = None,
+    seed=None,
+) -> Any:
+    """Average an observable over qDRIFT trajectories.
 
+    Runs the same trajectories as :func:`simulate_qdrift_double_factorized` with the
+    same seed, but instead of returning the final states, it evaluates the observable
+    on each final state and returns the average. The trajectories are run in batches,
+    and each batch is discarded once the observable has been evaluated on it, so the
+    memory used is bounded by the batch size rather than the number of samples.
 
-def _simulate_qdrift_step_double_factorized_symmetric(
-    vec: np.ndarray,
-    one_body_energies: np.ndarray,
-    one_body_basis_change: np.ndarray,
-    diag_coulomb_mats: np.ndarray,
-    orbital_rotations: np.ndarray,
-    time: float,
-    z_representation: bool,
-    norb: int,
-    nelec: tuple[int, int],
-    probabilities: np.ndarray,
-    term_indices: np.ndarray,
-) -> np.ndarray:
-    # simulate the one-body term for half the time
-    vec = apply_num_op_sum_evolution(
-        vec,
-        one_body_energies,
-        0.5 * time,
-        norb=norb,
-        nelec=nelec,
-        orbital_rotation=one_body_basis_change,
-        copy=False,
-    )
-    # simulate the first sampled term
-    term_index = term_indices[0]
-    vec = apply_diag_coulomb_evolution(
-        vec,
-        diag_coulomb_mats[term_index - 1],
-        time / probabilities[term_index],
+    The kernels for each term of the Hamiltonian, namely the Givens decompositions of
+    the orbital rotations and the exponentiated coefficients, are computed once and
+    shared by all trajectories. Within a batch, the trajectories that apply the same
+    term at a given step are evolved together in a single call to each kernel.
+
+    Args:
+        vec: The state vector to evolve.
+        hamiltonian: The Hamiltonian.
+        time: The evolution time.
+        observable: A function that takes a state vector and returns the quantity to
+            average, such as a float for an expectation value or a Numpy array for a
+            density matrix.
+        norb: The number of spatial orbitals.
+        nelec: The number of alpha and beta electrons.
+        n_steps: The number of Trotter steps.
+        symmetric: Whether to use the symmetric variant of qDRIFT.
+        probabilities: The sampling method to use, or else an explicit array of
+            probabilities. See :func:`simulate_qdrift_double_factorized`.
+        one_rdm: The one-body reduced density matrix of the initial state.
+        n_samples: The number of qDRIFT trajectories to sample.
+        batch_size: The number of trajectories evolved at a time. By default, it is
+            chosen so that a batch of state vectors occupies a bounded amount of memory.
+        seed: A seed to initialize the pseudorandom number generator.
+            Should be a valid input to ``np.random.default_rng``.
+
+    Returns:
+        The average of the observable over the final states of the trajectories.
+    """
+    if n_steps < 0:
+        raise ValueError(f"n_steps must be non-negative, got {n_steps}.")
+    if n_samples < 1:
+        raise ValueError(f"n_samples must be positive, got {n_samples}.")
+    if batch_size is None:
+        batch_size = _qdrift_batch_size(len(vec))
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}.")
+
+    if n_steps == 0 or time == 0:
+        return observable(vec.copy())
+
+    engine = _QDriftEngine(
+        hamiltonian,
+        time,
         norb=norb,
         nelec=nelec,
-        orbital_rotation=orbital_rotations[term_index - 1],
-        z_representation=z_representation,
-        copy=False,
+        n_steps=n_steps,
+        symmetric=symmetric,
+        probabilities=probabilities,
+        one_rdm=one_rdm,
     )
-    # simulate the remaining sampled terms
-    for term_index in term_indices[1:]:
-        vec = apply_num_op_sum_evolution(
-            vec,
-            one_body_energies,
-            time,
-            norb=norb,
-            nelec=nelec,
-            orbital_rotation=one_body_basis_change,
-            copy=False,
+    rng = np.random.default_rng(seed)
+    total: Any = 0
+    for start in range(0, n_samples, batch_size):
+        this_batch_size = min(batch_size, n_samples - start)
+        batch = np.tile(vec.astype(complex, copy=False), (this_batch_size, 1))
+        for final_state in engine.run(batch, rng):
+            total = total + observable(final_state)
+    return total / n_samples
+
+
+# Maximum number of entries in a batch of state vectors evolved together
+_QDRIFT_BATCH_ENTRIES = 1 << 22
+
+
+def _qdrift_batch_size(dim: int) -> int:
+    return max(1, _QDRIFT_BATCH_ENTRIES // dim)
+
+
+@dataclass(frozen=True)
+class _QDriftTerm:
+    """Precomputed kernels for evolving by one term of a qDRIFT trajectory.
+
+    The term is an evolution by either a sum of number operators, given by its phases,
+    or a diagonal Coulomb operator, given by its exponentiated matrices, conjugated by
+    an orbital rotation.
+    """
+
+    orbital_rotation: np.ndarray
+    phases: tuple[np.ndarray | None, np.ndarray | None] | None = None
+    mat_exp: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+
+
+class _QDriftEngine:
+    """Runs batches of qDRIFT trajectories of a double-factorized Hamiltonian.
+
+    The kernels of the terms are computed once on construction. Each trajectory is
+    represented by the sequence of indices of the terms it applies.
+    """
+
+    def __init__(
+        self,
+        hamiltonian: DoubleFactorizedHamiltonian,
+        time: float,
+        *,
+        norb: int,
+        nelec: tuple[int, int],
+        n_steps: int,
+        symmetric: bool,
+        probabilities: str | np.ndarray,
+        one_rdm: np.ndarray | None,
+    ):
+        if isinstance(probabilities, str):
+            probabilities = qdrift_probabilities(
+                hamiltonian, sampling_method=probabilities, nelec=nelec, one_rdm=one_rdm
+            )
+        probabilities = np.array(probabilities, dtype=float)
+        if symmetric:
+            # in symmetric qDRIFT the one-body term is treated as a constant
+            probabilities[0] = 0
+            probabilities /= sum(probabilities)
+        self.norb = norb
+        self.nelec = nelec
+        self.n_steps = n_steps
+        self.symmetric = symmetric
+        self.probabilities = probabilities
+        self.z_representation = hamiltonian.z_representation
+
+        one_body_energies, one_body_basis_change = scipy.linalg.eigh(
+            hamiltonian.one_body_tensor
         )
-        vec = apply_diag_coulomb_evolution(
-            vec,
-            diag_coulomb_mats[term_index - 1],
-            time / probabilities[term_index],
-            norb=norb,
-            nelec=nelec,
-            orbital_rotation=orbital_rotations[term_index - 1],
-            z_representation=z_representation,
-            copy=False,
+        step_time = time / n_steps
+
+        def one_body_term(time: float) -> _QDriftTerm:
+            return _QDriftTerm(
+                orbital_rotation=one_body_basis_change,
+                phases=_get_phases(one_body_energies, time=time),
+            )
+
+        # In the standard variant, term i is term i of the Hamiltonian. In the
+        # symmetric variant, the one-body term is replaced by its evolution for half
+        # a step, and an extra term at the end holds its evolution for a full step.
+        terms: list[_QDriftTerm | None] = []
+        if symmetric:
+            terms.append(one_body_term(0.5 * step_time))
+        elif probabilities[0]:
+            terms.append(one_body_term(step_time / probabilities[0]))
+        else:
+            terms.append(None)
+        for diag_coulomb_mat, orbital_rotation, probability in zip(
+            hamiltonian.diag_coulomb_mats,
+            hamiltonian.orbital_rotations,
+            probabilities[1:],
+        ):
+            terms.append(
+                _QDriftTerm(
+                    orbital_rotation=orbital_rotation,
+                    mat_exp=_get_mat_exp(
+                        diag_coulomb_mat,
+                        step_time / probability,
+                        norb=norb,
+                        z_representation=hamiltonian.z_representation,
+                    ),
+                )
+                if probability
+                else None
+            )
+        if symmetric:
+            terms.append(one_body_term(step_time))
+        self.terms = terms
+        self._transitions: dict[
+            tuple[int, int], tuple[_GivensArrays | None, _GivensArrays | None] | None
+        ] = {}
+
+    def sample_sequences(
+        self, n_trajectories: int, rng: np.random.Generator
+    ) -> np.ndarray:
+        """Sample the sequences of term indices of a batch of trajectories."""
+        term_indices = np.stack(
+            [
+                rng.choice(
+                    len(self.probabilities),
+                    size=self.n_steps,
+                    replace=True,
+                    p=self.probabilities,
+                )
+                for _ in range(n_trajectories)
+            ]
+        )
+        if not self.symmetric:
+            return term_indices
+        # half one-body step, first term, then alternate full one-body steps with the
+        # remaining terms, and finish with a half one-body step
+        full_step = len(self.terms) - 1
+        sequences = np.full(
+            (n_trajectories, 2 * self.n_steps + 1), full_step, dtype=term_indices.dtype
+        )
+        sequences[:, 0] = 0
+        sequences[:, -1] = 0
+        sequences[:, 1::2] = term_indices
+        return sequences
+
+    def run(self, vecs: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Evolve a batch of state vectors, one trajectory per vector.
+
+        Each term is applied in the basis of its orbital rotation. Instead of rotating
+        back to the original basis after each term, each vector is rotated directly
+        from the basis of its previous term to the basis of its next term, so that
+        consecutive terms share a single orbital rotation.
+
+        The input array may be overwritten.
+        """
+        sequences = self.sample_sequences(len(vecs), rng)
+        vecs = np.ascontiguousarray(vecs, dtype=complex)
+        # index of the term whose basis each vector is in, with -1 for the original
+        # basis
+        previous = np.full(len(vecs), -1, dtype=sequences.dtype)
+        for column in sequences.T:
+            transitions = np.stack([previous, column], axis=1)
+            for prev_index, term_index in np.unique(transitions, axis=0):
+                (rows,) = np.nonzero((previous == prev_index) & (column == term_index))
+                if len(rows) == len(vecs):
+                    vecs = self._apply_term(vecs, prev_index, term_index)
+                else:
+                    vecs[rows] = self._apply_term(vecs[rows], prev_index, term_index)
+            previous = column
+        for prev_index in np.unique(previous):
+            (rows,) = np.nonzero(previous == prev_index)
+            if len(rows) == len(vecs):
+                vecs = self._change_basis(vecs, prev_index, -1)
+            else:
+                vecs[rows] = self._change_basis(vecs[rows], prev_index, -1)
+        return vecs
+
+    def _apply_term(
+        self, vecs: np.ndarray, prev_index: int, term_index: int
+    ) -> np.ndarray:
+        term = self.terms[term_index]
+        assert term is not None
+        vecs = self._change_basis(vecs, prev_index, term_index)
+        if term.phases is not None:
+            return _apply_num_op_sum_phases(
+                vecs, term.phases, norb=self.norb, nelec=self.nelec
+            )
+        assert term.mat_exp is not None
+        return _apply_diag_coulomb_mat_exp(
+            vecs,
+            term.mat_exp,
+            norb=self.norb,
+            nelec=self.nelec,
+            z_representation=self.z_representation,
         )
-    # simulate the one-body term for half the time
-    vec = apply_num_op_sum_evolution(
-        vec,
-        one_body_energies,
-        0.5 * time,
-        norb=norb,
-        nelec=nelec,
-        orbital_rotation=one_body_basis_change,
-        copy=False,
-    )
 
-    return vec
+    def _change_basis(
+        self, vecs: np.ndarray, prev_index: int, term_index: int
+    ) -> np.ndarray:
+        """Rotate vectors from the basis of one term to the basis of another."""
+        key = (int(prev_index), int(term_index))
+        if key not in self._transitions:
+            self._transitions[key] = self._get_transition(*key)
+        givens_arrays = self._transitions[key]
+        if givens_arrays is None:
+            return vecs
+        return _apply_givens_arrays_spinful(vecs, *givens_arrays, self.norb, self.nelec)
+
+    def _get_transition(
+        self, prev_index: int, term_index: int
+    ) -> tuple[_GivensArrays | None, _GivensArrays | None] | None:
+        prev_rotation = self._orbital_rotation(prev_index)
+        rotation = self._orbital_rotation(term_index)
+        if prev_rotation is rotation:
+            return None
+        if rotation is None:
+            assert prev_rotation is not None
+            mat = prev_rotation
+        elif prev_rotation is None:
+            mat = rotation.T.conj()
+        else:
+            mat = rotation.T.conj() @ prev_rotation
+        return _get_givens_arrays(mat)
+
+    def _orbital_rotation(self, term_index: int) -> np.ndarray | None:
+        if term_index < 0:
+            return None
+        term = self.terms[term_index]
+        assert term is not None
+        return term.orbital_rotation
 
 
 def qdrift_probabilities(
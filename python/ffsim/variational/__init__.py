@@ -10,6 +10,7 @@
 
 """Variational ansatzes."""
 
+from ffsim.variational.adjoint import AdjointAnsatz
 from ffsim.variational.givens import GivensAnsatzOp
 from ffsim.variational.hopgate import HopGateAnsatzOperator
 from ffsim.variational.multireference import (
@@ -19,11 +20,13 @@ from ffsim.variational.multireference import (
 from ffsim.variational.num_num import NumNumAnsatzOpSpinBalanced
 from ffsim.variational.uccsd import UCCSDOpRestrictedReal
 from ffsim.variational.ucj_angles_spin_balanced import UCJAnglesOpSpinBalanced
+from ffsim.variational.ucj_plan import UCJPlan
 from ffsim.variational.ucj_spin_balanced import UCJOpSpinBalanced
 from ffsim.variational.ucj_spin_unbalanced import UCJOpSpinUnbalanced
 from ffsim.variational.ucj_spinless import UCJOpSpinless
 
 __all__ = [
+    "AdjointAnsatz",
     "GivensAnsatzOp",
     "HopGateAnsatzOperator",
     "NumNumAnsatzOpSpinBalanced",
@@ -32,6 +35,7 @@ __all__ = [
     "UCJOpSpinBalanced",
     "UCJOpSpinUnbalanced",
     "UCJOpSpinless",
+    "UCJPlan",
     "multireference_state",
     "multireference_state_prod",
 ]
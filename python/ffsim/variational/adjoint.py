@@ -0,0 +1,595 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Analytic derivatives of variational ansatz states."""
+
+from __future__ import annotations
+
+import cmath
+import functools
+import itertools
+import math
+from dataclasses import dataclass
+from typing import Callable, Union, cast
+
+import numpy as np
+import scipy.linalg
+from scipy.sparse.linalg import LinearOperator
+
+from ffsim.cistring import gen_linkstr_index, make_strings
+from ffsim.contract.diag_coulomb import contract_diag_coulomb
+from ffsim.contract.one_body import contract_one_body
+from ffsim.gates.diag_coulomb import apply_diag_coulomb_evolution
+from ffsim.gates.orbital_rotation import apply_orbital_rotation
+from ffsim.states import dims
+from ffsim.variational.givens import GivensAnsatzOp
+from ffsim.variational.num_num import NumNumAnsatzOpSpinBalanced
+from ffsim.variational.ucj_spin_balanced import UCJOpSpinBalanced
+
+
+@dataclass(frozen=True)
+class _OrbitalRotationLayer:
+    """An orbital rotation together with its parameter derivatives.
+
+    The derivative of the output state with respect to parameter ``indices[k]`` is
+    obtained by applying the one-body operator with matrix ``generators[k]`` to the
+    output state.
+    """
+
+    orbital_rotation: np.ndarray
+    indices: np.ndarray
+    generators: np.ndarray  # shape: (n, norb, norb)
+
+    def apply(
+        self, vec: np.ndarray, norb: int, nelec: tuple[int, int], inverse: bool = False
+    ) -> np.ndarray:
+        mat = self.orbital_rotation.T.conj() if inverse else self.orbital_rotation
+        return apply_orbital_rotation(vec, mat, norb=norb, nelec=nelec, copy=False)
+
+    def tangents(self, vec: np.ndarray, norb: int, nelec: tuple[int, int]):
+        out = np.empty((len(self.generators), len(vec)), dtype=complex)
+        for tangent, generator in zip(out, self.generators):
+            tangent[:] = contract_one_body(vec, generator, norb=norb, nelec=nelec)
+        return out
+
+    def overlaps(
+        self, bra: np.ndarray, ket: np.ndarray, norb: int, nelec: tuple[int, int]
+    ) -> np.ndarray:
+        rdm = _transition_rdm1(bra, ket, norb=norb, nelec=nelec)
+        return np.einsum("kij,ij->k", self.generators, rdm)
+
+
+@dataclass(frozen=True)
+class _DiagCoulombLayer:
+    r"""Time evolution by a diagonal Coulomb operator with its parameter derivatives.
+
+    The layer applies :math:`\exp(i \mathcal{J})`. The derivative of the output state
+    with respect to parameter ``indices[k]`` is obtained by applying :math:`i` times
+    the diagonal Coulomb operator with alpha-alpha and alpha-beta matrices
+    ``generators[k]`` to the output state.
+    """
+
+    mats: np.ndarray  # shape: (2, norb, norb)
+    indices: np.ndarray
+    generators: np.ndarray  # shape: (n, 2, norb, norb)
+
+    def apply(
+        self, vec: np.ndarray, norb: int, nelec: tuple[int, int], inverse: bool = False
+    ) -> np.ndarray:
+        mat_aa, mat_ab = self.mats
+        return apply_diag_coulomb_evolution(
+            vec,
+            (mat_aa, mat_ab, mat_aa),
+            time=1.0 if inverse else -1.0,
+            norb=norb,
+            nelec=nelec,
+            copy=False,
+        )
+
+    def tangents(self, vec: np.ndarray, norb: int, nelec: tuple[int, int]):
+        out = np.empty((len(self.generators), len(vec)), dtype=complex)
+        for tangent, (mat_aa, mat_ab) in zip(out, self.generators):
+            tangent[:] = 1j * contract_diag_coulomb(
+                vec, (mat_aa, mat_ab, mat_aa), norb=norb, nelec=nelec
+            )
+        return out
+
+    def overlaps(
+        self, bra: np.ndarray, ket: np.ndarray, norb: int, nelec: tuple[int, int]
+    ) -> np.ndarray:
+        n_alpha, n_beta = nelec
+        occ_a = _occupations(norb, n_alpha)
+        occ_b = _occupations(norb, n_beta)
+        prod = (bra.conj() * ket).reshape(dims(norb, nelec))
+        corr_aa = occ_a.T @ (prod.sum(axis=1)[:, None] * occ_a)
+        corr_bb = occ_b.T @ (prod.sum(axis=0)[:, None] * occ_b)
+        corr_ab = occ_a.T @ prod @ occ_b
+        return 1j * (
+            0.5 * np.einsum("kij,ij->k", self.generators[:, 0], corr_aa + corr_bb)
+            + np.einsum("kij,ij->k", self.generators[:, 1], corr_ab)
+        )
+
+
+_Layer = Union[_OrbitalRotationLayer, _DiagCoulombLayer]
+
+
+@dataclass(frozen=True)
+class AdjointAnsatz:
+    """A parameterized ansatz state with analytic derivatives.
+
+    The state is obtained by applying a sequence of orbital rotations and diagonal
+    Coulomb evolutions, whose matrices depend on a real-valued parameter vector, to a
+    reference state. The derivatives are computed analytically. Vector-Jacobian
+    products and energy gradients use the adjoint method, whose cost is that of a few
+    simulations of the ansatz regardless of the number of parameters. The full
+    Jacobian, as required by :func:`ffsim.optimize.minimize_linear_method`, is computed
+    by propagating all parameter derivatives together as a batch of vectors.
+
+    Use one of the constructors, for example :meth:`ucj_spin_balanced`, to create an
+    instance.
+
+    Attributes:
+        reference_state (np.ndarray): The reference state.
+        norb (int): The number of spatial orbitals.
+        nelec (tuple[int, int]): The number of alpha and beta electrons.
+        n_params (int): The number of parameters.
+    """
+
+    reference_state: np.ndarray
+    norb: int
+    nelec: tuple[int, int]
+    n_params: int
+    _layers_from_parameters: Callable[[np.ndarray], list[_Layer]]
+
+    @staticmethod
+    def ucj_spin_balanced(
+        reference_state: np.ndarray,
+        *,
+        norb: int,
+        nelec: tuple[int, int],
+        n_reps: int,
+        interaction_pairs: tuple[
+            list[tuple[int, int]] | None, list[tuple[int, int]] | None
+        ]
+        | None = None,
+        with_final_orbital_rotation: bool = False,
+    ) -> AdjointAnsatz:
+        r"""Spin-balanced UCJ ansatz.
+
+        The parameters are interpreted as in
+        :meth:`ffsim.UCJOpSpinBalanced.from_parameters`.
+
+        Args:
+            reference_state: The reference state.
+            norb: The number of spatial orbitals.
+            nelec: The number of alpha and beta electrons.
+            n_reps: The number of ansatz repetitions.
+            interaction_pairs: Optional restrictions on allowed orbital interactions
+                for the diagonal Coulomb operators. See
+                :meth:`ffsim.UCJOpSpinBalanced.from_parameters`.
+            with_final_orbital_rotation: Whether to include a final orbital rotation
+                in the operator.
+
+        Returns:
+            The ansatz.
+        """
+        n_params = UCJOpSpinBalanced.n_params(
+            norb,
+            n_reps,
+            interaction_pairs=interaction_pairs,
+            with_final_orbital_rotation=with_final_orbital_rotation,
+        )
+        return AdjointAnsatz(
+            reference_state=reference_state,
+            norb=norb,
+            nelec=nelec,
+            n_params=n_params,
+            _layers_from_parameters=functools.partial(
+                _ucj_spin_balanced_layers,
+                norb=norb,
+                n_reps=n_reps,
+                interaction_pairs=interaction_pairs,
+                with_final_orbital_rotation=with_final_orbital_rotation,
+            ),
+        )
+
+    @staticmethod
+    def givens(
+        reference_state: np.ndarray,
+        *,
+        norb: int,
+        nelec: tuple[int, int],
+        interaction_pairs: list[tuple[int, int]],
+        with_phis: bool = True,
+        with_phase_angles: bool = True,
+    ) -> AdjointAnsatz:
+        """Givens rotation ansatz.
+
+        The parameters are interpreted as in
+        :meth:`ffsim.GivensAnsatzOp.from_parameters`.
+
+        Args:
+            reference_state: The reference state.
+            norb: The number of spatial orbitals.
+            nelec: The number of alpha and beta electrons.
+            interaction_pairs: The orbital pairs to apply the Givens rotation gates to.
+            with_phis: Whether to include complex phases for the Givens rotations.
+            with_phase_angles: Whether to include a layer of single-orbital phase gates.
+
+        Returns:
+            The ansatz.
+        """
+        n_params = GivensAnsatzOp.n_params(
+            norb,
+            interaction_pairs,
+            with_phis=with_phis,
+            with_phase_angles=with_phase_angles,
+        )
+        return AdjointAnsatz(
+            reference_state=reference_state,
+            norb=norb,
+            nelec=nelec,
+            n_params=n_params,
+            _layers_from_parameters=functools.partial(
+                _givens_layers,
+                norb=norb,
+                interaction_pairs=interaction_pairs,
+                with_phis=with_phis,
+                with_phase_angles=with_phase_angles,
+            ),
+        )
+
+    @staticmethod
+    def num_num_spin_balanced(
+        reference_state: np.ndarray,
+        *,
+        norb: int,
+        nelec: tuple[int, int],
+        interaction_pairs: tuple[list[tuple[int, int]], list[tuple[int, int]]],
+    ) -> AdjointAnsatz:
+        """Spin-balanced number-number interaction ansatz.
+
+        The parameters are interpreted as in
+        :meth:`ffsim.NumNumAnsatzOpSpinBalanced.from_parameters`.
+
+        Args:
+            reference_state: The reference state.
+            norb: The number of spatial orbitals.
+            nelec: The number of alpha and beta electrons.
+            interaction_pairs: The orbital pairs to apply the number-number interactions
+                to.
+
+        Returns:
+            The ansatz.
+        """
+        return AdjointAnsatz(
+            reference_state=reference_state,
+            norb=norb,
+            nelec=nelec,
+            n_params=NumNumAnsatzOpSpinBalanced.n_params(interaction_pairs),
+            _layers_from_parameters=functools.partial(
+                _num_num_spin_balanced_layers,
+                norb=norb,
+                interaction_pairs=interaction_pairs,
+            ),
+        )
+
+    def state(self, params: np.ndarray) -> np.ndarray:
+        """Return the ansatz state.
+
+        Args:
+            params: The real-valued parameter vector.
+
+        Returns:
+            The state vector.
+        """
+        return self._state(self._layers_from_parameters(params))
+
+    def jacobian(self, params: np.ndarray) -> np.ndarray:
+        """Return the Jacobian of the ansatz state.
+
+        Args:
+            params: The real-valued parameter vector.
+
+        Returns:
+            The Jacobian matrix, of shape ``(dim, n_params)``. Its :math:`i`-th column
+            holds the derivative of the state vector with respect to the :math:`i`-th
+            parameter.
+        """
+        vec = self.reference_state.astype(complex, copy=True)
+        tangents = np.zeros((self.n_params, len(vec)), dtype=complex)
+        active = np.zeros(self.n_params, dtype=bool)
+        for layer in self._layers_from_parameters(params):
+            vec = layer.apply(vec, self.norb, self.nelec)
+            if active.any():
+                tangents[active] = layer.apply(tangents[active], self.norb, self.nelec)
+            tangents[layer.indices] += layer.tangents(vec, self.norb, self.nelec)
+            active[layer.indices] = True
+        return tangents.T
+
+    def vjp(self, params: np.ndarray, vec: np.ndarray) -> np.ndarray:
+        r"""Return the product of the adjoint of the Jacobian with a vector.
+
+        Computes :math:`J^\dagger v`, where :math:`J` is the Jacobian of the ansatz
+        state and :math:`v` is the given vector, using the adjoint method.
+
+        Args:
+            params: The real-valued parameter vector.
+            vec: The vector :math:`v`.
+
+        Returns:
+            The complex-valued vector :math:`J^\dagger v`, of length ``n_params``.
+        """
+        layers = self._layers_from_parameters(params)
+        return self._vjp(layers, self._state(layers), vec)
+
+    def energy_and_gradient(
+        self, params: np.ndarray, hamiltonian: LinearOperator
+    ) -> tuple[float, np.ndarray]:
+        """Return the energy of the ansatz state and its gradient.
+
+        The return value can be used directly as the objective function of
+        `scipy.optimize.minimize`_ with ``jac=True``.
+
+        Args:
+            params: The real-valued parameter vector.
+            hamiltonian: The Hamiltonian.
+
+        Returns:
+            The energy, and its gradient with respect to the parameters.
+
+        .. _scipy.optimize.minimize: https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html
+        """  # noqa: E501
+        layers = self._layers_from_parameters(params)
+        vec = self._state(layers)
+        hamiltonian_vec = hamiltonian @ vec
+        energy = np.vdot(vec, hamiltonian_vec).real
+        grad = 2 * self._vjp(layers, vec, hamiltonian_vec).real
+        return energy, grad
+
+    def _state(self, layers: list[_Layer]) -> np.ndarray:
+        vec = self.reference_state.astype(complex, copy=True)
+        for layer in layers:
+            vec = layer.apply(vec, self.norb, self.nelec)
+        return vec
+
+    def _vjp(self, layers: list[_Layer], state: np.ndarray, vec: np.ndarray):
+        result = np.zeros(self.n_params, dtype=complex)
+        # Propagate the state and the vector backwards together as a batch
+        pair = np.stack([state, vec.astype(complex)])
+        for layer in reversed(layers):
+            ket, bra = pair
+            result[layer.indices] += layer.overlaps(
+                bra, ket, self.norb, self.nelec
+            ).conj()
+            pair = layer.apply(pair, self.norb, self.nelec, inverse=True)
+        return result
+
+
+def _ucj_spin_balanced_layers(
+    params: np.ndarray,
+    *,
+    norb: int,
+    n_reps: int,
+    interaction_pairs: tuple[list[tuple[int, int]] | None, list[tuple[int, int]] | None]
+    | None,
+    with_final_orbital_rotation: bool,
+) -> list[_Layer]:
+    n_params = UCJOpSpinBalanced.n_params(
+        norb,
+        n_reps,
+        interaction_pairs=interaction_pairs,
+        with_final_orbital_rotation=with_final_orbital_rotation,
+    )
+    _validate_n_params(params, n_params)
+    if interaction_pairs is None:
+        interaction_pairs = (None, None)
+    pairs_aa, pairs_ab = interaction_pairs
+    triu_indices = cast(
+        list[tuple[int, int]],
+        list(itertools.combinations_with_replacement(range(norb), 2)),
+    )
+    if pairs_aa is None:
+        pairs_aa = triu_indices
+    if pairs_ab is None:
+        pairs_ab = triu_indices
+    layers: list[_Layer] = []
+    index = 0
+    for _ in range(n_reps):
+        # Orbital rotation
+        indices = np.arange(index, index + norb**2)
+        orbital_rotation, derivs = _orbital_rotation_with_derivatives(
+            params[indices], norb
+        )
+        index += norb**2
+        # Diag Coulomb matrices
+        diag_coulomb_mats = np.zeros((2, norb, norb))
+        generators = []
+        for sigma, pairs in enumerate((pairs_aa, pairs_ab)):
+            for i, j in pairs:
+                diag_coulomb_mats[sigma, i, j] = params[index]
+                diag_coulomb_mats[sigma, j, i] = params[index]
+                generator = np.zeros((2, norb, norb))
+                generator[sigma, [i, j], [j, i]] = 1
+                generators.append(generator)
+                index += 1
+        layers.append(
+            _OrbitalRotationLayer(
+                orbital_rotation.T.conj(),
+                indices,
+                derivs.conj().transpose(0, 2, 1) @ orbital_rotation,
+            )
+        )
+        layers.append(
+            _DiagCoulombLayer(
+                diag_coulomb_mats,
+                np.arange(index - len(generators), index),
+                np.array(generators).reshape(-1, 2, norb, norb),
+            )
+        )
+        layers.append(
+            _OrbitalRotationLayer(
+                orbital_rotation, indices, derivs @ orbital_rotation.T.conj()
+            )
+        )
+    # Final orbital rotation
+    if with_final_orbital_rotation:
+        indices = np.arange(index, index + norb**2)
+        orbital_rotation, derivs = _orbital_rotation_with_derivatives(
+            params[indices], norb
+        )
+        layers.append(
+            _OrbitalRotationLayer(
+                orbital_rotation, indices, derivs @ orbital_rotation.T.conj()
+            )
+        )
+    return layers
+
+
+def _givens_layers(
+    params: np.ndarray,
+    *,
+    norb: int,
+    interaction_pairs: list[tuple[int, int]],
+    with_phis: bool,
+    with_phase_angles: bool,
+) -> list[_Layer]:
+    operator = GivensAnsatzOp.from_parameters(
+        params,
+        norb=norb,
+        interaction_pairs=interaction_pairs,
+        with_phis=with_phis,
+        with_phase_angles=with_phase_angles,
+    )
+    n_pairs = len(interaction_pairs)
+    phis = operator.phis
+    phase_angles = operator.phase_angles
+    if phis is None:
+        phis = np.zeros(n_pairs)
+    if phase_angles is None:
+        phase_angles = np.zeros(norb)
+    generators = np.zeros((len(params), norb, norb), dtype=complex)
+    # The orbital rotation is D M_n ... M_1, where D is the diagonal matrix of phases
+    # and M_k is the k-th Givens rotation. The generator of the k-th rotation
+    # parameters is L dM_k M_k^\dagger L^\dagger, where L = D M_n ... M_{k+1}.
+    left = np.diag(np.exp(1j * phase_angles))
+    for k in reversed(range(n_pairs)):
+        i, j = interaction_pairs[k]
+        c = math.cos(operator.thetas[k])
+        s = cmath.rect(math.sin(operator.thetas[k]), -phis[k])
+        rot = np.array([[c, s], [-s.conjugate(), c]])
+        d_theta = np.array(
+            [
+                [-math.sin(operator.thetas[k]), cmath.rect(c, -phis[k])],
+                [-cmath.rect(c, phis[k]), -math.sin(operator.thetas[k])],
+            ]
+        )
+        left_cols = left[:, [i, j]]
+        generators[k] = left_cols @ d_theta @ rot.T.conj() @ left_cols.T.conj()
+        if with_phis:
+            d_phi = np.array([[0, -1j * s], [-1j * s.conjugate(), 0]])
+            generators[n_pairs + k] = (
+                left_cols @ d_phi @ rot.T.conj() @ left_cols.T.conj()
+            )
+        left[:, [i, j]] = left_cols @ rot
+    if with_phase_angles:
+        offset = (1 + with_phis) * n_pairs
+        generators[offset + np.arange(norb), np.arange(norb), np.arange(norb)] = 1j
+    return [_OrbitalRotationLayer(left, np.arange(len(params)), generators)]
+
+
+def _num_num_spin_balanced_layers(
+    params: np.ndarray,
+    *,
+    norb: int,
+    interaction_pairs: tuple[list[tuple[int, int]], list[tuple[int, int]]],
+) -> list[_Layer]:
+    operator = NumNumAnsatzOpSpinBalanced.from_parameters(
+        params, norb=norb, interaction_pairs=interaction_pairs
+    )
+    generators = np.zeros((len(params), 2, norb, norb))
+    index = 0
+    for sigma, pairs in enumerate(interaction_pairs):
+        for i, j in pairs:
+            generators[index, sigma, [i, j], [j, i]] = 1
+            index += 1
+    return [
+        _DiagCoulombLayer(
+            operator.to_diag_coulomb_mats(), np.arange(len(params)), generators
+        )
+    ]
+
+
+def _validate_n_params(params: np.ndarray, n_params: int) -> None:
+    if len(params) != n_params:
+        raise ValueError(
+            "The number of parameters passed did not match the number expected "
+            "based on the function inputs. "
+            f"Expected {n_params} but got {len(params)}."
+        )
+
+
+def _orbital_rotation_with_derivatives(
+    params: np.ndarray, norb: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return an orbital rotation and its derivatives with respect to its parameters.
+
+    The parameterization is the same as in ``orbital_rotation_from_parameters``.
+    """
+    triu_indices_no_diag = list(itertools.combinations(range(norb), 2))
+    triu_indices = list(itertools.combinations_with_replacement(range(norb), 2))
+    directions = np.zeros((norb**2, norb, norb), dtype=complex)
+    # real part
+    for k, (i, j) in enumerate(triu_indices_no_diag):
+        directions[k, i, j] = 1
+        directions[k, j, i] = -1
+    # imaginary part
+    for k, (i, j) in enumerate(triu_indices, start=len(triu_indices_no_diag)):
+        directions[k, i, j] = 1j
+        directions[k, j, i] = 1j
+    generator = np.einsum("k,kij->ij", params, directions)
+    # The generator is anti-Hermitian, so exp(generator) and its derivatives are
+    # computed from the eigendecomposition using the Daleckii-Krein formula
+    eigs, vecs = scipy.linalg.eigh(-1j * generator)
+    orbital_rotation = (vecs * np.exp(1j * eigs)) @ vecs.T.conj()
+    half_diffs = 0.5 * (eigs[:, None] - eigs[None, :])
+    divided_diffs = np.exp(0.5j * (eigs[:, None] + eigs[None, :])) * np.sinc(
+        half_diffs / np.pi
+    )
+    rotated_directions = vecs.T.conj() @ directions @ vecs
+    derivs = vecs @ (divided_diffs * rotated_directions) @ vecs.T.conj()
+    return orbital_rotation, derivs
+
+
+def _transition_rdm1(
+    bra: np.ndarray, ket: np.ndarray, norb: int, nelec: tuple[int, int]
+) -> np.ndarray:
+    r"""Return the spin-summed transition one-RDM.
+
+    The returned matrix has entries
+    :math:`\langle \text{bra} | \sum_\sigma a^\dagger_{\sigma, p} a_{\sigma, q}
+    | \text{ket} \rangle`.
+    """
+    n_alpha, n_beta = nelec
+    bra = bra.reshape(dims(norb, nelec))
+    ket = ket.reshape(dims(norb, nelec))
+    rdm = np.zeros((norb, norb), dtype=complex)
+    for nocc, bra_mat, ket_mat in [(n_alpha, bra, ket), (n_beta, bra.T, ket.T)]:
+        link_index = gen_linkstr_index(range(norb), nocc)
+        creation, annihilation, target, sign = link_index.transpose(2, 0, 1)
+        for k in range(link_index.shape[1]):
+            overlaps = np.einsum("sb,sb->s", bra_mat[target[:, k]].conj(), ket_mat)
+            np.add.at(rdm, (creation[:, k], annihilation[:, k]), sign[:, k] * overlaps)
+    return rdm
+
+
+def _occupations(norb: int, nocc: int) -> np.ndarray:
+    strings = make_strings(range(norb), nocc)
+    return ((strings[:, None] >> np.arange(norb)) & 1).astype(float)
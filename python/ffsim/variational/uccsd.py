@@ -17,8 +17,6 @@ from dataclasses import InitVar, dataclass
 from typing import cast
 
 import numpy as np
-import scipy.linalg
-import scipy.sparse.linalg
 
 from ffsim import gates, hamiltonians, linalg, protocols
 from ffsim.variational.util import (
@@ -224,7 +222,12 @@ class UCCSDOpRestrictedReal:
             norb=norb,
             nelec=nelec,
         )
-        vec = scipy.sparse.linalg.expm_multiply(linop, vec, traceA=0.0)
+        # The generator is anti-Hermitian, so exp(linop) = exp(-i (i linop)) where
+        # i linop is Hermitian and the Lanczos algorithm applies
+        if vec.ndim == 1:
+            vec = linalg.expm_multiply_krylov(1j * linop, vec)
+        else:
+            vec = np.stack([linalg.expm_multiply_krylov(1j * linop, v) for v in vec])
 
         if self.final_orbital_rotation is not None:
             vec = gates.apply_orbital_rotation(
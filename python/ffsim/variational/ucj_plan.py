@@ -0,0 +1,111 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Precompiled plan for applying unitary cluster Jastrow operators."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Union
+
+import numpy as np
+
+from ffsim.gates.diag_coulomb import _apply_diag_coulomb_mat_exp, _get_mat_exp
+from ffsim.gates.orbital_rotation import (
+    _apply_givens_arrays_spinful,
+    _apply_givens_arrays_spinless,
+    _get_givens_arrays,
+    _GivensArrays,
+)
+
+
+@dataclass(frozen=True)
+class _OrbitalRotationStep:
+    givens_arrays_a: _GivensArrays | None
+    givens_arrays_b: _GivensArrays | None
+
+
+@dataclass(frozen=True)
+class _DiagCoulombStep:
+    mat_exp: tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+_Step = Union[_OrbitalRotationStep, _DiagCoulombStep]
+
+
+@dataclass(frozen=True)
+class UCJPlan:
+    """A precompiled plan for applying a unitary cluster Jastrow operator.
+
+    A plan is returned by the ``compile`` method of a UCJ operator. It stores the
+    Givens decompositions of the orbital rotations and the exponentiated diagonal
+    Coulomb matrices, so that applying it only runs the simulation kernels. Apply it
+    with :func:`ffsim.apply_unitary`, in the same way as the operator it was compiled
+    from.
+
+    Attributes:
+        norb (int): The number of spatial orbitals.
+        spinless (bool): Whether the plan can be applied to a spinless system, that is,
+            with ``nelec`` given as a single integer.
+        steps (tuple): The steps of the plan, in the order in which they are applied.
+            Each step is either an orbital rotation, stored as the Givens
+            decompositions of its alpha and beta matrices, or a diagonal Coulomb
+            evolution, stored as its exponentiated matrices.
+    """
+
+    norb: int
+    spinless: bool
+    steps: tuple[_Step, ...]
+
+    def _apply_unitary_(
+        self, vec: np.ndarray, norb: int, nelec: int | tuple[int, int], copy: bool
+    ) -> np.ndarray:
+        if norb != self.norb:
+            raise ValueError(
+                f"The plan was compiled for {self.norb} orbitals but norb={norb} "
+                "was given."
+            )
+        if isinstance(nelec, int) and not self.spinless:
+            return NotImplemented
+        if copy:
+            vec = vec.copy()
+        for step in self.steps:
+            if isinstance(step, _OrbitalRotationStep):
+                if isinstance(nelec, int):
+                    assert step.givens_arrays_a is not None
+                    vec = _apply_givens_arrays_spinless(
+                        vec, step.givens_arrays_a, norb, nelec
+                    )
+                else:
+                    vec = _apply_givens_arrays_spinful(
+                        vec, step.givens_arrays_a, step.givens_arrays_b, norb, nelec
+                    )
+            else:
+                vec = _apply_diag_coulomb_mat_exp(
+                    vec,
+                    step.mat_exp,
+                    norb=norb,
+                    nelec=(nelec, 0) if isinstance(nelec, int) else nelec,
+                    z_representation=False,
+                )
+        return vec
+
+
+def _orbital_rotation_step(
+    mat: np.ndarray | tuple[np.ndarray | None, np.ndarray | None],
+) -> _OrbitalRotationStep:
+    return _OrbitalRotationStep(*_get_givens_arrays(mat))
+
+
+def _diag_coulomb_step(
+    mat: np.ndarray | tuple[np.ndarray | None, np.ndarray | None, np.ndarray | None],
+    norb: int,
+) -> _DiagCoulombStep:
+    return _DiagCoulombStep(_get_mat_exp(mat, -1.0, norb=norb, z_representation=False))
@@ -18,7 +18,13 @@ from typing import cast
 
 import numpy as np
 
-from ffsim import gates, linalg
+from ffsim import linalg
+from ffsim.variational.ucj_plan import (
+    UCJPlan,
+    _diag_coulomb_step,
+    _orbital_rotation_step,
+    _Step,
+)
 from ffsim.variational.util import (
     orbital_rotation_from_parameters,
     orbital_rotation_from_t1_amplitudes,
@@ -473,46 +479,43 @@ class UCJOpSpinBalanced:
             final_orbital_rotation=final_orbital_rotation,
         )
 
-    def _apply_unitary_(
-        self, vec: np.ndarray, norb: int, nelec: int | tuple[int, int], copy: bool
-    ) -> np.ndarray:
-        if isinstance(nelec, int):
-            return NotImplemented
-        if copy:
-            vec = vec.copy()
+    def compile(self) -> UCJPlan:
+        """Precompile the operator for repeated application.
+
+        The returned plan stores the Givens decompositions of the orbital rotations
+        and the exponentiated diagonal Coulomb matrices. Applying the plan with
+        :func:`ffsim.apply_unitary` gives the same result as applying the operator,
+        but skips this setup, which is useful when the same operator is applied
+        many times.
+
+        Returns:
+            The compiled plan.
+        """
+        norb = self.norb
+        steps: list[_Step] = []
         current_basis = np.eye(norb)
         for (diag_coulomb_mat_aa, diag_coulomb_mat_ab), orbital_rotation in zip(
             self.diag_coulomb_mats, self.orbital_rotations
         ):
-            vec = gates.apply_orbital_rotation(
-                vec,
-                orbital_rotation.T.conj() @ current_basis,
-                norb=norb,
-                nelec=nelec,
-                copy=False,
+            steps.append(
+                _orbital_rotation_step(orbital_rotation.T.conj() @ current_basis)
             )
-            vec = gates.apply_diag_coulomb_evolution(
-                vec,
-                (diag_coulomb_mat_aa, diag_coulomb_mat_ab, diag_coulomb_mat_aa),
-                time=-1.0,
-                norb=norb,
-                nelec=nelec,
-                copy=False,
+            steps.append(
+                _diag_coulomb_step(
+                    (diag_coulomb_mat_aa, diag_coulomb_mat_ab, diag_coulomb_mat_aa),
+                    norb=norb,
+                )
             )
             current_basis = orbital_rotation
-        if self.final_orbital_rotation is None:
-            vec = gates.apply_orbital_rotation(
-                vec, current_basis, norb=norb, nelec=nelec, copy=False
-            )
-        else:
-            vec = gates.apply_orbital_rotation(
-                vec,
-                self.final_orbital_rotation @ current_basis,
-                norb=norb,
-                nelec=nelec,
-                copy=False,
-            )
-        return vec
+        if self.final_orbital_rotation is not None:
+            current_basis = self.final_orbital_rotation @ current_basis
+        steps.append(_orbital_rotation_step(current_basis))
+        return UCJPlan(norb=norb, spinless=False, steps=tuple(steps))
+
+    def _apply_unitary_(
+        self, vec: np.ndarray, norb: int, nelec: int | tuple[int, int], copy: bool
+    ) -> np.ndarray:
+        return self.compile()._apply_unitary_(vec, norb=norb, nelec=nelec, copy=copy)
 
     def _approx_eq_(self, other, rtol: float, atol: float) -> bool:
         if isinstance(other, UCJOpSpinBalanced):
@@ -18,7 +18,13 @@ from typing import cast
 
 import numpy as np
 
-from ffsim import gates, linalg
+from ffsim import linalg
+from ffsim.variational.ucj_plan import (
+    UCJPlan,
+    _diag_coulomb_step,
+    _orbital_rotation_step,
+    _Step,
+)
 from ffsim.variational.util import (
     orbital_rotation_from_parameters,
     orbital_rotation_from_t1_amplitudes,
@@ -610,47 +616,41 @@ class UCJOpSpinUnbalanced:
             final_orbital_rotation=final_orbital_rotation,
         )
 
-    def _apply_unitary_(
-        self, vec: np.ndarray, norb: int, nelec: int | tuple[int, int], copy: bool
-    ) -> np.ndarray:
-        if isinstance(nelec, int):
-            return NotImplemented
-        if copy:
-            vec = vec.copy()
+    def compile(self) -> UCJPlan:
+        """Precompile the operator for repeated application.
+
+        The returned plan stores the Givens decompositions of the orbital rotations
+        and the exponentiated diagonal Coulomb matrices. Applying the plan with
+        :func:`ffsim.apply_unitary` gives the same result as applying the operator,
+        but skips this setup, which is useful when the same operator is applied
+        many times.
+
+        Returns:
+            The compiled plan.
+        """
+        norb = self.norb
+        steps: list[_Step] = []
         eye = np.eye(norb)
         current_basis = np.stack([eye, eye])
         for diag_coulomb_mat, orbital_rotation in zip(
             self.diag_coulomb_mats, self.orbital_rotations
         ):
-            vec = gates.apply_orbital_rotation(
-                vec,
-                orbital_rotation.transpose(0, 2, 1).conj() @ current_basis,
-                norb=norb,
-                nelec=nelec,
-                copy=False,
-            )
-            vec = gates.apply_diag_coulomb_evolution(
-                vec,
-                diag_coulomb_mat,
-                time=-1.0,
-                norb=norb,
-                nelec=nelec,
-                copy=False,
+            steps.append(
+                _orbital_rotation_step(
+                    orbital_rotation.transpose(0, 2, 1).conj() @ current_basis
+                )
             )
+            steps.append(_diag_coulomb_step(diag_coulomb_mat, norb=norb))
             current_basis = orbital_rotation
-        if self.final_orbital_rotation is None:
-            vec = gates.apply_orbital_rotation(
-                vec, current_basis, norb=norb, nelec=nelec, copy=False
-            )
-        else:
-            vec = gates.apply_orbital_rotation(
-                vec,
-                self.final_orbital_rotation @ current_basis,
-                norb=norb,
-                nelec=nelec,
-                copy=False,
-            )
-        return vec
+        if self.final_orbital_rotation is not None:
+            current_basis = self.final_orbital_rotation @ current_basis
+        steps.append(_orbital_rotation_step(current_basis))
+        return UCJPlan(norb=norb, spinless=False, steps=tuple(steps))
+
+    def _apply_unitary_(
+        self, vec: np.ndarray, norb: int, nelec: int | tuple[int, int], copy: bool
+    ) -> np.ndarray:
+        return self.compile()._apply_unitary_(vec, norb=norb, nelec=nelec, copy=copy)
 
     def _approx_eq_(self, other, rtol: float, atol: float) -> bool:
         if isinstance(other, UCJOpSpinUnbalanced):
@@ -18,7 +18,13 @@ from typing import cast
 
 import numpy as np
 
-from ffsim import gates, linalg
+from ffsim import linalg
+from ffsim.variational.ucj_plan import (
+    UCJPlan,
+    _diag_coulomb_step,
+    _orbital_rotation_step,
+    _Step,
+)
 from ffsim.variational.util import (
     orbital_rotation_from_parameters,
     orbital_rotation_from_t1_amplitudes,
@@ -401,66 +407,43 @@ class UCJOpSpinless:
             final_orbital_rotation=final_orbital_rotation,
         )
 
-    def _apply_unitary_(
-        self, vec: np.ndarray, norb: int, nelec: int | tuple[int, int], copy: bool
-    ) -> np.ndarray:
-        if copy:
-            vec = vec.copy()
+    def compile(self) -> UCJPlan:
+        """Precompile the operator for repeated application.
+
+        The returned plan stores the Givens decompositions of the orbital rotations
+        and the exponentiated diagonal Coulomb matrices. Applying the plan with
+        :func:`ffsim.apply_unitary` gives the same result as applying the operator,
+        but skips this setup, which is useful when the same operator is applied
+        many times.
+
+        Returns:
+            The compiled plan.
+        """
+        norb = self.norb
+        steps: list[_Step] = []
         current_basis = np.eye(norb)
-        if isinstance(nelec, int):
-            for diag_coulomb_mat, orbital_rotation in zip(
-                self.diag_coulomb_mats, self.orbital_rotations
-            ):
-                vec = gates.apply_orbital_rotation(
-                    vec,
-                    orbital_rotation.T.conj() @ current_basis,
-                    norb=norb,
-                    nelec=nelec,
-                    copy=False,
-                )
-                vec = gates.apply_diag_coulomb_evolution(
-                    vec,
-                    diag_coulomb_mat,
-                    time=-1.0,
-                    norb=norb,
-                    nelec=nelec,
-                    copy=False,
-                )
-                current_basis = orbital_rotation
-        else:
-            zero = np.zeros((norb, norb))
-            for diag_coulomb_mat, orbital_rotation in zip(
-                self.diag_coulomb_mats, self.orbital_rotations
-            ):
-                vec = gates.apply_orbital_rotation(
-                    vec,
-                    orbital_rotation.T.conj() @ current_basis,
-                    norb=norb,
-                    nelec=nelec,
-                    copy=False,
-                )
-                vec = gates.apply_diag_coulomb_evolution(
-                    vec,
-                    (diag_coulomb_mat, zero, diag_coulomb_mat),
-                    time=-1.0,
-                    norb=norb,
-                    nelec=nelec,
-                    copy=False,
-                )
-                current_basis = orbital_rotation
-        if self.final_orbital_rotation is None:
-            vec = gates.apply_orbital_rotation(
-                vec, current_basis, norb=norb, nelec=nelec, copy=False
+        zero = np.zeros((norb, norb))
+        for diag_coulomb_mat, orbital_rotation in zip(
+            self.diag_coulomb_mats, self.orbital_rotations
+        ):
+            steps.append(
+                _orbital_rotation_step(orbital_rotation.T.conj() @ current_basis)
             )
-        else:
-            vec = gates.apply_orbital_rotation(
-                vec,
-                self.final_orbital_rotation @ current_basis,
-                norb=norb,
-                nelec=nelec,
-                copy=False,
+            steps.append(
+                _diag_coulomb_step(
+                    (diag_coulomb_mat, zero, diag_coulomb_mat), norb=norb
+                )
             )
-        return vec
+            current_basis = orbital_rotation
+        if self.final_orbital_rotation is not None:
+            current_basis = self.final_orbital_rotation @ current_basis
+        steps.append(_orbital_rotation_step(current_basis))
+        return UCJPlan(norb=norb, spinless=True, steps=tuple(steps))
+
+    def _apply_unitary_(
+        self, vec: np.ndarray, norb: int, nelec: int | tuple[int, int], copy: bool
+    ) -> np.ndarray:
+        return self.compile()._apply_unitary_(vec, norb=norb, nelec=nelec, copy=copy)
 
     def _approx_eq_(self, other, rtol: float, atol: float) -> bool:
         if isinstance(other, UCJOpSpinless):
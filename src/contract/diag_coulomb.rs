@@ -9,43 +9,53 @@
 // that they have been altered from the originals.
 
 use ndarray::Array;
+use ndarray::Array1;
+use ndarray::Array2;
+use ndarray::ArrayView1;
+use ndarray::ArrayView2;
+use ndarray::ArrayViewMut2;
 use ndarray::Zip;
+use num_complex::Complex;
 use numpy::Complex64;
 use numpy::PyReadonlyArray1;
 use numpy::PyReadonlyArray2;
-use numpy::PyReadwriteArray2;
 use pyo3::prelude::*;
 
+use crate::precision::dtype_mismatch_error;
+use crate::precision::ComplexArray2;
+use crate::precision::ComplexArrayMut2;
+use crate::precision::Real;
+
 /// Contract a diagonal Coulomb operator into a buffer.
+///
+/// The vector and output buffer may be stored in double or single precision, but
+/// must have the same precision.
 #[allow(clippy::too_many_arguments)]
 #[pyfunction]
 pub fn contract_diag_coulomb_into_buffer_num_rep(
-    vec: PyReadonlyArray2<Complex64>,
+    vec: ComplexArray2,
     mat_aa: PyReadonlyArray2<f64>,
     mat_ab: PyReadonlyArray2<f64>,
     mat_bb: PyReadonlyArray2<f64>,
     norb: usize,
     occupations_a: PyReadonlyArray2<usize>,
     occupations_b: PyReadonlyArray2<usize>,
-    mut out: PyReadwriteArray2<Complex64>,
-) {
-    let vec = vec.as_array();
+    out: ComplexArrayMut2,
+) -> PyResult<()> {
     let mat_aa = mat_aa.as_array();
     let mat_ab = mat_ab.as_array();
     let mat_bb = mat_bb.as_array();
     let occupations_a = occupations_a.as_array();
     let occupations_b = occupations_b.as_array();
-    let mut out = out.as_array_mut();
 
-    let shape = vec.shape();
-    let dim_a = shape[0];
-    let dim_b = shape[1];
+    let dim_a = occupations_a.nrows();
+    let dim_b = occupations_b.nrows();
     let n_alpha = occupations_a.shape()[1];
     let n_beta = occupations_b.shape()[1];
 
-    let mut alpha_coeffs = Array::zeros(dim_a);
-    let mut beta_coeffs = Array::zeros(dim_b);
-    let mut coeff_map = Array::zeros((dim_a, norb));
+    let mut alpha_coeffs: Array1<Complex64> = Array::zeros(dim_a);
+    let mut beta_coeffs: Array1<Complex64> = Array::zeros(dim_b);
+    let mut coeff_map: Array2<f64> = Array::zeros((dim_a, norb));
 
     Zip::from(&mut beta_coeffs)
         .and(occupations_b.rows())
@@ -77,6 +87,40 @@ pub fn contract_diag_coulomb_into_buffer_num_rep(
             *val = coeff;
         });
 
+    match (vec, out) {
+        (ComplexArray2::Double(vec), ComplexArrayMut2::Double(mut out)) => contract_coeffs_num_rep(
+            vec.as_array(),
+            alpha_coeffs.view(),
+            beta_coeffs.view(),
+            coeff_map.view(),
+            occupations_b,
+            out.as_array_mut(),
+        ),
+        (ComplexArray2::Single(vec), ComplexArrayMut2::Single(mut out)) => contract_coeffs_num_rep(
+            vec.as_array(),
+            alpha_coeffs.view(),
+            beta_coeffs.view(),
+            coeff_map.view(),
+            occupations_b,
+            out.as_array_mut(),
+        ),
+        _ => return Err(dtype_mismatch_error()),
+    }
+    Ok(())
+}
+
+/// Accumulate each entry of the vector times the coefficient of its pair of strings.
+fn contract_coeffs_num_rep<T: Real>(
+    vec: ArrayView2<Complex<T>>,
+    alpha_coeffs: ArrayView1<Complex64>,
+    beta_coeffs: ArrayView1<Complex64>,
+    coeff_map: ArrayView2<f64>,
+    occupations_b: ArrayView2<usize>,
+    mut out: ArrayViewMut2<Complex<T>>,
+) {
+    let alpha_coeffs = alpha_coeffs.mapv(T::from_c64);
+    let beta_coeffs = beta_coeffs.mapv(T::from_c64);
+    let coeff_map = coeff_map.mapv(T::from_f64);
     Zip::from(vec.rows())
         .and(out.rows_mut())
         .and(&alpha_coeffs)
@@ -89,39 +133,39 @@ pub fn contract_diag_coulomb_into_buffer_num_rep(
                 .for_each(|source, target, beta_coeff, orbs| {
                     let mut coeff = *alpha_coeff + *beta_coeff;
                     orbs.for_each(|&orb| coeff += coeff_map[orb]);
-                    *target += coeff * source;
+                    *target += coeff * *source;
                 })
         });
 }
 
 /// Contract a diagonal Coulomb operator into a buffer, Z representation.
+///
+/// The vector and output buffer may be stored in double or single precision, but
+/// must have the same precision.
 #[allow(clippy::too_many_arguments)]
 #[pyfunction]
 pub fn contract_diag_coulomb_into_buffer_z_rep(
-    vec: PyReadonlyArray2<Complex64>,
+    vec: ComplexArray2,
     mat_aa: PyReadonlyArray2<f64>,
     mat_ab: PyReadonlyArray2<f64>,
     mat_bb: PyReadonlyArray2<f64>,
     norb: usize,
     strings_a: PyReadonlyArray1<i64>,
     strings_b: PyReadonlyArray1<i64>,
-    mut out: PyReadwriteArray2<Complex64>,
-) {
-    let vec = vec.as_array();
+    out: ComplexArrayMut2,
+) -> PyResult<()> {
     let mat_aa = mat_aa.as_array();
     let mat_ab = mat_ab.as_array();
     let mat_bb = mat_bb.as_array();
     let strings_a = strings_a.as_array();
     let strings_b = strings_b.as_array();
-    let mut out = out.as_array_mut();
 
-    let shape = vec.shape();
-    let dim_a = shape[0];
-    let dim_b = shape[1];
+    let dim_a = strings_a.len();
+    let dim_b = strings_b.len();
 
-    let mut alpha_coeffs = Array::zeros(dim_a);
-    let mut beta_coeffs = Array::zeros(dim_b);
-    let mut coeff_map = Array::zeros((dim_a, norb));
+    let mut alpha_coeffs: Array1<Complex64> = Array::zeros(dim_a);
+    let mut beta_coeffs: Array1<Complex64> = Array::zeros(dim_b);
+    let mut coeff_map: Array2<f64> = Array::zeros((dim_a, norb));
 
     Zip::from(&mut beta_coeffs)
         .and(strings_b)
@@ -153,6 +197,47 @@ pub fn contract_diag_coulomb_into_buffer_z_rep(
             *val = coeff;
         });
 
+    // absorb the overall factor of 1/4 into the coefficients
+    alpha_coeffs *= Complex64::new(0.25, 0.0);
+    beta_coeffs *= Complex64::new(0.25, 0.0);
+    coeff_map *= 0.25;
+    match (vec, out) {
+        (ComplexArray2::Double(vec), ComplexArrayMut2::Double(mut out)) => contract_coeffs_z_rep(
+            vec.as_array(),
+            alpha_coeffs.view(),
+            beta_coeffs.view(),
+            coeff_map.view(),
+            norb,
+            strings_b,
+            out.as_array_mut(),
+        ),
+        (ComplexArray2::Single(vec), ComplexArrayMut2::Single(mut out)) => contract_coeffs_z_rep(
+            vec.as_array(),
+            alpha_coeffs.view(),
+            beta_coeffs.view(),
+            coeff_map.view(),
+            norb,
+            strings_b,
+            out.as_array_mut(),
+        ),
+        _ => return Err(dtype_mismatch_error()),
+    }
+    Ok(())
+}
+
+/// Accumulate each entry of the vector times the coefficient of its pair of strings.
+fn contract_coeffs_z_rep<T: Real>(
+    vec: ArrayView2<Complex<T>>,
+    alpha_coeffs: ArrayView1<Complex64>,
+    beta_coeffs: ArrayView1<Complex64>,
+    coeff_map: ArrayView2<f64>,
+    norb: usize,
+    strings_b: ArrayView1<i64>,
+    mut out: ArrayViewMut2<Complex<T>>,
+) {
+    let alpha_coeffs = alpha_coeffs.mapv(T::from_c64);
+    let beta_coeffs = beta_coeffs.mapv(T::from_c64);
+    let coeff_map = coeff_map.mapv(T::from_f64);
     Zip::from(vec.rows())
         .and(out.rows_mut())
         .and(&alpha_coeffs)
@@ -165,10 +250,13 @@ pub fn contract_diag_coulomb_into_buffer_z_rep(
                 .for_each(|source, target, beta_coeff, str0| {
                     let mut coeff = *alpha_coeff + *beta_coeff;
                     for j in 0..norb {
-                        let sign_j = if (str0 >> j) & 1 == 1 { -1 } else { 1 } as f64;
-                        coeff += sign_j * coeff_map[j];
+                        if (str0 >> j) & 1 == 1 {
+                            coeff -= coeff_map[j];
+                        } else {
+                            coeff += coeff_map[j];
+                        }
                     }
-                    *target += 0.25 * coeff * source;
+                    *target += coeff * *source;
                 })
         });
 }
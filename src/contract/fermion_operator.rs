@@ -0,0 +1,261 @@
+// (C) Copyright IBM 2024
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use crate::fermion_operator::FermionOperator;
+use crate::precision::dtype_mismatch_error;
+use crate::precision::ComplexArray2;
+use crate::precision::ComplexArrayMut2;
+use crate::precision::Real;
+use ndarray::aview1;
+use ndarray::ArrayView2;
+use ndarray::ArrayViewMut2;
+use ndarray::Zip;
+use num_complex::Complex;
+use num_integer::binomial;
+use numpy::Complex64;
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use std::collections::HashMap;
+
+/// String transitions of one spin species under a product of ladder operators.
+///
+/// Entry k maps the string with address ``source[k]`` to the string with address
+/// ``target[k]`` with sign ``sign[k]``. Strings annihilated by the operators are
+/// omitted.
+struct SectorTransitions {
+    source: Vec<usize>,
+    target: Vec<usize>,
+    sign: Vec<f64>,
+}
+
+/// Precompiled string-transition tables of a FermionOperator.
+///
+/// The action of each term on a determinant factors into an action on the alpha
+/// string and an action on the beta string, up to a sign that depends only on the
+/// term. The alpha transitions of all terms are grouped by target address so that
+/// contraction can be parallelized over the rows of the output without write
+/// conflicts. Beta transitions are shared between terms with the same beta
+/// operators, and terms with no beta operators act as the identity on beta strings.
+///
+/// Args:
+///     operator (FermionOperator): The operator. It must conserve particle number
+///         and the Z component of spin.
+///     norb (int): The number of spatial orbitals.
+///     nelec (tuple[int, int]): The number of alpha and beta electrons.
+#[pyclass(module = "ffsim._lib")]
+pub struct FermionOperatorTables {
+    /// For each target alpha address, the list of (beta table, source alpha address,
+    /// coefficient) contributions.
+    rows: Vec<Vec<(usize, usize, Complex64)>>,
+    /// Beta transition tables. None indicates the identity.
+    beta: Vec<Option<SectorTransitions>>,
+}
+
+#[pymethods]
+impl FermionOperatorTables {
+    #[new]
+    fn new(operator: &FermionOperator, norb: usize, nelec: (usize, usize)) -> PyResult<Self> {
+        if norb > 63 {
+            return Err(PyValueError::new_err(format!(
+                "Number of orbitals must be at most 63. Got {}.",
+                norb
+            )));
+        }
+        let (n_alpha, n_beta) = nelec;
+        let binom = binomial_table(norb);
+        let strings_a = make_strings(norb, n_alpha);
+        let strings_b = make_strings(norb, n_beta);
+        let mut rows: Vec<Vec<(usize, usize, Complex64)>> = vec![Vec::new(); strings_a.len()];
+        let mut beta = vec![None];
+        let mut beta_indices: HashMap<Vec<(bool, usize)>, usize> = HashMap::new();
+        beta_indices.insert(Vec::new(), 0);
+
+        for (term, &coeff) in &operator.coeffs {
+            // Split the term into alpha and beta operators in the order they are
+            // applied, and compute the sign from moving beta operators past alpha
+            // electrons.
+            let mut ops_a = Vec::new();
+            let mut ops_b = Vec::new();
+            let mut count_a = n_alpha as i64;
+            let mut count_b = n_beta as i64;
+            let mut parity = false;
+            for &(action, spin, orb) in term.iter().rev() {
+                if orb < 0 || orb as usize >= norb {
+                    return Err(PyValueError::new_err(format!(
+                        "Orbital index {} is out of range for {} orbitals.",
+                        orb, norb
+                    )));
+                }
+                let change = if action { 1 } else { -1 };
+                if spin {
+                    parity ^= count_a % 2 != 0;
+                    ops_b.push((action, orb as usize));
+                    count_b += change;
+                } else {
+                    ops_a.push((action, orb as usize));
+                    count_a += change;
+                }
+            }
+            if count_a != n_alpha as i64 || count_b != n_beta as i64 {
+                return Err(PyValueError::new_err(
+                    "The operator does not conserve particle number and the Z component \
+                     of spin.",
+                ));
+            }
+            let coeff = if parity { -coeff } else { coeff };
+
+            let beta_index = match beta_indices.get(&ops_b) {
+                Some(&index) => index,
+                None => {
+                    let index = beta.len();
+                    beta.push(Some(sector_transitions(&ops_b, &strings_b, &binom)));
+                    beta_indices.insert(ops_b, index);
+                    index
+                }
+            };
+            let alpha = sector_transitions(&ops_a, &strings_a, &binom);
+            for ((&source, &target), &sign) in
+                alpha.source.iter().zip(&alpha.target).zip(&alpha.sign)
+            {
+                rows[target].push((beta_index, source, sign * coeff));
+            }
+        }
+
+        Ok(Self { rows, beta })
+    }
+}
+
+/// Contract a FermionOperator into a buffer using precompiled transition tables.
+///
+/// The vector and output buffer may be stored in double or single precision, but
+/// must have the same precision.
+#[pyfunction]
+pub fn contract_fermion_operator_into_buffer(
+    vec: ComplexArray2,
+    tables: &FermionOperatorTables,
+    out: ComplexArrayMut2,
+) -> PyResult<()> {
+    match (vec, out) {
+        (ComplexArray2::Double(vec), ComplexArrayMut2::Double(mut out)) => {
+            contract_fermion_operator(vec.as_array(), tables, out.as_array_mut())
+        }
+        (ComplexArray2::Single(vec), ComplexArrayMut2::Single(mut out)) => {
+            contract_fermion_operator(vec.as_array(), tables, out.as_array_mut())
+        }
+        _ => return Err(dtype_mismatch_error()),
+    }
+    Ok(())
+}
+
+fn contract_fermion_operator<T: Real>(
+    vec: ArrayView2<Complex<T>>,
+    tables: &FermionOperatorTables,
+    mut out: ArrayViewMut2<Complex<T>>,
+) {
+    Zip::from(out.rows_mut())
+        .and(aview1(&tables.rows))
+        .par_for_each(|mut target_row, entries| {
+            for &(beta_index, source, coeff) in entries {
+                let coeff = T::from_c64(coeff);
+                let source_row = vec.row(source);
+                match &tables.beta[beta_index] {
+                    None => Zip::from(&mut target_row)
+                        .and(&source_row)
+                        .for_each(|val, &v| *val += coeff * v),
+                    Some(beta) => {
+                        for ((&i, &j), &sign) in
+                            beta.source.iter().zip(&beta.target).zip(&beta.sign)
+                        {
+                            target_row[j] += coeff * source_row[i] * T::from_f64(sign);
+                        }
+                    }
+                }
+            }
+        });
+}
+
+/// Table of binomial coefficients C(n, k) for n, k <= norb.
+fn binomial_table(norb: usize) -> Vec<Vec<usize>> {
+    (0..=norb)
+        .map(|n| (0..=norb).map(|k| binomial(n, k)).collect())
+        .collect()
+}
+
+/// Return the bitstrings of length norb with nocc bits set, in increasing order.
+///
+/// The position of a string in the returned list is its address.
+fn make_strings(norb: usize, nocc: usize) -> Vec<u64> {
+    if nocc > norb {
+        return Vec::new();
+    }
+    let dim = binomial(norb, nocc);
+    let mut strings = Vec::with_capacity(dim);
+    let mut string: u64 = (1 << nocc) - 1;
+    loop {
+        strings.push(string);
+        if strings.len() == dim {
+            break;
+        }
+        // Gosper's hack: next larger integer with the same number of bits set
+        let c = string & string.wrapping_neg();
+        let r = string + c;
+        string = (((r ^ string) >> 2) / c) | r;
+    }
+    strings
+}
+
+/// Return the address of a bitstring among the strings with the same number of bits.
+fn string_address(string: u64, binom: &[Vec<usize>]) -> usize {
+    let mut address = 0;
+    let mut remaining = string;
+    let mut k = 0;
+    while remaining != 0 {
+        let pos = remaining.trailing_zeros() as usize;
+        k += 1;
+        if k <= pos {
+            address += binom[pos][k];
+        }
+        remaining &= remaining - 1;
+    }
+    address
+}
+
+/// Compute the string transitions of a sequence of ladder operators of one spin.
+///
+/// The operators are given as (action, orbital) pairs in the order they are applied.
+fn sector_transitions(
+    ops: &[(bool, usize)],
+    strings: &[u64],
+    binom: &[Vec<usize>],
+) -> SectorTransitions {
+    let mut source = Vec::new();
+    let mut target = Vec::new();
+    let mut sign = Vec::new();
+    'strings: for (address, &string) in strings.iter().enumerate() {
+        let mut current = string;
+        let mut parity = false;
+        for &(action, orb) in ops {
+            let bit = 1 << orb;
+            if action == (current & bit != 0) {
+                continue 'strings;
+            }
+            parity ^= (current >> (orb + 1)).count_ones() % 2 != 0;
+            current ^= bit;
+        }
+        source.push(address);
+        target.push(string_address(current, binom));
+        sign.push(if parity { -1.0 } else { 1.0 });
+    }
+    SectorTransitions {
+        source,
+        target,
+        sign,
+    }
+}
@@ -8,32 +8,60 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
+use ndarray::ArrayView1;
+use ndarray::ArrayView2;
+use ndarray::ArrayViewMut2;
 use ndarray::Zip;
-use numpy::Complex64;
+use num_complex::Complex;
 use numpy::PyReadonlyArray1;
 use numpy::PyReadonlyArray2;
-use numpy::PyReadwriteArray2;
 use pyo3::prelude::*;
 
+use crate::precision::dtype_mismatch_error;
+use crate::precision::ComplexArray2;
+use crate::precision::ComplexArrayMut2;
+use crate::precision::Real;
+
 /// Contract a sum of number operators into a buffer.
+///
+/// The vector and output buffer may be stored in double or single precision, but
+/// must have the same precision.
 #[pyfunction]
 pub fn contract_num_op_sum_spin_into_buffer(
-    vec: PyReadonlyArray2<Complex64>,
+    vec: ComplexArray2,
     coeffs: PyReadonlyArray1<f64>,
     occupations: PyReadonlyArray2<usize>,
-    mut out: PyReadwriteArray2<Complex64>,
-) {
-    let vec = vec.as_array();
+    out: ComplexArrayMut2,
+) -> PyResult<()> {
     let coeffs = coeffs.as_array();
     let occupations = occupations.as_array();
-    let mut out = out.as_array_mut();
+    match (vec, out) {
+        (ComplexArray2::Double(vec), ComplexArrayMut2::Double(mut out)) => {
+            contract_num_op_sum_spin(vec.as_array(), coeffs, occupations, out.as_array_mut())
+        }
+        (ComplexArray2::Single(vec), ComplexArrayMut2::Single(mut out)) => {
+            contract_num_op_sum_spin(vec.as_array(), coeffs, occupations, out.as_array_mut())
+        }
+        _ => return Err(dtype_mismatch_error()),
+    }
+    Ok(())
+}
 
+fn contract_num_op_sum_spin<T: Real>(
+    vec: ArrayView2<Complex<T>>,
+    coeffs: ArrayView1<f64>,
+    occupations: ArrayView2<usize>,
+    mut out: ArrayViewMut2<Complex<T>>,
+) {
     Zip::from(vec.rows())
         .and(out.rows_mut())
         .and(occupations.rows())
         .par_for_each(|source, mut target, orbs| {
-            let mut coeff = Complex64::new(0.0, 0.0);
+            let mut coeff = 0.0;
             orbs.for_each(|&orb| coeff += coeffs[orb]);
-            target += &(coeff * &source);
+            let coeff = T::from_f64(coeff);
+            Zip::from(&mut target)
+                .and(&source)
+                .for_each(|val, &v| *val += v * coeff);
         });
 }
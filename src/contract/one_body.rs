@@ -0,0 +1,97 @@
+// (C) Copyright IBM 2024
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use ndarray::ArrayView2;
+use ndarray::ArrayView3;
+use ndarray::ArrayViewMut2;
+use ndarray::Zip;
+use num_complex::Complex;
+use numpy::Complex64;
+use numpy::PyReadonlyArray2;
+use numpy::PyReadonlyArray3;
+use pyo3::prelude::*;
+
+use crate::precision::dtype_mismatch_error;
+use crate::precision::ComplexArray2;
+use crate::precision::ComplexArrayMut2;
+use crate::precision::Real;
+
+/// Contract a one-body tensor into a buffer.
+///
+/// The link index of a string lists the strings it is connected to by a single
+/// excitation. Each entry (a, i, str1, sign) of the link index of str0 means that
+/// the matrix element of the excitation from orbital a to orbital i between str0 and
+/// str1 is sign, so each row of the output is gathered from its own link index and
+/// the rows are computed in parallel.
+///
+/// The vector and output buffer may be stored in double or single precision, but
+/// must have the same precision.
+#[pyfunction]
+pub fn contract_one_body_into_buffer(
+    vec: ComplexArray2,
+    mat: PyReadonlyArray2<Complex64>,
+    linkstr_index_a: PyReadonlyArray3<i32>,
+    linkstr_index_b: PyReadonlyArray3<i32>,
+    out: ComplexArrayMut2,
+) -> PyResult<()> {
+    let mat = mat.as_array();
+    let linkstr_index_a = linkstr_index_a.as_array();
+    let linkstr_index_b = linkstr_index_b.as_array();
+    match (vec, out) {
+        (ComplexArray2::Double(vec), ComplexArrayMut2::Double(mut out)) => contract_one_body(
+            vec.as_array(),
+            mat,
+            linkstr_index_a,
+            linkstr_index_b,
+            out.as_array_mut(),
+        ),
+        (ComplexArray2::Single(vec), ComplexArrayMut2::Single(mut out)) => contract_one_body(
+            vec.as_array(),
+            mat,
+            linkstr_index_a,
+            linkstr_index_b,
+            out.as_array_mut(),
+        ),
+        _ => return Err(dtype_mismatch_error()),
+    }
+    Ok(())
+}
+
+fn contract_one_body<T: Real>(
+    vec: ArrayView2<Complex<T>>,
+    mat: ArrayView2<Complex64>,
+    linkstr_index_a: ArrayView3<i32>,
+    linkstr_index_b: ArrayView3<i32>,
+    mut out: ArrayViewMut2<Complex<T>>,
+) {
+    let mat = mat.mapv(T::from_c64);
+    Zip::from(out.rows_mut())
+        .and(vec.rows())
+        .and(linkstr_index_a.outer_iter())
+        .par_for_each(|mut target, source, links_a| {
+            // apply alpha
+            for link in links_a.rows() {
+                let (a, i, str1) = (link[0] as usize, link[1] as usize, link[2] as usize);
+                let coeff = mat[(i, a)] * T::from_f64(link[3] as f64);
+                Zip::from(&mut target)
+                    .and(vec.row(str1))
+                    .for_each(|val, &v| *val += coeff * v);
+            }
+            // apply beta
+            Zip::from(&mut target)
+                .and(linkstr_index_b.outer_iter())
+                .for_each(|val, links_b| {
+                    for link in links_b.rows() {
+                        let (a, i, str1) = (link[0] as usize, link[1] as usize, link[2] as usize);
+                        *val += mat[(i, a)] * source[str1] * T::from_f64(link[3] as f64);
+                    }
+                });
+        });
+}
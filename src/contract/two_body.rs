@@ -0,0 +1,234 @@
+// (C) Copyright IBM 2024
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use ndarray::s;
+use ndarray::Array3;
+use ndarray::ArrayView2;
+use ndarray::ArrayView3;
+use ndarray::ArrayViewMut2;
+use ndarray::ArrayViewMut3;
+use ndarray::Axis;
+use ndarray::Zip;
+use num_complex::Complex;
+use num_traits::One;
+use num_traits::Zero;
+use numpy::Complex64;
+use numpy::PyReadonlyArray2;
+use numpy::PyReadonlyArray3;
+use pyo3::prelude::*;
+use std::ops::Range;
+
+use crate::precision::dtype_mismatch_error;
+use crate::precision::ComplexArray2;
+use crate::precision::ComplexArrayMut2;
+use crate::precision::Real;
+
+/// Contract a two-body tensor with absorbed one-body part into a buffer.
+///
+/// The two-body tensor is given as a matrix with rows and columns indexed by
+/// orbital pairs, and the operator it represents is
+/// sum_{pqrs} two_body[pq, rs] E_pq E_rs, where E_pq is the spin-summed excitation
+/// operator from orbital q to orbital p. The alpha strings are processed in
+/// blocks of block_size strings. For each block, the action of every E_rs is
+/// computed first, then contracted with the tensor in a single matrix
+/// multiplication, and finally the action of every E_pq is accumulated into the
+/// output. The intermediate buffers hold block_size * dim_b * norb ** 2 entries.
+///
+/// The vector and output buffer may be stored in double or single precision, but
+/// must have the same precision.
+#[pyfunction]
+pub fn contract_two_body_into_buffer(
+    vec: ComplexArray2,
+    two_body: PyReadonlyArray2<Complex64>,
+    norb: usize,
+    linkstr_index_a: PyReadonlyArray3<i32>,
+    linkstr_index_b: PyReadonlyArray3<i32>,
+    out: ComplexArrayMut2,
+    block_size: usize,
+) -> PyResult<()> {
+    let two_body = two_body.as_array();
+    let linkstr_index_a = linkstr_index_a.as_array();
+    let linkstr_index_b = linkstr_index_b.as_array();
+    match (vec, out) {
+        (ComplexArray2::Double(vec), ComplexArrayMut2::Double(mut out)) => contract_two_body(
+            vec.as_array(),
+            two_body,
+            norb,
+            linkstr_index_a,
+            linkstr_index_b,
+            out.as_array_mut(),
+            block_size,
+        ),
+        (ComplexArray2::Single(vec), ComplexArrayMut2::Single(mut out)) => contract_two_body(
+            vec.as_array(),
+            two_body,
+            norb,
+            linkstr_index_a,
+            linkstr_index_b,
+            out.as_array_mut(),
+            block_size,
+        ),
+        _ => return Err(dtype_mismatch_error()),
+    }
+    Ok(())
+}
+
+fn contract_two_body<T: Real>(
+    vec: ArrayView2<Complex<T>>,
+    two_body: ArrayView2<Complex64>,
+    norb: usize,
+    linkstr_index_a: ArrayView3<i32>,
+    linkstr_index_b: ArrayView3<i32>,
+    mut out: ArrayViewMut2<Complex<T>>,
+    block_size: usize,
+) {
+    let two_body = two_body.mapv(T::from_c64);
+    let shape = vec.shape();
+    let dim_a = shape[0];
+    let dim_b = shape[1];
+    let n_pairs = norb * norb;
+    let block_size = block_size.clamp(1, dim_a.max(1));
+
+    // The buffers hold the excitations of one block of alpha strings at a time and
+    // are reused across blocks
+    let mut excitations_buffer: Array3<Complex<T>> = Array3::zeros((block_size, dim_b, n_pairs));
+    let mut contracted_buffer: Array3<Complex<T>> = Array3::zeros((block_size, dim_b, n_pairs));
+    for start in (0..dim_a).step_by(block_size) {
+        let end = (start + block_size).min(dim_a);
+        let n_rows = end - start;
+        let mut excitations = excitations_buffer.slice_mut(s![..n_rows, .., ..]);
+        let mut contracted = contracted_buffer.slice_mut(s![..n_rows, .., ..]);
+
+        // excitations[x, y, pq] = (E_pq vec)[start + x, y]
+        excitations.fill(Complex::zero());
+        apply_excitations(
+            vec,
+            start..end,
+            excitations.view_mut(),
+            norb,
+            linkstr_index_a,
+            linkstr_index_b,
+        );
+
+        // contracted[x, y, pq] = sum_rs two_body[pq, rs] excitations[x, y, rs]
+        match (
+            two_body.as_slice(),
+            excitations.as_slice(),
+            contracted.as_slice_mut(),
+        ) {
+            (Some(two_body), Some(excitations), Some(contracted)) => unsafe {
+                T::gemm(
+                    b'T',
+                    b'N',
+                    n_pairs as i32,
+                    (n_rows * dim_b) as i32,
+                    n_pairs as i32,
+                    Complex::one(),
+                    two_body,
+                    n_pairs as i32,
+                    excitations,
+                    n_pairs as i32,
+                    Complex::zero(),
+                    contracted,
+                    n_pairs as i32,
+                );
+            },
+            _ => panic!(
+                "Failed to convert ArrayBase to slice, possibly because the data was not contiguous and in standard order."
+            ),
+        }
+
+        gather_excitations(
+            contracted.view(),
+            start..end,
+            out.view_mut(),
+            norb,
+            linkstr_index_a,
+            linkstr_index_b,
+        );
+    }
+}
+
+/// Compute the action of every excitation operator E_pq on a vector, for the given
+/// rows of the result.
+fn apply_excitations<T: Real>(
+    vec: ArrayView2<Complex<T>>,
+    rows: Range<usize>,
+    mut excitations: ArrayViewMut3<Complex<T>>,
+    norb: usize,
+    linkstr_index_a: ArrayView3<i32>,
+    linkstr_index_b: ArrayView3<i32>,
+) {
+    Zip::from(excitations.outer_iter_mut())
+        .and(vec.slice(s![rows.clone(), ..]).rows())
+        .and(linkstr_index_a.slice(s![rows, .., ..]).outer_iter())
+        .par_for_each(|mut target, source, links_a| {
+            // apply alpha
+            for link in links_a.rows() {
+                let (a, i, str1) = (link[0] as usize, link[1] as usize, link[2] as usize);
+                let sign = T::from_f64(link[3] as f64);
+                Zip::from(target.column_mut(i * norb + a))
+                    .and(vec.row(str1))
+                    .for_each(|val, &v| *val += v * sign);
+            }
+            // apply beta
+            Zip::from(target.outer_iter_mut())
+                .and(linkstr_index_b.outer_iter())
+                .for_each(|mut row, links_b| {
+                    for link in links_b.rows() {
+                        let (a, i, str1) = (link[0] as usize, link[1] as usize, link[2] as usize);
+                        row[i * norb + a] += source[str1] * T::from_f64(link[3] as f64);
+                    }
+                });
+        });
+}
+
+/// Accumulate the sum over pq of E_pq applied to the pq component of a vector.
+///
+/// Only the given rows of the vector are stored in contracted. Their beta
+/// excitations stay in the same rows of the output, but their alpha excitations
+/// can reach any row. Since E_ia |str1> = sign |x> whenever E_ai |x> = sign |str1>,
+/// the alpha excitations are scattered using the links of the rows of the block,
+/// in parallel over the columns of the output so that no two threads write to the
+/// same entry.
+fn gather_excitations<T: Real>(
+    contracted: ArrayView3<Complex<T>>,
+    rows: Range<usize>,
+    mut out: ArrayViewMut2<Complex<T>>,
+    norb: usize,
+    linkstr_index_a: ArrayView3<i32>,
+    linkstr_index_b: ArrayView3<i32>,
+) {
+    // apply beta
+    Zip::from(out.slice_mut(s![rows.clone(), ..]).rows_mut())
+        .and(contracted.outer_iter())
+        .par_for_each(|mut target, source| {
+            Zip::from(&mut target)
+                .and(linkstr_index_b.outer_iter())
+                .for_each(|val, links_b| {
+                    for link in links_b.rows() {
+                        let (a, i, str1) = (link[0] as usize, link[1] as usize, link[2] as usize);
+                        *val += source[(str1, i * norb + a)] * T::from_f64(link[3] as f64);
+                    }
+                });
+        });
+    // apply alpha
+    let links_a = linkstr_index_a.slice(s![rows, .., ..]);
+    Zip::from(out.columns_mut())
+        .and(contracted.axis_iter(Axis(1)))
+        .par_for_each(|mut target, source| {
+            for (source_row, links) in source.rows().into_iter().zip(links_a.outer_iter()) {
+                for link in links.rows() {
+                    let (a, i, str0) = (link[0] as usize, link[1] as usize, link[2] as usize);
+                    target[str0] += source_row[a * norb + i] * T::from_f64(link[3] as f64);
+                }
+            }
+        });
+}
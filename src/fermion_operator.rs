@@ -15,9 +15,14 @@ use pyo3::exceptions::PyKeyError;
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::PyTuple;
+use rayon::prelude::*;
+use smallvec::SmallVec;
 use std::cmp::Ordering;
+use std::collections::hash_map::RandomState;
 use std::collections::HashMap;
 use std::collections::HashSet;
+use std::hash::BuildHasher;
+use std::hash::Hash;
 
 #[pyclass]
 struct KeysIterator {
@@ -107,7 +112,7 @@ impl KeysIterator {
 #[pyclass(module = "ffsim", mapping)]
 #[derive(Clone)]
 pub struct FermionOperator {
-    coeffs: HashMap<Vec<(bool, bool, i32)>, Complex64>,
+    pub(crate) coeffs: HashMap<Vec<(bool, bool, i32)>, Complex64>,
 }
 
 #[pymethods]
@@ -285,15 +290,13 @@ impl FermionOperator {
     }
 
     fn __mul__(&self, other: &Self) -> Self {
-        let mut coeffs = HashMap::new();
-        for (term_1, coeff_1) in &self.coeffs {
-            for (term_2, coeff_2) in &other.coeffs {
-                let mut new_term = term_1.to_vec();
-                new_term.extend(term_2);
-                let val = coeffs.entry(new_term).or_insert(Complex64::default());
-                *val += coeff_1 * coeff_2;
-            }
-        }
+        let coeffs = match (pack_terms(&self.coeffs), pack_terms(&other.coeffs)) {
+            (Some(terms_1), Some(terms_2)) => into_coeffs(multiply_terms(&terms_1, &terms_2)),
+            _ => into_coeffs(multiply_terms(
+                &unpacked_terms(&self.coeffs),
+                &unpacked_terms(&other.coeffs),
+            )),
+        };
         Self { coeffs }
     }
 
@@ -301,13 +304,11 @@ impl FermionOperator {
         match modulo {
             Some(_) => Err(PyValueError::new_err("mod argument not supported")),
             None => {
-                let mut coeffs = HashMap::new();
-                coeffs.insert(vec![], Complex64::new(1.0, 0.0));
-                let mut result = Self { coeffs };
-                for _ in 0..exponent {
-                    result = result.__mul__(self);
-                }
-                Ok(result)
+                let coeffs = match pack_terms(&self.coeffs) {
+                    Some(terms) => into_coeffs(power_terms(terms, exponent)),
+                    None => into_coeffs(power_terms(unpacked_terms(&self.coeffs), exponent)),
+                };
+                Ok(Self { coeffs })
             }
         }
     }
@@ -334,13 +335,11 @@ impl FermionOperator {
     /// Returns:
     ///     FermionOperator: The normal-ordered fermion operator.
     fn normal_ordered(&self) -> Self {
-        let mut result = Self {
-            coeffs: HashMap::new(),
+        let coeffs = match pack_terms(&self.coeffs) {
+            Some(terms) => into_coeffs(normal_order_terms(terms)),
+            None => into_coeffs(normal_order_terms(unpacked_terms(&self.coeffs))),
         };
-        for (term, coeff) in &self.coeffs {
-            result.__iadd__(&_normal_ordered_term(term, coeff))
-        }
-        result
+        Self { coeffs }
     }
 
     /// Return whether the operator conserves particle number.
@@ -548,24 +547,210 @@ fn term_trace(op: &[(bool, bool, i32)], norb: usize, nelec: (usize, usize)) -> i
         * binomial(norb - norb_beta, n_beta - nelec_beta) as i32
 }
 
-fn _normal_ordered_term(term: &[(bool, bool, i32)], coeff: &Complex64) -> FermionOperator {
-    let mut coeffs = HashMap::new();
-    let mut stack = vec![(term.to_vec(), *coeff)];
-    while let Some((mut term, coeff)) = stack.pop() {
+/// A term of a FermionOperator stored inline for short terms.
+type Term<T> = SmallVec<[T; 8]>;
+
+/// A list of terms and their coefficients, possibly with repeated terms.
+type Terms<T> = Vec<(Term<T>, Complex64)>;
+
+const ACTION_BIT: u16 = 1 << 15;
+const SPIN_BIT: u16 = 1 << 14;
+const ORB_MASK: u16 = SPIN_BIT - 1;
+
+/// Number of hash shards used to accumulate the terms of a result in parallel.
+const N_SHARDS: usize = 64;
+
+/// A ladder operator appearing in a term.
+///
+/// Besides the (action, spin, orb) tuple exposed to Python, a ladder operator with
+/// a nonnegative orbital index below 2^14 can be packed into a u16 holding the
+/// action in bit 15, the spin in bit 14 and the orbital index in the low bits.
+/// Packed operators compare in the same order as the tuples they represent.
+trait LadderOp: Copy + Ord + Hash + Send + Sync {
+    fn is_creation(self) -> bool;
+
+    fn same_mode(self, other: Self) -> bool;
+
+    fn to_tuple(self) -> (bool, bool, i32);
+}
+
+impl LadderOp for (bool, bool, i32) {
+    fn is_creation(self) -> bool {
+        self.0
+    }
+
+    fn same_mode(self, other: Self) -> bool {
+        (self.1, self.2) == (other.1, other.2)
+    }
+
+    fn to_tuple(self) -> (bool, bool, i32) {
+        self
+    }
+}
+
+impl LadderOp for u16 {
+    fn is_creation(self) -> bool {
+        self & ACTION_BIT != 0
+    }
+
+    fn same_mode(self, other: Self) -> bool {
+        (self ^ other) & !ACTION_BIT == 0
+    }
+
+    fn to_tuple(self) -> (bool, bool, i32) {
+        (
+            self & ACTION_BIT != 0,
+            self & SPIN_BIT != 0,
+            (self & ORB_MASK) as i32,
+        )
+    }
+}
+
+fn pack_op(&(action, spin, orb): &(bool, bool, i32)) -> Option<u16> {
+    if !(0..=ORB_MASK as i32).contains(&orb) {
+        return None;
+    }
+    let mut op = orb as u16;
+    if action {
+        op |= ACTION_BIT;
+    }
+    if spin {
+        op |= SPIN_BIT;
+    }
+    Some(op)
+}
+
+/// Return the terms with packed ladder operators, or None if some cannot be packed.
+fn pack_terms(coeffs: &HashMap<Vec<(bool, bool, i32)>, Complex64>) -> Option<Terms<u16>> {
+    coeffs
+        .par_iter()
+        .map(|(term, &coeff)| {
+            term.iter()
+                .map(pack_op)
+                .collect::<Option<Term<u16>>>()
+                .map(|term| (term, coeff))
+        })
+        .collect()
+}
+
+fn unpacked_terms(coeffs: &HashMap<Vec<(bool, bool, i32)>, Complex64>) -> Terms<(bool, bool, i32)> {
+    coeffs
+        .par_iter()
+        .map(|(term, &coeff)| (Term::from_slice(term), coeff))
+        .collect()
+}
+
+/// Sum the coefficients of repeated terms.
+///
+/// Each worker accumulates its terms into hash maps sharded by the hash of the term,
+/// and then the shards are merged in parallel.
+fn sum_terms<T, I>(terms: I) -> Terms<T>
+where
+    T: LadderOp,
+    I: ParallelIterator<Item = (Term<T>, Complex64)>,
+{
+    let hasher = RandomState::new();
+    let partial_sums: Vec<Vec<HashMap<Term<T>, Complex64>>> = terms
+        .fold(
+            || (0..N_SHARDS).map(|_| HashMap::new()).collect::<Vec<_>>(),
+            |mut shards, (term, coeff)| {
+                let shard = hasher.hash_one(&term) as usize % N_SHARDS;
+                *shards[shard].entry(term).or_default() += coeff;
+                shards
+            },
+        )
+        .collect();
+    let mut shards: Vec<Vec<HashMap<Term<T>, Complex64>>> =
+        (0..N_SHARDS).map(|_| Vec::new()).collect();
+    for partial_sum in partial_sums {
+        for (shard, map) in shards.iter_mut().zip(partial_sum) {
+            shard.push(map);
+        }
+    }
+    shards
+        .into_par_iter()
+        .flat_map_iter(|maps| {
+            let mut maps = maps.into_iter();
+            let mut sum = maps.next().unwrap_or_default();
+            for map in maps {
+                for (term, coeff) in map {
+                    *sum.entry(term).or_default() += coeff;
+                }
+            }
+            sum
+        })
+        .collect()
+}
+
+/// Convert terms to the representation used by FermionOperator.
+fn into_coeffs<T: LadderOp>(terms: Terms<T>) -> HashMap<Vec<(bool, bool, i32)>, Complex64> {
+    let mut coeffs = HashMap::with_capacity(terms.len());
+    coeffs.par_extend(terms.into_par_iter().map(|(term, coeff)| {
+        (
+            term.iter().map(|&op| op.to_tuple()).collect::<Vec<_>>(),
+            coeff,
+        )
+    }));
+    coeffs
+}
+
+fn multiply_terms<T: LadderOp>(
+    terms_1: &[(Term<T>, Complex64)],
+    terms_2: &[(Term<T>, Complex64)],
+) -> Terms<T> {
+    sum_terms(terms_1.par_iter().flat_map_iter(|(term_1, coeff_1)| {
+        terms_2.iter().map(move |(term_2, coeff_2)| {
+            let mut new_term = Term::with_capacity(term_1.len() + term_2.len());
+            new_term.extend_from_slice(term_1);
+            new_term.extend_from_slice(term_2);
+            (new_term, coeff_1 * coeff_2)
+        })
+    }))
+}
+
+/// Raise a sum of terms to a power by repeated squaring.
+///
+/// The intermediate products stay in the representation of the input terms.
+fn power_terms<T: LadderOp>(terms: Terms<T>, mut exponent: u32) -> Terms<T> {
+    let mut result = vec![(Term::new(), Complex64::new(1.0, 0.0))];
+    let mut base = terms;
+    while exponent > 0 {
+        if exponent & 1 == 1 {
+            result = multiply_terms(&result, &base);
+        }
+        exponent >>= 1;
+        if exponent > 0 {
+            base = multiply_terms(&base, &base);
+        }
+    }
+    result
+}
+
+fn normal_order_terms<T: LadderOp>(terms: Terms<T>) -> Terms<T> {
+    sum_terms(
+        terms
+            .into_par_iter()
+            .flat_map_iter(|(term, coeff)| normal_ordered_term(term, coeff)),
+    )
+}
+
+/// Return the normal-ordered terms of a single term, possibly with repeats.
+fn normal_ordered_term<T: LadderOp>(term: Term<T>, coeff: Complex64) -> Terms<T> {
+    let mut terms = Vec::new();
+    let mut stack = vec![(term, coeff)];
+    'stack: while let Some((mut term, coeff)) = stack.pop() {
         let mut parity = false;
         for i in 1..term.len() {
             // shift the operator at index i to the left until it's in the correct location
             for j in (1..=i).rev() {
-                let (action_right, spin_right, index_right) = term[j];
-                let (action_left, spin_left, index_left) = term[j - 1];
-                if action_right == action_left {
+                let right = term[j];
+                let left = term[j - 1];
+                if right.is_creation() == left.is_creation() {
                     // both create or both destroy
-                    match (spin_right, index_right).cmp(&(spin_left, index_left)) {
+                    match right.cmp(&left) {
                         Ordering::Equal => {
                             // operators are the same, so product is zero
-                            return FermionOperator {
-                                coeffs: HashMap::new(),
-                            };
+                            continue 'stack;
                         }
                         Ordering::Greater => {
                             // swap operators and update sign
@@ -574,13 +759,13 @@ fn _normal_ordered_term(term: &[(bool, bool, i32)], coeff: &Complex64) -> Fermio
                         }
                         Ordering::Less => {}
                     }
-                } else if action_right && !action_left {
+                } else if right.is_creation() {
                     // create on right and destroy on left
-                    if index_right == index_left {
+                    if right.same_mode(left) {
                         // add new term
-                        let mut new_term: Vec<(bool, bool, i32)> = Vec::new();
-                        new_term.extend(&term[..j - 1]);
-                        new_term.extend(&term[j + 1..]);
+                        let mut new_term = Term::with_capacity(term.len() - 2);
+                        new_term.extend_from_slice(&term[..j - 1]);
+                        new_term.extend_from_slice(&term[j + 1..]);
                         let signed_coeff = if parity { -coeff } else { coeff };
                         stack.push((new_term, signed_coeff))
                     }
@@ -591,8 +776,7 @@ fn _normal_ordered_term(term: &[(bool, bool, i32)], coeff: &Complex64) -> Fermio
             }
         }
         let signed_coeff = if parity { -coeff } else { coeff };
-        let val = coeffs.entry(term).or_insert(Complex64::default());
-        *val += signed_coeff;
+        terms.push((term, signed_coeff));
     }
-    FermionOperator { coeffs }
+    terms
 }
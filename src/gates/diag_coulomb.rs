@@ -9,17 +9,30 @@
 // that they have been altered from the originals.
 
 use ndarray::Array;
+use ndarray::Array1;
+use ndarray::Array2;
+use ndarray::ArrayView1;
+use ndarray::ArrayView2;
+use ndarray::ArrayViewMut3;
+use ndarray::Axis;
 use ndarray::Zip;
+use num_complex::Complex;
 use numpy::Complex64;
 use numpy::PyReadonlyArray1;
 use numpy::PyReadonlyArray2;
-use numpy::PyReadwriteArray2;
 use pyo3::prelude::*;
 
+use crate::precision::ComplexArrayMut3;
+use crate::precision::Real;
+
 /// Apply time evolution by a diagonal Coulomb operator in-place.
+///
+/// The vector has shape (batch, dim_a, dim_b). The phase of each pair of strings is
+/// computed once and applied to every vector in the batch. The vector may be stored
+/// in double or single precision.
 #[pyfunction]
 pub fn apply_diag_coulomb_evolution_in_place_num_rep(
-    mut vec: PyReadwriteArray2<Complex64>,
+    vec: ComplexArrayMut3,
     mat_exp_aa: PyReadonlyArray2<Complex64>,
     mat_exp_ab: PyReadonlyArray2<Complex64>,
     mat_exp_bb: PyReadonlyArray2<Complex64>,
@@ -30,19 +43,17 @@ pub fn apply_diag_coulomb_evolution_in_place_num_rep(
     let mat_exp_aa = mat_exp_aa.as_array();
     let mat_exp_ab = mat_exp_ab.as_array();
     let mat_exp_bb = mat_exp_bb.as_array();
-    let mut vec = vec.as_array_mut();
     let occupations_a = occupations_a.as_array();
     let occupations_b = occupations_b.as_array();
 
-    let shape = vec.shape();
-    let dim_a = shape[0];
-    let dim_b = shape[1];
+    let dim_a = occupations_a.nrows();
+    let dim_b = occupations_b.nrows();
     let n_alpha = occupations_a.shape()[1];
     let n_beta = occupations_b.shape()[1];
 
-    let mut alpha_phases = Array::zeros(dim_a);
-    let mut beta_phases = Array::zeros(dim_b);
-    let mut phase_map = Array::ones((dim_a, norb));
+    let mut alpha_phases: Array1<Complex64> = Array::zeros(dim_a);
+    let mut beta_phases: Array1<Complex64> = Array::zeros(dim_b);
+    let mut phase_map: Array2<Complex64> = Array::ones((dim_a, norb));
 
     Zip::from(&mut beta_phases)
         .and(occupations_b.rows())
@@ -74,26 +85,59 @@ pub fn apply_diag_coulomb_evolution_in_place_num_rep(
             *val = phase;
         });
 
-    Zip::from(vec.rows_mut())
+    match vec {
+        ComplexArrayMut3::Double(mut vec) => apply_phases_num_rep(
+            vec.as_array_mut(),
+            alpha_phases.view(),
+            beta_phases.view(),
+            phase_map.view(),
+            occupations_b,
+        ),
+        ComplexArrayMut3::Single(mut vec) => apply_phases_num_rep(
+            vec.as_array_mut(),
+            alpha_phases.view(),
+            beta_phases.view(),
+            phase_map.view(),
+            occupations_b,
+        ),
+    }
+}
+
+/// Multiply each entry of the vector by the phase of its pair of strings.
+fn apply_phases_num_rep<T: Real>(
+    mut vec: ArrayViewMut3<Complex<T>>,
+    alpha_phases: ArrayView1<Complex64>,
+    beta_phases: ArrayView1<Complex64>,
+    phase_map: ArrayView2<Complex64>,
+    occupations_b: ArrayView2<usize>,
+) {
+    let alpha_phases = alpha_phases.mapv(T::from_c64);
+    let beta_phases = beta_phases.mapv(T::from_c64);
+    let phase_map = phase_map.mapv(T::from_c64);
+    Zip::from(vec.axis_iter_mut(Axis(1)))
         .and(&alpha_phases)
         .and(phase_map.rows())
-        .par_for_each(|row, alpha_phase, phase_map| {
-            Zip::from(row)
+        .par_for_each(|mut rows, alpha_phase, phase_map| {
+            Zip::from(rows.columns_mut())
                 .and(&beta_phases)
                 .and(occupations_b.rows())
-                .for_each(|val, beta_phase, orbs| {
+                .for_each(|mut vals, beta_phase, orbs| {
                     let mut phase = *alpha_phase * *beta_phase;
                     orbs.for_each(|&orb| phase *= phase_map[orb]);
-                    *val *= phase;
+                    vals.map_inplace(|val| *val *= phase);
                 })
         });
 }
 
 /// Apply time evolution by a diagonal Coulomb operator in-place, Z representation.
+///
+/// The vector has shape (batch, dim_a, dim_b). The phase of each pair of strings is
+/// computed once and applied to every vector in the batch. The vector may be stored
+/// in double or single precision.
 #[allow(clippy::too_many_arguments)]
 #[pyfunction]
 pub fn apply_diag_coulomb_evolution_in_place_z_rep(
-    mut vec: PyReadwriteArray2<Complex64>,
+    vec: ComplexArrayMut3,
     mat_exp_aa: PyReadonlyArray2<Complex64>,
     mat_exp_ab: PyReadonlyArray2<Complex64>,
     mat_exp_bb: PyReadonlyArray2<Complex64>,
@@ -110,17 +154,15 @@ pub fn apply_diag_coulomb_evolution_in_place_z_rep(
     let mat_exp_aa_conj = mat_exp_aa_conj.as_array();
     let mat_exp_ab_conj = mat_exp_ab_conj.as_array();
     let mat_exp_bb_conj = mat_exp_bb_conj.as_array();
-    let mut vec = vec.as_array_mut();
     let strings_a = strings_a.as_array();
     let strings_b = strings_b.as_array();
 
-    let shape = vec.shape();
-    let dim_a = shape[0];
-    let dim_b = shape[1];
+    let dim_a = strings_a.len();
+    let dim_b = strings_b.len();
 
-    let mut alpha_phases = Array::zeros(dim_a);
-    let mut beta_phases = Array::zeros(dim_b);
-    let mut phase_map = Array::ones((dim_a, norb));
+    let mut alpha_phases: Array1<Complex64> = Array::zeros(dim_a);
+    let mut beta_phases: Array1<Complex64> = Array::zeros(dim_b);
+    let mut phase_map: Array2<Complex64> = Array::ones((dim_a, norb));
 
     Zip::from(&mut beta_phases)
         .and(strings_b)
@@ -167,14 +209,46 @@ pub fn apply_diag_coulomb_evolution_in_place_z_rep(
             *val = phase;
         });
 
-    Zip::from(vec.rows_mut())
+    match vec {
+        ComplexArrayMut3::Double(mut vec) => apply_phases_z_rep(
+            vec.as_array_mut(),
+            alpha_phases.view(),
+            beta_phases.view(),
+            phase_map.view(),
+            norb,
+            strings_b,
+        ),
+        ComplexArrayMut3::Single(mut vec) => apply_phases_z_rep(
+            vec.as_array_mut(),
+            alpha_phases.view(),
+            beta_phases.view(),
+            phase_map.view(),
+            norb,
+            strings_b,
+        ),
+    }
+}
+
+/// Multiply each entry of the vector by the phase of its pair of strings.
+fn apply_phases_z_rep<T: Real>(
+    mut vec: ArrayViewMut3<Complex<T>>,
+    alpha_phases: ArrayView1<Complex64>,
+    beta_phases: ArrayView1<Complex64>,
+    phase_map: ArrayView2<Complex64>,
+    norb: usize,
+    strings_b: ArrayView1<i64>,
+) {
+    let alpha_phases = alpha_phases.mapv(T::from_c64);
+    let beta_phases = beta_phases.mapv(T::from_c64);
+    let phase_map = phase_map.mapv(T::from_c64);
+    Zip::from(vec.axis_iter_mut(Axis(1)))
         .and(&alpha_phases)
         .and(phase_map.rows())
-        .par_for_each(|row, alpha_phase, phase_map| {
-            Zip::from(row)
+        .par_for_each(|mut rows, alpha_phase, phase_map| {
+            Zip::from(rows.columns_mut())
                 .and(&beta_phases)
                 .and(strings_b)
-                .for_each(|val, beta_phase, str0| {
+                .for_each(|mut vals, beta_phase, str0| {
                     let mut phase = *alpha_phase * *beta_phase;
                     for j in 0..norb {
                         let this_phase = if (str0 >> j) & 1 == 1 {
@@ -184,7 +258,7 @@ pub fn apply_diag_coulomb_evolution_in_place_z_rep(
                         };
                         phase *= this_phase
                     }
-                    *val *= phase;
+                    vals.map_inplace(|val| *val *= phase);
                 })
         });
 }
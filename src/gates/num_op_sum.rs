@@ -8,29 +8,61 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
+use ndarray::Array;
+use ndarray::Array1;
+use ndarray::ArrayView1;
+use ndarray::ArrayView2;
+use ndarray::ArrayViewMut3;
+use ndarray::Axis;
 use ndarray::Zip;
+use num_complex::Complex;
 use numpy::Complex64;
 use numpy::PyReadonlyArray1;
 use numpy::PyReadonlyArray2;
-use numpy::PyReadwriteArray2;
 use pyo3::prelude::*;
 
+use crate::precision::ComplexArrayMut3;
+use crate::precision::Real;
+
 /// Apply time evolution by a sum of number operators in-place.
+///
+/// The vector has shape (batch, rows, columns) and the phases act on the rows.
+/// The vector may be stored in double or single precision.
 #[pyfunction]
 pub fn apply_num_op_sum_evolution_in_place(
-    mut vec: PyReadwriteArray2<Complex64>,
+    vec: ComplexArrayMut3,
     phases: PyReadonlyArray1<Complex64>,
     occupations: PyReadonlyArray2<usize>,
 ) {
     let phases = phases.as_array();
-    let mut vec = vec.as_array_mut();
     let occupations = occupations.as_array();
+    match vec {
+        ComplexArrayMut3::Double(mut vec) => {
+            apply_num_op_sum_evolution(vec.as_array_mut(), phases, occupations)
+        }
+        ComplexArrayMut3::Single(mut vec) => {
+            apply_num_op_sum_evolution(vec.as_array_mut(), phases, occupations)
+        }
+    }
+}
 
-    Zip::from(vec.rows_mut())
+fn apply_num_op_sum_evolution<T: Real>(
+    mut vec: ArrayViewMut3<Complex<T>>,
+    phases: ArrayView1<Complex64>,
+    occupations: ArrayView2<usize>,
+) {
+    let mut row_phases: Array1<Complex<T>> = Array::zeros(occupations.nrows());
+    Zip::from(&mut row_phases)
         .and(occupations.rows())
-        .par_for_each(|mut row, orbs| {
+        .par_for_each(|val, orbs| {
             let mut phase = Complex64::new(1.0, 0.0);
             orbs.for_each(|&orb| phase *= phases[orb]);
-            row *= phase;
+            *val = T::from_c64(phase);
+        });
+
+    Zip::from(vec.lanes_mut(Axis(2)))
+        .and_broadcast(&row_phases)
+        .par_for_each(|mut row, &phase| {
+            row.map_inplace(|val| *val *= phase);
         });
 }
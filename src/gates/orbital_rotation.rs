@@ -12,15 +12,26 @@ extern crate blas_src;
 
 use blas::zdrot;
 use blas::zscal;
+use ndarray::parallel::prelude::*;
 use ndarray::s;
-
+use ndarray::Array;
+use ndarray::Array1;
+use ndarray::ArrayView1;
+use ndarray::ArrayView2;
+use ndarray::ArrayViewMut2;
+use ndarray::ArrayViewMut3;
+use ndarray::Axis;
 use ndarray::Zip;
+use num_complex::Complex;
 use numpy::Complex64;
 use numpy::PyReadonlyArray1;
-
+use numpy::PyReadonlyArray2;
 use numpy::PyReadwriteArray2;
-
 use pyo3::prelude::*;
+use std::mem;
+
+use crate::precision::ComplexArrayMut3;
+use crate::precision::Real;
 
 /// Apply a matrix to slices of a matrix.
 #[pyfunction]
@@ -60,3 +71,136 @@ pub fn apply_givens_rotation_in_place(
         };
     });
 }
+
+/// Target size in bytes of a column block processed by a single thread.
+const BLOCK_BYTES: usize = 1 << 18;
+
+/// Minimum number of columns in a block, chosen to fill a cache line.
+const MIN_BLOCK_COLS: usize = 4;
+
+/// Apply a sequence of Givens rotations followed by phase shifts in-place.
+///
+/// The vector has shape (batch, rows, columns) and the rotations mix its rows.
+/// The columns of each matrix in the batch are split into independent blocks small
+/// enough to stay in cache. Each block has the whole sequence of rotations and phase
+/// shifts applied to it before moving on, and the blocks are processed in parallel.
+/// The vector may be stored in double or single precision.
+#[allow(clippy::too_many_arguments)]
+#[pyfunction]
+pub fn apply_givens_rotations_in_place(
+    vec: ComplexArrayMut3,
+    cs: PyReadonlyArray1<f64>,
+    ss: PyReadonlyArray1<Complex64>,
+    target_orbs: PyReadonlyArray2<usize>,
+    indices: PyReadonlyArray2<usize>,
+    phases: PyReadonlyArray1<Complex64>,
+    occupations: PyReadonlyArray2<usize>,
+) {
+    let cs = cs.as_array();
+    let ss = ss.as_array();
+    let target_orbs = target_orbs.as_array();
+    let indices = indices.as_array();
+    let phases = phases.as_array();
+    let occupations = occupations.as_array();
+    match vec {
+        ComplexArrayMut3::Double(mut vec) => apply_givens_rotations(
+            vec.as_array_mut(),
+            cs,
+            ss,
+            target_orbs,
+            indices,
+            phases,
+            occupations,
+        ),
+        ComplexArrayMut3::Single(mut vec) => apply_givens_rotations(
+            vec.as_array_mut(),
+            cs,
+            ss,
+            target_orbs,
+            indices,
+            phases,
+            occupations,
+        ),
+    }
+}
+
+fn apply_givens_rotations<T: Real>(
+    mut vec: ArrayViewMut3<Complex<T>>,
+    cs: ArrayView1<f64>,
+    ss: ArrayView1<Complex64>,
+    target_orbs: ArrayView2<usize>,
+    indices: ArrayView2<usize>,
+    phases: ArrayView1<Complex64>,
+    occupations: ArrayView2<usize>,
+) {
+    let shape = vec.shape();
+    let dim_a = shape[1];
+    let dim_b = shape[2];
+    let block_cols = (BLOCK_BYTES / (mem::size_of::<Complex<T>>() * dim_a.max(1)))
+        .max(MIN_BLOCK_COLS)
+        .min(dim_b.max(1));
+    let cs = cs.mapv(T::from_f64);
+    let ss = ss.mapv(T::from_c64);
+
+    let mut row_phases: Array1<Complex<T>> = Array::zeros(dim_a);
+    Zip::from(&mut row_phases)
+        .and(occupations.rows())
+        .par_for_each(|val, orbs| {
+            let mut phase = Complex64::new(1.0, 0.0);
+            orbs.for_each(|&orb| phase *= phases[orb]);
+            *val = T::from_c64(phase);
+        });
+
+    vec.axis_iter_mut(Axis(0))
+        .into_par_iter()
+        .for_each(|mut mat| {
+            mat.axis_chunks_iter_mut(Axis(1), block_cols)
+                .into_par_iter()
+                .for_each(|mut block| {
+                    apply_givens_rotations_to_block(
+                        &mut block,
+                        &cs.view(),
+                        &ss.view(),
+                        &target_orbs,
+                        &indices,
+                    );
+                    Zip::from(block.rows_mut())
+                        .and(&row_phases)
+                        .for_each(|mut row, &phase| {
+                            row.map_inplace(|val| *val *= phase);
+                        });
+                });
+        });
+}
+
+/// Apply a sequence of Givens rotations to the rows of a block of columns.
+fn apply_givens_rotations_to_block<T: Real>(
+    block: &mut ArrayViewMut2<Complex<T>>,
+    cs: &ArrayView1<T>,
+    ss: &ArrayView1<Complex<T>>,
+    target_orbs: &ArrayView2<usize>,
+    indices: &ArrayView2<usize>,
+) {
+    let n_pairs = indices.shape()[1] / 2;
+    Zip::from(cs)
+        .and(ss)
+        .and(target_orbs.rows())
+        .for_each(|&c, &s, orbs| {
+            let (i, j) = (orbs[0], orbs[1]);
+            let row = indices.row(i.min(j));
+            let (slice1, slice2) = if i < j {
+                (row.slice(s![..n_pairs]), row.slice(s![n_pairs..]))
+            } else {
+                (row.slice(s![n_pairs..]), row.slice(s![..n_pairs]))
+            };
+            let s_conj = s.conj();
+            Zip::from(&slice1).and(&slice2).for_each(|&a, &b| {
+                let (row_a, row_b) = block.multi_slice_mut((s![a, ..], s![b, ..]));
+                Zip::from(row_a).and(row_b).for_each(|x, y| {
+                    let (val_x, val_y) = (*x, *y);
+                    *x = val_x * c + s * val_y;
+                    *y = val_y * c - s_conj * val_x;
+                });
+            });
+        });
+}
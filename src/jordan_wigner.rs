@@ -0,0 +1,185 @@
+// (C) Copyright IBM 2024
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use crate::fermion_operator::FermionOperator;
+use ndarray::Array1;
+use ndarray::Array2;
+use numpy::Complex64;
+use numpy::IntoPyArray;
+use numpy::PyArray1;
+use numpy::PyArray2;
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use rayon::prelude::*;
+use std::collections::HashMap;
+
+/// A Pauli string X^x Z^z, stored as the words of the bit mask x followed by the
+/// words of the bit mask z.
+type PauliBits = Vec<u64>;
+
+const WORD_BITS: usize = u64::BITS as usize;
+
+/// Jordan-Wigner transformation of a FermionOperator to symplectic arrays.
+///
+/// The ladder operators on qubit q are mapped to
+///
+///     a_q = X_q (1 - Z_q) Z_0 ... Z_{q-1} / 2,
+///     a^†_q = X_q (1 + Z_q) Z_0 ... Z_{q-1} / 2.
+///
+/// Pauli strings are multiplied as bit masks in the form X^x Z^z, where the only
+/// phase from a product is the sign from moving Z factors past X factors. The Pauli
+/// strings of all the terms are summed in a hash map, and at the end each string is
+/// converted to the usual form, in which Y = iXZ. The strings are sorted so that the
+/// output does not depend on the iteration order of the operator.
+///
+/// Args:
+///     op (FermionOperator): The fermion operator.
+///     norb (int): The number of spatial orbitals.
+///     tol (float): Pauli strings whose coefficients have absolute value at most this
+///         value are discarded.
+///
+/// Returns:
+///     tuple[np.ndarray, np.ndarray, np.ndarray]: The Z bits and X bits of the Pauli
+///     strings as boolean arrays of shape (n_terms, 2 * norb), and the coefficients of
+///     the Pauli strings.
+#[pyfunction]
+pub fn jordan_wigner_symplectic<'py>(
+    py: Python<'py>,
+    op: &FermionOperator,
+    norb: usize,
+    tol: f64,
+) -> PyResult<(
+    Bound<'py, PyArray2<bool>>,
+    Bound<'py, PyArray2<bool>>,
+    Bound<'py, PyArray1<Complex64>>,
+)> {
+    let n_qubits = 2 * norb;
+    let n_words = n_qubits.div_ceil(WORD_BITS);
+    for term in op.coeffs.keys() {
+        for &(_, _, orb) in term {
+            if orb < 0 || orb as usize >= norb {
+                return Err(PyValueError::new_err(format!(
+                    "Orbital index must be between 0 and {}. Got {}.",
+                    norb as i64 - 1,
+                    orb
+                )));
+            }
+        }
+    }
+
+    let sums = op
+        .coeffs
+        .par_iter()
+        .fold(HashMap::new, |mut sums, (term, &coeff)| {
+            for (bits, coeff) in term_pauli_strings(term, coeff, norb, n_words) {
+                *sums.entry(bits).or_default() += coeff;
+            }
+            sums
+        })
+        .reduce(HashMap::new, |sums_1, sums_2| {
+            let (mut sums, other) = if sums_1.len() >= sums_2.len() {
+                (sums_1, sums_2)
+            } else {
+                (sums_2, sums_1)
+            };
+            for (bits, coeff) in other {
+                *sums.entry(bits).or_default() += coeff;
+            }
+            sums
+        });
+
+    let mut terms: Vec<(PauliBits, Complex64)> = sums
+        .into_par_iter()
+        .filter(|(_, coeff)| coeff.norm() > tol)
+        .map(|(bits, coeff)| {
+            // X_q Z_q = -i Y_q
+            let n_y: u32 = bits[..n_words]
+                .iter()
+                .zip(&bits[n_words..])
+                .map(|(x, z)| (x & z).count_ones())
+                .sum();
+            let coeff = coeff * Complex64::new(0.0, -1.0).powu(n_y % 4);
+            (bits, coeff)
+        })
+        .collect();
+    terms.par_sort_unstable_by(|(bits_1, _), (bits_2, _)| bits_1.cmp(bits_2));
+
+    let n_terms = terms.len();
+    let mut z = Array2::from_elem((n_terms, n_qubits), false);
+    let mut x = Array2::from_elem((n_terms, n_qubits), false);
+    let mut coeffs = Array1::zeros(n_terms);
+    for (i, (bits, coeff)) in terms.iter().enumerate() {
+        for q in 0..n_qubits {
+            x[(i, q)] = get_bit(&bits[..n_words], q);
+            z[(i, q)] = get_bit(&bits[n_words..], q);
+        }
+        coeffs[i] = *coeff;
+    }
+    Ok((
+        z.into_pyarray_bound(py),
+        x.into_pyarray_bound(py),
+        coeffs.into_pyarray_bound(py),
+    ))
+}
+
+/// Return the Pauli strings of coeff times a product of ladder operators.
+fn term_pauli_strings(
+    term: &[(bool, bool, i32)],
+    coeff: Complex64,
+    norb: usize,
+    n_words: usize,
+) -> HashMap<PauliBits, Complex64> {
+    let mut strings = HashMap::from([(vec![0; 2 * n_words], coeff)]);
+    for &(action, spin, orb) in term {
+        let qubit = orb as usize + if spin { norb } else { 0 };
+        let z_coeff = if action { 0.5 } else { -0.5 };
+        let mut product = HashMap::with_capacity(2 * strings.len());
+        for (bits, coeff) in strings {
+            // X^x Z^z X_q = (-1)^{z_q} X_q X^x Z^z
+            let coeff = if get_bit(&bits[n_words..], qubit) {
+                -coeff
+            } else {
+                coeff
+            };
+            let mut bits_x = bits;
+            flip_bit(&mut bits_x[..n_words], qubit);
+            let z_bits = &mut bits_x[n_words..];
+            for (word, z_word) in z_bits.iter_mut().enumerate() {
+                *z_word ^= lower_mask(word, qubit);
+            }
+            let mut bits_xz = bits_x.clone();
+            flip_bit(&mut bits_xz[n_words..], qubit);
+            *product.entry(bits_x).or_default() += 0.5 * coeff;
+            *product.entry(bits_xz).or_default() += z_coeff * coeff;
+        }
+        strings = product;
+    }
+    strings
+}
+
+fn get_bit(words: &[u64], index: usize) -> bool {
+    (words[index / WORD_BITS] >> (index % WORD_BITS)) & 1 == 1
+}
+
+fn flip_bit(words: &mut [u64], index: usize) {
+    words[index / WORD_BITS] ^= 1 << (index % WORD_BITS);
+}
+
+/// Return the bits of the given word that represent qubits with index less than qubit.
+fn lower_mask(word: usize, qubit: usize) -> u64 {
+    let start = word * WORD_BITS;
+    if qubit <= start {
+        0
+    } else if qubit >= start + WORD_BITS {
+        u64::MAX
+    } else {
+        (1 << (qubit - start)) - 1
+    }
+}
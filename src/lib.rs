@@ -13,6 +13,9 @@ use pyo3::prelude::*;
 mod contract;
 mod fermion_operator;
 mod gates;
+mod jordan_wigner;
+mod precision;
+mod states;
 
 /// Python module exposing Rust extensions.
 #[pymodule]
@@ -25,6 +28,10 @@ fn _lib(m: &Bound<'_, PyModule>) -> PyResult<()> {
         gates::orbital_rotation::apply_givens_rotation_in_place,
         m
     )?)?;
+    m.add_function(wrap_pyfunction!(
+        gates::orbital_rotation::apply_givens_rotations_in_place,
+        m
+    )?)?;
     m.add_function(wrap_pyfunction!(
         gates::num_op_sum::apply_num_op_sum_evolution_in_place,
         m
@@ -49,6 +56,31 @@ fn _lib(m: &Bound<'_, PyModule>) -> PyResult<()> {
         contract::num_op_sum::contract_num_op_sum_spin_into_buffer,
         m
     )?)?;
+    m.add_function(wrap_pyfunction!(
+        contract::one_body::contract_one_body_into_buffer,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        contract::two_body::contract_two_body_into_buffer,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        contract::fermion_operator::contract_fermion_operator_into_buffer,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        states::sampling::build_alias_table_into_buffers,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        states::sampling::sample_alias_table_into_buffer,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        jordan_wigner::jordan_wigner_symplectic,
+        m
+    )?)?;
     m.add_class::<fermion_operator::FermionOperator>()?;
+    m.add_class::<contract::fermion_operator::FermionOperatorTables>()?;
     Ok(())
 }
@@ -0,0 +1,135 @@
+// (C) Copyright IBM 2024
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+extern crate blas_src;
+
+use blas::cgemm;
+use blas::zgemm;
+use num_complex::Complex;
+use num_traits::Float;
+use num_traits::NumAssign;
+use numpy::Complex32;
+use numpy::Complex64;
+use numpy::PyReadonlyArray2;
+use numpy::PyReadwriteArray2;
+use numpy::PyReadwriteArray3;
+use pyo3::exceptions::PyTypeError;
+use pyo3::prelude::*;
+
+/// The real type of the real and imaginary parts of state vector amplitudes.
+///
+/// Kernels are generic over this type so that they can operate on vectors stored in
+/// either double precision (complex128) or single precision (complex64). Operator
+/// coefficients are always passed in double precision and converted once.
+pub trait Real: Float + NumAssign + Send + Sync + 'static {
+    /// Convert a real number from double precision.
+    fn from_f64(x: f64) -> Self;
+
+    /// Convert a complex number from double precision.
+    fn from_c64(z: Complex64) -> Complex<Self> {
+        Complex::new(Self::from_f64(z.re), Self::from_f64(z.im))
+    }
+
+    /// Compute C = alpha * op(A) * op(B) + beta * C using BLAS.
+    ///
+    /// # Safety
+    ///
+    /// The arguments must satisfy the requirements of the BLAS gemm routine.
+    #[allow(clippy::too_many_arguments)]
+    unsafe fn gemm(
+        transa: u8,
+        transb: u8,
+        m: i32,
+        n: i32,
+        k: i32,
+        alpha: Complex<Self>,
+        a: &[Complex<Self>],
+        lda: i32,
+        b: &[Complex<Self>],
+        ldb: i32,
+        beta: Complex<Self>,
+        c: &mut [Complex<Self>],
+        ldc: i32,
+    );
+}
+
+impl Real for f64 {
+    fn from_f64(x: f64) -> Self {
+        x
+    }
+
+    unsafe fn gemm(
+        transa: u8,
+        transb: u8,
+        m: i32,
+        n: i32,
+        k: i32,
+        alpha: Complex64,
+        a: &[Complex64],
+        lda: i32,
+        b: &[Complex64],
+        ldb: i32,
+        beta: Complex64,
+        c: &mut [Complex64],
+        ldc: i32,
+    ) {
+        zgemm(transa, transb, m, n, k, alpha, a, lda, b, ldb, beta, c, ldc);
+    }
+}
+
+impl Real for f32 {
+    fn from_f64(x: f64) -> Self {
+        x as f32
+    }
+
+    unsafe fn gemm(
+        transa: u8,
+        transb: u8,
+        m: i32,
+        n: i32,
+        k: i32,
+        alpha: Complex32,
+        a: &[Complex32],
+        lda: i32,
+        b: &[Complex32],
+        ldb: i32,
+        beta: Complex32,
+        c: &mut [Complex32],
+        ldc: i32,
+    ) {
+        cgemm(transa, transb, m, n, k, alpha, a, lda, b, ldb, beta, c, ldc);
+    }
+}
+
+/// A read-only two-dimensional complex array in double or single precision.
+#[derive(FromPyObject)]
+pub enum ComplexArray2<'py> {
+    Double(PyReadonlyArray2<'py, Complex64>),
+    Single(PyReadonlyArray2<'py, Complex32>),
+}
+
+/// A writeable two-dimensional complex array in double or single precision.
+#[derive(FromPyObject)]
+pub enum ComplexArrayMut2<'py> {
+    Double(PyReadwriteArray2<'py, Complex64>),
+    Single(PyReadwriteArray2<'py, Complex32>),
+}
+
+/// A writeable three-dimensional complex array in double or single precision.
+#[derive(FromPyObject)]
+pub enum ComplexArrayMut3<'py> {
+    Double(PyReadwriteArray3<'py, Complex64>),
+    Single(PyReadwriteArray3<'py, Complex32>),
+}
+
+/// The error raised when an input and output array have different precisions.
+pub fn dtype_mismatch_error() -> PyErr {
+    PyTypeError::new_err("The input and output arrays must have the same dtype.")
+}
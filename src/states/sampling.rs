@@ -0,0 +1,89 @@
+// (C) Copyright IBM 2024
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use ndarray::Zip;
+use numpy::PyReadonlyArray1;
+use numpy::PyReadwriteArray1;
+use pyo3::prelude::*;
+
+/// Build an alias table for sampling from a discrete probability distribution.
+///
+/// The table is built with Vose's algorithm and written into the given buffers.
+/// Outcome i is sampled by choosing bucket i uniformly at random and keeping it with
+/// probability thresholds[i], or otherwise taking aliases[i]. The weights must be
+/// nonnegative with a positive sum, but need not be normalized.
+#[pyfunction]
+pub fn build_alias_table_into_buffers(
+    weights: PyReadonlyArray1<f64>,
+    mut thresholds: PyReadwriteArray1<f64>,
+    mut aliases: PyReadwriteArray1<usize>,
+) {
+    let weights = weights.as_array();
+    let mut thresholds = thresholds.as_array_mut();
+    let mut aliases = aliases.as_array_mut();
+    let n = weights.len();
+    let scale = n as f64 / weights.sum();
+
+    let mut small = Vec::with_capacity(n);
+    let mut large = Vec::with_capacity(n);
+    for i in 0..n {
+        thresholds[i] = weights[i] * scale;
+        aliases[i] = i;
+        if thresholds[i] < 1.0 {
+            small.push(i);
+        } else {
+            large.push(i);
+        }
+    }
+    while !small.is_empty() && !large.is_empty() {
+        let s = small.pop().unwrap();
+        let l = large.pop().unwrap();
+        aliases[s] = l;
+        thresholds[l] += thresholds[s] - 1.0;
+        if thresholds[l] < 1.0 {
+            small.push(l);
+        } else {
+            large.push(l);
+        }
+    }
+    // The remaining buckets are full, up to rounding error
+    for i in small.into_iter().chain(large) {
+        thresholds[i] = 1.0;
+    }
+}
+
+/// Draw samples from an alias table into a buffer.
+///
+/// Each uniform random number in [0, 1) is mapped to one sample, using its integer
+/// part after scaling to choose a bucket and its fractional part to choose between
+/// the bucket and its alias. The samples are drawn in parallel.
+#[pyfunction]
+pub fn sample_alias_table_into_buffer(
+    thresholds: PyReadonlyArray1<f64>,
+    aliases: PyReadonlyArray1<usize>,
+    uniforms: PyReadonlyArray1<f64>,
+    mut out: PyReadwriteArray1<usize>,
+) {
+    let thresholds = thresholds.as_array();
+    let aliases = aliases.as_array();
+    let uniforms = uniforms.as_array();
+    let mut out = out.as_array_mut();
+    let n = thresholds.len();
+
+    Zip::from(&mut out).and(&uniforms).par_for_each(|val, &u| {
+        let x = u * n as f64;
+        let i = (x as usize).min(n - 1);
+        *val = if x - (i as f64) < thresholds[i] {
+            i
+        } else {
+            aliases[i]
+        };
+    });
+}
@@ -0,0 +1,57 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for FermionOperator contraction."""
+
+from __future__ import annotations
+
+import itertools
+
+import numpy as np
+import pytest
+
+import ffsim
+from ffsim._lib import FermionOperatorTables, contract_fermion_operator_into_buffer
+from ffsim._slow.contract.fermion_operator import (
+    contract_fermion_operator_into_buffer_slow,
+)
+
+
+@pytest.mark.parametrize(
+    "norb, nelec",
+    [
+        (norb, nelec)
+        for norb in range(1, 5)
+        for nelec in itertools.product(range(norb + 1), repeat=2)
+    ],
+)
+def test_contract_fermion_operator_into_buffer_slow(norb: int, nelec: tuple[int, int]):
+    """Test contracting a FermionOperator."""
+    rng = np.random.default_rng()
+    dim_a, dim_b = ffsim.dims(norb, nelec)
+    op = ffsim.random.random_fermion_hamiltonian(norb, n_terms=10, seed=rng)
+    vec = ffsim.random.random_state_vector(dim_a * dim_b, seed=rng).reshape(
+        (dim_a, dim_b)
+    )
+    out_slow = np.zeros_like(vec)
+    out_fast = np.zeros_like(vec)
+    contract_fermion_operator_into_buffer_slow(
+        vec, op, norb=norb, nelec=nelec, out=out_slow
+    )
+    tables = FermionOperatorTables(op, norb, nelec)
+    contract_fermion_operator_into_buffer(vec, tables, out_fast)
+    np.testing.assert_allclose(out_fast, out_slow, atol=1e-12)
+
+
+def test_fermion_operator_tables_orbital_out_of_range():
+    """Test that an orbital index out of range raises an error."""
+    op = ffsim.FermionOperator({(ffsim.cre_a(3), ffsim.des_a(0)): 1.0})
+    with pytest.raises(ValueError, match="out of range"):
+        FermionOperatorTables(op, 3, (1, 1))
@@ -29,7 +29,10 @@ from ffsim._slow.gates.diag_coulomb import (
 
 
 @pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(6)))
-def test_apply_diag_coulomb_evolution_num_rep_slow(norb: int, nelec: tuple[int, int]):
+@pytest.mark.parametrize("n_vecs", [None, 3])
+def test_apply_diag_coulomb_evolution_num_rep_slow(
+    norb: int, nelec: tuple[int, int], n_vecs: int | None
+):
     """Test applying time evolution of diagonal Coulomb operator."""
     rng = np.random.default_rng(40541)
     n_alpha, n_beta = nelec
@@ -45,9 +48,12 @@ def test_apply_diag_coulomb_evolution_num_rep_slow(norb: int, nelec: tuple[int,
         mat_exp_aa = np.exp(-1j * time * mat_aa)
         mat_exp_ab = np.exp(-1j * time * mat_ab)
         mat_exp_bb = np.exp(-1j * time * mat_bb)
-        vec_slow = ffsim.random.random_state_vector(dim_a * dim_b, seed=rng).reshape(
-            (dim_a, dim_b)
-        )
+        vec_slow = np.stack(
+            [
+                ffsim.random.random_state_vector(dim_a * dim_b, seed=rng)
+                for _ in range(n_vecs or 1)
+            ]
+        ).reshape((dim_a, dim_b) if n_vecs is None else (n_vecs, dim_a, dim_b))
         vec_fast = vec_slow.copy()
         apply_diag_coulomb_evolution_in_place_num_rep_slow(
             vec_slow,
@@ -59,7 +65,7 @@ def test_apply_diag_coulomb_evolution_num_rep_slow(norb: int, nelec: tuple[int,
             occupations_b=occupations_b,
         )
         apply_diag_coulomb_evolution_in_place_num_rep(
-            vec_fast,
+            vec_fast.reshape((-1, dim_a, dim_b)),
             mat_exp_aa,
             mat_exp_ab,
             mat_exp_bb,
@@ -71,7 +77,10 @@ def test_apply_diag_coulomb_evolution_num_rep_slow(norb: int, nelec: tuple[int,
 
 
 @pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(6)))
-def test_apply_diag_coulomb_evolution_z_rep_slow(norb: int, nelec: tuple[int, int]):
+@pytest.mark.parametrize("n_vecs", [None, 3])
+def test_apply_diag_coulomb_evolution_z_rep_slow(
+    norb: int, nelec: tuple[int, int], n_vecs: int | None
+):
     """Test applying time evolution of diagonal Coulomb operator."""
     rng = np.random.default_rng(744)
     n_alpha, n_beta = nelec
@@ -87,9 +96,12 @@ def test_apply_diag_coulomb_evolution_z_rep_slow(norb: int, nelec: tuple[int, in
         mat_exp_aa = np.exp(-1j * time * mat_aa)
         mat_exp_ab = np.exp(-1j * time * mat_ab)
         mat_exp_bb = np.exp(-1j * time * mat_bb)
-        vec_slow = ffsim.random.random_state_vector(dim_a * dim_b, seed=rng).reshape(
-            (dim_a, dim_b)
-        )
+        vec_slow = np.stack(
+            [
+                ffsim.random.random_state_vector(dim_a * dim_b, seed=rng)
+                for _ in range(n_vecs or 1)
+            ]
+        ).reshape((dim_a, dim_b) if n_vecs is None else (n_vecs, dim_a, dim_b))
         vec_fast = vec_slow.copy()
         apply_diag_coulomb_evolution_in_place_z_rep_slow(
             vec_slow,
@@ -104,7 +116,7 @@ def test_apply_diag_coulomb_evolution_z_rep_slow(norb: int, nelec: tuple[int, in
             strings_b=strings_b,
         )
         apply_diag_coulomb_evolution_in_place_z_rep(
-            vec_fast,
+            vec_fast.reshape((-1, dim_a, dim_b)),
             mat_exp_aa,
             mat_exp_ab,
             mat_exp_bb,
@@ -119,7 +131,10 @@ def test_apply_diag_coulomb_evolution_z_rep_slow(norb: int, nelec: tuple[int, in
 
 
 @pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(6)))
-def test_apply_diag_coulomb_evolution_num_rep_numpy(norb: int, nelec: tuple[int, int]):
+@pytest.mark.parametrize("n_vecs", [None, 3])
+def test_apply_diag_coulomb_evolution_num_rep_numpy(
+    norb: int, nelec: tuple[int, int], n_vecs: int | None
+):
     """Test applying time evolution of diag Coulomb operator, numpy implementation."""
     rng = np.random.default_rng(31267)
     n_alpha, n_beta = nelec
@@ -135,9 +150,12 @@ def test_apply_diag_coulomb_evolution_num_rep_numpy(norb: int, nelec: tuple[int,
         mat_exp_aa = np.exp(-1j * time * mat_aa)
         mat_exp_ab = np.exp(-1j * time * mat_ab)
         mat_exp_bb = np.exp(-1j * time * mat_bb)
-        vec_slow = ffsim.random.random_state_vector(dim_a * dim_b, seed=rng).reshape(
-            (dim_a, dim_b)
-        )
+        vec_slow = np.stack(
+            [
+                ffsim.random.random_state_vector(dim_a * dim_b, seed=rng)
+                for _ in range(n_vecs or 1)
+            ]
+        ).reshape((dim_a, dim_b) if n_vecs is None else (n_vecs, dim_a, dim_b))
         vec_fast = vec_slow.copy()
         apply_diag_coulomb_evolution_in_place_num_rep_numpy(
             vec_slow,
@@ -148,7 +166,7 @@ def test_apply_diag_coulomb_evolution_num_rep_numpy(norb: int, nelec: tuple[int,
             nelec=(n_alpha, n_beta),
         )
         apply_diag_coulomb_evolution_in_place_num_rep(
-            vec_fast,
+            vec_fast.reshape((-1, dim_a, dim_b)),
             mat_exp_aa,
             mat_exp_ab,
             mat_exp_bb,
@@ -13,6 +13,7 @@ from __future__ import annotations
 import math
 
 import numpy as np
+import pytest
 
 import ffsim
 from ffsim import cistring
@@ -20,7 +21,8 @@ from ffsim._lib import apply_num_op_sum_evolution_in_place
 from ffsim._slow.gates.num_op_sum import apply_num_op_sum_evolution_in_place_slow
 
 
-def test_apply_num_op_sum_evolution_in_place_slow():
+@pytest.mark.parametrize("n_vecs", [None, 3])
+def test_apply_num_op_sum_evolution_in_place_slow(n_vecs: int | None):
     """Test applying num op sum evolution."""
     norb = 5
     rng = np.random.default_rng()
@@ -32,15 +34,18 @@ def test_apply_num_op_sum_evolution_in_place_slow():
         occupations = cistring.gen_occslst(range(norb), n_alpha)
         exponents = rng.uniform(0, 2 * np.pi, size=norb)
         phases = np.exp(1j * exponents)
-        vec_slow = ffsim.random.random_state_vector(dim_a * dim_b, seed=rng).reshape(
-            (dim_a, dim_b)
-        )
+        vec_slow = np.stack(
+            [
+                ffsim.random.random_state_vector(dim_a * dim_b, seed=rng)
+                for _ in range(n_vecs or 1)
+            ]
+        ).reshape((dim_a, dim_b) if n_vecs is None else (n_vecs, dim_a, dim_b))
         vec_fast = vec_slow.copy()
         apply_num_op_sum_evolution_in_place_slow(
             vec_slow, phases, occupations=occupations
         )
         apply_num_op_sum_evolution_in_place(
-            vec_fast,
+            vec_fast.reshape((-1, dim_a, dim_b)),
             phases,
             occupations=occupations,
         )
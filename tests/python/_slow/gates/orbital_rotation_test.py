@@ -17,9 +17,17 @@ import numpy as np
 import ffsim
 from ffsim._lib import (
     apply_givens_rotation_in_place,
+    apply_givens_rotations_in_place,
+)
+from ffsim._slow.gates.orbital_rotation import (
+    apply_givens_rotation_in_place_slow,
+    apply_givens_rotations_in_place_slow,
+)
+from ffsim.cistring import gen_occslst
+from ffsim.gates.orbital_rotation import (
+    _adjacent_zero_one_subspace_indices,
+    _zero_one_subspace_indices,
 )
-from ffsim._slow.gates.orbital_rotation import apply_givens_rotation_in_place_slow
-from ffsim.gates.orbital_rotation import _zero_one_subspace_indices
 
 
 def test_apply_givens_rotation_in_place_slow():
@@ -43,3 +51,39 @@ def test_apply_givens_rotation_in_place_slow():
         apply_givens_rotation_in_place_slow(vec_slow, c, s, slice1, slice2)
         apply_givens_rotation_in_place(vec_fast, c, s, slice1, slice2)
         np.testing.assert_allclose(vec_slow, vec_fast)
+
+
+def test_apply_givens_rotations_in_place_slow():
+    """Test applying a sequence of Givens rotations and phase shifts."""
+    norb = 5
+    n_vecs = 3
+    rng = np.random.default_rng()
+    for _ in range(5):
+        n_alpha = rng.integers(1, norb + 1)
+        n_beta = rng.integers(1, norb + 1)
+        dim_a = math.comb(norb, n_alpha)
+        dim_b = math.comb(norb, n_beta)
+        vec_slow = np.stack(
+            [
+                ffsim.random.random_state_vector(dim_a * dim_b, seed=rng)
+                for _ in range(n_vecs)
+            ]
+        ).reshape((n_vecs, dim_a, dim_b))
+        vec_fast = vec_slow.copy()
+        givens_rotations, phase_shifts = ffsim.linalg.givens_decomposition(
+            ffsim.random.random_unitary(norb, seed=rng)
+        )
+        cs = np.array([c for c, _, _, _ in givens_rotations])
+        ss = np.array([s for _, s, _, _ in givens_rotations])
+        target_orbs = np.array(
+            [(i, j) for _, _, i, j in givens_rotations], dtype=np.uint
+        )
+        indices = _adjacent_zero_one_subspace_indices(norb, n_alpha)
+        occupations = gen_occslst(range(norb), n_alpha)
+        apply_givens_rotations_in_place_slow(
+            vec_slow, cs, ss, target_orbs, indices, phase_shifts, occupations
+        )
+        apply_givens_rotations_in_place(
+            vec_fast, cs, ss, target_orbs, indices, phase_shifts, occupations
+        )
+        np.testing.assert_allclose(vec_slow, vec_fast)
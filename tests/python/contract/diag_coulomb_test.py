@@ -274,3 +274,24 @@ def test_diag_coulomb_to_linop():
     )
 
     np.testing.assert_allclose(result, expected)
+
+
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(5)))
+def test_contract_diag_coulomb_single_precision(norb: int, nelec: tuple[int, int]):
+    """Test contracting a diagonal Coulomb matrix in single precision."""
+    rng = np.random.default_rng()
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    mat = ffsim.random.random_real_symmetric_matrix(norb, seed=rng)
+    for z_representation in [False, True]:
+        result = ffsim.contract.contract_diag_coulomb(
+            vec.astype(np.complex64),
+            mat,
+            norb=norb,
+            nelec=nelec,
+            z_representation=z_representation,
+        )
+        expected = ffsim.contract.contract_diag_coulomb(
+            vec, mat, norb=norb, nelec=nelec, z_representation=z_representation
+        )
+        assert result.dtype == np.complex64
+        np.testing.assert_allclose(result, expected, atol=1e-5)
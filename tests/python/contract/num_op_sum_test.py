@@ -78,3 +78,17 @@ def test_num_op_sum_to_linop():
     )
 
     np.testing.assert_allclose(result, expected)
+
+
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(5)))
+def test_contract_num_op_sum_single_precision(norb: int, nelec: tuple[int, int]):
+    """Test contracting a sum of number operators in single precision."""
+    rng = np.random.default_rng()
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    coeffs = rng.standard_normal(norb)
+    result = ffsim.contract.contract_num_op_sum(
+        vec.astype(np.complex64), coeffs, norb=norb, nelec=nelec
+    )
+    expected = ffsim.contract.contract_num_op_sum(vec, coeffs, norb=norb, nelec=nelec)
+    assert result.dtype == np.complex64
+    np.testing.assert_allclose(result, expected, atol=1e-5)
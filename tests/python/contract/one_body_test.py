@@ -0,0 +1,93 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for one-body contraction."""
+
+from __future__ import annotations
+
+import itertools
+
+import numpy as np
+import pytest
+
+import ffsim
+from ffsim._lib import contract_one_body_into_buffer
+from ffsim.cistring import gen_linkstr_index
+
+
+@pytest.mark.parametrize(
+    "norb, nelec",
+    [
+        (norb, nelec)
+        for norb in range(1, 5)
+        for nelec in itertools.product(range(norb + 1), repeat=2)
+    ],
+)
+def test_contract_one_body(norb: int, nelec: tuple[int, int]):
+    """Test contracting a complex one-body tensor."""
+    rng = np.random.default_rng()
+    mat = rng.standard_normal((norb, norb)) + 1j * rng.standard_normal((norb, norb))
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    original_vec = vec.copy()
+
+    op = ffsim.FermionOperator(
+        {
+            (ffsim.cre_a(p), ffsim.des_a(q)): mat[p, q]
+            for p, q in itertools.product(range(norb), repeat=2)
+        }
+        | {
+            (ffsim.cre_b(p), ffsim.des_b(q)): mat[p, q]
+            for p, q in itertools.product(range(norb), repeat=2)
+        }
+    )
+    expected = ffsim.linear_operator(op, norb, nelec) @ vec
+
+    result = ffsim.contract.contract_one_body(vec, mat, norb=norb, nelec=nelec)
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+    np.testing.assert_allclose(vec, original_vec)
+
+    linop = ffsim.contract.one_body_linop(mat, norb=norb, nelec=nelec)
+    other = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    np.testing.assert_allclose(
+        np.vdot(other, linop @ vec), np.vdot(linop.rmatvec(other), vec), atol=1e-12
+    )
+
+
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(5)))
+def test_contract_one_body_single_precision(norb: int, nelec: tuple[int, int]):
+    """Test contracting a one-body tensor in single precision."""
+    rng = np.random.default_rng()
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    mat = ffsim.random.random_hermitian(norb, seed=rng)
+    result = ffsim.contract.contract_one_body(
+        vec.astype(np.complex64), mat, norb=norb, nelec=nelec
+    )
+    expected = ffsim.contract.contract_one_body(vec, mat, norb=norb, nelec=nelec)
+    assert result.dtype == np.complex64
+    np.testing.assert_allclose(result, expected, atol=1e-5)
+
+
+def test_contract_one_body_mismatched_dtypes():
+    """Test passing input and output arrays of different precisions raises an error."""
+    norb = 3
+    nelec = (2, 1)
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec)).reshape(
+        ffsim.dims(norb, nelec)
+    )
+    mat = ffsim.random.random_hermitian(norb)
+    out = np.zeros_like(vec, dtype=np.complex64)
+    with pytest.raises(TypeError, match="dtype"):
+        contract_one_body_into_buffer(
+            vec,
+            mat,
+            gen_linkstr_index(range(norb), nelec[0]),
+            gen_linkstr_index(range(norb), nelec[1]),
+            out=out,
+        )
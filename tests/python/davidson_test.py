@@ -0,0 +1,66 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the Davidson eigensolver for Hamiltonians."""
+
+from __future__ import annotations
+
+import numpy as np
+import pyscf
+import pyscf.gto
+import pyscf.scf
+import pytest
+
+import ffsim
+
+
+@pytest.mark.parametrize("norb, nelec", [(4, (2, 2)), (5, (3, 2))])
+def test_lowest_eigenstates(norb: int, nelec: tuple[int, int]):
+    """Test computing the lowest eigenstates of a molecular Hamiltonian."""
+    rng = np.random.default_rng()
+    hamiltonian = ffsim.random.random_molecular_hamiltonian(norb, seed=rng, dtype=float)
+    dense = ffsim.linear_operator(hamiltonian, norb=norb, nelec=nelec) @ np.eye(
+        ffsim.dim(norb, nelec)
+    )
+    k = 3
+    energies, vecs = ffsim.lowest_eigenstates(
+        hamiltonian, norb=norb, nelec=nelec, k=k, tol=1e-10
+    )
+    np.testing.assert_allclose(energies, np.linalg.eigvalsh(dense)[:k], atol=1e-8)
+    np.testing.assert_allclose(dense @ vecs, vecs * energies, atol=1e-8)
+
+
+def test_lowest_eigenstates_spin_penalty():
+    """Test selecting singlet eigenstates with a spin penalty."""
+    # Stretched H4 chain, whose low-lying states include triplets
+    mol = pyscf.gto.Mole()
+    mol.build(atom=[["H", (2.0 * i, 0, 0)] for i in range(4)], basis="sto-6g")
+    scf = pyscf.scf.RHF(mol).run()
+    mol_data = ffsim.MolecularData.from_scf(scf)
+    norb, nelec = mol_data.norb, mol_data.nelec
+    hamiltonian = mol_data.hamiltonian
+    dense = ffsim.linear_operator(hamiltonian, norb=norb, nelec=nelec) @ np.eye(
+        ffsim.dim(norb, nelec)
+    )
+    exact_energies, exact_vecs = np.linalg.eigh(dense)
+    singlet_energies = [
+        energy
+        for energy, vec in zip(exact_energies, exact_vecs.T)
+        if ffsim.spin_square(vec, norb=norb, nelec=nelec) < 1e-6
+    ]
+    k = 2
+    energies, vecs = ffsim.lowest_eigenstates(
+        hamiltonian, norb=norb, nelec=nelec, k=k, tol=1e-10, spin_penalty=10.0
+    )
+    np.testing.assert_allclose(energies, singlet_energies[:k], atol=1e-8)
+    for vec in vecs.T:
+        np.testing.assert_allclose(
+            ffsim.spin_square(vec, norb=norb, nelec=nelec), 0, atol=1e-8
+        )
@@ -457,6 +457,35 @@ def test_apply_num_op_prod(norb: int, nelec: tuple[int, int]):
             np.testing.assert_allclose(result, expected)
 
 
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(4)))
+def test_apply_num_op_prod_batch(norb: int, nelec: tuple[int, int]):
+    """Test applying num op prod interaction to a batch of vectors."""
+    rng = np.random.default_rng()
+    dim = ffsim.dim(norb, nelec)
+    n_vecs = 3
+    theta = rng.uniform(-10, 10)
+    target_orbs = (
+        [int(i) for i in rng.choice(norb, size=rng.integers(norb + 1), replace=False)],
+        [int(i) for i in rng.choice(norb, size=rng.integers(norb + 1), replace=False)],
+    )
+    vecs = np.stack(
+        [ffsim.random.random_state_vector(dim, seed=rng) for _ in range(n_vecs)]
+    )
+    result = ffsim.apply_num_op_prod_interaction(
+        vecs, theta, target_orbs, norb=norb, nelec=nelec
+    )
+    expected = np.stack(
+        [
+            ffsim.apply_num_op_prod_interaction(
+                vec, theta, target_orbs, norb=norb, nelec=nelec
+            )
+            for vec in vecs
+        ]
+    )
+    assert result.shape == (n_vecs, dim)
+    np.testing.assert_allclose(result, expected)
+
+
 @pytest.mark.parametrize("norb, spin", ffsim.testing.generate_norb_spin(range(4)))
 def test_apply_hop_gate_matrix_spinful(norb: int, spin: ffsim.Spin):
     """Test applying hop gate matrix."""
@@ -13,6 +13,7 @@
 from __future__ import annotations
 
 import itertools
+from pathlib import Path
 
 import numpy as np
 import pytest
@@ -107,6 +108,86 @@ def test_apply_diag_coulomb_evolution_random_symmetric_spin(
         np.testing.assert_allclose(result, expected)
 
 
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(4)))
+def test_apply_diag_coulomb_evolution_batch(norb: int, nelec: tuple[int, int]):
+    """Test applying diagonal Coulomb evolution to a batch of vectors."""
+    rng = np.random.default_rng()
+    dim = ffsim.dim(norb, nelec)
+    n_vecs = 3
+    mat = ffsim.random.random_real_symmetric_matrix(norb, seed=rng)
+    orbital_rotation = ffsim.random.random_unitary(norb, seed=rng)
+    time = rng.uniform(-10, 10)
+    vecs = np.stack(
+        [ffsim.random.random_state_vector(dim, seed=rng) for _ in range(n_vecs)]
+    )
+    for z_representation in [False, True]:
+        result = ffsim.apply_diag_coulomb_evolution(
+            vecs,
+            mat,
+            time,
+            norb,
+            nelec,
+            orbital_rotation=orbital_rotation,
+            z_representation=z_representation,
+        )
+        expected = np.stack(
+            [
+                ffsim.apply_diag_coulomb_evolution(
+                    vec,
+                    mat,
+                    time,
+                    norb,
+                    nelec,
+                    orbital_rotation=orbital_rotation,
+                    z_representation=z_representation,
+                )
+                for vec in vecs
+            ]
+        )
+        assert result.shape == (n_vecs, dim)
+        np.testing.assert_allclose(result, expected)
+
+
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(5)))
+def test_apply_diag_coulomb_evolution_memmap(
+    norb: int, nelec: tuple[int, int], tmp_path: Path, monkeypatch
+):
+    """Test applying diagonal Coulomb evolution in-place to a memory-mapped vector."""
+    # use a tiny block size so that the orbital rotations split the vector into
+    # many blocks
+    monkeypatch.setattr(ffsim.gates.orbital_rotation, "_MEMMAP_BLOCK_SIZE", 3)
+    rng = np.random.default_rng()
+    dim = ffsim.dim(norb, nelec)
+    mat = ffsim.random.random_real_symmetric_matrix(norb, seed=rng)
+    orbital_rotation = ffsim.random.random_unitary(norb, seed=rng)
+    time = rng.uniform(-10, 10)
+    for z_representation in [False, True]:
+        vec = ffsim.random.random_state_vector(dim, seed=rng)
+        state = ffsim.memmap_state_vector(tmp_path / "vec.npy", norb, nelec)
+        state.vec[:] = vec
+        result = ffsim.apply_diag_coulomb_evolution(
+            state.vec,
+            mat,
+            time,
+            norb,
+            nelec,
+            orbital_rotation=orbital_rotation,
+            z_representation=z_representation,
+            copy=False,
+        )
+        expected = ffsim.apply_diag_coulomb_evolution(
+            vec,
+            mat,
+            time,
+            norb,
+            nelec,
+            orbital_rotation=orbital_rotation,
+            z_representation=z_representation,
+        )
+        np.testing.assert_allclose(state.vec, expected)
+        np.testing.assert_allclose(result, expected)
+
+
 @pytest.mark.parametrize(
     "norb, nelec, z_representation",
     [
@@ -330,3 +411,36 @@ def test_apply_diag_coulomb_evolution_z_rep_asymmetric_spin(
             expected = np.exp(-1j * eig * time) * state
             np.testing.assert_allclose(result, expected)
             np.testing.assert_allclose(state, original_state)
+
+
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(5)))
+def test_apply_diag_coulomb_evolution_single_precision(
+    norb: int, nelec: tuple[int, int]
+):
+    """Test diagonal Coulomb evolution in single precision."""
+    rng = np.random.default_rng()
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    mat = ffsim.random.random_real_symmetric_matrix(norb, seed=rng)
+    orbital_rotation = ffsim.random.random_unitary(norb, seed=rng)
+    time = rng.uniform(-10, 10)
+    for z_representation in [False, True]:
+        result = ffsim.apply_diag_coulomb_evolution(
+            vec.astype(np.complex64),
+            mat,
+            time,
+            norb,
+            nelec,
+            orbital_rotation=orbital_rotation,
+            z_representation=z_representation,
+        )
+        expected = ffsim.apply_diag_coulomb_evolution(
+            vec,
+            mat,
+            time,
+            norb,
+            nelec,
+            orbital_rotation=orbital_rotation,
+            z_representation=z_representation,
+        )
+        assert result.dtype == np.complex64
+        np.testing.assert_allclose(result, expected, atol=1e-5)
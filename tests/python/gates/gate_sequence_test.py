@@ -0,0 +1,129 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for gate sequences."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import ffsim
+
+
+def _random_gates(norb: int, n_gates: int, rng: np.random.Generator) -> list:
+    gates: list = [
+        ffsim.OrbitalRotationGate(ffsim.random.random_unitary(norb, seed=rng))
+    ]
+    for i in range(n_gates):
+        orbital_rotation = ffsim.random.random_unitary(norb, seed=rng)
+        time = rng.standard_normal()
+        if i % 2:
+            gates.append(
+                ffsim.NumOpSumEvolutionGate(
+                    rng.standard_normal(norb), time, orbital_rotation=orbital_rotation
+                )
+            )
+        else:
+            gates.append(
+                ffsim.DiagCoulombEvolutionGate(
+                    ffsim.random.random_real_symmetric_matrix(norb, seed=rng),
+                    time,
+                    orbital_rotation=orbital_rotation,
+                )
+            )
+    gates.append(
+        ffsim.NumOpSumEvolutionGate(rng.standard_normal(norb), rng.standard_normal())
+    )
+    return gates
+
+
+def _apply_sequentially(vec, gates, norb, nelec):
+    for gate in gates:
+        vec = gate._apply_unitary_(vec, norb=norb, nelec=nelec, copy=True)
+    return vec
+
+
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(1, 5)))
+def test_apply_gates(norb: int, nelec: tuple[int, int]):
+    """Test applying merged gates matches applying them one at a time."""
+    rng = np.random.default_rng()
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    original_vec = vec.copy()
+    gates = _random_gates(norb, n_gates=4, rng=rng)
+    result = ffsim.apply_gates(vec, gates, norb, nelec)
+    expected = _apply_sequentially(vec, gates, norb, nelec)
+    np.testing.assert_allclose(result, expected)
+    np.testing.assert_allclose(vec, original_vec)
+
+
+@pytest.mark.parametrize("norb, nocc", ffsim.testing.generate_norb_nocc(range(1, 5)))
+def test_apply_gates_spinless(norb: int, nocc: int):
+    """Test applying merged gates to a spinless vector."""
+    rng = np.random.default_rng()
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nocc), seed=rng)
+    gates = [
+        gate
+        for gate in _random_gates(norb, n_gates=3, rng=rng)
+        if not isinstance(gate, ffsim.DiagCoulombEvolutionGate)
+    ]
+    result = ffsim.apply_gates(vec, gates, norb, nocc)
+    expected = _apply_sequentially(vec, gates, norb, nocc)
+    np.testing.assert_allclose(result, expected)
+
+
+def test_apply_gates_spin_resolved_rotations():
+    """Test merging orbital rotations that differ between spin sectors."""
+    rng = np.random.default_rng()
+    norb = 4
+    nelec = (2, 1)
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    gates: list = [
+        ffsim.OrbitalRotationGate((ffsim.random.random_unitary(norb, seed=rng), None)),
+        ffsim.DiagCoulombEvolutionGate(
+            ffsim.random.random_real_symmetric_matrix(norb, seed=rng),
+            rng.standard_normal(),
+            orbital_rotation=ffsim.random.random_unitary(norb, seed=rng),
+        ),
+        ffsim.NumOpSumEvolutionGate(
+            rng.standard_normal(norb),
+            rng.standard_normal(),
+            orbital_rotation=(None, ffsim.random.random_unitary(norb, seed=rng)),
+        ),
+        ffsim.OrbitalRotationGate(
+            (
+                ffsim.random.random_unitary(norb, seed=rng),
+                ffsim.random.random_unitary(norb, seed=rng),
+            )
+        ),
+    ]
+    result = ffsim.apply_gates(vec, gates, norb, nelec)
+    expected = _apply_sequentially(vec, gates, norb, nelec)
+    np.testing.assert_allclose(result, expected)
+
+
+def test_merge_orbital_rotations_count():
+    """Test merging halves the number of orbital rotations of rotated evolutions."""
+    rng = np.random.default_rng()
+    norb = 3
+    n_gates = 6
+    gates = _random_gates(norb, n_gates=n_gates, rng=rng)
+    merged = ffsim.merge_orbital_rotations(gates)
+    n_rotations = sum(isinstance(gate, ffsim.OrbitalRotationGate) for gate in merged)
+    # one rotation before each rotated evolution, one after the last of them, and
+    # none around the final unrotated evolution
+    assert n_rotations == n_gates + 1
+    assert all(
+        gate.orbital_rotation is None
+        for gate in merged
+        if not isinstance(gate, ffsim.OrbitalRotationGate)
+    )
+    assert isinstance(merged[0], ffsim.OrbitalRotationGate)
+    assert not isinstance(merged[-1], ffsim.OrbitalRotationGate)
@@ -68,6 +68,33 @@ def test_apply_num_op_sum_evolution_spinful(
             np.testing.assert_allclose(state, original_state)
 
 
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(4)))
+def test_apply_num_op_sum_evolution_batch(norb: int, nelec: tuple[int, int]):
+    """Test applying num op sum evolution to a batch of vectors."""
+    rng = np.random.default_rng()
+    dim = ffsim.dim(norb, nelec)
+    n_vecs = 3
+    coeffs = rng.standard_normal(norb)
+    orbital_rotation = ffsim.random.random_unitary(norb, seed=rng)
+    time = rng.uniform(-10, 10)
+    vecs = np.stack(
+        [ffsim.random.random_state_vector(dim, seed=rng) for _ in range(n_vecs)]
+    )
+    result = ffsim.apply_num_op_sum_evolution(
+        vecs, coeffs, time, norb, nelec, orbital_rotation=orbital_rotation
+    )
+    expected = np.stack(
+        [
+            ffsim.apply_num_op_sum_evolution(
+                vec, coeffs, time, norb, nelec, orbital_rotation=orbital_rotation
+            )
+            for vec in vecs
+        ]
+    )
+    assert result.shape == (n_vecs, dim)
+    np.testing.assert_allclose(result, expected)
+
+
 @pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(1, 5)))
 def test_apply_quadratic_hamiltonian_evolution(norb: int, nelec: tuple[int, int]):
     """Test applying time evolution of a quadratic Hamiltonian."""
@@ -85,3 +112,26 @@ def test_apply_quadratic_hamiltonian_evolution(norb: int, nelec: tuple[int, int]
         -1j * time * op, vec, traceA=-1j * time * np.sum(np.abs(mat))
     )
     np.testing.assert_allclose(result, expected)
+
+
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(5)))
+def test_apply_num_op_sum_evolution_single_precision(norb: int, nelec: tuple[int, int]):
+    """Test number operator sum evolution in single precision."""
+    rng = np.random.default_rng()
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    coeffs = rng.standard_normal(norb)
+    orbital_rotation = ffsim.random.random_unitary(norb, seed=rng)
+    time = rng.uniform(-10, 10)
+    result = ffsim.apply_num_op_sum_evolution(
+        vec.astype(np.complex64),
+        coeffs,
+        time,
+        norb,
+        nelec,
+        orbital_rotation=orbital_rotation,
+    )
+    expected = ffsim.apply_num_op_sum_evolution(
+        vec, coeffs, time, norb, nelec, orbital_rotation=orbital_rotation
+    )
+    assert result.dtype == np.complex64
+    np.testing.assert_allclose(result, expected, atol=1e-5)
@@ -21,6 +21,7 @@ import scipy.linalg
 import scipy.sparse.linalg
 
 import ffsim
+from ffsim.gates.orbital_rotation import _is_memory_mapped
 from ffsim.states import slater_determinant
 
 
@@ -118,6 +119,87 @@ def test_apply_orbital_rotation_random_spinful(norb: int, nelec: tuple[int, int]
         np.testing.assert_allclose(result, expected)
 
 
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(4)))
+def test_apply_orbital_rotation_batch_spinful(norb: int, nelec: tuple[int, int]):
+    """Test applying orbital rotation to a batch of vectors."""
+    rng = np.random.default_rng()
+    dim = ffsim.dim(norb, nelec)
+    n_vecs = 3
+    mats: list[np.ndarray | tuple[np.ndarray | None, np.ndarray | None]] = [
+        ffsim.random.random_unitary(norb, seed=rng),
+        (ffsim.random.random_unitary(norb, seed=rng), None),
+        (None, ffsim.random.random_unitary(norb, seed=rng)),
+    ]
+    for mat in mats:
+        vecs = np.stack(
+            [ffsim.random.random_state_vector(dim, seed=rng) for _ in range(n_vecs)]
+        )
+        original_vecs = vecs.copy()
+        result = ffsim.apply_orbital_rotation(vecs, mat, norb, nelec)
+        expected = np.stack(
+            [ffsim.apply_orbital_rotation(vec, mat, norb, nelec) for vec in vecs]
+        )
+        assert result.shape == (n_vecs, dim)
+        np.testing.assert_allclose(result, expected)
+        np.testing.assert_allclose(vecs, original_vecs)
+
+
+@pytest.mark.parametrize("norb, nocc", ffsim.testing.generate_norb_nocc(range(4)))
+def test_apply_orbital_rotation_batch_spinless(norb: int, nocc: int):
+    """Test applying orbital rotation to a batch of spinless vectors."""
+    rng = np.random.default_rng()
+    dim = ffsim.dim(norb, nocc)
+    n_vecs = 3
+    mat = ffsim.random.random_unitary(norb, seed=rng)
+    vecs = np.stack(
+        [ffsim.random.random_state_vector(dim, seed=rng) for _ in range(n_vecs)]
+    )
+    result = ffsim.apply_orbital_rotation(vecs, mat, norb, nocc)
+    expected = np.stack(
+        [ffsim.apply_orbital_rotation(vec, mat, norb, nocc) for vec in vecs]
+    )
+    assert result.shape == (n_vecs, dim)
+    np.testing.assert_allclose(result, expected)
+
+
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(5)))
+def test_apply_orbital_rotation_memmap(
+    norb: int, nelec: tuple[int, int], tmp_path: Path, monkeypatch
+):
+    """Test applying orbital rotation in-place to a memory-mapped vector."""
+    # use a tiny block size so that the vector is split into many blocks
+    monkeypatch.setattr(ffsim.gates.orbital_rotation, "_MEMMAP_BLOCK_SIZE", 3)
+    rng = np.random.default_rng()
+    dim = ffsim.dim(norb, nelec)
+    mats: list[np.ndarray | tuple[np.ndarray | None, np.ndarray | None]] = [
+        ffsim.random.random_unitary(norb, seed=rng),
+        (ffsim.random.random_unitary(norb, seed=rng), None),
+        (None, ffsim.random.random_unitary(norb, seed=rng)),
+    ]
+    for mat in mats:
+        vec = ffsim.random.random_state_vector(dim, seed=rng)
+        state = ffsim.memmap_state_vector(tmp_path / "vec.npy", norb, nelec)
+        state.vec[:] = vec
+        result = ffsim.apply_orbital_rotation(state.vec, mat, norb, nelec, copy=False)
+        expected = ffsim.apply_orbital_rotation(vec, mat, norb, nelec)
+        assert result is state.vec
+        np.testing.assert_allclose(result, expected)
+
+
+def test_is_memory_mapped(tmp_path: Path):
+    """Test detecting vectors backed by a memory-mapped file."""
+    state = ffsim.memmap_state_vector(tmp_path / "vec.npy", norb=3, nelec=(1, 1))
+    assert _is_memory_mapped(state.vec)
+    assert _is_memory_mapped(state.vec[1:])
+    assert _is_memory_mapped(np.asarray(state.vec).reshape((3, 3)))
+    # a copy of a memmap is still a memmap instance, but it lives in memory
+    in_memory = state.vec.copy()
+    assert isinstance(in_memory, np.memmap)
+    assert not _is_memory_mapped(in_memory)
+    assert not _is_memory_mapped(in_memory[1:])
+    assert not _is_memory_mapped(np.zeros(9, dtype=complex))
+
+
 @pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(4)))
 def test_apply_orbital_rotation_no_side_effects_vec(norb: int, nelec: tuple[int, int]):
     """Test applying orbital basis change doesn't modify the original vector."""
@@ -238,3 +320,34 @@ def test_apply_orbital_rotation_no_side_effects_special_case():
     assert ffsim.linalg.is_unitary(original_mat)
     assert ffsim.linalg.is_unitary(mat)
     np.testing.assert_allclose(mat, original_mat, atol=1e-12)
+
+
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(5)))
+def test_apply_orbital_rotation_single_precision(norb: int, nelec: tuple[int, int]):
+    """Test orbital rotation in single precision."""
+    rng = np.random.default_rng()
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    mats: list[np.ndarray | tuple[np.ndarray | None, np.ndarray | None]] = [
+        ffsim.random.random_unitary(norb, seed=rng),
+        (ffsim.random.random_unitary(norb, seed=rng), None),
+        (None, ffsim.random.random_unitary(norb, seed=rng)),
+    ]
+    for mat in mats:
+        result = ffsim.apply_orbital_rotation(
+            vec.astype(np.complex64), mat, norb, nelec
+        )
+        expected = ffsim.apply_orbital_rotation(vec, mat, norb, nelec)
+        assert result.dtype == np.complex64
+        np.testing.assert_allclose(result, expected, atol=1e-5)
+
+
+@pytest.mark.parametrize("norb, nocc", ffsim.testing.generate_norb_nocc(range(5)))
+def test_apply_orbital_rotation_spinless_single_precision(norb: int, nocc: int):
+    """Test spinless orbital rotation in single precision."""
+    rng = np.random.default_rng()
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nocc), seed=rng)
+    mat = ffsim.random.random_unitary(norb, seed=rng)
+    result = ffsim.apply_orbital_rotation(vec.astype(np.complex64), mat, norb, nocc)
+    expected = ffsim.apply_orbital_rotation(vec, mat, norb, nocc)
+    assert result.dtype == np.complex64
+    np.testing.assert_allclose(result, expected, atol=1e-5)
@@ -20,6 +20,7 @@ import pytest
 import scipy.sparse.linalg
 
 import ffsim
+from ffsim.linalg.packed import pair_indices
 
 
 def test_linear_operator():
@@ -120,6 +121,22 @@ def test_fermion_operator(norb: int, nelec: tuple[int, int]):
     np.testing.assert_allclose(actual, expected)
 
 
+@pytest.mark.parametrize("norb, nelec", [(4, (2, 1)), (5, (3, 2))])
+def test_linear_operator_blocks(norb: int, nelec: tuple[int, int], monkeypatch):
+    """Test linear operator processing one alpha string at a time."""
+    monkeypatch.setattr(
+        ffsim.hamiltonians.molecular_hamiltonian, "_TWO_BODY_BLOCK_ENTRIES", 1
+    )
+    rng = np.random.default_rng(6235)
+    mol_hamiltonian = ffsim.random.random_molecular_hamiltonian(norb, seed=rng)
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    linop = ffsim.linear_operator(mol_hamiltonian, norb, nelec)
+    expected_linop = ffsim.linear_operator(
+        ffsim.fermion_operator(mol_hamiltonian), norb, nelec
+    )
+    np.testing.assert_allclose(linop @ vec, expected_linop @ vec)
+
+
 def test_rotated():
     """Test rotating orbitals."""
     norb = 5
@@ -162,3 +179,87 @@ def test_rotated():
     original_expectation = np.vdot(vec, linop @ vec)
     rotated_expectation = np.vdot(rotated_vec, linop_rotated @ rotated_vec)
     np.testing.assert_allclose(original_expectation, rotated_expectation)
+
+
+@pytest.mark.parametrize("symmetry", [4, 8])
+def test_packed(symmetry: int):
+    """Test molecular Hamiltonian with compressed two-body tensor."""
+    norb = 5
+    nelec = (3, 2)
+    rng = np.random.default_rng(3590)
+    mol_hamiltonian = ffsim.random.random_molecular_hamiltonian(
+        norb, seed=rng, dtype=float
+    )
+    packed_hamiltonian = mol_hamiltonian.packed(symmetry)
+    assert mol_hamiltonian.two_body_symmetry == 1
+    assert packed_hamiltonian.two_body_symmetry == symmetry
+    assert packed_hamiltonian.two_body_tensor.ndim == {4: 2, 8: 1}[symmetry]
+    assert ffsim.approx_eq(packed_hamiltonian.unpacked(), mol_hamiltonian)
+    assert ffsim.approx_eq(packed_hamiltonian, mol_hamiltonian)
+
+    # linear operator and diagonal
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    actual = ffsim.linear_operator(packed_hamiltonian, norb, nelec) @ vec
+    expected = ffsim.linear_operator(mol_hamiltonian, norb, nelec) @ vec
+    np.testing.assert_allclose(actual, expected)
+    np.testing.assert_allclose(
+        ffsim.diag(packed_hamiltonian, norb, nelec),
+        ffsim.diag(mol_hamiltonian, norb, nelec),
+    )
+
+    # real orbital rotation keeps the compressed format
+    orbital_rotation = ffsim.random.random_orthogonal(norb, seed=rng)
+    rotated = packed_hamiltonian.rotated(orbital_rotation)
+    assert rotated.two_body_symmetry == symmetry
+    assert ffsim.approx_eq(rotated, mol_hamiltonian.rotated(orbital_rotation))
+
+    # complex orbital rotation returns the full tensor
+    orbital_rotation = ffsim.random.random_unitary(norb, seed=rng)
+    rotated = packed_hamiltonian.rotated(orbital_rotation)
+    assert rotated.two_body_symmetry == 1
+    assert ffsim.approx_eq(rotated, mol_hamiltonian.rotated(orbital_rotation))
+
+
+def test_pair_indices_read_only():
+    """Test the cached pair indices cannot be modified."""
+    pairs = pair_indices(4)
+    with pytest.raises(ValueError, match="read-only"):
+        pairs[0, 0] = 1
+    np.testing.assert_array_equal(np.diagonal(pair_indices(4)), [0, 2, 5, 9])
+
+
+@pytest.mark.parametrize("cholesky", [True, False])
+def test_packed_double_factorized(cholesky: bool):
+    """Test double factorization of a Hamiltonian with compressed two-body tensor."""
+    norb = 5
+    rng = np.random.default_rng(8841)
+    mol_hamiltonian = ffsim.random.random_molecular_hamiltonian(
+        norb, seed=rng, dtype=float
+    )
+    df_hamiltonian = ffsim.DoubleFactorizedHamiltonian.from_molecular_hamiltonian(
+        mol_hamiltonian.packed(), cholesky=cholesky
+    )
+    expected = ffsim.DoubleFactorizedHamiltonian.from_molecular_hamiltonian(
+        mol_hamiltonian, cholesky=cholesky
+    )
+    assert len(df_hamiltonian.diag_coulomb_mats) == len(expected.diag_coulomb_mats)
+    np.testing.assert_allclose(
+        df_hamiltonian.one_body_tensor, expected.one_body_tensor, atol=1e-8
+    )
+    assert ffsim.approx_eq(
+        df_hamiltonian.to_molecular_hamiltonian(), mol_hamiltonian, atol=1e-8
+    )
+
+
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(5)))
+def test_linear_operator_single_precision(norb: int, nelec: tuple[int, int]):
+    """Test linear operator in single precision."""
+    rng = np.random.default_rng()
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    mol_hamiltonian = ffsim.random.random_molecular_hamiltonian(norb, seed=rng)
+    linop = ffsim.linear_operator(mol_hamiltonian, norb=norb, nelec=nelec)
+    result = linop @ vec.astype(np.complex64)
+    expected = linop @ vec
+    norm = np.linalg.norm(expected)
+    assert result.dtype == np.complex64
+    np.testing.assert_allclose(result / norm, expected / norm, atol=1e-5)
@@ -0,0 +1,39 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for Krylov Hamiltonian simulation."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import scipy.linalg
+
+import ffsim
+
+
+@pytest.mark.parametrize("norb, nelec", [(4, (2, 2)), (5, (3, 2))])
+def test_simulate_krylov(norb: int, nelec: tuple[int, int]):
+    """Test Krylov simulation of a molecular Hamiltonian."""
+    rng = np.random.default_rng()
+    hamiltonian = ffsim.random.random_molecular_hamiltonian(norb, seed=rng)
+    linop = ffsim.linear_operator(hamiltonian, norb=norb, nelec=nelec)
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    times = [0.0, 0.25, 0.5, 1.0]
+    dense = linop @ np.eye(ffsim.dim(norb, nelec))
+
+    # Pass the Hamiltonian and the LinearOperator
+    for obj in [hamiltonian, linop]:
+        results = ffsim.simulate_krylov(
+            vec, obj, times, norb=norb, nelec=nelec, krylov_dim=10
+        )
+        for time, result in zip(times, results):
+            expected = scipy.linalg.expm(-1j * time * dense) @ vec
+            np.testing.assert_allclose(result, expected, atol=1e-8)
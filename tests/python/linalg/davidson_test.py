@@ -0,0 +1,97 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the Davidson eigensolver."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import scipy.sparse.linalg
+
+import ffsim
+
+
+def _random_diagonally_dominant_hermitian(dim: int, seed=None) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    mat = ffsim.random.random_hermitian(dim, seed=rng)
+    return np.diag(np.arange(dim, dtype=float)) + 0.1 * mat
+
+
+@pytest.mark.parametrize("dim, k", [(1, 1), (5, 5), (50, 1), (100, 4)])
+def test_davidson(dim: int, k: int):
+    """Test Davidson computes the lowest eigenpairs."""
+    rng = np.random.default_rng()
+    mat = _random_diagonally_dominant_hermitian(dim, seed=rng)
+    linop = scipy.sparse.linalg.aslinearoperator(mat)
+    eigs, vecs = ffsim.linalg.davidson(linop, np.diagonal(mat), k=k, tol=1e-10)
+    np.testing.assert_allclose(eigs, np.linalg.eigvalsh(mat)[:k], atol=1e-8)
+    np.testing.assert_allclose(mat @ vecs, vecs * eigs, atol=1e-8)
+    np.testing.assert_allclose(vecs.T.conj() @ vecs, np.eye(k), atol=1e-8)
+
+
+@pytest.mark.parametrize("max_subspace_dim", [4, 6, 10])
+def test_davidson_restart(max_subspace_dim: int):
+    """Test Davidson converges with a small subspace."""
+    dim = 100
+    k = 2
+    mat = _random_diagonally_dominant_hermitian(dim, seed=5730)
+    eigs, vecs = ffsim.linalg.davidson(
+        mat,
+        np.diagonal(mat),
+        k=k,
+        max_iter=100,
+        max_subspace_dim=max_subspace_dim,
+    )
+    np.testing.assert_allclose(eigs, np.linalg.eigvalsh(mat)[:k], atol=1e-8)
+    np.testing.assert_allclose(mat @ vecs, vecs * eigs, atol=1e-7)
+
+
+@pytest.mark.parametrize("k, max_subspace_dim", [(1, 4), (1, 6), (2, 6)])
+def test_davidson_restart_random_matrix(k: int, max_subspace_dim: int):
+    """Test Davidson converges with a small subspace on a weakly diagonal matrix."""
+    rng = np.random.default_rng(2)
+    dim = 100
+    mat = ffsim.random.random_hermitian(dim, seed=rng)
+    mat += np.diag(rng.uniform(0, 10, size=dim))
+    eigs, vecs = ffsim.linalg.davidson(
+        mat,
+        np.diagonal(mat),
+        k=k,
+        max_iter=150,
+        max_subspace_dim=max_subspace_dim,
+    )
+    np.testing.assert_allclose(eigs, np.linalg.eigvalsh(mat)[:k], atol=1e-8)
+    np.testing.assert_allclose(mat @ vecs, vecs * eigs, atol=1e-7)
+
+
+def test_davidson_initial_guess():
+    """Test Davidson with an initial guess."""
+    rng = np.random.default_rng(1832)
+    dim = 50
+    mat = _random_diagonally_dominant_hermitian(dim, seed=rng)
+    _, exact_vecs = np.linalg.eigh(mat)
+    v0 = exact_vecs[:, 0] + 1e-3 * ffsim.random.random_state_vector(dim, seed=rng)
+    eigs, vecs = ffsim.linalg.davidson(mat, np.diagonal(mat), v0=v0, max_iter=15)
+    np.testing.assert_allclose(eigs, np.linalg.eigvalsh(mat)[:1], atol=1e-8)
+    np.testing.assert_allclose(mat @ vecs, vecs * eigs, atol=1e-7)
+
+
+def test_davidson_errors():
+    """Test Davidson raises errors for invalid arguments."""
+    dim = 10
+    mat = _random_diagonally_dominant_hermitian(dim)
+    diag = np.diagonal(mat)
+    with pytest.raises(ValueError, match="k"):
+        _ = ffsim.linalg.davidson(mat, diag, k=0)
+    with pytest.raises(ValueError, match="max_subspace_dim"):
+        _ = ffsim.linalg.davidson(mat, diag, k=3, max_subspace_dim=4)
+    with pytest.raises(RuntimeError, match="converge"):
+        _ = ffsim.linalg.davidson(mat, diag, k=2, tol=1e-14, max_iter=1)
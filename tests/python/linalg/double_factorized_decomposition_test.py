@@ -305,6 +305,50 @@ def test_double_factorized_compressed_constrained():
     assert error_optimized < error
 
 
+def test_double_factorized_compressed_initial_decomposition():
+    """Test warm-starting compressed double factorization."""
+    norb = 3
+    two_body_tensor = ffsim.random.random_two_body_tensor(norb, seed=4512, dtype=float)
+    perturbation = ffsim.random.random_two_body_tensor(norb, seed=9013, dtype=float)
+    perturbed_tensor = two_body_tensor + 0.05 * perturbation
+
+    def error(tensor, diag_coulomb_mats, orbital_rotations):
+        reconstructed = np.einsum(
+            "kpi,kqi,kij,krj,ksj->pqrs",
+            orbital_rotations,
+            orbital_rotations,
+            diag_coulomb_mats,
+            orbital_rotations,
+            orbital_rotations,
+        )
+        return np.sum((reconstructed - tensor) ** 2)
+
+    initial_decomposition = double_factorized(
+        two_body_tensor, max_vecs=2, optimize=True
+    )
+    diag_coulomb_mats, orbital_rotations = double_factorized(
+        perturbed_tensor,
+        max_vecs=5,
+        optimize=True,
+        initial_decomposition=initial_decomposition,
+    )
+    assert diag_coulomb_mats.shape == (2, norb, norb)
+    assert orbital_rotations.shape == (2, norb, norb)
+    assert error(perturbed_tensor, diag_coulomb_mats, orbital_rotations) < error(
+        perturbed_tensor, *initial_decomposition
+    )
+
+    with pytest.raises(ValueError, match="shape"):
+        _ = double_factorized(
+            two_body_tensor,
+            optimize=True,
+            initial_decomposition=(
+                np.zeros((2, norb + 1, norb + 1)),
+                np.zeros((2, norb + 1, norb + 1)),
+            ),
+        )
+
+
 @pytest.mark.parametrize("norb, nocc", [(4, 2), (5, 2), (5, 3)])
 def test_double_factorized_t2_amplitudes_random(norb: int, nocc: int):
     """Test double factorization of random t2 amplitudes."""
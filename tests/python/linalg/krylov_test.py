@@ -0,0 +1,101 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for Krylov subspace time evolution."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import scipy.linalg
+import scipy.sparse.linalg
+
+import ffsim
+
+
+@pytest.mark.parametrize("hermitian", [True, False])
+@pytest.mark.parametrize("krylov_dim", [4, 30])
+def test_krylov_evolution(hermitian: bool, krylov_dim: int):
+    """Test Krylov evolution against dense matrix exponentiation."""
+    dim = 50
+    rng = np.random.default_rng()
+    if hermitian:
+        mat = ffsim.random.random_hermitian(dim, seed=rng)
+    else:
+        mat = rng.standard_normal((dim, dim)) + 1j * rng.standard_normal((dim, dim))
+    mat /= np.linalg.norm(mat, ord=2)
+    vec = ffsim.random.random_state_vector(dim, seed=rng)
+    times = [0.0, 0.1, 0.1, 0.5, 2.0, 3.0]
+
+    results = list(
+        ffsim.linalg.krylov_evolution(
+            mat, vec, times, hermitian=hermitian, krylov_dim=krylov_dim, tol=1e-10
+        )
+    )
+    assert len(results) == len(times)
+    for time, result in zip(times, results):
+        expected = scipy.linalg.expm(-1j * time * mat) @ vec
+        np.testing.assert_allclose(result, expected, atol=1e-8)
+
+
+def test_krylov_evolution_invariant_subspace():
+    """Test Krylov evolution when the subspace is smaller than the Krylov dimension."""
+    dim = 10
+    rng = np.random.default_rng()
+    eigs = rng.standard_normal(dim)
+    vec = ffsim.linalg.one_hot(dim, 3, dtype=complex)
+    (result,) = ffsim.linalg.krylov_evolution(np.diag(eigs), vec, [5.0])
+    np.testing.assert_allclose(result, np.exp(-5j * eigs[3]) * vec)
+
+
+def test_expm_multiply_krylov():
+    """Test single-time Krylov evolution."""
+    dim = 20
+    rng = np.random.default_rng()
+    mat = ffsim.random.random_hermitian(dim, seed=rng)
+    vec = ffsim.random.random_state_vector(dim, seed=rng)
+    result = ffsim.linalg.expm_multiply_krylov(mat, vec, time=0.7)
+    expected = scipy.linalg.expm(-0.7j * mat) @ vec
+    np.testing.assert_allclose(result, expected, atol=1e-8)
+
+
+def test_krylov_evolution_tolerance_below_roundoff():
+    """Test Krylov evolution with a tolerance below machine precision."""
+    dim = 50
+    rng = np.random.default_rng(3145)
+    mat = ffsim.random.random_hermitian(dim, seed=rng)
+    vec = ffsim.random.random_state_vector(dim, seed=rng)
+    n_matvecs = 0
+
+    def matvec(x: np.ndarray) -> np.ndarray:
+        nonlocal n_matvecs
+        n_matvecs += 1
+        return mat @ x
+
+    linop = scipy.sparse.linalg.LinearOperator((dim, dim), matvec=matvec, dtype=complex)
+    (result,) = ffsim.linalg.krylov_evolution(
+        linop, vec, [1.0], krylov_dim=10, tol=1e-16
+    )
+    expected = scipy.linalg.expm(-1j * mat) @ vec
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+    # The step size is limited by round-off, not by the unattainable tolerance
+    assert n_matvecs <= 2000
+
+
+def test_krylov_evolution_errors():
+    """Test Krylov evolution raises errors on invalid inputs."""
+    mat = np.eye(3)
+    vec = np.ones(3)
+    with pytest.raises(ValueError, match="krylov_dim"):
+        ffsim.linalg.krylov_evolution(mat, vec, [1.0], krylov_dim=0)
+    with pytest.raises(ValueError, match="times"):
+        ffsim.linalg.krylov_evolution(mat, vec, [1.0, 0.5])
+    with pytest.raises(ValueError, match="times"):
+        ffsim.linalg.krylov_evolution(mat, vec, [-1.0])
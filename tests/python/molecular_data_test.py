@@ -13,6 +13,7 @@ import pathlib
 
 import numpy as np
 import pyscf
+import pyscf.ao2mo
 import pyscf.data.elements
 
 import ffsim
@@ -64,6 +65,17 @@ def test_molecular_data_no_sym():
 
     assert mol_data.orbital_symmetries is None
 
+    # the Hamiltonian keeps the compressed two-body integrals
+    mol_hamiltonian = mol_data.hamiltonian
+    assert mol_hamiltonian.two_body_tensor is mol_data.two_body_integrals
+    assert mol_hamiltonian.two_body_symmetry != 1
+    expected = ffsim.MolecularHamiltonian(
+        mol_data.one_body_integrals,
+        pyscf.ao2mo.restore(1, mol_data.two_body_integrals, mol_data.norb),
+        constant=mol_data.core_energy,
+    )
+    assert ffsim.approx_eq(mol_hamiltonian, expected)
+
 
 def test_molecular_data_run_methods():
     # Build N2 molecule
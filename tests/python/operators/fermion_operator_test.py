@@ -336,6 +336,40 @@ def test_normal_ordered():
         assert list(term) == sorted(term, reverse=True)
 
 
+def test_normal_ordered_repeated_and_cross_spin():
+    """Test normal ordering of terms with repeated operators and mixed spins."""
+    actual = FermionOperator(
+        {(ffsim.cre_a(1), ffsim.des_a(1), ffsim.cre_a(1)): 0.5}
+    ).normal_ordered()
+    assert actual == FermionOperator({(ffsim.cre_a(1),): 0.5})
+
+    actual = FermionOperator({(ffsim.des_a(0), ffsim.cre_b(0)): 0.5}).normal_ordered()
+    assert actual == FermionOperator({(ffsim.cre_b(0), ffsim.des_a(0)): -0.5})
+
+
+def test_large_orbital_indices():
+    """Test multiplication and normal ordering with large orbital indices."""
+    op = FermionOperator(
+        {
+            (ffsim.cre_a(20000), ffsim.des_a(1)): 0.5,
+            (ffsim.des_b(20000),): 0.25j,
+        }
+    )
+    assert op * op == FermionOperator(
+        {
+            (ffsim.cre_a(20000), ffsim.des_a(1), ffsim.cre_a(20000), ffsim.des_a(1)): (
+                0.25
+            ),
+            (ffsim.cre_a(20000), ffsim.des_a(1), ffsim.des_b(20000)): 0.125j,
+            (ffsim.des_b(20000), ffsim.cre_a(20000), ffsim.des_a(1)): 0.125j,
+            (ffsim.des_b(20000), ffsim.des_b(20000)): -0.0625,
+        }
+    )
+    assert (op * op).normal_ordered() == FermionOperator(
+        {(ffsim.cre_a(20000), ffsim.des_b(20000), ffsim.des_a(1)): -0.25j}
+    )
+
+
 def test_conserves_particle_number():
     op = FermionOperator(
         {
@@ -742,3 +776,19 @@ def test_trace():
     t1 = ffsim.trace(ffsim.fermion_operator(ham), norb=norb, nelec=nelec)
     t2 = ffsim.trace(ham, norb=norb, nelec=nelec)
     np.testing.assert_allclose(t1, t2)
+
+
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(5)))
+def test_linear_operator_single_precision(norb: int, nelec: tuple[int, int]):
+    """Test linear operator in single precision."""
+    rng = np.random.default_rng()
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    op = ffsim.fermion_operator(
+        ffsim.random.random_molecular_hamiltonian(norb, seed=rng)
+    )
+    linop = ffsim.linear_operator(op, norb=norb, nelec=nelec)
+    result = linop @ vec.astype(np.complex64)
+    expected = linop @ vec
+    norm = np.linalg.norm(expected)
+    assert result.dtype == np.complex64
+    np.testing.assert_allclose(result / norm, expected / norm, atol=1e-5)
@@ -182,3 +182,36 @@ def test_minimize_linear_method():
         result = ffsim.optimize.minimize_linear_method(
             params_to_vec, x0=x0, hamiltonian=hamiltonian, maxiter=0
         )
+
+
+def test_minimize_linear_method_analytic_jacobian():
+    # Build an H2 molecule
+    mol = pyscf.gto.Mole()
+    mol.build(
+        atom=[["H", (0, 0, 0)], ["H", (0, 0, 1.8)]],
+        basis="sto-6g",
+    )
+    hartree_fock = pyscf.scf.RHF(mol)
+    hartree_fock.kernel()
+
+    # Get molecular data and molecular Hamiltonian (one- and two-body tensors)
+    mol_data = ffsim.MolecularData.from_scf(hartree_fock)
+    norb = mol_data.norb
+    nelec = mol_data.nelec
+    hamiltonian = ffsim.linear_operator(mol_data.hamiltonian, norb=norb, nelec=nelec)
+    reference_state = ffsim.hartree_fock_state(norb, nelec)
+
+    # Initialize ansatz and parameters
+    ansatz = ffsim.variational.AdjointAnsatz.ucj_spin_balanced(
+        reference_state, norb=norb, nelec=nelec, n_reps=2
+    )
+    rng = np.random.default_rng(1804)
+    x0 = rng.uniform(-10, 10, size=ansatz.n_params)
+
+    result = ffsim.optimize.minimize_linear_method(
+        ansatz.state, x0=x0, hamiltonian=hamiltonian, jac=ansatz.jacobian
+    )
+    vec = ansatz.state(result.x)
+    np.testing.assert_allclose(np.vdot(vec, hamiltonian @ vec).real, result.fun)
+    np.testing.assert_allclose(result.fun, -0.970773, atol=1e-5)
+    assert result.success
@@ -0,0 +1,206 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for FfsimEstimator."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from qiskit.circuit import ParameterVector, QuantumCircuit, QuantumRegister
+from qiskit.circuit.library import CPhaseGate, RZGate, XGate, XXPlusYYGate
+from qiskit.primitives import StatevectorEstimator
+from qiskit.primitives.containers.estimator_pub import EstimatorPub
+from qiskit.primitives.containers.observables_array import ObservablesArray
+from qiskit.quantum_info import SparsePauliOp
+
+import ffsim
+
+
+def _random_pauli_op(n_qubits: int, n_terms: int, rng: np.random.Generator):
+    paulis = ["".join(rng.choice(list("IXYZ"), size=n_qubits)) for _ in range(n_terms)]
+    return SparsePauliOp(paulis, rng.standard_normal(n_terms))
+
+
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(1, 4)))
+def test_pauli_observables(norb: int, nelec: tuple[int, int]):
+    """Test estimator with Pauli observables."""
+    rng = np.random.default_rng(3841)
+    ucj_op = ffsim.random.random_ucj_op_spin_balanced(
+        norb, n_reps=2, with_final_orbital_rotation=True, seed=rng
+    )
+    qubits = QuantumRegister(2 * norb)
+    circuit = QuantumCircuit(qubits)
+    circuit.append(ffsim.qiskit.PrepareHartreeFockJW(norb, nelec), qubits)
+    circuit.append(ffsim.qiskit.UCJOpSpinBalancedJW(ucj_op), qubits)
+
+    observables = [
+        [_random_pauli_op(2 * norb, n_terms=5, rng=rng)],
+        [_random_pauli_op(2 * norb, n_terms=3, rng=rng)],
+        [_random_pauli_op(2 * norb, n_terms=1, rng=rng)],
+    ]
+    estimator = ffsim.qiskit.FfsimEstimator()
+    pub_result = estimator.run([(circuit, observables)]).result()[0]
+    assert pub_result.data.evs.shape == (3, 1)
+
+    expected = StatevectorEstimator().run([(circuit.decompose(), observables)])
+    np.testing.assert_allclose(
+        pub_result.data.evs, expected.result()[0].data.evs, atol=1e-12
+    )
+    np.testing.assert_allclose(pub_result.data.stds, 0)
+
+
+@pytest.mark.parametrize("norb, nelec", ffsim.testing.generate_norb_nelec(range(1, 4)))
+def test_fermionic_observables(norb: int, nelec: tuple[int, int]):
+    """Test estimator with FermionOperators and Hamiltonians."""
+    rng = np.random.default_rng(5127)
+    orbital_rotation = ffsim.random.random_unitary(norb, seed=rng)
+    qubits = QuantumRegister(2 * norb)
+    circuit = QuantumCircuit(qubits)
+    circuit.append(
+        ffsim.qiskit.PrepareSlaterDeterminantJW(
+            norb,
+            ffsim.testing.random_occupied_orbitals(norb, nelec, seed=rng),
+            orbital_rotation=orbital_rotation,
+        ),
+        qubits,
+    )
+    vec = ffsim.qiskit.final_state_vector(circuit).vec
+
+    mol_hamiltonian = ffsim.random.random_molecular_hamiltonian(norb, seed=rng)
+    fermion_hamiltonian = ffsim.random.random_fermion_hamiltonian(
+        norb, n_terms=10, seed=rng
+    )
+    df_hamiltonian = ffsim.random.random_double_factorized_hamiltonian(norb, seed=rng)
+    observables = [mol_hamiltonian, fermion_hamiltonian, df_hamiltonian]
+
+    estimator = ffsim.qiskit.FfsimEstimator()
+    job = estimator.run([(circuit, observables), (circuit, fermion_hamiltonian)])
+    result = job.result()
+    assert result[0].data.evs.shape == (3,)
+    assert result[1].data.evs.shape == ()
+
+    expected = [
+        np.vdot(vec, ffsim.linear_operator(obs, norb=norb, nelec=nelec) @ vec).real
+        for obs in observables
+    ]
+    np.testing.assert_allclose(result[0].data.evs, expected)
+    np.testing.assert_allclose(result[1].data.evs, expected[1])
+
+
+def test_parameter_broadcasting():
+    """Test estimator broadcasts observables against parameter values."""
+    rng = np.random.default_rng(9620)
+    norb = 3
+    nelec = (2, 1)
+    qubits = QuantumRegister(2 * norb)
+    params = ParameterVector("theta", 3)
+    circuit = QuantumCircuit(qubits)
+    circuit.append(XGate(), [qubits[0]])
+    circuit.append(XGate(), [qubits[1]])
+    circuit.append(XGate(), [qubits[norb]])
+    circuit.append(XXPlusYYGate(params[0], params[1]), [qubits[1], qubits[2]])
+    circuit.append(XXPlusYYGate(params[2], 0.3), [qubits[3], qubits[4]])
+    circuit.append(CPhaseGate(params[0] - params[2]), [qubits[2], qubits[4]])
+    circuit.append(RZGate(params[1]), [qubits[0]])
+    circuit.append(XXPlusYYGate(2 * params[1], params[0]), [qubits[0], qubits[1]])
+
+    parameter_values = rng.uniform(-5, 5, size=(4, len(params)))
+    pauli_observables = [
+        [_random_pauli_op(2 * norb, n_terms=4, rng=rng)],
+        [_random_pauli_op(2 * norb, n_terms=2, rng=rng)],
+    ]
+    fermion_hamiltonian = ffsim.random.random_fermion_hamiltonian(
+        norb, n_terms=10, seed=rng
+    )
+    mol_hamiltonian = ffsim.random.random_molecular_hamiltonian(norb, seed=rng)
+    fermionic_observables: list[
+        list[ffsim.FermionOperator | ffsim.MolecularHamiltonian]
+    ] = [[fermion_hamiltonian], [mol_hamiltonian]]
+
+    estimator = ffsim.qiskit.FfsimEstimator(norb=norb, nelec=nelec)
+    job = estimator.run(
+        [
+            (circuit, pauli_observables, parameter_values),
+            (circuit, fermionic_observables, parameter_values),
+        ]
+    )
+    result = job.result()
+    assert result[0].data.evs.shape == (2, 4)
+    assert result[1].data.evs.shape == (2, 4)
+
+    expected = StatevectorEstimator().run(
+        [(circuit, pauli_observables, parameter_values)]
+    )
+    np.testing.assert_allclose(
+        result[0].data.evs, expected.result()[0].data.evs, atol=1e-12
+    )
+    for j, values in enumerate(parameter_values):
+        vec = ffsim.qiskit.final_state_vector(
+            circuit.assign_parameters(values), norb=norb, nelec=nelec
+        ).vec
+        for i, (obs,) in enumerate(fermionic_observables):
+            linop = ffsim.linear_operator(obs, norb=norb, nelec=nelec)
+            np.testing.assert_allclose(
+                result[1].data.evs[i, j], np.vdot(vec, linop @ vec).real
+            )
+
+
+def test_precision():
+    """Test estimator adds noise with the requested precision."""
+    norb = 2
+    nelec = (1, 1)
+    qubits = QuantumRegister(2 * norb)
+    circuit = QuantumCircuit(qubits)
+    circuit.append(ffsim.qiskit.PrepareHartreeFockJW(norb, nelec), qubits)
+    observable = SparsePauliOp("IIIZ")
+
+    estimator = ffsim.qiskit.FfsimEstimator()
+    pub_result = estimator.run([(circuit, observable)]).result()[0]
+    np.testing.assert_allclose(pub_result.data.evs, -1)
+    np.testing.assert_array_equal(pub_result.data.stds, 0)
+
+    estimator = ffsim.qiskit.FfsimEstimator(seed=1234)
+    job = estimator.run([(circuit, [observable] * 2000)], precision=0.1)
+    evs = job.result()[0].data.evs
+    np.testing.assert_array_equal(job.result()[0].data.stds, 0.1)
+    assert not np.allclose(evs, -1)
+    np.testing.assert_allclose(np.mean(evs), -1, atol=0.02)
+    np.testing.assert_allclose(np.std(evs), 0.1, atol=0.02)
+
+
+def test_empty_observable():
+    """Test an observable with no terms has expectation value zero."""
+    norb = 2
+    nelec = (1, 1)
+    qubits = QuantumRegister(2 * norb)
+    circuit = QuantumCircuit(qubits)
+    circuit.append(ffsim.qiskit.PrepareHartreeFockJW(norb, nelec), qubits)
+    observables = np.empty(2, dtype=object)
+    observables[0] = {}
+    observables[1] = {"IIIZ": 1.0}
+    pub = EstimatorPub(
+        circuit, ObservablesArray(observables, validate=False), validate=False
+    )
+    estimator = ffsim.qiskit.FfsimEstimator()
+    pub_result = estimator.run([pub]).result()[0]
+    np.testing.assert_allclose(pub_result.data.evs, [0, -1])
+
+
+def test_spinless_fermionic_observable():
+    """Test fermionic observables raise an error for spinless circuits."""
+    qubits = QuantumRegister(2)
+    circuit = QuantumCircuit(qubits)
+    circuit.append(XGate(), [qubits[0]])
+    circuit.append(XXPlusYYGate(0.1, 0.2), [qubits[0], qubits[1]])
+    estimator = ffsim.qiskit.FfsimEstimator()
+    job = estimator.run([(circuit, ffsim.FermionOperator({(): 1.0}))])
+    with pytest.raises(ValueError, match="spinful"):
+        _ = job.result()
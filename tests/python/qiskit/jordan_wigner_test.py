@@ -12,6 +12,7 @@
 
 import numpy as np
 import pytest
+from qiskit.quantum_info import SparsePauliOp
 
 import ffsim
 import ffsim.random.random
@@ -64,6 +65,36 @@ def test_more_norb():
     )
 
 
+def test_many_qubits():
+    """Test an operator acting on more than 64 qubits."""
+    norb = 40
+    op = ffsim.FermionOperator({(ffsim.cre_a(0), ffsim.des_b(norb - 1)): 1.0})
+    qubit_op = ffsim.qiskit.jordan_wigner(op)
+    assert qubit_op.num_qubits == 2 * norb
+    qubits = list(range(2 * norb))
+    z_string = "Z" * (2 * norb - 2)
+    assert sorted(qubit_op.to_sparse_list()) == sorted(
+        [
+            ("X" + z_string + "X", qubits, np.complex128(0.25)),
+            ("X" + z_string + "Y", qubits, np.complex128(0.25j)),
+            ("Y" + z_string + "X", qubits, np.complex128(-0.25j)),
+            ("Y" + z_string + "Y", qubits, np.complex128(0.25)),
+        ]
+    )
+
+
+def test_cancellation():
+    """Test Pauli strings that cancel are removed."""
+    op = ffsim.FermionOperator(
+        {
+            (ffsim.cre_a(0), ffsim.des_a(1)): 1.0,
+            (ffsim.des_a(1), ffsim.cre_a(0)): 1.0,
+        }
+    )
+    qubit_op = ffsim.qiskit.jordan_wigner(op)
+    assert qubit_op == SparsePauliOp("IIII", [0.0])
+
+
 def test_bad_norb():
     """Test passing bad number of spatial orbitals raises errors."""
     op = ffsim.FermionOperator({(ffsim.cre_a(3),): 1.0})
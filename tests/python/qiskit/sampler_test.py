@@ -16,7 +16,12 @@ import math
 
 import numpy as np
 import pytest
-from qiskit.circuit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit import (
+    ClassicalRegister,
+    ParameterVector,
+    QuantumCircuit,
+    QuantumRegister,
+)
 from qiskit.circuit.library import (
     CPhaseGate,
     PhaseGate,
@@ -370,6 +375,125 @@ def test_reproducible_with_seed():
     assert counts_1 == counts_2
 
 
+def test_parameter_sweep():
+    """Test sampler with a parametrized circuit and an array of parameter values."""
+    rng = np.random.default_rng(4831)
+
+    norb = 3
+    nelec = (2, 1)
+    qubits = QuantumRegister(2 * norb)
+    params = ParameterVector("theta", 3)
+    circuit = QuantumCircuit(qubits)
+    circuit.append(XGate(), [qubits[0]])
+    circuit.append(XGate(), [qubits[1]])
+    circuit.append(XGate(), [qubits[norb]])
+    circuit.append(XXPlusYYGate(params[0], params[1]), [qubits[1], qubits[2]])
+    circuit.append(XXPlusYYGate(2 * params[2], 0.5), [qubits[3], qubits[4]])
+    circuit.append(CPhaseGate(params[0] + params[2]), [qubits[2], qubits[3]])
+    circuit.append(XXPlusYYGate(params[1], params[2]), [qubits[0], qubits[1]])
+    circuit.measure_all()
+
+    shots = 5000
+    parameter_values = rng.uniform(-5, 5, size=(2, 3, len(params)))
+    sampler = ffsim.qiskit.FfsimSampler(
+        default_shots=shots, norb=norb, nelec=nelec, seed=rng
+    )
+    pub = (circuit, parameter_values)
+    job = sampler.run([pub])
+    result = job.result()
+    pub_result = result[0]
+    assert pub_result.data.meas.shape == (2, 3)
+
+    for index in np.ndindex(2, 3):
+        samples = pub_result.data.meas[index].get_counts()
+        strings, counts = zip(*samples.items())
+        addresses = ffsim.strings_to_addresses(strings, norb, nelec)
+        assert sum(counts) == shots
+        empirical_probs = np.zeros(ffsim.dim(norb, nelec), dtype=float)
+        empirical_probs[addresses] = np.array(counts) / shots
+        bound_circuit = circuit.assign_parameters(parameter_values[index])
+        vec = ffsim.qiskit.final_state_vector(
+            bound_circuit.remove_final_measurements(inplace=False),
+            norb=norb,
+            nelec=nelec,
+        )
+        exact_probs = np.abs(vec) ** 2
+        assert np.sum(np.sqrt(exact_probs * empirical_probs)) > 0.999
+
+
+@pytest.mark.parametrize("max_workers", [2, 3])
+def test_parallel_execution(max_workers: int):
+    """Test parallel execution gives the same results as serial execution."""
+    rng = np.random.default_rng(2290)
+
+    norb = 3
+    nelec = (1, 1)
+    qubits = QuantumRegister(2 * norb)
+    params = ParameterVector("theta", 2)
+    circuit = QuantumCircuit(qubits)
+    circuit.append(XGate(), [qubits[0]])
+    circuit.append(XGate(), [qubits[norb]])
+    circuit.append(XXPlusYYGate(params[0], params[1]), [qubits[0], qubits[1]])
+    circuit.append(XXPlusYYGate(params[1], params[0]), [qubits[4], qubits[3]])
+    circuit.append(CPhaseGate(params[0]), [qubits[1], qubits[4]])
+    circuit.append(XXPlusYYGate(params[0], 0.5), [qubits[1], qubits[2]])
+    circuit.measure_all()
+
+    pubs = [
+        (circuit, rng.uniform(-5, 5, size=(3, len(params)))),
+        (circuit, rng.uniform(-5, 5, size=len(params))),
+        (circuit, rng.uniform(-5, 5, size=(2, 2, len(params)))),
+    ]
+    shots = 100
+
+    serial_sampler = ffsim.qiskit.FfsimSampler(
+        default_shots=shots, norb=norb, nelec=nelec, seed=1234
+    )
+    parallel_sampler = ffsim.qiskit.FfsimSampler(
+        default_shots=shots,
+        norb=norb,
+        nelec=nelec,
+        seed=1234,
+        max_workers=max_workers,
+    )
+    executors = []
+    for _ in range(2):
+        serial_result = serial_sampler.run(pubs).result()
+        parallel_result = parallel_sampler.run(pubs).result()
+        executors.append(parallel_sampler._executor)
+        assert len(parallel_result) == len(pubs)
+        for serial_pub_result, parallel_pub_result in zip(
+            serial_result, parallel_result
+        ):
+            assert parallel_pub_result.data.meas == serial_pub_result.data.meas
+    # The worker processes are reused across jobs
+    assert executors[0] is not None
+    assert executors[1] is executors[0]
+
+
+def test_parallel_execution_invalid_options():
+    """Test invalid options for parallel execution raise errors."""
+    with pytest.raises(ValueError, match="max_workers"):
+        _ = ffsim.qiskit.FfsimSampler(max_workers=0)
+
+
+def test_fused_gates_on_some_qubits():
+    """Test sampling a circuit whose gates act on some of the qubits."""
+    norb = 3
+    nelec = (2, 1)
+    qubits = QuantumRegister(2 * norb, name="q")
+    circuit = QuantumCircuit(qubits)
+    circuit.append(ffsim.qiskit.PrepareHartreeFockJW(norb, nelec), qubits)
+    # move the spin beta electron from orbital 0 to orbital 1
+    circuit.append(XXPlusYYGate(math.pi, 0.0), [qubits[4], qubits[3]])
+    circuit.append(CPhaseGate(0.4), [qubits[2], qubits[1]])
+    circuit.measure_all()
+    shots = 100
+    sampler = ffsim.qiskit.FfsimSampler(default_shots=shots, seed=4820)
+    counts = sampler.run([(circuit,)]).result()[0].data.meas.get_counts()
+    assert counts == {"010011": shots}
+
+
 def test_edge_cases():
     """Test edge cases."""
     with pytest.raises(
@@ -17,7 +17,7 @@ import random
 
 import numpy as np
 import pytest
-from qiskit.circuit import QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter, ParameterVector, QuantumCircuit, QuantumRegister
 from qiskit.circuit.library import (
     CPhaseGate,
     CZGate,
@@ -399,3 +399,59 @@ def test_qiskit_gates_norb_nelec():
     # Pass wrong nelec
     with pytest.raises(ValueError, match="nelec"):
         ffsim_vec = ffsim.qiskit.final_state_vector(circuit, norb=norb, nelec=(2, 1))
+
+
+def test_fused_gates_on_some_qubits():
+    """Test fusing gates that act on some of the qubits, out of order."""
+    norb = 3
+    nelec = (2, 1)
+    rng = np.random.default_rng(3481)
+    qubits = QuantumRegister(2 * norb)
+    circuit = QuantumCircuit(qubits)
+    circuit.append(ffsim.qiskit.PrepareHartreeFockJW(norb, nelec), qubits)
+    circuit.append(XXPlusYYGate(*rng.uniform(-5, 5, size=2)), [qubits[4], qubits[3]])
+    circuit.append(CPhaseGate(rng.uniform(-5, 5)), [qubits[2], qubits[4]])
+    circuit.append(RZGate(rng.uniform(-5, 5)), [qubits[1]])
+    circuit.append(XXPlusYYGate(*rng.uniform(-5, 5, size=2)), [qubits[2], qubits[1]])
+    ffsim_vec = ffsim.qiskit.final_state_vector(circuit, norb=norb, nelec=nelec).vec
+    qiskit_vec = ffsim.qiskit.qiskit_vec_to_ffsim_vec(
+        Statevector(circuit).data, norb=norb, nelec=nelec
+    )
+    np.testing.assert_allclose(ffsim_vec, qiskit_vec, atol=1e-12)
+
+
+def test_compiled_circuit():
+    """Test rebinding the parameters of a compiled circuit."""
+    norb = 3
+    nelec = (2, 1)
+    rng = np.random.default_rng()
+    theta = ParameterVector("theta", 2)
+    phi = Parameter("phi")
+    qubits = QuantumRegister(2 * norb)
+    circuit = QuantumCircuit(qubits)
+    circuit.append(XGate(), [qubits[0]])
+    circuit.append(XGate(), [qubits[1]])
+    circuit.append(XGate(), [qubits[norb]])
+    circuit.append(XXPlusYYGate(theta[0], phi), [qubits[0], qubits[2]])
+    circuit.append(XXPlusYYGate(2 * theta[1] + phi, 0.1), [qubits[4], qubits[5]])
+    circuit.append(RZGate(phi), [qubits[1]])
+    circuit.append(CPhaseGate(theta[0] - theta[1]), [qubits[2], qubits[3]])
+    circuit.append(PhaseGate(0.3), [qubits[4]])
+    circuit.append(GlobalPhaseGate(phi), [])
+
+    compiled = ffsim.qiskit.CompiledCircuit(circuit, norb=norb, nelec=nelec)
+    assert compiled.norb == norb
+    assert compiled.nelec == nelec
+    assert compiled.parameters == tuple(circuit.parameters)
+    for _ in range(3):
+        values = rng.uniform(-5, 5, size=len(compiled.parameters))
+        result = compiled.final_state_vector(values)
+        expected = ffsim.qiskit.final_state_vector(
+            circuit.assign_parameters(values), norb=norb, nelec=nelec
+        )
+        np.testing.assert_allclose(result.vec, expected.vec)
+
+    with pytest.raises(ValueError, match="parameter values"):
+        compiled.final_state_vector(values[:-1])
+    with pytest.raises(ValueError, match="parameter values"):
+        compiled.final_state_vector()
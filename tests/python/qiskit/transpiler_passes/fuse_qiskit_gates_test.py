@@ -0,0 +1,131 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from qiskit.circuit import Parameter, QuantumCircuit, QuantumRegister
+from qiskit.circuit.library import (
+    CPhaseGate,
+    CZGate,
+    PhaseGate,
+    RZGate,
+    RZZGate,
+    SGate,
+    TdgGate,
+    XXPlusYYGate,
+    ZGate,
+    iSwapGate,
+)
+from qiskit.quantum_info import Operator
+
+import ffsim
+
+
+def _brickwork(norb: int, n_layers: int):
+    for i in range(n_layers):
+        for j in range(i % 2, norb - 1, 2):
+            yield (j, j + 1)
+
+
+def _append_givens_layers(
+    circuit: QuantumCircuit, qubits: list, rng: np.random.Generator
+):
+    norb = len(qubits)
+    for i, j in _brickwork(norb, norb):
+        circuit.append(
+            XXPlusYYGate(rng.uniform(-10, 10), rng.uniform(-10, 10)),
+            [qubits[i], qubits[j]],
+        )
+
+
+@pytest.mark.parametrize("norb", range(2, 5))
+def test_yields_equivalent_circuit_spinful(norb: int):
+    """Test fusing Qiskit gates results in an equivalent circuit."""
+    rng = np.random.default_rng()
+    qubits = QuantumRegister(2 * norb)
+    circuit = QuantumCircuit(qubits)
+    _append_givens_layers(circuit, qubits[:norb], rng)
+    _append_givens_layers(circuit, qubits[norb:], rng)
+    for q in qubits:
+        circuit.append(PhaseGate(rng.uniform(-10, 10)), [q])
+        circuit.append(RZGate(rng.uniform(-10, 10)), [q])
+    for i, j in _brickwork(2 * norb, norb):
+        circuit.append(CPhaseGate(rng.uniform(-10, 10)), [qubits[i], qubits[j]])
+        circuit.append(RZZGate(rng.uniform(-10, 10)), [qubits[i], qubits[j]])
+    circuit.append(CZGate(), [qubits[0], qubits[norb]])
+    circuit.append(SGate(), [qubits[1]])
+    circuit.append(ZGate(), [qubits[norb + 1]])
+    circuit.append(iSwapGate(), [qubits[norb - 1], qubits[norb - 2]])
+    _append_givens_layers(circuit, qubits[:norb], rng)
+    _append_givens_layers(circuit, qubits[norb:], rng)
+
+    transpiled = ffsim.qiskit.FuseQiskitGates(norb)(circuit)
+    ops = transpiled.count_ops()
+    assert ops["orb_rot_jw"] == 2
+    assert ops["diag_coulomb_jw"] == 1
+    assert "xx_plus_yy" not in ops
+    assert "cp" not in ops
+    np.testing.assert_allclose(
+        np.array(Operator(circuit)), np.array(Operator(transpiled)), atol=1e-12
+    )
+
+
+@pytest.mark.parametrize("norb", range(3, 6))
+def test_yields_equivalent_circuit_spinless(norb: int):
+    """Test fusing Qiskit gates results in an equivalent circuit, spinless."""
+    rng = np.random.default_rng()
+    qubits = QuantumRegister(norb)
+    circuit = QuantumCircuit(qubits)
+    _append_givens_layers(circuit, qubits, rng)
+    for i, j in _brickwork(norb, norb):
+        circuit.append(CPhaseGate(rng.uniform(-10, 10)), [qubits[i], qubits[j]])
+        circuit.append(RZGate(rng.uniform(-10, 10)), [qubits[i]])
+    circuit.append(TdgGate(), [qubits[0]])
+    circuit.append(iSwapGate(), [qubits[1], qubits[0]])
+    _append_givens_layers(circuit, qubits, rng)
+
+    transpiled = ffsim.qiskit.FuseQiskitGates()(circuit)
+    ops = transpiled.count_ops()
+    assert ops["orb_rot_spinless_jw"] == 2
+    assert ops["diag_coulomb_spinless_jw"] == 1
+    assert "xx_plus_yy" not in ops
+    np.testing.assert_allclose(
+        np.array(Operator(circuit)), np.array(Operator(transpiled)), atol=1e-12
+    )
+
+
+def test_unfusable_gates():
+    """Test gates that cannot be fused are left in place."""
+    norb = 3
+    theta = Parameter("theta")
+    qubits = QuantumRegister(2 * norb)
+    circuit = QuantumCircuit(qubits)
+    # Not adjacent
+    circuit.append(XXPlusYYGate(0.1, 0.2), [qubits[0], qubits[2]])
+    # Different spin species
+    circuit.append(XXPlusYYGate(0.3, 0.4), [qubits[2], qubits[3]])
+    # Unbound parameter
+    circuit.append(XXPlusYYGate(theta, 0.5), [qubits[0], qubits[1]])
+    circuit.append(CPhaseGate(theta), [qubits[0], qubits[1]])
+    # Single gate
+    circuit.append(PhaseGate(0.6), [qubits[4]])
+
+    transpiled = ffsim.qiskit.FuseQiskitGates(norb)(circuit)
+    assert transpiled.count_ops() == circuit.count_ops()
+
+
+def test_wrong_number_of_qubits():
+    """Test an error is raised if the number of qubits does not match norb."""
+    circuit = QuantumCircuit(3)
+    circuit.append(PhaseGate(0.1), [0])
+    with pytest.raises(ValueError, match="2 \\* norb"):
+        _ = ffsim.qiskit.FuseQiskitGates(2)(circuit)
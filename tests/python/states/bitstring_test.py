@@ -12,11 +12,17 @@
 
 from __future__ import annotations
 
+import itertools
+
 import numpy as np
 import pytest
 
 import ffsim
-from ffsim.states.bitstring import convert_bitstring_type
+from ffsim.states.bitstring import (
+    concatenate_bitstrings,
+    convert_bitstring_type,
+    restrict_bitstrings,
+)
 
 
 def test_addresses_to_strings_int_spinless():
@@ -470,3 +476,102 @@ def test_convert_bitstring_type_bad_input():
             output_type=ffsim.BitstringType,  # type: ignore
             length=6,
         )
+
+
+@pytest.mark.parametrize("length", [1, 5, 63, 64, 65, 130])
+def test_convert_bitstring_type_roundtrip(length: int):
+    """Test converting bitstrings between all types, including long bitstrings."""
+    rng = np.random.default_rng(4913)
+    ints = [int(s, base=2) for s in _random_str_list(rng, 20, length)]
+    strings = [f"{s:0{length}b}" for s in ints]
+    bit_array = np.array([[b == "1" for b in s] for s in strings])
+    bitstrings: dict[ffsim.BitstringType, list[int] | list[str] | np.ndarray] = {
+        ffsim.BitstringType.INT: ints,
+        ffsim.BitstringType.STRING: strings,
+        ffsim.BitstringType.BIT_ARRAY: bit_array,
+    }
+    for input_type, output_type in itertools.product(ffsim.BitstringType, repeat=2):
+        result = convert_bitstring_type(
+            bitstrings[input_type], input_type, output_type, length=length
+        )
+        np.testing.assert_array_equal(result, bitstrings[output_type])
+        assert isinstance(result, type(bitstrings[output_type]))
+
+
+def test_convert_bitstring_type_non_contiguous():
+    """Test converting bit arrays that are not C-contiguous."""
+    rng = np.random.default_rng(7702)
+    bit_array = rng.integers(2, size=(10, 12), dtype=bool)
+    for bits in [np.asfortranarray(bit_array), bit_array[::2, ::3], bit_array.T]:
+        expected = ["".join("1" if b else "0" for b in row) for row in bits]
+        assert not bits.flags.c_contiguous
+        assert (
+            convert_bitstring_type(
+                bits,
+                ffsim.BitstringType.BIT_ARRAY,
+                ffsim.BitstringType.STRING,
+                length=bits.shape[1],
+            )
+            == expected
+        )
+
+
+@pytest.mark.parametrize("length", [6, 70])
+def test_restrict_and_concatenate_bitstrings(length: int):
+    """Test restricting and concatenating bitstrings of each type."""
+    rng = np.random.default_rng(2201)
+    strings_a = _random_str_list(rng, 20, length)
+    strings_b = _random_str_list(rng, 20, length)
+    indices = [length - 1, 0, 3, 2]
+    expected_restricted = ["".join(s[-1 - i] for i in indices[::-1]) for s in strings_a]
+    expected_concatenated = [s_b + s_a for s_a, s_b in zip(strings_a, strings_b)]
+    for bitstring_type in ffsim.BitstringType:
+        converted_a, converted_b = (
+            convert_bitstring_type(
+                strings,
+                ffsim.BitstringType.STRING,
+                bitstring_type,
+                length=length,
+            )
+            for strings in [strings_a, strings_b]
+        )
+        restricted = restrict_bitstrings(converted_a, indices, bitstring_type)
+        assert (
+            convert_bitstring_type(
+                restricted,
+                bitstring_type,
+                ffsim.BitstringType.STRING,
+                length=len(indices),
+            )
+            == expected_restricted
+        )
+        concatenated = concatenate_bitstrings(
+            converted_a, converted_b, bitstring_type, length=length
+        )
+        assert (
+            convert_bitstring_type(
+                concatenated,
+                bitstring_type,
+                ffsim.BitstringType.STRING,
+                length=2 * length,
+            )
+            == expected_concatenated
+        )
+
+
+def test_strings_to_addresses_long_strings():
+    """Test converting bitstrings longer than 64 bits to addresses."""
+    norb = 33
+    nelec = (3, 3)
+    addresses = np.arange(29767920, 29767930)
+    for bitstring_type in ffsim.BitstringType:
+        strings = ffsim.addresses_to_strings(
+            addresses, norb, nelec, bitstring_type=bitstring_type
+        )
+        np.testing.assert_array_equal(
+            ffsim.strings_to_addresses(strings, norb, nelec), addresses
+        )
+
+
+def _random_str_list(rng: np.random.Generator, n: int, length: int) -> list[str]:
+    return ["".join(rng.choice(["0", "1"], size=length)) for _ in range(n)]
@@ -134,3 +134,39 @@ def test_sample_slater_determinant_restrict():
         (rdm_a, rdm_b), norb, nelec, orbs=([1, 2, 5], [3, 4, 5]), shots=shots
     )
     assert samples == ["011110"] * 10
+
+
+def test_sample_slater_determinant_many_orbitals():
+    """Test sample Slater determinant with more orbitals than fit in an integer."""
+    norb = 80
+    nelec = (30, 20)
+    rng = np.random.default_rng(2819)
+    shots = 20_000
+    occupied_orbitals = ffsim.testing.random_occupied_orbitals(norb, nelec, seed=rng)
+    rotation = ffsim.random.random_unitary(norb, seed=rng)
+    rdm_a, rdm_b = ffsim.slater_determinant_rdms(norb, occupied_orbitals, rotation)
+    samples_a, samples_b = ffsim.sample_slater_determinant(
+        (rdm_a, rdm_b),
+        norb,
+        nelec,
+        shots=shots,
+        concatenate=False,
+        bitstring_type=BitstringType.BIT_ARRAY,
+        seed=rng,
+    )
+    assert isinstance(samples_a, np.ndarray)
+    assert isinstance(samples_b, np.ndarray)
+    for samples, rdm, n in [(samples_a, rdm_a, nelec[0]), (samples_b, rdm_b, nelec[1])]:
+        assert samples.shape == (shots, norb)
+        np.testing.assert_array_equal(np.sum(samples, axis=1), n)
+        # Compare orbital occupations with the diagonal of the RDM
+        occupations = np.mean(samples[:, ::-1], axis=0)
+        np.testing.assert_allclose(occupations, np.diag(rdm).real, atol=0.02)
+        # Compare occupation covariances with Wick's theorem,
+        # <n_p n_q> - <n_p><n_q> = delta_pq D_pp - |D_pq|^2
+        covariance = np.cov(samples[:, ::-1], rowvar=False, bias=True)
+        expected = np.diag(np.diag(rdm).real) - np.abs(rdm) ** 2
+        np.testing.assert_allclose(covariance, expected, atol=0.01)
+    # The spin sectors are sampled independently
+    covariance = np.cov(samples_a[:, ::-1], samples_b[:, ::-1], rowvar=False, bias=True)
+    np.testing.assert_allclose(covariance[:norb, norb:], 0, atol=0.01)
@@ -12,9 +12,13 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import numpy as np
+import pytest
 
 import ffsim
+from ffsim.states.bitstring import concatenate_bitstrings, restrict_bitstrings
 
 
 def test_sample_state_vector_spinful_string():
@@ -384,3 +388,141 @@ def test_state_vector_array():
     vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=3556)
     state_vec = ffsim.StateVector(vec, norb, nelec)
     assert np.array_equal(np.abs(state_vec), np.abs(vec))
+
+
+def test_memmap_state_vector(tmp_path: Path):
+    """Test creating and reopening a memory-mapped state vector."""
+    norb = 5
+    nelec = (3, 2)
+    filename = tmp_path / "vec.npy"
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=2193)
+
+    state = ffsim.memmap_state_vector(filename, norb, nelec)
+    assert isinstance(state.vec, np.memmap)
+    np.testing.assert_array_equal(state.vec, 0)
+    state.vec[:] = vec
+    state.vec.flush()
+    del state
+
+    state = ffsim.memmap_state_vector(filename, norb, nelec, mode="r")
+    np.testing.assert_array_equal(state.vec, vec)
+    np.testing.assert_array_equal(np.load(filename), vec)
+
+    with pytest.raises(ValueError, match="shape"):
+        _ = ffsim.memmap_state_vector(filename, norb, (1, 1), mode="r")
+
+
+def test_state_vector_sampler_spinful():
+    """Test state vector sampler, spinful."""
+    norb = 5
+    nelec = (3, 2)
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=5193)
+    sampler = ffsim.StateVectorSampler(vec, norb=norb, nelec=nelec)
+    shots = 100
+    addresses = sampler.sample_addresses(shots, seed=3061)
+    assert addresses.shape == (shots,)
+    for orbs in [None, ([0, 1, 2], [0, 1, 3]), ([4, 1], [])]:
+        orbs_a, orbs_b = orbs or (range(norb), range(norb))
+        for bitstring_type in ffsim.BitstringType:
+            strings_a, strings_b = ffsim.addresses_to_strings(
+                addresses,
+                norb,
+                nelec,
+                concatenate=False,
+                bitstring_type=bitstring_type,
+            )
+            expected_a = restrict_bitstrings(strings_a, orbs_a, bitstring_type)
+            expected_b = restrict_bitstrings(strings_b, orbs_b, bitstring_type)
+            samples_a, samples_b = sampler.sample(
+                shots,
+                orbs=orbs,
+                concatenate=False,
+                bitstring_type=bitstring_type,
+                seed=3061,
+            )
+            np.testing.assert_array_equal(samples_a, expected_a)
+            np.testing.assert_array_equal(samples_b, expected_b)
+            samples = sampler.sample(
+                shots, orbs=orbs, bitstring_type=bitstring_type, seed=3061
+            )
+            expected = concatenate_bitstrings(
+                expected_a, expected_b, bitstring_type, length=len(orbs_a)
+            )
+            np.testing.assert_array_equal(samples, expected)
+    samples = sampler.sample(shots, bitstring_type=ffsim.BitstringType.INT)
+    assert isinstance(samples, list)
+    assert all(type(sample) is int for sample in samples)
+
+
+def test_state_vector_sampler_spinless():
+    """Test state vector sampler, spinless."""
+    norb = 6
+    nelec = 3
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=2772)
+    sampler = ffsim.StateVectorSampler(ffsim.StateVector(vec, norb, nelec))
+    shots = 100
+    addresses = sampler.sample_addresses(shots, seed=6613)
+    for orbs in [None, [0, 1, 2], [5, 2, 3]]:
+        for bitstring_type in ffsim.BitstringType:
+            expected = restrict_bitstrings(
+                ffsim.addresses_to_strings(
+                    addresses, norb, nelec, bitstring_type=bitstring_type
+                ),
+                orbs or range(norb),
+                bitstring_type,
+            )
+            samples = sampler.sample(
+                shots, orbs=orbs, bitstring_type=bitstring_type, seed=6613
+            )
+            np.testing.assert_array_equal(samples, expected)
+
+
+def test_state_vector_sampler_distribution():
+    """Test state vector sampler draws from the correct distribution."""
+    norb = 4
+    nelec = (2, 1)
+    dim = ffsim.dim(norb, nelec)
+    rng = np.random.default_rng(4410)
+    vec = ffsim.random.random_state_vector(dim, seed=rng)
+    # Include some outcomes with zero probability
+    vec[rng.choice(dim, size=5, replace=False)] = 0
+    sampler = ffsim.StateVectorSampler(vec, norb=norb, nelec=nelec)
+    shots = 100_000
+    addresses = sampler.sample_addresses(shots, seed=rng)
+    counts = np.bincount(addresses, minlength=dim)
+    probs = np.abs(vec) ** 2 / np.linalg.norm(vec) ** 2
+    np.testing.assert_array_equal(counts[probs == 0], 0)
+    np.testing.assert_allclose(counts / shots, probs, atol=1e-2)
+
+
+def test_state_vector_sampler_long_bitstrings():
+    """Test state vector sampler with concatenated bitstrings longer than 64 bits."""
+    norb = 33
+    nelec = (1, 1)
+    vec = ffsim.slater_determinant(norb, ([0], [32]))
+    sampler = ffsim.StateVectorSampler(vec, norb=norb, nelec=nelec)
+    samples = sampler.sample(10, bitstring_type=ffsim.BitstringType.INT)
+    assert samples == [1 << 65 | 1] * 10
+    samples_a, samples_b = sampler.sample(
+        10, concatenate=False, bitstring_type=ffsim.BitstringType.INT
+    )
+    assert samples_a == [1] * 10
+    assert samples_b == [1 << 32] * 10
+
+
+def test_state_vector_sampler_errors():
+    """Test state vector sampler raises errors."""
+    with pytest.raises(ValueError, match="nonzero"):
+        _ = ffsim.StateVectorSampler(np.zeros(16), norb=4, nelec=(1, 1))
+
+
+def test_memmap_state_vector_single_precision(tmp_path: Path):
+    """Test creating a single-precision memory-mapped state vector."""
+    norb = 4
+    nelec = (2, 2)
+    state = ffsim.memmap_state_vector(
+        tmp_path / "vec.npy", norb, nelec, dtype=np.complex64
+    )
+    assert state.vec.dtype == np.complex64
+    with pytest.raises(ValueError, match="dtype"):
+        _ = ffsim.memmap_state_vector(tmp_path / "vec.npy", norb, nelec, mode="r")
@@ -140,3 +140,52 @@ def test_hubbard():
     # check agreement
     np.testing.assert_allclose(np.linalg.norm(final_state), 1.0)
     np.testing.assert_allclose(final_state, exact_state, atol=atol)
+
+
+@pytest.mark.parametrize("order, stride", [(0, 1), (1, 2), (2, 3)])
+def test_iter(order: int, stride: int):
+    """Test iterating over intermediate states."""
+    rng = np.random.default_rng(7313)
+    norb = 4
+    nelec = (2, 2)
+    time = 0.5
+    n_steps = 7
+    one_body_tensor = ffsim.random.random_hermitian(norb, seed=rng)
+    diag_coulomb_mats = np.stack(
+        [ffsim.random.random_real_symmetric_matrix(norb, seed=rng) for _ in range(2)]
+    )
+    dc_hamiltonian = ffsim.DiagonalCoulombHamiltonian(
+        one_body_tensor, diag_coulomb_mats, constant=rng.uniform(-10, 10)
+    )
+    initial_state = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    original_state = initial_state.copy()
+
+    results = list(
+        ffsim.simulate_trotter_diag_coulomb_split_op_iter(
+            initial_state,
+            dc_hamiltonian,
+            time,
+            norb=norb,
+            nelec=nelec,
+            n_steps=n_steps,
+            order=order,
+            stride=stride,
+        )
+    )
+    np.testing.assert_allclose(initial_state, original_state)
+
+    steps = [*range(stride, n_steps, stride), n_steps]
+    assert len(results) == len(steps)
+    step_time = time / n_steps
+    for step, (this_time, state) in zip(steps, results):
+        np.testing.assert_allclose(this_time, step * step_time)
+        expected = ffsim.simulate_trotter_diag_coulomb_split_op(
+            initial_state,
+            dc_hamiltonian,
+            step * step_time,
+            norb=norb,
+            nelec=nelec,
+            n_steps=step,
+            order=order,
+        )
+        np.testing.assert_allclose(state, expected)
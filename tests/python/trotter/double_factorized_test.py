@@ -81,3 +81,53 @@ def test_random(
     # check agreement
     np.testing.assert_allclose(np.linalg.norm(final_state), 1.0)
     np.testing.assert_allclose(final_state, exact_state, atol=atol)
+
+
+@pytest.mark.parametrize("order, stride", [(0, 1), (1, 2), (2, 3)])
+def test_iter(order: int, stride: int):
+    """Test iterating over intermediate states."""
+    rng = np.random.default_rng(4921)
+    norb = 4
+    nelec = (2, 1)
+    time = 0.5
+    n_steps = 7
+    hamiltonian = ffsim.random.random_double_factorized_hamiltonian(
+        norb, rank=norb, seed=rng
+    )
+    initial_state = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    original_state = initial_state.copy()
+
+    results = list(
+        ffsim.simulate_trotter_double_factorized_iter(
+            initial_state,
+            hamiltonian,
+            time,
+            norb=norb,
+            nelec=nelec,
+            n_steps=n_steps,
+            order=order,
+            stride=stride,
+        )
+    )
+    np.testing.assert_allclose(initial_state, original_state)
+
+    steps = [*range(stride, n_steps, stride), n_steps]
+    assert len(results) == len(steps)
+    step_time = time / n_steps
+    for step, (this_time, state) in zip(steps, results):
+        np.testing.assert_allclose(this_time, step * step_time)
+        expected = ffsim.simulate_trotter_double_factorized(
+            initial_state,
+            hamiltonian,
+            step * step_time,
+            norb=norb,
+            nelec=nelec,
+            n_steps=step,
+            order=order,
+        )
+        np.testing.assert_allclose(state, expected)
+
+    with pytest.raises(ValueError, match="stride"):
+        _ = ffsim.simulate_trotter_double_factorized_iter(
+            initial_state, hamiltonian, time, norb=norb, nelec=nelec, stride=0
+        )
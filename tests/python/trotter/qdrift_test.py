@@ -409,3 +409,127 @@ def test_simulate_qdrift_double_factorized_random(
     np.testing.assert_allclose(np.linalg.norm(final_state), 1.0)
     fidelity = np.abs(np.vdot(final_state, exact_state))
     assert fidelity >= target_fidelity
+
+
+@pytest.mark.parametrize("z_representation", [False, True])
+def test_simulate_qdrift_double_factorized_trajectories(z_representation: bool):
+    """Test qDRIFT trajectories match applying the sampled terms one by one."""
+    norb = 4
+    nelec = (2, 1)
+    time = 0.3
+    n_steps = 5
+    n_samples = 3
+    rng = np.random.default_rng(6120)
+    df_hamiltonian = ffsim.random.random_double_factorized_hamiltonian(
+        norb, rank=3, z_representation=z_representation, seed=rng
+    )
+    initial_state = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    n_terms = 1 + len(df_hamiltonian.diag_coulomb_mats)
+    probabilities = np.ones(n_terms) / n_terms
+
+    final_states = ffsim.simulate_qdrift_double_factorized(
+        initial_state,
+        df_hamiltonian,
+        time,
+        norb=norb,
+        nelec=nelec,
+        n_steps=n_steps,
+        probabilities=probabilities,
+        n_samples=n_samples,
+        seed=1234,
+    )
+
+    one_body_energies, one_body_basis_change = scipy.linalg.eigh(
+        df_hamiltonian.one_body_tensor
+    )
+    step_time = time / n_steps
+    rng = np.random.default_rng(1234)
+    for final_state in final_states:
+        expected = initial_state.copy()
+        for term_index in rng.choice(n_terms, size=n_steps, p=probabilities):
+            if term_index == 0:
+                expected = ffsim.apply_num_op_sum_evolution(
+                    expected,
+                    one_body_energies,
+                    step_time / probabilities[0],
+                    norb=norb,
+                    nelec=nelec,
+                    orbital_rotation=one_body_basis_change,
+                )
+            else:
+                expected = ffsim.apply_diag_coulomb_evolution(
+                    expected,
+                    df_hamiltonian.diag_coulomb_mats[term_index - 1],
+                    step_time / probabilities[term_index],
+                    norb=norb,
+                    nelec=nelec,
+                    orbital_rotation=df_hamiltonian.orbital_rotations[term_index - 1],
+                    z_representation=z_representation,
+                )
+        np.testing.assert_allclose(final_state, expected)
+
+
+@pytest.mark.parametrize("symmetric", [False, True])
+def test_simulate_qdrift_double_factorized_average(symmetric: bool):
+    """Test averaging observables over qDRIFT trajectories."""
+    norb = 4
+    nelec = (2, 2)
+    time = 0.3
+    n_steps = 4
+    n_samples = 7
+    rng = np.random.default_rng(5581)
+    df_hamiltonian = ffsim.random.random_double_factorized_hamiltonian(
+        norb, rank=3, seed=rng
+    )
+    initial_state = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    final_states = ffsim.simulate_qdrift_double_factorized(
+        initial_state,
+        df_hamiltonian,
+        time,
+        norb=norb,
+        nelec=nelec,
+        n_steps=n_steps,
+        symmetric=symmetric,
+        probabilities="uniform",
+        n_samples=n_samples,
+        seed=9876,
+    )
+
+    # expectation value
+    linop = ffsim.linear_operator(df_hamiltonian, norb=norb, nelec=nelec)
+    energy = ffsim.simulate_qdrift_double_factorized_average(
+        initial_state,
+        df_hamiltonian,
+        time,
+        lambda vec: np.vdot(vec, linop @ vec).real,
+        norb=norb,
+        nelec=nelec,
+        n_steps=n_steps,
+        symmetric=symmetric,
+        probabilities="uniform",
+        n_samples=n_samples,
+        batch_size=3,
+        seed=9876,
+    )
+    np.testing.assert_allclose(
+        energy, np.mean([np.vdot(vec, linop @ vec).real for vec in final_states])
+    )
+
+    # density matrix
+    density_matrix = ffsim.simulate_qdrift_double_factorized_average(
+        initial_state,
+        df_hamiltonian,
+        time,
+        lambda vec: np.outer(vec, vec.conj()),
+        norb=norb,
+        nelec=nelec,
+        n_steps=n_steps,
+        symmetric=symmetric,
+        probabilities="uniform",
+        n_samples=n_samples,
+        seed=9876,
+    )
+    np.testing.assert_allclose(
+        density_matrix, final_states.T @ final_states.conj() / n_samples
+    )
+    np.testing.assert_allclose(np.trace(density_matrix), 1.0)
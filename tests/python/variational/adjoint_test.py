@@ -0,0 +1,152 @@
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for analytic ansatz derivatives."""
+
+from __future__ import annotations
+
+import itertools
+
+import numpy as np
+import pytest
+
+import ffsim
+from ffsim.optimize._util import jacobian_finite_diff
+
+
+def _check_derivatives(
+    ansatz: ffsim.variational.AdjointAnsatz,
+    params_to_vec,
+    rng: np.random.Generator,
+):
+    norb, nelec = ansatz.norb, ansatz.nelec
+    params = rng.uniform(-1, 1, size=ansatz.n_params)
+    vec = ansatz.state(params)
+    np.testing.assert_allclose(vec, params_to_vec(params), atol=1e-12)
+
+    jac = ansatz.jacobian(params)
+    expected = jacobian_finite_diff(params_to_vec, params, len(vec), epsilon=1e-6)
+    np.testing.assert_allclose(jac, expected, atol=1e-6)
+
+    other = ffsim.random.random_state_vector(len(vec), seed=rng)
+    np.testing.assert_allclose(ansatz.vjp(params, other), jac.T.conj() @ other)
+
+    hamiltonian = ffsim.linear_operator(
+        ffsim.random.random_molecular_hamiltonian(norb, seed=rng),
+        norb=norb,
+        nelec=nelec,
+    )
+    energy, grad = ansatz.energy_and_gradient(params, hamiltonian)
+    np.testing.assert_allclose(energy, np.vdot(vec, hamiltonian @ vec).real)
+    np.testing.assert_allclose(grad, 2 * (jac.T.conj() @ (hamiltonian @ vec)).real)
+
+
+@pytest.mark.parametrize(
+    "norb, nelec, interaction_pairs, with_final_orbital_rotation",
+    [
+        (3, (2, 1), None, False),
+        (4, (2, 2), None, True),
+        (4, (1, 2), ([(0, 1), (2, 3)], [(0, 0), (1, 1)]), True),
+        (4, (2, 1), ([], [(0, 0)]), False),
+    ],
+)
+def test_ucj_spin_balanced(
+    norb: int,
+    nelec: tuple[int, int],
+    interaction_pairs,
+    with_final_orbital_rotation: bool,
+):
+    """Test derivatives of the spin-balanced UCJ ansatz."""
+    rng = np.random.default_rng()
+    n_reps = 2
+    reference_state = ffsim.hartree_fock_state(norb, nelec)
+
+    def params_to_vec(params: np.ndarray) -> np.ndarray:
+        operator = ffsim.UCJOpSpinBalanced.from_parameters(
+            params,
+            norb=norb,
+            n_reps=n_reps,
+            interaction_pairs=interaction_pairs,
+            with_final_orbital_rotation=with_final_orbital_rotation,
+        )
+        return ffsim.apply_unitary(reference_state, operator, norb=norb, nelec=nelec)
+
+    ansatz = ffsim.variational.AdjointAnsatz.ucj_spin_balanced(
+        reference_state,
+        norb=norb,
+        nelec=nelec,
+        n_reps=n_reps,
+        interaction_pairs=interaction_pairs,
+        with_final_orbital_rotation=with_final_orbital_rotation,
+    )
+    _check_derivatives(ansatz, params_to_vec, rng)
+
+
+@pytest.mark.parametrize(
+    "with_phis, with_phase_angles", itertools.product([False, True], repeat=2)
+)
+def test_givens(with_phis: bool, with_phase_angles: bool):
+    """Test derivatives of the Givens rotation ansatz."""
+    rng = np.random.default_rng()
+    norb = 4
+    nelec = (2, 1)
+    interaction_pairs = [(0, 1), (2, 3), (1, 2), (0, 1), (3, 2)]
+    reference_state = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+
+    def params_to_vec(params: np.ndarray) -> np.ndarray:
+        operator = ffsim.GivensAnsatzOp.from_parameters(
+            params,
+            norb=norb,
+            interaction_pairs=interaction_pairs,
+            with_phis=with_phis,
+            with_phase_angles=with_phase_angles,
+        )
+        return ffsim.apply_unitary(reference_state, operator, norb=norb, nelec=nelec)
+
+    ansatz = ffsim.variational.AdjointAnsatz.givens(
+        reference_state,
+        norb=norb,
+        nelec=nelec,
+        interaction_pairs=interaction_pairs,
+        with_phis=with_phis,
+        with_phase_angles=with_phase_angles,
+    )
+    _check_derivatives(ansatz, params_to_vec, rng)
+
+
+def test_num_num_spin_balanced():
+    """Test derivatives of the number-number interaction ansatz."""
+    rng = np.random.default_rng()
+    norb = 4
+    nelec = (2, 2)
+    interaction_pairs = ([(0, 1), (1, 1), (2, 3)], [(0, 0), (0, 2), (3, 3)])
+    reference_state = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+
+    def params_to_vec(params: np.ndarray) -> np.ndarray:
+        operator = ffsim.NumNumAnsatzOpSpinBalanced.from_parameters(
+            params, norb=norb, interaction_pairs=interaction_pairs
+        )
+        return ffsim.apply_unitary(reference_state, operator, norb=norb, nelec=nelec)
+
+    ansatz = ffsim.variational.AdjointAnsatz.num_num_spin_balanced(
+        reference_state, norb=norb, nelec=nelec, interaction_pairs=interaction_pairs
+    )
+    _check_derivatives(ansatz, params_to_vec, rng)
+
+
+def test_wrong_number_of_parameters():
+    """Test passing the wrong number of parameters raises an error."""
+    norb = 3
+    nelec = (1, 1)
+    ansatz = ffsim.variational.AdjointAnsatz.ucj_spin_balanced(
+        ffsim.hartree_fock_state(norb, nelec), norb=norb, nelec=nelec, n_reps=1
+    )
+    with pytest.raises(ValueError, match="number of parameters"):
+        ansatz.state(np.zeros(ansatz.n_params + 1))
@@ -112,3 +112,25 @@ def test_apply_unitary():
         )
         result = ffsim.apply_unitary(vec, operator, norb=norb, nelec=(nocc, nocc))
         np.testing.assert_allclose(np.linalg.norm(result), 1.0)
+
+
+def test_apply_unitary_batch():
+    """Test applying unitary to a batch of vectors."""
+    rng = np.random.default_rng(8820)
+    norb = 5
+    nocc = 3
+    nelec = (nocc, nocc)
+    vecs = np.stack(
+        [
+            ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+            for _ in range(3)
+        ]
+    )
+    operator = ffsim.random.random_uccsd_restricted(
+        norb, nocc, with_final_orbital_rotation=True, real=True, seed=rng
+    )
+    result = ffsim.apply_unitary(vecs, operator, norb=norb, nelec=nelec)
+    expected = np.stack(
+        [ffsim.apply_unitary(vec, operator, norb=norb, nelec=nelec) for vec in vecs]
+    )
+    np.testing.assert_allclose(result, expected)
@@ -287,3 +287,79 @@ def test_validate():
             ),
             orbital_rotations=orbital_rotations,
         )
+
+
+def test_apply_unitary_batch():
+    """Test applying unitary to a batch of vectors."""
+    rng = np.random.default_rng(1350)
+    norb = 5
+    nelec = (3, 2)
+    vecs = np.stack(
+        [
+            ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+            for _ in range(3)
+        ]
+    )
+    operator = ffsim.random.random_ucj_op_spin_balanced(
+        norb, n_reps=2, with_final_orbital_rotation=True, seed=rng
+    )
+    result = ffsim.apply_unitary(vecs, operator, norb=norb, nelec=nelec)
+    expected = np.stack(
+        [ffsim.apply_unitary(vec, operator, norb=norb, nelec=nelec) for vec in vecs]
+    )
+    np.testing.assert_allclose(result, expected)
+
+
+def test_compile():
+    """Test compiling the operator into a plan."""
+    rng = np.random.default_rng(4806)
+    norb = 5
+    nelec = (3, 2)
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    operator = ffsim.random.random_ucj_op_spin_balanced(
+        norb, n_reps=3, with_final_orbital_rotation=True, seed=rng
+    )
+    plan = operator.compile()
+
+    expected = vec
+    for (mat_aa, mat_ab), orbital_rotation in zip(
+        operator.diag_coulomb_mats, operator.orbital_rotations
+    ):
+        expected = ffsim.apply_diag_coulomb_evolution(
+            expected,
+            (mat_aa, mat_ab, mat_aa),
+            time=-1.0,
+            norb=norb,
+            nelec=nelec,
+            orbital_rotation=orbital_rotation,
+        )
+    assert operator.final_orbital_rotation is not None
+    expected = ffsim.apply_orbital_rotation(
+        expected, operator.final_orbital_rotation, norb=norb, nelec=nelec
+    )
+
+    original_vec = vec.copy()
+    result = ffsim.apply_unitary(vec, plan, norb=norb, nelec=nelec)
+    np.testing.assert_allclose(result, expected)
+    np.testing.assert_allclose(vec, original_vec)
+    # the plan can be applied repeatedly
+    result = ffsim.apply_unitary(vec, plan, norb=norb, nelec=nelec)
+    np.testing.assert_allclose(result, expected)
+
+
+def test_apply_unitary_single_precision():
+    """Test applying a UCJ operator to a single-precision Hartree-Fock state."""
+    rng = np.random.default_rng()
+    norb = 6
+    nelec = (3, 2)
+    operator = ffsim.random.random_ucj_op_spin_balanced(
+        norb, n_reps=3, with_final_orbital_rotation=True, seed=rng
+    )
+    vec = ffsim.hartree_fock_state(norb, nelec, dtype=np.complex64)
+    assert vec.dtype == np.complex64
+    result = ffsim.apply_unitary(vec, operator, norb=norb, nelec=nelec)
+    expected = ffsim.apply_unitary(
+        ffsim.hartree_fock_state(norb, nelec), operator, norb=norb, nelec=nelec
+    )
+    assert result.dtype == np.complex64
+    np.testing.assert_allclose(result, expected, atol=1e-5)
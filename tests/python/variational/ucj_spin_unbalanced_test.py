@@ -329,3 +329,35 @@ def test_validate():
                 [np.stack([eye, eye, eye]) for _ in range(n_reps)]
             ),
         )
+
+
+def test_compile():
+    """Test compiling the operator into a plan."""
+    rng = np.random.default_rng(4807)
+    norb = 5
+    nelec = (3, 2)
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nelec), seed=rng)
+    operator = ffsim.random.random_ucj_op_spin_unbalanced(
+        norb, n_reps=3, with_final_orbital_rotation=True, seed=rng
+    )
+    plan = operator.compile()
+
+    expected = vec
+    for diag_coulomb_mat, orbital_rotation in zip(
+        operator.diag_coulomb_mats, operator.orbital_rotations
+    ):
+        expected = ffsim.apply_diag_coulomb_evolution(
+            expected,
+            diag_coulomb_mat,
+            time=-1.0,
+            norb=norb,
+            nelec=nelec,
+            orbital_rotation=orbital_rotation,
+        )
+    assert operator.final_orbital_rotation is not None
+    expected = ffsim.apply_orbital_rotation(
+        expected, operator.final_orbital_rotation, norb=norb, nelec=nelec
+    )
+
+    result = ffsim.apply_unitary(vec, plan, norb=norb, nelec=nelec)
+    np.testing.assert_allclose(result, expected)
@@ -285,3 +285,35 @@ def test_validate():
             orbital_rotations=orbital_rotations,
             final_orbital_rotation=rng.standard_normal((norb, norb)),
         )
+
+
+def test_compile():
+    """Test compiling the operator into a plan."""
+    rng = np.random.default_rng(4808)
+    norb = 5
+    nocc = 3
+    vec = ffsim.random.random_state_vector(ffsim.dim(norb, nocc), seed=rng)
+    operator = ffsim.random.random_ucj_op_spinless(
+        norb, n_reps=3, with_final_orbital_rotation=True, seed=rng
+    )
+    plan = operator.compile()
+
+    expected = vec
+    for diag_coulomb_mat, orbital_rotation in zip(
+        operator.diag_coulomb_mats, operator.orbital_rotations
+    ):
+        expected = ffsim.apply_diag_coulomb_evolution(
+            expected,
+            diag_coulomb_mat,
+            time=-1.0,
+            norb=norb,
+            nelec=nocc,
+            orbital_rotation=orbital_rotation,
+        )
+    assert operator.final_orbital_rotation is not None
+    expected = ffsim.apply_orbital_rotation(
+        expected, operator.final_orbital_rotation, norb=norb, nelec=nocc
+    )
+
+    result = ffsim.apply_unitary(vec, plan, norb=norb, nelec=nocc)
+    np.testing.assert_allclose(result, expected)